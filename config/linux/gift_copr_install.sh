@@ -53,6 +53,7 @@ PYTHON3_DEPENDENCIES="libbde-python3
                       python3-future
                       python3-idna
                       python3-lz4
+                      python3-numpy
                       python3-pefile
                       python3-psutil
                       python3-pyparsing
@@ -5,7 +5,10 @@ from __future__ import unicode_literals
 
 import abc
 import collections
+import concurrent.futures
+import json
 import queue
+import sqlite3
 import threading
 import time
 
@@ -250,10 +253,27 @@ class HashTaggingAnalysisPlugin(interface.AnalysisPlugin):
       average_analysis_time, _ = divmod(
           self._analyzer.seconds_spent_analyzing, analyses_performed)
 
+    # Batches are analyzed concurrently but their start is limited by
+    # the wait time per batch.
+    number_of_concurrent_batches = max(
+        self._analyzer.number_of_concurrent_batches, 1)
+    average_analysis_time, _ = divmod(
+        average_analysis_time, number_of_concurrent_batches)
+
     batches_remaining, _ = divmod(number_of_hashes, hashes_per_batch)
-    estimated_seconds_per_batch = average_analysis_time + wait_time_per_batch
+    estimated_seconds_per_batch = max(
+        average_analysis_time, wait_time_per_batch)
     return batches_remaining * estimated_seconds_per_batch
 
+  def GetSupportedEventDataTypes(self):
+    """Retrieves the event data types supported by the plugin.
+
+    Returns:
+      frozenset[str]: event data types supported by the plugin or None if
+          the plugin supports events of all data types.
+    """
+    return frozenset(self.DATA_TYPES) or None
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def GenerateLabels(self, hash_information):
@@ -268,6 +288,17 @@ class HashTaggingAnalysisPlugin(interface.AnalysisPlugin):
       list[str]: list of labels to apply to events.
     """
 
+  def SetCacheFile(self, path):
+    """Sets the file to cache hash analysis results in.
+
+    Results in the cache file are reused instead of looking up the same
+    hash again.
+
+    Args:
+      path (str): path of the cache file.
+    """
+    self._analyzer.SetCacheFile(path, self.NAME)
+
   def SetLookupHash(self, lookup_hash):
     """Sets the hash to query.
 
@@ -277,20 +308,120 @@ class HashTaggingAnalysisPlugin(interface.AnalysisPlugin):
     self._analyzer.SetLookupHash(lookup_hash)
 
 
+class HashAnalysisCache(object):
+  """Cache of hash analysis results stored in a SQLite database file.
+
+  The cache allows repeated analysis runs, for example over the same storage
+  file, to reuse the results of earlier look ups instead of querying the
+  hash analysis service again. Hash information is stored JSON serialized.
+  """
+
+  _CREATE_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS hash_analysis ('
+      'namespace TEXT, lookup_hash TEXT, digest TEXT, hash_information TEXT, '
+      'PRIMARY KEY (namespace, lookup_hash, digest))')
+
+  _INSERT_QUERY = (
+      'INSERT OR REPLACE INTO hash_analysis (namespace, lookup_hash, digest, '
+      'hash_information) VALUES (?, ?, ?, ?)')
+
+  _SELECT_QUERY = (
+      'SELECT hash_information FROM hash_analysis WHERE namespace = ? AND '
+      'lookup_hash = ? AND digest = ?')
+
+  def __init__(self, path, namespace):
+    """Initializes a hash analysis cache.
+
+    Args:
+      path (str): path of the SQLite database file.
+      namespace (str): namespace of the cached results, such as the name of
+          the analysis plugin, which allows multiple plugins to share the
+          same database file.
+    """
+    super(HashAnalysisCache, self).__init__()
+    self._connection = None
+    self._lock = threading.Lock()
+    self._namespace = namespace
+    self._path = path
+
+  def _Open(self):
+    """Opens the cache database."""
+    self._connection = sqlite3.connect(
+        self._path, check_same_thread=False, isolation_level=None)
+    self._connection.execute(self._CREATE_TABLE_QUERY)
+
+  def Close(self):
+    """Closes the cache."""
+    with self._lock:
+      if self._connection:
+        self._connection.close()
+        self._connection = None
+
+  def GetHashInformation(self, lookup_hash, digest):
+    """Retrieves cached hash information.
+
+    Args:
+      lookup_hash (str): name of the hash attribute that was looked up.
+      digest (str): hash that was looked up.
+
+    Returns:
+      tuple: containing:
+
+        bool: True if the hash information was cached.
+        object: cached hash information or None if not available.
+    """
+    with self._lock:
+      if not self._connection:
+        self._Open()
+
+      cursor = self._connection.execute(
+          self._SELECT_QUERY, (self._namespace, lookup_hash, digest))
+      row = cursor.fetchone()
+
+    if not row:
+      return False, None
+
+    return True, json.loads(row[0])
+
+  def SetHashInformation(self, lookup_hash, digest, hash_information):
+    """Caches hash information.
+
+    Args:
+      lookup_hash (str): name of the hash attribute that was looked up.
+      digest (str): hash that was looked up.
+      hash_information (object): JSON serializable hash information.
+    """
+    json_string = json.dumps(hash_information)
+
+    with self._lock:
+      if not self._connection:
+        self._Open()
+
+      self._connection.execute(
+          self._INSERT_QUERY,
+          (self._namespace, lookup_hash, digest, json_string))
+
+
 class HashAnalyzer(threading.Thread):
   """Class that defines the interfaces for hash analyzer threads.
 
   This interface should be implemented once for each hash analysis plugin.
 
+  Batches of hashes are analyzed concurrently in a pool of threads, hence
+  implementations of Analyze() must be thread-safe.
+
   Attributes:
     analyses_performed (int): number of analysis batches completed by this
         analyzer.
     hashes_per_batch (int): maximum number of hashes to analyze at once.
     lookup_hash (str): name of the hash attribute to look up.
+    number_of_concurrent_batches (int): maximum number of batches of hashes
+        that are analyzed at the same time.
     seconds_spent_analyzing (int): number of seconds this analyzer has spent
         performing analysis (as opposed to waiting on queues, etc.)
-    wait_after_analysis (int): number of seconds the analyzer will sleep for
-        after analyzing a batch of hashes.
+    wait_after_analysis (int): minimum number of seconds between the start of
+        the analysis of consecutive batches of hashes, which is used to
+        honour rate limits.
   """
   # How long to wait for new items to be added to the the input queue.
   EMPTY_QUEUE_WAIT_TIME = 4
@@ -300,7 +431,8 @@ class HashAnalyzer(threading.Thread):
 
   def __init__(
       self, hash_queue, hash_analysis_queue, hashes_per_batch=1,
-      lookup_hash='sha256', wait_after_analysis=0):
+      lookup_hash='sha256', number_of_concurrent_batches=1,
+      wait_after_analysis=0):
     """Initializes a hash analyzer.
 
     Args:
@@ -309,22 +441,78 @@ class HashAnalyzer(threading.Thread):
           HashAnalysis objects to.
       hashes_per_batch (Optional[int]): number of hashes to analyze at once.
       lookup_hash (Optional[str]): name of the hash attribute to look up.
-      wait_after_analysis (Optional[int]): number of seconds to wait after each
-          batch is analyzed.
+      number_of_concurrent_batches (Optional[int]): maximum number of batches
+          of hashes that are analyzed at the same time.
+      wait_after_analysis (Optional[int]): minimum number of seconds between
+          the start of the analysis of consecutive batches.
     """
     super(HashAnalyzer, self).__init__()
     self._abort = False
+    self._abort_event = threading.Event()
+    self._cache = None
     self._hash_queue = hash_queue
     self._hash_analysis_queue = hash_analysis_queue
+    self._next_batch_time = 0.0
+    self._statistics_lock = threading.Lock()
     self.analyses_performed = 0
     self.hashes_per_batch = hashes_per_batch
     self.lookup_hash = lookup_hash
+    self.number_of_concurrent_batches = number_of_concurrent_batches
     self.seconds_spent_analyzing = 0
     self.wait_after_analysis = wait_after_analysis
 
+  def _AnalyzeBatch(self, hashes):
+    """Analyzes a batch of hashes.
+
+    This method is run in a thread of the analyzer thread pool.
+
+    Args:
+      hashes (list[str]): hashes to look up.
+    """
+    try:
+      time_before_analysis = time.time()
+      hash_analyses = self.Analyze(hashes)
+      seconds_spent_analyzing = time.time() - time_before_analysis
+
+      with self._statistics_lock:
+        self.seconds_spent_analyzing += seconds_spent_analyzing
+        self.analyses_performed += 1
+
+      for hash_analysis in hash_analyses:
+        if self._cache and self._IsCacheable(hash_analysis):
+          self._cache.SetHashInformation(
+              self.lookup_hash, hash_analysis.subject_hash,
+              hash_analysis.hash_information)
+
+        self._hash_analysis_queue.put(hash_analysis)
+
+    # All exceptions need to be caught here to prevent the results of
+    # the other batches from being lost.
+    except Exception as exception:  # pylint: disable=broad-except
+      logger.error('Unable to analyze hashes with error: {0!s}'.format(
+          exception))
+      self.SignalAbort()
+
+    finally:
+      # Mark every hash of the batch as done, including hashes that did not
+      # produce a result, otherwise the plugin keeps waiting for them.
+      for _ in hashes:
+        self._hash_queue.task_done()
+
+  def _CloseConnections(self):
+    """Closes connections to the hash analysis service.
+
+    Subclasses that keep connections open across batches should override
+    this method.
+    """
+    return
+
   def _GetHashes(self, target_queue, max_hashes):
     """Retrieves a list of items from a queue.
 
+    Waits for at most EMPTY_QUEUE_WAIT_TIME seconds for the first item to
+    become available.
+
     Args:
       target_queue (queue.Queue): queue to retrieve hashes from.
       max_hashes (int): maximum number of items to retrieve from the
@@ -335,14 +523,63 @@ class HashAnalyzer(threading.Thread):
           The list may have no elements if the target_queue is empty.
     """
     hashes = []
-    for _ in range(0, max_hashes):
-      try:
-        item = target_queue.get_nowait()
-      except queue.Empty:
-        continue
-      hashes.append(item)
+    try:
+      hashes.append(target_queue.get(timeout=self.EMPTY_QUEUE_WAIT_TIME))
+      while len(hashes) < max_hashes:
+        hashes.append(target_queue.get_nowait())
+    except queue.Empty:
+      pass
+
     return hashes
 
+  def _GetUncachedHashes(self, hashes):
+    """Retrieves the hashes without a cached analysis result.
+
+    The cached analysis results are added to the hash analysis queue.
+
+    Args:
+      hashes (list[str]): hashes to look up.
+
+    Returns:
+      list[str]: hashes without a cached analysis result.
+    """
+    if not self._cache:
+      return hashes
+
+    uncached_hashes = []
+    for digest in hashes:
+      is_cached, hash_information = self._cache.GetHashInformation(
+          self.lookup_hash, digest)
+      if not is_cached:
+        uncached_hashes.append(digest)
+        continue
+
+      hash_analysis = HashAnalysis(digest, hash_information)
+      self._hash_analysis_queue.put(hash_analysis)
+      self._hash_queue.task_done()
+
+    return uncached_hashes
+
+  def _IsCacheable(self, hash_analysis):
+    """Determines if the result of the analysis of a hash can be cached.
+
+    Args:
+      hash_analysis (HashAnalysis): result of the analysis of a hash.
+
+    Returns:
+      bool: True if the result can be cached.
+    """
+    return hash_analysis.hash_information is not None
+
+  def _WaitForRateLimit(self):
+    """Waits until the next batch is allowed to start by the rate limit."""
+    if self.wait_after_analysis:
+      delay = self._next_batch_time - time.time()
+      if delay > 0:
+        self._abort_event.wait(delay)
+
+      self._next_batch_time = time.time() + self.wait_after_analysis
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def Analyze(self, hashes):
@@ -359,21 +596,50 @@ class HashAnalyzer(threading.Thread):
   # not follow the style guide.
   def run(self):
     """The method called by the threading library to start the thread."""
-    while not self._abort:
-      hashes = self._GetHashes(self._hash_queue, self.hashes_per_batch)
-      if hashes:
-        time_before_analysis = time.time()
-        hash_analyses = self.Analyze(hashes)
-        current_time = time.time()
-        self.seconds_spent_analyzing += current_time - time_before_analysis
-        self.analyses_performed += 1
-        for hash_analysis in hash_analyses:
-          self._hash_analysis_queue.put(hash_analysis)
-          self._hash_queue.task_done()
-        time.sleep(self.wait_after_analysis)
-      else:
-        # Wait for some more hashes to be added to the queue.
-        time.sleep(self.EMPTY_QUEUE_WAIT_TIME)
+    number_of_concurrent_batches = max(self.number_of_concurrent_batches, 1)
+    batch_semaphore = threading.BoundedSemaphore(number_of_concurrent_batches)
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=number_of_concurrent_batches)
+
+    try:
+      while not self._abort:
+        hashes = self._GetHashes(self._hash_queue, self.hashes_per_batch)
+        hashes = self._GetUncachedHashes(hashes)
+        if not hashes:
+          continue
+
+        self._WaitForRateLimit()
+
+        # Wait for a batch to complete when the maximum number of concurrent
+        # batches is in flight.
+        while not batch_semaphore.acquire(timeout=self.EMPTY_QUEUE_WAIT_TIME):
+          if self._abort:
+            break
+
+        if self._abort:
+          for _ in hashes:
+            self._hash_queue.task_done()
+          break
+
+        future = executor.submit(self._AnalyzeBatch, hashes)
+        future.add_done_callback(lambda _: batch_semaphore.release())
+
+    finally:
+      executor.shutdown(wait=True)
+      self._CloseConnections()
+
+      if self._cache:
+        self._cache.Close()
+
+  def SetCacheFile(self, path, namespace):
+    """Sets the file to cache hash analysis results in.
+
+    Args:
+      path (str): path of the cache file.
+      namespace (str): namespace of the cached results.
+    """
+    self._cache = HashAnalysisCache(path, namespace)
 
   def SetLookupHash(self, lookup_hash):
     """Sets the hash to query.
@@ -392,10 +658,77 @@ class HashAnalyzer(threading.Thread):
   def SignalAbort(self):
     """Instructs this analyzer to stop running."""
     self._abort = True
+    self._abort_event.set()
 
 
 class HTTPHashAnalyzer(HashAnalyzer):
-  """Interface for hash analysis plugins that use HTTP(S)"""
+  """Interface for hash analysis plugins that use HTTP(S)
+
+  HTTP connections are reused across batches by means of a requests session
+  per thread.
+  """
+
+  # Maximum number of times a rate limited request is retried.
+  _MAXIMUM_NUMBER_OF_RETRIES = 3
+
+  # Number of seconds to wait before retrying a rate limited request if
+  # the response does not contain a Retry-After header.
+  _DEFAULT_RETRY_AFTER = 60
+
+  def __init__(self, hash_queue, hash_analysis_queue, **kwargs):
+    """Initializes a HTTP hash analyzer.
+
+    Args:
+      hash_queue (queue.Queue): contains hashes to be analyzed.
+      hash_analysis_queue (queue.Queue): queue that the analyzer will append
+          HashAnalysis objects to.
+    """
+    super(HTTPHashAnalyzer, self).__init__(
+        hash_queue, hash_analysis_queue, **kwargs)
+    self._sessions = []
+    self._sessions_lock = threading.Lock()
+    self._thread_local = threading.local()
+
+  def _CloseConnections(self):
+    """Closes connections to the hash analysis service."""
+    with self._sessions_lock:
+      for session in self._sessions:
+        session.close()
+
+      self._sessions = []
+
+    self._thread_local = threading.local()
+
+  def _GetRetryAfter(self, response):
+    """Retrieves the number of seconds to wait before retrying a request.
+
+    Args:
+      response (requests.Response): HTTP response.
+
+    Returns:
+      float: number of seconds to wait.
+    """
+    retry_after = response.headers.get('Retry-After', None)
+    try:
+      return max(float(retry_after), 0.0)
+    except (TypeError, ValueError):
+      return self._DEFAULT_RETRY_AFTER
+
+  def _GetSession(self):
+    """Retrieves the requests session of the current thread.
+
+    Returns:
+      requests.Session: HTTP session.
+    """
+    session = getattr(self._thread_local, 'session', None)
+    if not session:
+      session = requests.Session()
+      self._thread_local.session = session
+
+      with self._sessions_lock:
+        self._sessions.append(session)
+
+    return session
 
   @abc.abstractmethod
   def Analyze(self, hashes):
@@ -411,6 +744,9 @@ class HTTPHashAnalyzer(HashAnalyzer):
   def MakeRequestAndDecodeJSON(self, url, method, **kwargs):
     """Make a HTTP request and decode the results as JSON.
 
+    Requests that are rate limited by the server, with HTTP status 429, are
+    retried after the delay indicated by the server.
+
     Args:
       url (str): URL to make a request to.
       method (str): HTTP method to used to make the request. GET and POST are
@@ -430,12 +766,23 @@ class HTTPHashAnalyzer(HashAnalyzer):
     if method_upper not in ('GET', 'POST'):
       raise ValueError('Method {0:s} is not supported')
 
+    session = self._GetSession()
+
     try:
-      if method_upper == 'GET':
-        response = requests.get(url, **kwargs)
+      for _ in range(self._MAXIMUM_NUMBER_OF_RETRIES + 1):
+        if method_upper == 'GET':
+          response = session.get(url, **kwargs)
+
+        elif method_upper == 'POST':
+          response = session.post(url, **kwargs)
+
+        if getattr(response, 'status_code', None) != 429 or self._abort:
+          break
 
-      elif method_upper == 'POST':
-        response = requests.post(url, **kwargs)
+        retry_after = self._GetRetryAfter(response)
+        logger.debug('{0:s} rate limited, retrying after {1:f} seconds'.format(
+            url, retry_after))
+        self._abort_event.wait(retry_after)
 
       response.raise_for_status()
 
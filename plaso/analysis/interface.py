@@ -22,6 +22,11 @@ class AnalysisPlugin(object):
   # explains the nature of the plugin easily. It also needs to be unique.
   NAME = 'analysis_plugin'
 
+  # The event data types the plugin examines, where an empty set represents
+  # all event data types. Events of other data types are not sent to
+  # the plugin.
+  _SUPPORTED_EVENT_DATA_TYPES = frozenset()
+
   def __init__(self):
     """Initializes an analysis plugin."""
     super(AnalysisPlugin, self).__init__()
@@ -54,6 +59,15 @@ class AnalysisPlugin(object):
 
     return event_tag
 
+  def GetSupportedEventDataTypes(self):
+    """Retrieves the event data types supported by the plugin.
+
+    Returns:
+      frozenset[str]: event data types supported by the plugin or None if
+          the plugin supports events of all data types.
+    """
+    return self._SUPPORTED_EVENT_DATA_TYPES or None
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def CompileReport(self, mediator):
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import socket
+import threading
 
 from plaso.analysis import hash_tagging
 from plaso.analysis import logger
@@ -13,14 +14,20 @@ from plaso.analysis import manager
 class NsrlsvrAnalyzer(hash_tagging.HashAnalyzer):
   """Analyzes file hashes by consulting an nsrlsvr instance.
 
+  Every thread of the analyzer keeps a connection to nsrlsvr open across
+  batches. The queries of a batch are sent at once after which the responses
+  are read, which avoids a network round trip per hash.
+
   Attributes:
     analyses_performed (int): number of analysis batches completed by this
         analyzer.
     hashes_per_batch (int): maximum number of hashes to analyze at once.
+    number_of_concurrent_batches (int): maximum number of batches of hashes
+        that are analyzed at the same time.
     seconds_spent_analyzing (int): number of seconds this analyzer has spent
         performing analysis (as opposed to waiting on queues, etc.)
-    wait_after_analysis (int): number of seconds the analyzer will sleep for
-        after analyzing a batch of hashes.
+    wait_after_analysis (int): minimum number of seconds between the start of
+        the analysis of consecutive batches of hashes.
   """
   _RECEIVE_BUFFER_SIZE = 4096
   _SOCKET_TIMEOUT = 3
@@ -37,9 +44,66 @@ class NsrlsvrAnalyzer(hash_tagging.HashAnalyzer):
     """
     super(NsrlsvrAnalyzer, self).__init__(
         hash_queue, hash_analysis_queue, **kwargs)
+    self._connections = []
+    self._connections_lock = threading.Lock()
     self._host = None
     self._port = None
+    self._thread_local = threading.local()
     self.hashes_per_batch = 100
+    self.number_of_concurrent_batches = 4
+
+  def _CloseConnection(self, connection):
+    """Closes a connection to an nsrlsvr instance.
+
+    Args:
+      connection (tuple[socket._socketobject, io.BufferedReader]): socket
+          and buffered reader of a connection to nsrlsvr.
+    """
+    nsrl_socket, nsrl_file_object = connection
+    nsrl_file_object.close()
+    nsrl_socket.close()
+
+    with self._connections_lock:
+      if connection in self._connections:
+        self._connections.remove(connection)
+
+  def _CloseConnections(self):
+    """Closes the connections to the nsrlsvr instance."""
+    with self._connections_lock:
+      connections = list(self._connections)
+
+    for connection in connections:
+      self._CloseConnection(connection)
+
+    logger.debug('Closed connections to {0!s}:{1!s}'.format(
+        self._host, self._port))
+
+    self._thread_local = threading.local()
+
+  def _GetConnection(self):
+    """Retrieves the connection to nsrlsvr of the current thread.
+
+    Returns:
+      tuple[socket._socketobject, io.BufferedReader]: socket and buffered
+          reader of a connection to an nsrlsvr instance or None if
+          a connection cannot be established.
+    """
+    connection = getattr(self._thread_local, 'connection', None)
+    if not connection:
+      logger.debug('Opening connection to {0!s}:{1!s}'.format(
+          self._host, self._port))
+
+      nsrl_socket = self._GetSocket()
+      if not nsrl_socket:
+        return None
+
+      connection = (nsrl_socket, nsrl_socket.makefile('rb'))
+      self._thread_local.connection = connection
+
+      with self._connections_lock:
+        self._connections.append(connection)
+
+    return connection
 
   def _GetSocket(self):
     """Establishes a connection to an nsrlsvr instance.
@@ -56,40 +120,51 @@ class NsrlsvrAnalyzer(hash_tagging.HashAnalyzer):
       logger.error('Unable to connect to nsrlsvr with error: {0!s}.'.format(
           exception))
 
-  def _QueryHash(self, nsrl_socket, digest):
-    """Queries nsrlsvr for a specific hash.
+  def _QueryHashes(self, connection, digests):
+    """Queries nsrlsvr for specific hashes.
 
     Args:
-      nsrl_socket (socket._socketobject): socket of connection to nsrlsvr.
-      digest (str): hash to look up.
+      connection (tuple[socket._socketobject, io.BufferedReader]): socket
+          and buffered reader of a connection to nsrlsvr.
+      digests (list[str]): hashes to look up.
 
     Returns:
-      bool: True if the hash was found, False if not or None on error.
-    """
-    try:
-      query = 'QUERY {0:s}\n'.format(digest).encode('ascii')
-    except UnicodeDecodeError:
-      logger.error('Unable to encode digest: {0!s} to ASCII.'.format(digest))
-      return False
+      list[bool]: for every hash True if the hash was found, False if not or
+          None on error.
 
-    response = None
-
-    try:
-      nsrl_socket.sendall(query)
-      response = nsrl_socket.recv(self._RECEIVE_BUFFER_SIZE)
+    Raises:
+      OSError: if nsrlsvr cannot be queried.
+    """
+    nsrl_socket, nsrl_file_object = connection
+
+    queries = []
+    for digest in digests:
+      try:
+        queries.append('QUERY {0:s}\n'.format(digest).encode('ascii'))
+      except UnicodeEncodeError:
+        logger.error('Unable to encode digest: {0!s} to ASCII.'.format(
+            digest))
+        queries.append(None)
+
+    nsrl_socket.sendall(b''.join([query for query in queries if query]))
+
+    results = []
+    for query in queries:
+      if not query:
+        results.append(False)
+        continue
 
-    except socket.error as exception:
-      logger.error('Unable to query nsrlsvr with error: {0!s}.'.format(
-          exception))
+      response = nsrl_file_object.readline(self._RECEIVE_BUFFER_SIZE)
+      if not response:
+        raise OSError('Connection closed by nsrlsvr.')
 
-    if not response:
-      return False
+      # Strip end-of-line characters since they can differ per platform on
+      # which nsrlsvr is running.
+      response = response.strip()
+      # nsrlsvr returns "OK 1" if the has was found or "OK 0" if not.
+      results.append(response == b'OK 1')
 
-    # Strip end-of-line characters since they can differ per platform on which
-    # nsrlsvr is running.
-    response = response.strip()
-    # nsrlsvr returns "OK 1" if the has was found or "OK 0" if not.
-    return response == b'OK 1'
+    return results
 
   def Analyze(self, hashes):
     """Looks up hashes in nsrlsvr.
@@ -100,29 +175,33 @@ class NsrlsvrAnalyzer(hash_tagging.HashAnalyzer):
     Returns:
       list[HashAnalysis]: analysis results, or an empty list on error.
     """
-    logger.debug('Opening connection to {0:s}:{1:d}'.format(
-        self._host, self._port))
+    results = None
 
-    nsrl_socket = self._GetSocket()
-    if not nsrl_socket:
-      self.SignalAbort()
-      return []
+    # A connection that was kept open can have been closed by nsrlsvr in
+    # the mean time, hence the query is retried once on a new connection.
+    for _ in range(2):
+      connection = self._GetConnection()
+      if not connection:
+        self.SignalAbort()
+        return []
 
-    hash_analyses = []
-    for digest in hashes:
-      response = self._QueryHash(nsrl_socket, digest)
-      if response is None:
-        continue
+      try:
+        results = self._QueryHashes(connection, hashes)
+        break
 
-      hash_analysis = hash_tagging.HashAnalysis(digest, response)
-      hash_analyses.append(hash_analysis)
+      except socket.error as exception:
+        logger.error('Unable to query nsrlsvr with error: {0!s}.'.format(
+            exception))
 
-    nsrl_socket.close()
+        self._thread_local.connection = None
+        self._CloseConnection(connection)
 
-    logger.debug('Closed connection to {0:s}:{1:d}'.format(
-        self._host, self._port))
+    if results is None:
+      return []
 
-    return hash_analyses
+    return [
+        hash_tagging.HashAnalysis(digest, result)
+        for digest, result in zip(hashes, results)]
 
   def SetHost(self, host):
     """Sets the address or hostname of the server running nsrlsvr.
@@ -153,8 +232,15 @@ class NsrlsvrAnalyzer(hash_tagging.HashAnalyzer):
     response = None
     nsrl_socket = self._GetSocket()
     if nsrl_socket:
-      response = self._QueryHash(
-          nsrl_socket, 'd41d8cd98f00b204e9800998ecf8427e')
+      connection = (nsrl_socket, nsrl_socket.makefile('rb'))
+      try:
+        response = self._QueryHashes(
+            connection, ['d41d8cd98f00b204e9800998ecf8427e'])
+      except socket.error as exception:
+        logger.error('Unable to query nsrlsvr with error: {0!s}.'.format(
+            exception))
+
+      connection[1].close()
       nsrl_socket.close()
 
     return response is not None
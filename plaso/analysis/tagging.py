@@ -62,8 +62,20 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
     Returns:
       AnalysisReport: analysis report.
     """
-    report_text = 'Tagging plugin produced {0:d} tags.\n'.format(
-        self._number_of_event_tags)
+    lines_of_text = ['Tagging plugin produced {0:d} tags.'.format(
+        self._number_of_event_tags)]
+
+    if self._tagging_rules:
+      lines_of_text.append('')
+      for label_name, number_of_matches, time_spent in (
+          self._tagging_rules.GetStatistics()):
+        lines_of_text.append((
+            'Label: {0:s} matched: {1:d} events in: {2:.3f} '
+            'seconds').format(label_name, number_of_matches, time_spent))
+
+    lines_of_text.append('')
+    report_text = '\n'.join(lines_of_text)
+
     self._number_of_event_tags = 0
     return reports.AnalysisReport(plugin_name=self.NAME, text=report_text)
 
@@ -90,15 +102,8 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
             'no events will be tagged.')
         return
 
-    matched_label_names = []
-    for label_name, filter_objects in self._tagging_rules.items():
-      for filter_object in filter_objects:
-        # Note that tagging events based on existing labels is currently
-        # not supported.
-        if filter_object.Match(event, event_data, event_data_stream, None):
-          matched_label_names.append(label_name)
-          break
-
+    matched_label_names = self._tagging_rules.GetMatchingLabels(
+        event, event_data, event_data_stream)
     if matched_label_names:
       event_tag = self._CreateEventTag(event, matched_label_names)
 
@@ -112,7 +117,7 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
       tagging_file_path (str): path of the tagging file.
     """
     tag_file = tagging_file.TaggingFile(tagging_file_path)
-    self._tagging_rules = tag_file.GetEventTaggingRules()
+    self._tagging_rules = tag_file.GetEventTaggingRulesIndex()
 
 
 manager.AnalysisPluginManager.RegisterPlugin(TaggingAnalysisPlugin)
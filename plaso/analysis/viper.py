@@ -35,6 +35,7 @@ class ViperAnalyzer(hash_tagging.HTTPHashAnalyzer):
     self._port = None
     self._protocol = None
     self._url = None
+    self.number_of_concurrent_batches = 4
 
   def _QueryHash(self, digest):
     """Queries the Viper Server for a specfic hash.
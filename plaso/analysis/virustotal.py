@@ -15,6 +15,8 @@ class VirusTotalAnalyzer(hash_tagging.HTTPHashAnalyzer):
   _VIRUSTOTAL_API_REPORT_URL = (
       'https://www.virustotal.com/vtapi/v2/file/report')
 
+  _VIRUSTOTAL_ANALYSIS_PENDING_RESPONSE_CODE = -2
+
   _EICAR_SHA256 = (
       '275a021bbfb6489e54d471899f7db9d1663fc695ec2fe2a2c4538aabf651fd0f')
 
@@ -32,6 +34,21 @@ class VirusTotalAnalyzer(hash_tagging.HTTPHashAnalyzer):
         hash_queue, hash_analysis_queue, **kwargs)
     self._api_key = None
     self._checked_for_old_python_version = False
+    self.number_of_concurrent_batches = 4
+
+  def _IsCacheable(self, hash_analysis):
+    """Determines if the result of the analysis of a hash can be cached.
+
+    Args:
+      hash_analysis (HashAnalysis): result of the analysis of a hash.
+
+    Returns:
+      bool: True if the result can be cached.
+    """
+    hash_information = hash_analysis.hash_information or {}
+    response_code = hash_information.get('response_code', None)
+    return response_code not in (
+        None, self._VIRUSTOTAL_ANALYSIS_PENDING_RESPONSE_CODE)
 
   def _QueryHashes(self, digests):
     """Queries VirusTotal for a specfic hashes.
@@ -132,6 +149,7 @@ class VirusTotalAnalysisPlugin(hash_tagging.HashTaggingAnalysisPlugin):
     minute.
     """
     self._analyzer.hashes_per_batch = 4
+    self._analyzer.number_of_concurrent_batches = 1
     self._analyzer.wait_after_analysis = 60
     self._analysis_queue_timeout = self._analyzer.wait_after_analysis + 1
 
@@ -211,6 +211,9 @@ class WindowsServicesAnalysisPlugin(interface.AnalysisPlugin):
 
   NAME = 'windows_services'
 
+  _SUPPORTED_EVENT_DATA_TYPES = frozenset([
+      'windows:registry:service'])
+
   def __init__(self):
     """Initializes the Windows Services plugin."""
     super(WindowsServicesAnalysisPlugin, self).__init__()
@@ -282,7 +285,7 @@ class WindowsServicesAnalysisPlugin(interface.AnalysisPlugin):
       event_data_stream (EventDataStream): event data stream.
     """
     # TODO: Handle event log entries here also (ie, event id 4697).
-    if event_data.data_type != 'windows:registry:service':
+    if event_data.data_type not in self._SUPPORTED_EVENT_DATA_TYPES:
       return
 
     event_data_attributes = event_data.CopyToDict()
@@ -7,6 +7,11 @@ from __future__ import unicode_literals
 import collections
 import math
 
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
 from plaso.analyzers.hashers import interface
 from plaso.analyzers.hashers import manager
 
@@ -22,8 +27,12 @@ class EntropyHasher(interface.BaseHasher):
     """Initializes the entropy hasher."""
     super(EntropyHasher, self).__init__()
     self._byte_frequency_counter = collections.Counter()
+    self._byte_frequency_counts = None
     self._file_length = 0
 
+    if numpy:
+      self._byte_frequency_counts = numpy.zeros(256, dtype=numpy.int64)
+
   def GetStringDigest(self):
     """Calculates the byte entropy value.
 
@@ -37,8 +46,13 @@ class EntropyHasher(interface.BaseHasher):
     if self._file_length == 0:
       return '0.000000'
 
+    if self._byte_frequency_counts is not None:
+      byte_frequencies = self._byte_frequency_counts.tolist()
+    else:
+      byte_frequencies = self._byte_frequency_counter.values()
+
     entropy = 0.0
-    for byte_frequency in self._byte_frequency_counter.values():
+    for byte_frequency in byte_frequencies:
       byte_probability = byte_frequency / self._file_length
       if byte_probability:
         entropy += - byte_probability * math.log(byte_probability, 2)
@@ -54,9 +68,18 @@ class EntropyHasher(interface.BaseHasher):
       data(bytes): block of data with which to update the context of the entropy
           calculator.
     """
-    # The call to update() determines the number of occurrences of a byte value
-    # within data.
-    self._byte_frequency_counter.update(data)
+    if self._byte_frequency_counts is not None:
+      # Count the occurrences of all byte values in the block at once, which
+      # is significantly faster than counting them one byte at a time.
+      byte_values = numpy.frombuffer(data, dtype=numpy.uint8)
+      self._byte_frequency_counts += numpy.bincount(
+          byte_values, minlength=256)
+
+    else:
+      # The call to update() determines the number of occurrences of a byte
+      # value within data.
+      self._byte_frequency_counter.update(data)
+
     self._file_length += len(data)
 
 
@@ -11,9 +11,6 @@ from dfvfs.resolver import context as dfvfs_context
 # The following import makes sure the analyzers are registered.
 from plaso import analyzers  # pylint: disable=unused-import
 
-# The following import makes sure the parsers are registered.
-from plaso import parsers  # pylint: disable=unused-import
-
 from plaso.containers import artifacts
 from plaso.cli import logger
 from plaso.cli import storage_media_tool
@@ -62,6 +59,10 @@ class ExtractionTool(
         input_reader=input_reader, output_writer=output_writer)
     self._artifacts_registry = None
     self._buffer_size = 0
+    self._collect_from_mft = False
+    self._file_system_cache_size = None
+    self._high_memory_worker_memory_limit = None
+    self._maximum_number_of_prefetched_tasks = 1
     self._parser_filter_expression = None
     self._preferred_time_zone = None
     self._preferred_year = None
@@ -73,6 +74,7 @@ class ExtractionTool(
     self._queue_size = self._DEFAULT_QUEUE_SIZE
     self._resolver_context = dfvfs_context.Context()
     self._single_process_mode = False
+    self._skip_unchanged_snapshot_files = False
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
@@ -143,20 +145,37 @@ class ExtractionTool(
           'parser filter expression: {1:s}'.format(
               invalid_parser_names_string, parser_filter_expression))
 
+    # Collection filters are applied by the file system searcher, which
+    # traverses the directories of the file system.
+    collect_from_mft = self._collect_from_mft
+    if collect_from_mft and (self._artifact_filters or self._filter_file):
+      logger.warning(
+          'Collection from $MFT is not supported in combination with a filter '
+          'file or artifact filters.')
+      collect_from_mft = False
+
     # TODO: pass preferred_encoding.
     configuration = configurations.ProcessingConfiguration()
     configuration.artifact_filters = self._artifact_filters
     configuration.credentials = self._credential_configurations
     configuration.debug_output = self._debug_mode
+    configuration.extraction.collect_from_mft = collect_from_mft
     configuration.extraction.hasher_file_size_limit = (
         self._hasher_file_size_limit)
     configuration.extraction.hasher_names_string = self._hasher_names_string
+    if self._file_system_cache_size is not None:
+      configuration.extraction.maximum_number_of_cached_file_systems = (
+          self._file_system_cache_size)
     configuration.extraction.process_archives = self._process_archives
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
+    configuration.extraction.skip_unchanged_snapshot_files = (
+        self._skip_unchanged_snapshot_files)
     configuration.extraction.yara_rules_string = self._yara_rules_string
     configuration.filter_file = self._filter_file
     configuration.log_filename = self._log_file
+    configuration.maximum_number_of_prefetched_tasks = (
+        self._maximum_number_of_prefetched_tasks)
     configuration.parser_filter_expression = parser_filter_expression
     configuration.preferred_year = self._preferred_year
     configuration.profiling.directory = self._profiling_directory
@@ -26,6 +26,24 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--collect_from_mft', '--collect-from-mft', dest='collect_from_mft',
+        action='store_true', default=False, help=(
+            'Collect the file entries of NTFS file systems by reading their '
+            '$MFT sequentially instead of by traversing their directories. '
+            'This can make the collection of large NTFS volumes significantly '
+            'faster. It is ignored when a filter file or artifact filters '
+            'are used.'))
+
+    argument_group.add_argument(
+        '--file_system_cache_size', '--file-system-cache-size',
+        dest='file_system_cache_size', type=int, action='store', default=None,
+        metavar='NUMBER', help=(
+            'Maximum number of file systems, such as those of the volumes '
+            'and snapshots of a storage media image, that a worker process '
+            'keeps open between tasks, where 0 represents that file systems '
+            'are not kept open. The default is 8.'))
+
     argument_group.add_argument(
         '--preferred_year', '--preferred-year', dest='preferred_year',
         type=int, action='store', default=None, metavar='YEAR', help=(
@@ -47,6 +65,16 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
             'Skip processing file content within compressed streams, such as '
             'syslog.gz and syslog.bz2.'))
 
+    argument_group.add_argument(
+        '--skip_unchanged_snapshot_files', '--skip-unchanged-snapshot-files',
+        dest='skip_unchanged_snapshot_files', action='store_true',
+        default=False, help=(
+            'Process a file entry that is stored in multiple volume '
+            'snapshots, such as VSS, only once when its size, modification '
+            'and change time are unchanged. Note that unchanged copies of '
+            'the file entry in the other snapshots will not be represented '
+            'in the output.'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -58,22 +86,41 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: when a configuration parameter fails validation.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
           'Configuration object is not an instance of CLITool')
 
+    collect_from_mft = getattr(options, 'collect_from_mft', False)
+
+    file_system_cache_size = cls._ParseNumericOption(
+        options, 'file_system_cache_size')
+
+    if file_system_cache_size is not None and file_system_cache_size < 0:
+      raise errors.BadConfigOption(
+          'Invalid file system cache size value cannot be less than 0.')
+
     preferred_year = cls._ParseNumericOption(options, 'preferred_year')
 
     process_archives = getattr(options, 'process_archives', False)
     process_compressed_streams = getattr(
         options, 'process_compressed_streams', True)
+    skip_unchanged_snapshot_files = getattr(
+        options, 'skip_unchanged_snapshot_files', False)
 
+    setattr(configuration_object, '_collect_from_mft', collect_from_mft)
+    setattr(
+        configuration_object, '_file_system_cache_size',
+        file_system_cache_size)
     setattr(configuration_object, '_preferred_year', preferred_year)
     setattr(configuration_object, '_process_archives', process_archives)
     setattr(
         configuration_object, '_process_compressed_streams',
         process_compressed_streams)
+    setattr(
+        configuration_object, '_skip_unchanged_snapshot_files',
+        skip_unchanged_snapshot_files)
 
 
 manager.ArgumentHelperManager.RegisterHelper(ExtractionArgumentsHelper)
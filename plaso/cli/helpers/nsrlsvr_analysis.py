@@ -32,6 +32,13 @@ class NsrlsvrAnalysisArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser): group
           to append arguments to.
     """
+    argument_group.add_argument(
+        '--nsrlsvr-cache-file', '--nsrlsvr_cache_file',
+        dest='nsrlsvr_cache_file', type=str, action='store', default=None,
+        metavar='PATH', help=(
+            'Path of a file to cache the nsrlsvr look up results in. Hashes '
+            'with results in the cache file are not looked up again.'))
+
     argument_group.add_argument(
         '--nsrlsvr-hash', '--nsrlsvr_hash', dest='nsrlsvr_hash', type=str,
         action='store', choices=nsrlsvr.NsrlsvrAnalyzer.SUPPORTED_HASHES,
@@ -78,6 +85,10 @@ class NsrlsvrAnalysisArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigObject(
           'Analysis plugin is not an instance of NsrlsvrAnalysisPlugin')
 
+    cache_file = cls._ParseStringOption(options, 'nsrlsvr_cache_file')
+    if cache_file:
+      analysis_plugin.SetCacheFile(cache_file)
+
     label = cls._ParseStringOption(
         options, 'nsrlsvr_label', default_value=cls._DEFAULT_LABEL)
     analysis_plugin.SetLabel(label)
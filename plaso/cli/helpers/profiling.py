@@ -27,7 +27,10 @@ class ProfilingArgumentsHelper(interface.ArgumentsHelper):
       'serializers': 'Profile CPU time of serialization',
       'storage': 'Profile storage reads and writes',
       'task_queue': 'Profile task queue status (multi-processing only)',
-      'tasks': 'Profile the status of tasks (multi-processing only)'}
+      'tasks': 'Profile the status of tasks (multi-processing only)',
+      'trace': (
+          'Write a trace with processing phases, task status and sampled '
+          'Python stacks')}
 
   @classmethod
   def AddArguments(cls, argument_group):
@@ -33,6 +33,20 @@ class StatusViewArgumentsHelper(interface.ArgumentsHelper):
         metavar='TYPE', default=status_view.StatusView.MODE_WINDOW, help=(
             'The processing status view mode: "linear", "none" or "window".'))
 
+    argument_group.add_argument(
+        '--status_file', '--status-file', dest='status_file', type=str,
+        action='store', default=None, metavar='PATH', help=(
+            'Path of a JSON file to which the processing status is written '
+            'periodically, for monitoring.'))
+
+    argument_group.add_argument(
+        '--status_metrics_port', '--status-metrics-port',
+        dest='status_metrics_port', type=int, action='store', default=None,
+        metavar='PORT', help=(
+            'Port of a local HTTP endpoint that publishes the processing '
+            'status, in the Prometheus text format on /metrics and as JSON '
+            'on /status.json, for monitoring.'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -44,6 +58,7 @@ class StatusViewArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: when the status metrics port is invalid.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -53,6 +68,17 @@ class StatusViewArgumentsHelper(interface.ArgumentsHelper):
         options, 'status_view_mode',
         default_value=status_view.StatusView.MODE_WINDOW)
 
+    status_file = cls._ParseStringOption(options, 'status_file')
+
+    status_metrics_port = getattr(options, 'status_metrics_port', None)
+    if status_metrics_port is not None and not (
+        0 <= status_metrics_port <= 65535):
+      raise errors.BadConfigOption(
+          'Invalid status metrics port: {0:d}.'.format(status_metrics_port))
+
+    setattr(configuration_object, '_status_file', status_file)
+    setattr(
+        configuration_object, '_status_metrics_port', status_metrics_port)
     setattr(configuration_object, '_status_view_mode', status_view_mode)
 
 
@@ -32,6 +32,13 @@ class ViperAnalysisArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--viper-cache-file', '--viper_cache_file',
+        dest='viper_cache_file', type=str, action='store', default=None,
+        metavar='PATH', help=(
+            'Path of a file to cache the Viper look up results in. Hashes '
+            'with results in the cache file are not looked up again.'))
+
     argument_group.add_argument(
         '--viper-hash', '--viper_hash', dest='viper_hash', type=str,
         action='store', choices=viper.ViperAnalyzer.SUPPORTED_HASHES,
@@ -82,6 +89,10 @@ class ViperAnalysisArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigObject(
           'Analysis plugin is not an instance of ViperAnalysisPlugin')
 
+    cache_file = cls._ParseStringOption(options, 'viper_cache_file')
+    if cache_file:
+      analysis_plugin.SetCacheFile(cache_file)
+
     lookup_hash = cls._ParseStringOption(
         options, 'viper_hash', default_value=cls._DEFAULT_HASH)
     analysis_plugin.SetLookupHash(lookup_hash)
@@ -38,6 +38,13 @@ class VirusTotalAnalysisArgumentsHelper(interface.ArgumentsHelper):
         metavar='API_KEY', help=(
             'Specify the API key for use with VirusTotal.'))
 
+    argument_group.add_argument(
+        '--virustotal-cache-file', '--virustotal_cache_file',
+        dest='virustotal_cache_file', type=str, action='store', default=None,
+        metavar='PATH', help=(
+            'Path of a file to cache the VirusTotal look up results in. Hashes '
+            'with results in the cache file are not looked up again.'))
+
     argument_group.add_argument(
         '--virustotal-free-rate-limit', '--virustotal_free_rate_limit',
         dest='virustotal_free_rate_limit',
@@ -83,6 +90,10 @@ class VirusTotalAnalysisArgumentsHelper(interface.ArgumentsHelper):
     if enable_rate_limit:
       analysis_plugin.EnableFreeAPIKeyRateLimit()
 
+    cache_file = cls._ParseStringOption(options, 'virustotal_cache_file')
+    if cache_file:
+      analysis_plugin.SetCacheFile(cache_file)
+
     lookup_hash = cls._ParseStringOption(
         options, 'virustotal_hash', default_value=cls._DEFAULT_HASH)
     analysis_plugin.SetLookupHash(lookup_hash)
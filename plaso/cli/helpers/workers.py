@@ -26,6 +26,25 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--high_memory_worker_memory_limit',
+        '--high-memory-worker-memory-limit',
+        dest='high_memory_worker_memory_limit', action='store', type=int,
+        metavar='SIZE', help=(
+            'Maximum amount of memory (data segment and shared memory) '
+            'a high-memory worker process is allowed to consume in bytes. '
+            'The default is no limit.'))
+
+    argument_group.add_argument(
+        '--high_memory_workers', '--high-memory-workers',
+        dest='high_memory_workers', action='store', type=int, default=0,
+        metavar='WORKERS', help=(
+            'Number of high-memory worker processes, which process the '
+            'tasks that exceeded the memory limit of a worker process. Their '
+            'memory limit is set with --high_memory_worker_memory_limit. The '
+            'default is 0, where these tasks are retried by another worker '
+            'process.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -34,7 +53,20 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
             'a worker process is allowed to consume in bytes, where 0 '
             'represents no limit. The default limit is 2147483648 (2 GiB). '
             'If a worker process exceeds this limit it is killed by the main '
-            '(foreman) process.'))
+            '(foreman) process. Before that, when a worker process exceeds '
+            '80 percent of this limit, it writes buffered data, collects '
+            'garbage and hands off the records that remain to be parsed of '
+            'large files to other tasks.'))
+
+    argument_group.add_argument(
+        '--worker_prefetched_tasks', '--worker-prefetched-tasks',
+        dest='worker_prefetched_tasks', action='store', type=int, default=1,
+        metavar='TASKS', help=(
+            'Maximum number of tasks a worker process requests from the task '
+            'queue at once. The default is 1, where tasks are not prefetched. '
+            'Prefetching tasks saves a request to the main (foreman) process '
+            'per task, but a task that is prefetched by a busy worker process '
+            'cannot be processed by an idle one.'))
 
     argument_group.add_argument(
         '--worker_timeout', '--worker-timeout', dest='worker_timeout',
@@ -80,15 +112,47 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid worker memory limit value cannot be less than 0.')
 
+    number_of_high_memory_workers = cls._ParseNumericOption(
+        options, 'high_memory_workers', default_value=0)
+
+    if number_of_high_memory_workers < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of high-memory workers value cannot be less than 0.')
+
+    high_memory_worker_memory_limit = cls._ParseNumericOption(
+        options, 'high_memory_worker_memory_limit')
+
+    if high_memory_worker_memory_limit and high_memory_worker_memory_limit < 0:
+      raise errors.BadConfigOption(
+          'Invalid high-memory worker memory limit value cannot be less '
+          'than 0.')
+
+    worker_prefetched_tasks = cls._ParseNumericOption(
+        options, 'worker_prefetched_tasks', default_value=1)
+
+    if worker_prefetched_tasks < 1:
+      raise errors.BadConfigOption(
+          'Invalid number of worker prefetched tasks value cannot be less '
+          'than 1.')
+
     worker_timeout = cls._ParseNumericOption(options, 'worker_timeout')
 
     if worker_timeout is not None and worker_timeout <= 0.0:
       raise errors.BadConfigOption(
           'Invalid worker timeout value must be larger than 0.0 minutes.')
 
+    setattr(
+        configuration_object, '_high_memory_worker_memory_limit',
+        high_memory_worker_memory_limit)
+    setattr(
+        configuration_object, '_maximum_number_of_prefetched_tasks',
+        worker_prefetched_tasks)
     setattr(
         configuration_object, '_number_of_extraction_workers',
         number_of_extraction_workers)
+    setattr(
+        configuration_object, '_number_of_high_memory_extraction_workers',
+        number_of_high_memory_workers)
     setattr(configuration_object, '_worker_memory_limit', worker_memory_limit)
     setattr(configuration_object, '_worker_timeout', worker_timeout)
 
@@ -8,8 +8,12 @@ import codecs
 import collections
 import io
 import json
+import multiprocessing
 import os
+import signal
+import tempfile
 import textwrap
+import time
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
@@ -29,6 +33,86 @@ from plaso.lib import loggers
 from plaso.lib import specification
 
 
+# Resolver context of an export worker process.
+_worker_resolver_context = None
+
+
+def _InitializeExportWorker():
+  """Initializes an export worker process.
+
+  Every export worker process uses its own resolver context, so that the
+  file systems opened by the worker process are cached between data streams.
+  """
+  global _worker_resolver_context  # pylint: disable=global-statement
+
+  # The main process handles an abort.
+  signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+  _worker_resolver_context = context.Context()
+
+
+def _ExportDataStreamInWorker(data_stream_export):
+  """Exports a data stream in an export worker process.
+
+  Args:
+    data_stream_export (DataStreamExport): data stream export.
+
+  Returns:
+    DataStreamExport: data stream export.
+  """
+  # pylint: disable=protected-access
+  return ImageExportTool._WriteDataStreamExport(
+      data_stream_export, _worker_resolver_context)
+
+
+class DataStreamExport(object):
+  """Data stream to export.
+
+  Attributes:
+    data_stream_name (str): name of the data stream.
+    digest (str): hexadecimal representation of the SHA-256 digest of
+        the content of the data stream or None if not exported.
+    display_name (str): display name of the file entry.
+    error (str): error that occurred while exporting the data stream or None
+        if no error occurred.
+    path_spec (dfvfs.PathSpec): path specification of the file entry that
+        contains the data stream.
+    size (int): number of bytes exported.
+    target_directory (str): path of the directory of the exported file.
+    target_filename (str): name of the exported file.
+    temporary_directory (str): path of the directory for the temporary file.
+    temporary_path (str): path of the temporary file that contains the content
+        of the data stream or None if not exported.
+  """
+
+  def __init__(
+      self, path_spec, data_stream_name, display_name, target_directory,
+      target_filename, temporary_directory):
+    """Initializes a data stream export.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file entry that
+          contains the data stream.
+      data_stream_name (str): name of the data stream.
+      display_name (str): display name of the file entry.
+      target_directory (str): path of the directory of the exported file.
+      target_filename (str): name of the exported file.
+      temporary_directory (str): path of the directory for the temporary file,
+          which should be on the same file system as the target directory.
+    """
+    super(DataStreamExport, self).__init__()
+    self.data_stream_name = data_stream_name
+    self.digest = None
+    self.display_name = display_name
+    self.error = None
+    self.path_spec = path_spec
+    self.size = 0
+    self.target_directory = target_directory
+    self.target_filename = target_filename
+    self.temporary_directory = temporary_directory
+    self.temporary_path = None
+
+
 class ImageExportTool(storage_media_tool.StorageMediaTool):
   """Class that implements the image export CLI tool.
 
@@ -71,6 +155,17 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
   _HASHES_FILENAME = 'hashes.json'
 
+  # Number of data stream exports that are passed to an export worker process
+  # at once.
+  _EXPORT_WORKER_CHUNK_SIZE = 16
+
+  _MAXIMUM_NUMBER_OF_WORKERS = 15
+
+  # Number of seconds between progress updates.
+  _PROGRESS_UPDATE_INTERVAL = 10.0
+
+  _TEMPORARY_FILE_PREFIX = '.image_export-'
+
   def __init__(self, input_reader=None, output_writer=None):
     """Initializes the CLI tool object.
 
@@ -91,47 +186,21 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     self._digests = {}
     self._filter_collection = file_entry_filters.FileEntryFilterCollection()
     self._filter_file = None
+    self._last_progress_update_time = 0.0
+    self._number_of_exported_bytes = 0
+    self._number_of_exported_files = 0
+    self._number_of_workers = 1
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_memory_limit = None
     self._paths_by_hash = collections.defaultdict(list)
     self._resolver_context = context.Context()
     self._skip_duplicates = True
     self._source_type = None
+    self._start_time = None
 
     self.has_filters = False
     self.list_signature_identifiers = False
 
-  def _CalculateDigestHash(self, file_entry, data_stream_name):
-    """Calculates a SHA-256 digest of the contents of the file entry.
-
-    Args:
-      file_entry (dfvfs.FileEntry): file entry whose content will be hashed.
-      data_stream_name (str): name of the data stream whose content is to be
-          hashed.
-
-    Returns:
-      str: hexadecimal representation of the SHA-256 hash or None if the digest
-          cannot be determined.
-    """
-    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
-    if not file_object:
-      return None
-
-    try:
-      file_object.seek(0, os.SEEK_SET)
-
-      hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
-
-      data = file_object.read(self._READ_BUFFER_SIZE)
-      while data:
-        hasher_object.Update(data)
-        data = file_object.read(self._READ_BUFFER_SIZE)
-
-    finally:
-      file_object.close()
-
-    return hasher_object.GetStringDigest()
-
   def _CreateSanitizedDestination(
       self, source_file_entry, source_path_spec, source_data_stream_name,
       destination_path):
@@ -185,110 +254,31 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     return target_directory, target_filename
 
-  def _ExtractDataStream(
-      self, file_entry, data_stream_name, destination_path,
-      skip_duplicates=True):
-    """Extracts a data stream.
+  def _CreateDataStreamExport(
+      self, file_entry, data_stream_name, destination_path):
+    """Creates a data stream export.
 
     Args:
       file_entry (dfvfs.FileEntry): file entry containing the data stream.
       data_stream_name (str): name of the data stream.
       destination_path (str): path where the extracted files should be stored.
-      skip_duplicates (Optional[bool]): True if files with duplicate content
-          should be skipped.
+
+    Returns:
+      DataStreamExport: data stream export or None if the file entry has
+          no data stream to export.
     """
     if not data_stream_name and not file_entry.IsFile():
-      return
+      return None
 
     display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
         file_entry.path_spec)
 
-    try:
-      digest = self._CalculateDigestHash(file_entry, data_stream_name)
-    except (IOError, dfvfs_errors.BackEndError) as exception:
-      logger.error((
-          '[skipping] unable to read content of file entry: {0:s} '
-          'with error: {1!s}').format(display_name, exception))
-      return
-
-    if not digest:
-      logger.error(
-          '[skipping] unable to read content of file entry: {0:s}'.format(
-              display_name))
-      return
-
     target_directory, target_filename = self._CreateSanitizedDestination(
         file_entry, file_entry.path_spec, data_stream_name, destination_path)
 
-    # If does not exist, append path separator to have consistant behaviour.
-    if not destination_path.endswith(os.path.sep):
-      destination_path = destination_path + os.path.sep
-
-    target_path = os.path.join(target_directory, target_filename)
-    if target_path.startswith(destination_path):
-      path = target_path[len(destination_path):]
-
-    self._paths_by_hash[digest].append(path)
-
-    if skip_duplicates:
-      duplicate_display_name = self._digests.get(digest, None)
-      if duplicate_display_name:
-        logger.warning((
-            '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
-            'digest: {2:s}').format(
-                display_name, duplicate_display_name, digest))
-        return
-
-      self._digests[digest] = display_name
-
-    if not os.path.isdir(target_directory):
-      os.makedirs(target_directory)
-
-    if os.path.exists(target_path):
-      logger.warning((
-          '[skipping] unable to export contents of file entry: {0:s} '
-          'because exported file: {1:s} already exists.').format(
-              display_name, target_path))
-      return
-
-    try:
-      self._WriteFileEntry(file_entry, data_stream_name, target_path)
-    except (IOError, dfvfs_errors.BackEndError) as exception:
-      logger.error((
-          '[skipping] unable to export contents of file entry: {0:s} '
-          'with error: {1!s}').format(display_name, exception))
-
-      try:
-        os.remove(target_path)
-      except (IOError, OSError):
-        pass
-
-  def _ExtractFileEntry(
-      self, file_entry, destination_path, skip_duplicates=True):
-    """Extracts a file entry.
-
-    Args:
-      file_entry (dfvfs.FileEntry): file entry whose content is to be written.
-      destination_path (str): path where the extracted files should be stored.
-      skip_duplicates (Optional[bool]): True if files with duplicate content
-          should be skipped.
-    """
-    if not self._filter_collection.Matches(file_entry):
-      return
-
-    file_entry_processed = False
-    for data_stream in file_entry.data_streams:
-      if self._abort:
-        break
-      self._ExtractDataStream(
-          file_entry, data_stream.name, destination_path,
-          skip_duplicates=skip_duplicates)
-
-      file_entry_processed = True
-
-    if not file_entry_processed:
-      self._ExtractDataStream(
-          file_entry, '', destination_path, skip_duplicates=skip_duplicates)
+    return DataStreamExport(
+        file_entry.path_spec, data_stream_name, display_name,
+        target_directory, target_filename, destination_path)
 
   # TODO: merge with collector and/or engine.
   def _Extract(
@@ -300,6 +290,13 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     This method runs the file extraction process on the image and
     potentially on every VSS if that is wanted.
 
+    The content of every data stream is read once, to both calculate its
+    digest and copy it into a temporary file, which is renamed to the exported
+    file or removed if the content is a duplicate. If more than one worker
+    process is used, the data streams are copied by the worker processes while
+    the main process determines the file entries to export and which of
+    the data streams are duplicates.
+
     Args:
       source_path_specs (list[dfvfs.PathSpec]): path specifications to extract.
       destination_path (str): path where the extracted files should be stored.
@@ -315,6 +312,7 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     Raises:
       BadConfigOption: if an invalid collection filter was specified.
+      KeyboardInterrupt: if the export was interrupted.
     """
     extraction_engine = engine.BaseEngine()
 
@@ -334,18 +332,167 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     filters_helper = extraction_engine.collection_filters_helper
 
-    excluded_find_specs = None
+    excluded_path_filter = None
     included_find_specs = None
     if filters_helper:
-      excluded_find_specs = filters_helper.excluded_file_system_find_specs
+      excluded_path_filter = filters_helper.excluded_file_system_path_filter
       included_find_specs = filters_helper.included_file_system_find_specs
 
     output_writer.Write('Extracting file entries.\n')
+
+    data_stream_exports = self._GetDataStreamExports(
+        source_path_specs, destination_path,
+        excluded_path_filter=excluded_path_filter,
+        included_find_specs=included_find_specs)
+
+    number_of_workers = self._GetNumberOfWorkers()
+    if number_of_workers > 1:
+      logger.debug('Exporting with {0:d} worker processes.'.format(
+          number_of_workers))
+
+    worker_pool = None
+
+    try:
+      if number_of_workers <= 1:
+        for data_stream_export in data_stream_exports:
+          data_stream_export = self._WriteDataStreamExport(
+              data_stream_export, self._resolver_context)
+          self._FinalizeDataStreamExport(
+              data_stream_export, destination_path,
+              skip_duplicates=skip_duplicates)
+          self._UpdateProgress(output_writer)
+
+      else:
+        worker_pool = multiprocessing.Pool(
+            processes=number_of_workers, initializer=_InitializeExportWorker)
+
+        # The results are returned in the order of the data stream exports,
+        # so that which of the data streams is considered the duplicate is
+        # the same as when exporting with a single process.
+        for data_stream_export in worker_pool.imap(
+            _ExportDataStreamInWorker, data_stream_exports,
+            chunksize=self._EXPORT_WORKER_CHUNK_SIZE):
+          self._FinalizeDataStreamExport(
+              data_stream_export, destination_path,
+              skip_duplicates=skip_duplicates)
+          self._UpdateProgress(output_writer)
+
+        worker_pool.close()
+
+    except KeyboardInterrupt:
+      self._abort = True
+      if worker_pool:
+        worker_pool.terminate()
+      raise
+
+    finally:
+      if worker_pool:
+        worker_pool.join()
+
+      # Temporary files of data streams that were being written when
+      # the export was interrupted are left behind otherwise.
+      self._RemoveTemporaryFiles(destination_path)
+
+  def _FinalizeDataStreamExport(
+      self, data_stream_export, destination_path, skip_duplicates=True):
+    """Finalizes a data stream export.
+
+    Moves the temporary file of the data stream export to the exported file
+    or removes it if the content of the data stream is a duplicate.
+
+    Args:
+      data_stream_export (DataStreamExport): data stream export.
+      destination_path (str): path where the extracted files should be stored.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    display_name = data_stream_export.display_name
+    digest = data_stream_export.digest
+
+    if not digest:
+      if data_stream_export.error:
+        logger.error((
+            '[skipping] unable to read content of file entry: {0:s} '
+            'with error: {1:s}').format(display_name, data_stream_export.error))
+      else:
+        logger.error(
+            '[skipping] unable to read content of file entry: {0:s}'.format(
+                display_name))
+
+      self._RemoveTemporaryFile(data_stream_export)
+      return
+
+    # If does not exist, append path separator to have consistant behaviour.
+    if not destination_path.endswith(os.path.sep):
+      destination_path = destination_path + os.path.sep
+
+    target_path = os.path.join(
+        data_stream_export.target_directory,
+        data_stream_export.target_filename)
+    if target_path.startswith(destination_path):
+      path = target_path[len(destination_path):]
+
+    self._paths_by_hash[digest].append(path)
+
+    if skip_duplicates:
+      duplicate_display_name = self._digests.get(digest, None)
+      if duplicate_display_name:
+        logger.warning((
+            '[skipping] file entry: {0:s} is a duplicate of: {1:s} with '
+            'digest: {2:s}').format(
+                display_name, duplicate_display_name, digest))
+        self._RemoveTemporaryFile(data_stream_export)
+        return
+
+      self._digests[digest] = display_name
+
+    if not os.path.isdir(data_stream_export.target_directory):
+      os.makedirs(data_stream_export.target_directory)
+
+    if os.path.exists(target_path):
+      logger.warning((
+          '[skipping] unable to export contents of file entry: {0:s} '
+          'because exported file: {1:s} already exists.').format(
+              display_name, target_path))
+      self._RemoveTemporaryFile(data_stream_export)
+      return
+
+    try:
+      os.rename(data_stream_export.temporary_path, target_path)
+    except OSError as exception:
+      logger.error((
+          '[skipping] unable to export contents of file entry: {0:s} '
+          'with error: {1!s}').format(display_name, exception))
+      self._RemoveTemporaryFile(data_stream_export)
+      return
+
+    self._number_of_exported_bytes += data_stream_export.size
+    self._number_of_exported_files += 1
+
+  def _GetDataStreamExports(
+      self, source_path_specs, destination_path, excluded_path_filter=None,
+      included_find_specs=None):
+    """Retrieves the data streams to export.
+
+    Args:
+      source_path_specs (list[dfvfs.PathSpec]): path specifications to extract.
+      destination_path (str): path where the extracted files should be stored.
+      excluded_path_filter (Optional[PathFilterTrie]): paths of the file
+          entries to exclude.
+      included_find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
+          of the file entries to include.
+
+    Yields:
+      DataStreamExport: data stream export.
+    """
     path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
         source_path_specs, find_specs=included_find_specs,
         resolver_context=self._resolver_context)
 
     for path_spec in path_spec_generator:
+      if self._abort:
+        break
+
       file_entry = path_spec_resolver.Resolver.OpenFileEntry(
           path_spec, resolver_context=self._resolver_context)
 
@@ -355,18 +502,66 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         continue
 
       skip_file_entry = False
-      for find_spec in excluded_find_specs or []:
-        skip_file_entry = find_spec.CompareLocation(file_entry)
-        if skip_file_entry:
-          break
+      location = getattr(file_entry.path_spec, 'location', None)
+      if (location and excluded_path_filter and
+          excluded_path_filter.number_of_paths):
+        file_system = file_entry.GetFileSystem()
+        path_segments = file_system.SplitPath(location)
+        skip_file_entry = excluded_path_filter.CheckPathSegments(path_segments)
 
       if skip_file_entry:
         logger.info('Skipped: {0:s} because of exclusion filter.'.format(
             file_entry.path_spec.location))
         continue
 
-      self._ExtractFileEntry(
-          file_entry, destination_path, skip_duplicates=skip_duplicates)
+      for data_stream_export in self._GetFileEntryDataStreamExports(
+          file_entry, destination_path):
+        yield data_stream_export
+
+  def _GetFileEntryDataStreamExports(self, file_entry, destination_path):
+    """Retrieves the data streams of a file entry to export.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+      destination_path (str): path where the extracted files should be stored.
+
+    Returns:
+      list[DataStreamExport]: data stream exports.
+    """
+    if not self._filter_collection.Matches(file_entry):
+      return []
+
+    data_stream_names = [
+        data_stream.name for data_stream in file_entry.data_streams]
+    if not data_stream_names:
+      data_stream_names = ['']
+
+    data_stream_exports = []
+    for data_stream_name in data_stream_names:
+      data_stream_export = self._CreateDataStreamExport(
+          file_entry, data_stream_name, destination_path)
+      if data_stream_export:
+        data_stream_exports.append(data_stream_export)
+
+    return data_stream_exports
+
+  def _GetNumberOfWorkers(self):
+    """Retrieves the number of export worker processes.
+
+    Returns:
+      int: number of export worker processes, where 1 represents the data
+          streams are exported by the main process.
+    """
+    if self._number_of_workers:
+      return self._number_of_workers
+
+    # One worker for each "available" CPU, minus the main process.
+    try:
+      number_of_workers = multiprocessing.cpu_count() - 1
+    except NotImplementedError:
+      number_of_workers = 1
+
+    return max(1, min(number_of_workers, self._MAXIMUM_NUMBER_OF_WORKERS))
 
   def _ParseExtensionsString(self, extensions_string):
     """Parses the extensions string.
@@ -536,34 +731,152 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     return specification_store
 
-  def _WriteFileEntry(self, file_entry, data_stream_name, destination_file):
+  def _RemoveTemporaryFile(self, data_stream_export):
+    """Removes the temporary file of a data stream export.
+
+    Args:
+      data_stream_export (DataStreamExport): data stream export.
+    """
+    if data_stream_export.temporary_path:
+      try:
+        os.remove(data_stream_export.temporary_path)
+      except (IOError, OSError):
+        pass
+
+      data_stream_export.temporary_path = None
+
+  def _RemoveTemporaryFiles(self, destination_path):
+    """Removes the temporary files of data stream exports.
+
+    Args:
+      destination_path (str): path where the extracted files should be stored.
+    """
+    try:
+      filenames = os.listdir(destination_path)
+    except OSError:
+      return
+
+    for filename in filenames:
+      if filename.startswith(self._TEMPORARY_FILE_PREFIX):
+        try:
+          os.remove(os.path.join(destination_path, filename))
+        except OSError:
+          pass
+
+  def _UpdateProgress(self, output_writer, force=False):
+    """Writes the progress of the export if the update interval passed.
+
+    Args:
+      output_writer (CLIOutputWriter): output writer.
+      force (Optional[bool]): True if the progress should be written regardless
+          of the update interval.
+    """
+    if self._quiet_mode:
+      return
+
+    current_time = time.time()
+    if self._start_time is None:
+      self._start_time = current_time
+      self._last_progress_update_time = current_time
+
+    if not force and current_time < (
+        self._last_progress_update_time + self._PROGRESS_UPDATE_INTERVAL):
+      return
+
+    self._last_progress_update_time = current_time
+
+    elapsed_time = current_time - self._start_time
+    throughput = 0
+    if elapsed_time > 0.0:
+      throughput = int(self._number_of_exported_bytes / elapsed_time)
+
+    output_writer.Write((
+        'Exported: {0:d} files ({1:s}) in {2:.1f} seconds ({3:s}/s).\n').format(
+            self._number_of_exported_files,
+            self._FormatHumanReadableSize(self._number_of_exported_bytes),
+            elapsed_time, self._FormatHumanReadableSize(throughput)))
+
+  @classmethod
+  def _WriteDataStreamExport(cls, data_stream_export, resolver_context):
+    """Writes the content of a data stream export to a temporary file.
+
+    Args:
+      data_stream_export (DataStreamExport): data stream export.
+      resolver_context (dfvfs.Context): resolver context.
+
+    Returns:
+      DataStreamExport: data stream export with the digest and temporary path
+          set if the content was written.
+    """
+    try:
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+          data_stream_export.path_spec, resolver_context=resolver_context)
+      if not file_entry:
+        return data_stream_export
+
+      file_descriptor, data_stream_export.temporary_path = tempfile.mkstemp(
+          dir=data_stream_export.temporary_directory,
+          prefix=cls._TEMPORARY_FILE_PREFIX)
+      os.close(file_descriptor)
+
+      data_stream_export.digest, data_stream_export.size = (
+          cls._WriteFileEntry(
+              file_entry, data_stream_export.data_stream_name,
+              data_stream_export.temporary_path))
+
+    except (IOError, OSError, dfvfs_errors.BackEndError) as exception:
+      data_stream_export.digest = None
+      data_stream_export.error = '{0!s}'.format(exception)
+
+    return data_stream_export
+
+  @classmethod
+  def _WriteFileEntry(cls, file_entry, data_stream_name, destination_file):
     """Writes the contents of the source file entry to a destination file.
 
-    Note that this function will overwrite an existing file.
+    The SHA-256 digest of the contents is calculated while it is written, so
+    that the contents is read only once. Note that this function will
+    overwrite an existing file.
 
     Args:
       file_entry (dfvfs.FileEntry): file entry whose content is to be written.
       data_stream_name (str): name of the data stream whose content is to be
           written.
       destination_file (str): path of the destination file.
+
+    Returns:
+      tuple[str, int]: hexadecimal representation of the SHA-256 digest and
+          number of bytes of the contents, or None and 0 if the data stream
+          cannot be opened.
+
+    Raises:
+      IOError: if the contents cannot be read or written.
+      OSError: if the contents cannot be read or written.
     """
     source_file_object = file_entry.GetFileObject(
         data_stream_name=data_stream_name)
     if not source_file_object:
-      return
+      return None, 0
+
+    hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
+    size = 0
 
     try:
       with open(destination_file, 'wb') as destination_file_object:
         source_file_object.seek(0, os.SEEK_SET)
 
-        data = source_file_object.read(self._COPY_BUFFER_SIZE)
+        data = source_file_object.read(cls._COPY_BUFFER_SIZE)
         while data:
+          hasher_object.Update(data)
           destination_file_object.write(data)
-          data = source_file_object.read(self._COPY_BUFFER_SIZE)
+          size += len(data)
+          data = source_file_object.read(cls._COPY_BUFFER_SIZE)
 
     finally:
       source_file_object.close()
 
+    return hasher_object.GetStringDigest(), size
+
   def AddFilterOptions(self, argument_group):
     """Adds the filter options to the argument group.
 
@@ -670,6 +983,14 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
             'exported files and duplicates are skipped. Use this option to '
             'include duplicate files in the export.'))
 
+    argument_parser.add_argument(
+        '--workers', dest='workers', action='store', type=int, default=1,
+        help=(
+            'Number of worker processes that export files. The default is 1, '
+            'which exports the files in the main process. Use 0 for the '
+            'number of available system CPUs minus one, for the main '
+            'process.'))
+
     argument_parser.add_argument(
         self._SOURCE_OPTION, nargs='?', action='store', metavar='IMAGE',
         default=None, type=str, help=(
@@ -765,6 +1086,18 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     include_duplicates = getattr(options, 'include_duplicates', False)
     self._skip_duplicates = not include_duplicates
 
+    self._number_of_workers = getattr(options, 'workers', None)
+    if self._number_of_workers is None:
+      self._number_of_workers = 1
+
+    if not isinstance(self._number_of_workers, int):
+      raise errors.BadConfigOption(
+          'Unsupported number of workers value integer type required.')
+
+    if self._number_of_workers < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of workers value cannot be less than 0.')
+
     self._EnforceProcessMemoryLimit(self._process_memory_limit)
 
   def PrintFilterCollection(self):
@@ -787,12 +1120,17 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     if not os.path.isdir(self._destination_path):
       os.makedirs(self._destination_path)
 
+    self._start_time = time.time()
+    self._last_progress_update_time = self._start_time
+
     self._Extract(
         self._source_path_specs, self._destination_path,
         self._output_writer, self._artifact_filters, self._filter_file,
         self._artifact_definitions_path, self._custom_artifacts_path,
         skip_duplicates=self._skip_duplicates)
 
+    self._UpdateProgress(self._output_writer, force=True)
+
     json_data = []
 
     with open(os.path.join(
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import argparse
+import os
 import sys
 import time
 import textwrap
@@ -23,6 +24,7 @@ from plaso.cli import tools
 from plaso.cli import views
 from plaso.cli.helpers import manager as helpers_manager
 from plaso.engine import engine
+from plaso.engine import processed_sources
 from plaso.engine import single_process as single_process_engine
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -91,11 +93,16 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         input_reader=input_reader, output_writer=output_writer)
     self._command_line_arguments = None
     self._enable_sigsegv_handler = False
+    self._incremental = False
     self._number_of_extraction_workers = 0
+    self._number_of_high_memory_extraction_workers = 0
     self._storage_serializer_format = definitions.SERIALIZER_FORMAT_JSON
     self._source_type = None
+    self._status_file = None
+    self._status_metrics_port = None
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
+    self._store_event_sources = True
     self._stdout_output_writer = isinstance(
         self._output_writer, tools.StdoutOutputWriter)
 
@@ -130,6 +137,32 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
 
     return return_dict
 
+  def _ReadProcessedEventSources(self):
+    """Reads the event sources processed by previous extraction sessions.
+
+    Returns:
+      ProcessedEventSources: event sources processed by previous extraction
+          sessions.
+
+    Raises:
+      BadConfigOption: if the storage file cannot be read.
+    """
+    storage_reader = (
+        storage_factory.StorageFactory.CreateStorageReaderForFile(
+            self._storage_file_path))
+    if not storage_reader:
+      raise errors.BadConfigOption(
+          'Unable to read processed event sources from storage file: '
+          '{0:s}'.format(self._storage_file_path))
+
+    processed_event_sources = processed_sources.ProcessedEventSources()
+    try:
+      processed_event_sources.ReadFromStorage(storage_reader)
+    finally:
+      storage_reader.Close()
+
+    return processed_event_sources
+
   def ParseArguments(self, arguments):
     """Parses the command line arguments.
 
@@ -224,6 +257,24 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
         storage_group, names=['storage_format'])
 
+    storage_group.add_argument(
+        '--incremental', '--resume', dest='incremental', action='store_true',
+        default=False, help=(
+            'Only process the event sources that were not processed by '
+            'a previous extraction into the same storage file, or that '
+            'changed since. Use to resume an aborted extraction or to '
+            'extract from a source that was extended. Event sources that '
+            'were abandoned by a previous extraction are retried.'))
+
+    storage_group.add_argument(
+        '--no_event_source_storage', '--no-event-source-storage',
+        dest='store_event_sources', action='store_false', default=True,
+        help=(
+            'Do not store the event sources in the storage file. Event '
+            'sources are scheduled from memory in multi process mode and only '
+            'their number is recorded. Processed event sources are still '
+            'stored so that the extraction can be resumed.'))
+
     argument_parser.add_argument(
         self._SOURCE_OPTION, action='store', metavar='SOURCE', nargs='?',
         default=None, type=str, help=(
@@ -344,6 +395,8 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         options, self, names=['status_view'])
 
     self._enable_sigsegv_handler = getattr(options, 'sigsegv_handler', False)
+    self._incremental = getattr(options, 'incremental', False)
+    self._store_event_sources = getattr(options, 'store_event_sources', True)
 
     self._EnforceProcessMemoryLimit(self._process_memory_limit)
 
@@ -367,6 +420,10 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         self._source_path, self._source_type,
         artifact_filters=self._artifact_filters,
         filter_file=self._filter_file)
+    self._status_view.StartStatusMetrics(
+        http_port=self._status_metrics_port,
+        status_file_path=self._status_file,
+        storage_file_path=self._storage_file_path)
 
     status_update_callback = (
         self._status_view.GetExtractionStatusUpdateCallback())
@@ -400,6 +457,10 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
       extraction_engine = single_process_engine.SingleProcessEngine()
     else:
       extraction_engine = multi_process_engine.TaskMultiProcessEngine(
+          high_memory_worker_memory_limit=(
+              self._high_memory_worker_memory_limit),
+          number_of_high_memory_worker_processes=(
+              self._number_of_high_memory_extraction_workers),
           number_of_worker_processes=self._number_of_extraction_workers,
           worker_memory_limit=self._worker_memory_limit,
           worker_timeout=self._worker_timeout)
@@ -429,6 +490,23 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
           'Unable to build collection filters with error: {0!s}'.format(
               exception))
 
+    processed_event_sources = None
+    if self._incremental and os.path.isfile(self._storage_file_path):
+      if single_process_mode:
+        logger.warning((
+            'Incremental extraction is not supported in single process mode, '
+            'all event sources are processed.'))
+      else:
+        processed_event_sources = self._ReadProcessedEventSources()
+
+    if not self._store_event_sources:
+      if single_process_mode:
+        logger.warning((
+            'Event sources are always stored in single process mode, since '
+            'they are read back from the storage file.'))
+      else:
+        storage_writer.SetStoreEventSources(False)
+
     processing_status = None
     if single_process_mode:
       logger.debug('Starting extraction in single process mode.')
@@ -444,8 +522,10 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
       processing_status = extraction_engine.ProcessSources(
           session, self._source_path_specs, storage_writer,
           configuration, enable_sigsegv_handler=self._enable_sigsegv_handler,
+          processed_event_sources=processed_event_sources,
           status_update_callback=status_update_callback)
 
+    self._status_view.StopStatusMetrics(processing_status)
     self._status_view.PrintExtractionSummary(processing_status)
 
   def ShowInfo(self):
@@ -80,9 +80,12 @@ class PsortTool(
     self._event_filter = None
     self._knowledge_base = knowledge_base.KnowledgeBase()
     self._number_of_analysis_reports = 0
+    self._number_of_export_processes = 0
     self._output_time_zone = None
     self._preferred_language = 'en-US'
     self._process_memory_limit = None
+    self._status_file = None
+    self._status_metrics_port = None
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._stdout_output_writer = isinstance(
@@ -236,6 +239,13 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.ParseOptions(
         options, self, names=argument_helper_names)
 
+    number_of_export_processes = getattr(options, 'export_workers', None) or 0
+
+    if number_of_export_processes < 0:
+      raise errors.BadConfigOption((
+          'Invalid number of export workers: {0:d}, value must be 0 or '
+          'greater.').format(number_of_export_processes))
+
     worker_memory_limit = getattr(options, 'worker_memory_limit', None)
 
     if worker_memory_limit and worker_memory_limit < 0:
@@ -250,6 +260,7 @@ class PsortTool(
           'Invalid worker timeout: {0:f}, value must be greater than '
           '0.0 minutes.').format(worker_timeout))
 
+    self._number_of_export_processes = number_of_export_processes
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
@@ -300,6 +311,16 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
         argument_group, names=argument_helper_names)
 
+    argument_group.add_argument(
+        '--export_workers', '--export-workers', dest='export_workers',
+        action='store', type=int, default=0, metavar='WORKERS', help=(
+            'Maximum number of worker processes that export events in '
+            'parallel, each exporting the events of a different time range. '
+            'The default is 0, which represents that the events are exported '
+            'by the main process. Only output formats that write events per '
+            'line, such as dynamic, json_line and l2tcsv, can be exported in '
+            'parallel and only if no time slice or filter limit is used.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -517,6 +538,11 @@ class PsortTool(
     self._status_view.SetMode(self._status_view_mode)
     self._status_view.SetStorageFileInformation(self._storage_file_path)
 
+    self._status_view.StartStatusMetrics(
+        http_port=self._status_metrics_port,
+        status_file_path=self._status_file,
+        storage_file_path=self._storage_file_path)
+
     status_update_callback = (
         self._status_view.GetAnalysisStatusUpdateCallback())
 
@@ -550,9 +576,11 @@ class PsortTool(
     configuration.data_location = self._data_location
     configuration.debug_output = self._debug_mode
     configuration.log_filename = self._log_file
+    configuration.number_of_export_processes = self._number_of_export_processes
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.sample_rate = self._profiling_sample_rate
     configuration.profiling.profilers = self._profilers
+    configuration.storage_file_path = self._storage_file_path
 
     analysis_counter = None
     if self._analysis_plugins:
@@ -597,6 +625,8 @@ class PsortTool(
           status_update_callback=status_update_callback,
           time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
 
+    self._status_view.StopStatusMetrics()
+
     if self._quiet_mode:
       return
 
@@ -109,13 +109,19 @@ class PstealTool(
     self._knowledge_base = knowledge_base.KnowledgeBase()
     self._number_of_analysis_reports = 0
     self._number_of_extraction_workers = 0
+    self._number_of_high_memory_extraction_workers = 0
+    self._number_of_streamed_events = 0
     self._output_format = None
+    self._output_streamed = False
     self._output_time_zone = None
     self._parsers_manager = parsers_manager.ParsersManager
     self._preferred_language = 'en-US'
     self._preferred_year = None
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
+    self._status_file = None
+    self._status_metrics_port = None
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
+    self._stream_output = False
     self._time_slice = None
     self._use_time_slicer = False
 
@@ -156,6 +162,47 @@ class PstealTool(
 
     return '{0:s}-{1:s}.plaso'.format(datetime_string, source_name)
 
+  def _StartOutputStream(self, knowledge_base_object, session):
+    """Starts streaming events to the output module during extraction.
+
+    Args:
+      knowledge_base_object (KnowledgeBase): knowledge base of the extraction,
+          which contains the information determined by preprocessing.
+      session (Session): session in which the sources are processed.
+    """
+    # The output mediator uses the knowledge base of the tool, which normally
+    # is populated from the storage file after extraction.
+    for source_configuration in (
+        knowledge_base_object.GetSourceConfigurationArtifacts()):
+      self._knowledge_base.ReadSystemConfigurationArtifact(
+          source_configuration.system_configuration,
+          session_identifier=session.identifier)
+
+    self._knowledge_base.SetTextPrepend(session.text_prepend)
+
+    self._number_of_streamed_events = 0
+
+    self._output_module.Open()
+    self._output_module.WriteHeader()
+
+  def _StopOutputStream(self):
+    """Stops streaming events to the output module."""
+    self._output_module.WriteFooter()
+    self._output_module.Close()
+
+    self._output_streamed = True
+
+  def _WriteMergedEvent(self, event, event_data, event_data_stream):
+    """Writes an event that was merged into the storage to the output module.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+    """
+    self._output_module.WriteEvent(event, event_data, event_data_stream, None)
+    self._number_of_streamed_events += 1
+
   def _ParseOutputTimeZoneOption(self, options):
     """Parses the output time zone options.
 
@@ -243,9 +290,16 @@ class PstealTool(
         self._knowledge_base)
 
     counter = collections.Counter()
-    if self._output_format != 'null':
+    if self._output_streamed:
+      counter['Streamed events'] = self._number_of_streamed_events
+
+    elif self._output_format != 'null':
       self._status_view.SetMode(self._status_view_mode)
       self._status_view.SetStorageFileInformation(self._storage_file_path)
+      self._status_view.StartStatusMetrics(
+          http_port=self._status_metrics_port,
+          status_file_path=self._status_file,
+          storage_file_path=self._storage_file_path)
 
       status_update_callback = (
           self._status_view.GetAnalysisStatusUpdateCallback())
@@ -265,6 +319,8 @@ class PstealTool(
           status_update_callback=status_update_callback,
           time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
 
+      self._status_view.StopStatusMetrics()
+
     for item, value in session.analysis_reports_counter.items():
       counter[item] = value
 
@@ -313,6 +369,10 @@ class PstealTool(
         self._source_path, source_type,
         artifact_filters=self._artifact_filters,
         filter_file=self._filter_file)
+    self._status_view.StartStatusMetrics(
+        http_port=self._status_metrics_port,
+        status_file_path=self._status_file,
+        storage_file_path=self._storage_file_path)
 
     status_update_callback = (
         self._status_view.GetExtractionStatusUpdateCallback())
@@ -344,6 +404,10 @@ class PstealTool(
       extraction_engine = single_process_engine.SingleProcessEngine()
     else:
       extraction_engine = multi_process_engine.TaskMultiProcessEngine(
+          high_memory_worker_memory_limit=(
+              self._high_memory_worker_memory_limit),
+          number_of_high_memory_worker_processes=(
+              self._number_of_high_memory_extraction_workers),
           number_of_worker_processes=self._number_of_extraction_workers,
           worker_memory_limit=self._worker_memory_limit,
           worker_timeout=self._worker_timeout)
@@ -377,6 +441,11 @@ class PstealTool(
     if single_process_mode:
       logger.debug('Starting extraction in single process mode.')
 
+      if self._stream_output:
+        logger.info((
+            'Streaming output is not supported in single process mode, the '
+            'output is written after extraction.'))
+
       processing_status = extraction_engine.ProcessSources(
           session, self._source_path_specs, storage_writer,
           self._resolver_context, configuration,
@@ -385,11 +454,23 @@ class PstealTool(
     else:
       logger.debug('Starting extraction in multi process mode.')
 
-      processing_status = extraction_engine.ProcessSources(
-          session, self._source_path_specs, storage_writer, configuration,
-          enable_sigsegv_handler=self._enable_sigsegv_handler,
-          status_update_callback=status_update_callback)
+      merged_event_callback = None
+      if self._stream_output and self._output_format != 'null':
+        self._StartOutputStream(extraction_engine.knowledge_base, session)
+        merged_event_callback = self._WriteMergedEvent
+
+      try:
+        processing_status = extraction_engine.ProcessSources(
+            session, self._source_path_specs, storage_writer, configuration,
+            enable_sigsegv_handler=self._enable_sigsegv_handler,
+            merged_event_callback=merged_event_callback,
+            status_update_callback=status_update_callback)
 
+      finally:
+        if merged_event_callback:
+          self._StopOutputStream()
+
+    self._status_view.StopStatusMetrics(processing_status)
     self._status_view.PrintExtractionSummary(processing_status)
 
   def ParseArguments(self, arguments):
@@ -458,6 +539,14 @@ class PstealTool(
 
     self.AddOutputTimeZoneOption(output_group)
 
+    output_group.add_argument(
+        '--stream_output', '--stream-output', dest='stream_output',
+        action='store_true', default=False, help=(
+            'write events to the output while extraction is still in '
+            'progress, as soon as they are merged into the storage file. '
+            'Streamed output is not sorted by date and time, nor '
+            'deduplicated. Streaming requires multi process mode.'))
+
     output_format_group = argument_parser.add_argument_group(
         'output format arguments')
 
@@ -561,6 +650,7 @@ class PstealTool(
       self._storage_file_path = self._GenerateStorageFileName()
 
     self._output_filename = getattr(options, 'write', None)
+    self._stream_output = getattr(options, 'stream_output', False)
 
     if not self._output_filename:
       raise errors.BadConfigOption((
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""The status metrics publisher.
+
+The status metrics publisher makes the processing status of a long-running
+extraction or analysis machine-readable, for example for an orchestrator.
+It can publish the processing status as metrics in the Prometheus text
+exposition format and as JSON, via a local HTTP endpoint, and can write the
+processing status periodically to a JSON status file.
+"""
+
+from __future__ import unicode_literals
+
+import json
+import os
+import threading
+import time
+
+from http import server as http_server
+
+from plaso.cli import logger
+
+
+class StatusMetricsHTTPRequestHandler(http_server.BaseHTTPRequestHandler):
+  """HTTP request handler of the status metrics.
+
+  The handler serves:
+
+  * /metrics, the processing status in the Prometheus text exposition format;
+  * /status.json, the processing status as JSON.
+  """
+
+  # pylint: disable=invalid-name
+
+  def do_GET(self):
+    """Handles a HTTP GET request."""
+    publisher = self.server.status_metrics_publisher
+
+    path, _, _ = self.path.partition('?')
+    if path == '/metrics':
+      content = publisher.GetPrometheusMetrics()
+      content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+    elif path in ('/', '/status.json'):
+      content = json.dumps(publisher.GetStatusValues(), sort_keys=True)
+      content_type = 'application/json'
+
+    else:
+      self.send_error(404)
+      return
+
+    content = content.encode('utf-8')
+
+    self.send_response(200)
+    self.send_header('Content-Type', content_type)
+    self.send_header('Content-Length', '{0:d}'.format(len(content)))
+    self.end_headers()
+    self.wfile.write(content)
+
+  def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+    """Logs a HTTP request.
+
+    Args:
+      format (str): format string of the log message.
+      args (list[object]): arguments of the format string.
+    """
+    logger.debug('Status metrics HTTP request: {0:s}'.format(format % args))
+
+
+class StatusMetricsPublisher(object):
+  """Status metrics publisher.
+
+  The publisher is updated with the processing status by the status update
+  callback of the engine. Since the engine calls the status update callback
+  from a status update thread, access to the status values is serialized.
+  """
+
+  # Prometheus metrics, as tuples of name, type and help text.
+  _PROMETHEUS_METRICS = [
+      ('plaso_aborted', 'gauge', 'Processing was aborted.'),
+      ('plaso_processing_time_seconds', 'gauge',
+       'Number of seconds since processing started.'),
+      ('plaso_storage_file_size_bytes', 'gauge',
+       'Size of the storage file in bytes.'),
+      ('plaso_process_info', 'gauge',
+       'Status of a process, in the labels.'),
+      ('plaso_process_used_memory_bytes', 'gauge',
+       'Memory used by a process in bytes.'),
+      ('plaso_process_consumed_event_sources_total', 'counter',
+       'Number of event sources consumed by a process.'),
+      ('plaso_process_produced_event_sources_total', 'counter',
+       'Number of event sources produced by a process.'),
+      ('plaso_process_consumed_events_total', 'counter',
+       'Number of events consumed by a process.'),
+      ('plaso_process_produced_events_total', 'counter',
+       'Number of events produced by a process.'),
+      ('plaso_process_produced_warnings_total', 'counter',
+       'Number of warnings produced by a process.'),
+      ('plaso_process_events_per_second', 'gauge',
+       'Number of events produced or consumed per second by a process.'),
+      ('plaso_tasks', 'gauge',
+       'Number of tasks per status.'),
+      ('plaso_tasks_total', 'counter',
+       'Total number of tasks.'),
+      ('plaso_events_total', 'counter',
+       'Number of events per analysis and output status.')]
+
+  def __init__(
+      self, http_port=None, status_file_path=None, storage_file_path=None):
+    """Initializes a status metrics publisher.
+
+    Args:
+      http_port (Optional[int]): port of the local HTTP endpoint, where None
+          disables the HTTP endpoint.
+      status_file_path (Optional[str]): path of the JSON status file, where
+          None disables the status file.
+      storage_file_path (Optional[str]): path of the storage file, which is
+          used to determine the size of the storage file.
+    """
+    super(StatusMetricsPublisher, self).__init__()
+    self._http_port = http_port
+    self._http_server = None
+    self._http_server_thread = None
+    self._lock = threading.Lock()
+    self._last_number_of_events = {}
+    self._status_file_path = status_file_path
+    self._status_values = {}
+    self._storage_file_path = storage_file_path
+
+  def _GetProcessStatusValues(self, process_status, update_time):
+    """Retrieves the status values of a process.
+
+    Args:
+      process_status (ProcessStatus): processing status of a process.
+      update_time (float): POSIX timestamp in seconds of the update.
+
+    Returns:
+      dict[str, object]: status values of the process.
+    """
+    # The analysis of events consumes events, the extraction produces them.
+    number_of_events = max(
+        process_status.number_of_consumed_events,
+        process_status.number_of_produced_events)
+
+    events_per_second = 0.0
+    last_update_time, last_number_of_events = self._last_number_of_events.get(
+        process_status.identifier, (None, None))
+    if last_update_time is not None and update_time > last_update_time:
+      events_per_second = float(
+          number_of_events - last_number_of_events) / (
+              update_time - last_update_time)
+
+    self._last_number_of_events[process_status.identifier] = (
+        update_time, number_of_events)
+
+    return {
+        'consumed_event_sources': process_status.number_of_consumed_sources,
+        'consumed_events': process_status.number_of_consumed_events,
+        'events_per_second': max(events_per_second, 0.0),
+        'identifier': process_status.identifier,
+        'pid': process_status.pid,
+        'produced_event_sources': process_status.number_of_produced_sources,
+        'produced_events': process_status.number_of_produced_events,
+        'produced_warnings': process_status.number_of_produced_warnings,
+        'status': process_status.status,
+        'used_memory': process_status.used_memory}
+
+  def _FormatPrometheusLabels(self, labels):
+    """Formats Prometheus metric labels.
+
+    Args:
+      labels (dict[str, object]): label values per name.
+
+    Returns:
+      str: formatted labels.
+    """
+    if not labels:
+      return ''
+
+    formatted_labels = []
+    for name, value in sorted(labels.items()):
+      value = '{0!s}'.format(value)
+      value = value.replace('\\', '\\\\').replace('"', '\\"').replace(
+          '\n', '\\n')
+      formatted_labels.append('{0:s}="{1:s}"'.format(name, value))
+
+    return '{{{0:s}}}'.format(','.join(formatted_labels))
+
+  def _GetPrometheusSamples(self, status_values):
+    """Retrieves the Prometheus samples of the status values.
+
+    Args:
+      status_values (dict[str, object]): status values.
+
+    Returns:
+      dict[str, list[tuple[dict[str, object], object]]]: labels and values
+          of the samples per metric name.
+    """
+    samples = {
+        'plaso_aborted': [({}, int(status_values.get('aborted', False)))],
+        'plaso_processing_time_seconds': [
+            ({}, status_values.get('processing_time', 0.0))]}
+
+    storage_file_size = status_values.get('storage_file_size', None)
+    if storage_file_size is not None:
+      samples['plaso_storage_file_size_bytes'] = [({}, storage_file_size)]
+
+    for process_values in status_values.get('processes', []):
+      process_labels = {'process': process_values['identifier']}
+
+      samples.setdefault('plaso_process_info', []).append(({
+          'pid': process_values['pid'],
+          'process': process_values['identifier'],
+          'status': process_values['status']}, 1))
+
+      for metric_name, key in (
+          ('plaso_process_used_memory_bytes', 'used_memory'),
+          ('plaso_process_consumed_event_sources_total',
+           'consumed_event_sources'),
+          ('plaso_process_produced_event_sources_total',
+           'produced_event_sources'),
+          ('plaso_process_consumed_events_total', 'consumed_events'),
+          ('plaso_process_produced_events_total', 'produced_events'),
+          ('plaso_process_produced_warnings_total', 'produced_warnings'),
+          ('plaso_process_events_per_second', 'events_per_second')):
+        samples.setdefault(metric_name, []).append(
+            (process_labels, process_values[key]))
+
+    tasks_values = status_values.get('tasks', None)
+    if tasks_values:
+      for status in ('abandoned', 'pending_merge', 'processing', 'queued'):
+        samples.setdefault('plaso_tasks', []).append(
+            ({'status': status}, tasks_values[status]))
+
+      samples['plaso_tasks_total'] = [({}, tasks_values['total'])]
+
+    events_values = status_values.get('events', None)
+    if events_values:
+      for status in ('duplicate', 'filtered', 'macb_grouped', 'total'):
+        samples.setdefault('plaso_events_total', []).append(
+            ({'status': status}, events_values[status]))
+
+    return samples
+
+  def _WriteStatusFile(self, status_values):
+    """Writes the status values to the JSON status file.
+
+    The status file is replaced atomically, so that a reader never sees
+    a partially written status file.
+
+    Args:
+      status_values (dict[str, object]): status values.
+    """
+    temporary_path = '{0:s}.tmp'.format(self._status_file_path)
+    try:
+      with open(temporary_path, 'w', encoding='utf-8') as file_object:
+        json.dump(status_values, file_object, sort_keys=True)
+
+      os.replace(temporary_path, self._status_file_path)
+
+    except (IOError, OSError) as exception:
+      logger.warning((
+          'Unable to write status file: {0:s} with error: {1!s}').format(
+              self._status_file_path, exception))
+
+  def GetPrometheusMetrics(self):
+    """Retrieves the processing status in the Prometheus text format.
+
+    Returns:
+      str: processing status in the Prometheus text exposition format.
+    """
+    with self._lock:
+      samples = self._GetPrometheusSamples(self._status_values)
+
+    lines = []
+    for metric_name, metric_type, help_text in self._PROMETHEUS_METRICS:
+      metric_samples = samples.get(metric_name, None)
+      if not metric_samples:
+        continue
+
+      lines.append('# HELP {0:s} {1:s}'.format(metric_name, help_text))
+      lines.append('# TYPE {0:s} {1:s}'.format(metric_name, metric_type))
+      for labels, value in metric_samples:
+        lines.append('{0:s}{1:s} {2!s}'.format(
+            metric_name, self._FormatPrometheusLabels(labels), value))
+
+    lines.append('')
+    return '\n'.join(lines)
+
+  def GetStatusValues(self):
+    """Retrieves the processing status values.
+
+    Returns:
+      dict[str, object]: processing status values.
+    """
+    with self._lock:
+      return dict(self._status_values)
+
+  def Start(self):
+    """Starts the publisher.
+
+    Raises:
+      IOError: if the HTTP endpoint cannot be started.
+      OSError: if the HTTP endpoint cannot be started.
+    """
+    if self._http_port is not None:
+      self._http_server = http_server.HTTPServer(
+          ('localhost', self._http_port), StatusMetricsHTTPRequestHandler)
+      self._http_server.status_metrics_publisher = self
+
+      self._http_server_thread = threading.Thread(
+          name='StatusMetrics', target=self._http_server.serve_forever)
+      self._http_server_thread.daemon = True
+      self._http_server_thread.start()
+
+      logger.info('Status metrics published on: http://localhost:{0:d}'.format(
+          self._http_server.server_port))
+
+  def Stop(self):
+    """Stops the publisher."""
+    if self._http_server:
+      self._http_server.shutdown()
+      self._http_server.server_close()
+      self._http_server_thread.join()
+
+      self._http_server = None
+      self._http_server_thread = None
+
+  def Update(self, processing_status):
+    """Updates the publisher with the processing status.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+    """
+    update_time = time.time()
+
+    status_values = {
+        'aborted': processing_status.aborted,
+        'processing_time': update_time - processing_status.start_time,
+        'processes': [],
+        'update_time': update_time}
+
+    if self._storage_file_path and os.path.isfile(self._storage_file_path):
+      status_values['storage_file_size'] = os.path.getsize(
+          self._storage_file_path)
+
+    process_statuses = []
+    if processing_status.foreman_status:
+      process_statuses.append(processing_status.foreman_status)
+    process_statuses.extend(processing_status.workers_status)
+
+    with self._lock:
+      for process_status in process_statuses:
+        status_values['processes'].append(self._GetProcessStatusValues(
+            process_status, update_time))
+
+      tasks_status = processing_status.tasks_status
+      if tasks_status:
+        status_values['tasks'] = {
+            'abandoned': tasks_status.number_of_abandoned_tasks,
+            'pending_merge': tasks_status.number_of_tasks_pending_merge,
+            'processing': tasks_status.number_of_tasks_processing,
+            'queued': tasks_status.number_of_queued_tasks,
+            'total': tasks_status.total_number_of_tasks}
+
+      events_status = processing_status.events_status
+      if events_status:
+        status_values['events'] = {
+            'duplicate': events_status.number_of_duplicate_events,
+            'filtered': events_status.number_of_filtered_events,
+            'macb_grouped': events_status.number_of_macb_grouped_events,
+            'total': events_status.total_number_of_events}
+
+      self._status_values = status_values
+
+    if self._status_file_path:
+      self._WriteStatusFile(status_values)
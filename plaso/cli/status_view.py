@@ -17,8 +17,10 @@ from dfvfs.lib import definitions as dfvfs_definitions
 
 import plaso
 
+from plaso.cli import status_metrics
 from plaso.cli import tools
 from plaso.cli import views
+from plaso.lib import errors
 
 
 class StatusView(object):
@@ -62,6 +64,7 @@ class StatusView(object):
     self._output_writer = output_writer
     self._source_path = None
     self._source_type = None
+    self._status_metrics_publisher = None
     self._stdout_output_writer = isinstance(
         output_writer, tools.StdoutOutputWriter)
     self._storage_file_path = None
@@ -412,19 +415,47 @@ class StatusView(object):
       self._output_writer.Write('\n')
       table_view.Write(self._output_writer)
 
+  def _GetStatusUpdateCallback(self, print_status_update_callback):
+    """Retrieves the status update callback function.
+
+    Args:
+      print_status_update_callback (function): function to print a status
+          update or None if not available.
+
+    Returns:
+      function: status update callback function or None if not available.
+    """
+    if not self._status_metrics_publisher:
+      return print_status_update_callback
+
+    if not print_status_update_callback:
+      return self._status_metrics_publisher.Update
+
+    def _StatusUpdateCallback(processing_status):
+      """Updates the status metrics and prints a status update.
+
+      Args:
+        processing_status (ProcessingStatus): processing status.
+      """
+      self._status_metrics_publisher.Update(processing_status)
+      print_status_update_callback(processing_status)
+
+    return _StatusUpdateCallback
+
   def GetAnalysisStatusUpdateCallback(self):
     """Retrieves the analysis status update callback function.
 
     Returns:
       function: status update callback function or None if not available.
     """
+    print_status_update_callback = None
     if self._mode == self.MODE_LINEAR:
-      return self._PrintAnalysisStatusUpdateLinear
+      print_status_update_callback = self._PrintAnalysisStatusUpdateLinear
 
-    if self._mode == self.MODE_WINDOW:
-      return self._PrintAnalysisStatusUpdateWindow
+    elif self._mode == self.MODE_WINDOW:
+      print_status_update_callback = self._PrintAnalysisStatusUpdateWindow
 
-    return None
+    return self._GetStatusUpdateCallback(print_status_update_callback)
 
   def GetExtractionStatusUpdateCallback(self):
     """Retrieves the extraction status update callback function.
@@ -432,13 +463,14 @@ class StatusView(object):
     Returns:
       function: status update callback function or None if not available.
     """
+    print_status_update_callback = None
     if self._mode == self.MODE_LINEAR:
-      return self._PrintExtractionStatusUpdateLinear
+      print_status_update_callback = self._PrintExtractionStatusUpdateLinear
 
-    if self._mode == self.MODE_WINDOW:
-      return self._PrintExtractionStatusUpdateWindow
+    elif self._mode == self.MODE_WINDOW:
+      print_status_update_callback = self._PrintExtractionStatusUpdateWindow
 
-    return None
+    return self._GetStatusUpdateCallback(print_status_update_callback)
 
   # TODO: refactor to protected method.
   def PrintExtractionStatusHeader(self, processing_status):
@@ -495,6 +527,17 @@ class StatusView(object):
             ''])
         self._output_writer.Write(output_text)
 
+      number_of_skipped_file_entries = (
+          processing_status.number_of_skipped_file_entries)
+      if number_of_skipped_file_entries:
+        output_text = '\n'.join([
+            '',
+            ('Number of file entries skipped because an unchanged copy in '
+             'another volume snapshot was already processed: {0:d}.').format(
+                 number_of_skipped_file_entries),
+            ''])
+        self._output_writer.Write(output_text)
+
       if processing_status.error_path_specs:
         output_text = '\n'.join([
             '',
@@ -531,6 +574,52 @@ class StatusView(object):
     self._source_path = source_path
     self._source_type = self._SOURCE_TYPES.get(source_type, 'UNKNOWN')
 
+  def StartStatusMetrics(
+      self, http_port=None, status_file_path=None, storage_file_path=None):
+    """Starts publishing the processing status as metrics.
+
+    Args:
+      http_port (Optional[int]): port of the local HTTP endpoint, where None
+          disables the HTTP endpoint.
+      status_file_path (Optional[str]): path of the JSON status file, where
+          None disables the status file.
+      storage_file_path (Optional[str]): path of the storage file, which is
+          used to determine the size of the storage file.
+
+    Raises:
+      BadConfigOption: if the HTTP endpoint cannot be started.
+    """
+    if http_port is None and not status_file_path:
+      return
+
+    status_metrics_publisher = status_metrics.StatusMetricsPublisher(
+        http_port=http_port, status_file_path=status_file_path,
+        storage_file_path=storage_file_path)
+
+    try:
+      status_metrics_publisher.Start()
+    except (IOError, OSError) as exception:
+      raise errors.BadConfigOption((
+          'Unable to start status metrics HTTP endpoint on port: {0!s} with '
+          'error: {1!s}').format(http_port, exception))
+
+    self._status_metrics_publisher = status_metrics_publisher
+
+  def StopStatusMetrics(self, processing_status=None):
+    """Stops publishing the processing status as metrics.
+
+    Args:
+      processing_status (Optional[ProcessingStatus]): final processing status.
+    """
+    if not self._status_metrics_publisher:
+      return
+
+    if processing_status:
+      self._status_metrics_publisher.Update(processing_status)
+
+    self._status_metrics_publisher.Stop()
+    self._status_metrics_publisher = None
+
   def SetStorageFileInformation(self, storage_file_path):
     """Sets the storage file information.
 
@@ -55,4 +55,78 @@ class FileEntryEventSource(EventSource):
   DATA_TYPE = 'file_entry'
 
 
-manager.AttributeContainersManager.RegisterAttributeContainer(EventSource)
+class RecordRangeEventSource(EventSource):
+  """Record range event source.
+
+  The record range event source is an event source that represents a range
+  of records, such as $MFT entries or Windows XML EventLog (EVTX) records,
+  in a data stream of a file entry. Record ranges allow the records of
+  a large file to be parsed by multiple workers in parallel. A record range
+  without a parser name represents a range of members of an archive, such as
+  TAR or ZIP, where the path specification is that of the archive root.
+
+  Attributes:
+    data_stream_name (str): name of the data stream that contains the records.
+    event_data_stream (EventDataStream): event data stream of the data stream
+        that contains the records.
+    first_record_index (int): index of the first record in the range.
+    number_of_records (int): number of records in the range.
+    parser_name (str): name of the parser that parses the records or None if
+        the records are archive members.
+  """
+  DATA_TYPE = 'record_range'
+
+  def __init__(self, path_spec=None):
+    """Initializes a record range event source.
+
+    Args:
+      path_spec (Optional[dfvfs.PathSpec]): path specification.
+    """
+    super(RecordRangeEventSource, self).__init__(path_spec=path_spec)
+    self.data_stream_name = None
+    self.event_data_stream = None
+    self.first_record_index = None
+    self.number_of_records = None
+    self.parser_name = None
+
+
+class ProcessedEventSource(interface.AttributeContainer):
+  """Processed event source attribute container.
+
+  The processed event source records the outcome of processing an event
+  source, so that a subsequent extraction into the same storage file can skip
+  the event sources that were already processed.
+
+  Attributes:
+    file_entry_identity (str): identity of the file entry when it was
+        processed, such as its inode, size and modification time, or None if
+        not available.
+    file_entry_type (str): dfVFS file entry type.
+    path_spec (dfvfs.PathSpec): path specification.
+    record_range (RecordRangeEventSource): range of records of the path
+        specification that was processed, where None represents all data of
+        the path specification.
+    status (str): processing status, either "completed" or "abandoned".
+  """
+  CONTAINER_TYPE = 'processed_event_source'
+
+  STATUS_ABANDONED = 'abandoned'
+  STATUS_COMPLETED = 'completed'
+
+  def __init__(self, path_spec=None, status=None):
+    """Initializes a processed event source.
+
+    Args:
+      path_spec (Optional[dfvfs.PathSpec]): path specification.
+      status (Optional[str]): processing status.
+    """
+    super(ProcessedEventSource, self).__init__()
+    self.file_entry_identity = None
+    self.file_entry_type = None
+    self.path_spec = path_spec
+    self.record_range = None
+    self.status = status
+
+
+manager.AttributeContainersManager.RegisterAttributeContainers([
+    EventSource, ProcessedEventSource])
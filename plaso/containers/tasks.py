@@ -31,6 +31,12 @@ class Task(interface.AttributeContainer):
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
     path_spec (dfvfs.PathSpec): path specification.
+    record_range (RecordRangeEventSource): range of records of the path
+        specification to process, where None represents all data of the
+        path specification.
+    requires_high_memory (bool): True if the task should be processed by
+        a high-memory worker process, for example since a worker process
+        exceeded its memory limit while processing the task.
     session_identifier (str): the identifier of the session the task is part of.
     start_time (int): time that the task was started. Contains the number
         of micro seconds since January 1, 1970, 00:00:00 UTC.
@@ -55,6 +61,8 @@ class Task(interface.AttributeContainer):
     self.last_processing_time = None
     self.merge_priority = None
     self.path_spec = None
+    self.record_range = None
+    self.requires_high_memory = False
     self.session_identifier = session_identifier
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
     self.storage_file_size = None
@@ -85,6 +93,8 @@ class Task(interface.AttributeContainer):
     retry_task.file_entry_type = self.file_entry_type
     retry_task.merge_priority = self.merge_priority
     retry_task.path_spec = self.path_spec
+    retry_task.record_range = self.record_range
+    retry_task.requires_high_memory = self.requires_high_memory
     retry_task.storage_file_size = self.storage_file_size
     retry_task.storage_format = self.storage_format
 
@@ -54,14 +54,41 @@ class ExtractionConfiguration(interface.AttributeContainer):
   These settings are primarily used by the extraction worker.
 
   Attributes:
+    collect_from_mft (bool): True if the file entries of NTFS file systems
+        should be collected from their $MFT instead of by traversing their
+        directories.
     hasher_file_size_limit (int): maximum file size that hashers
         should process, where 0 or None represents unlimited.
     hasher_names_string (str): comma separated string of names
         of hashers to use during processing.
+    maximum_archive_size_per_task (int): maximum size of archive data in
+        bytes, that a worker processes in a single task, where the members of
+        larger archives are split into more ranges. 0 or None represents
+        no maximum.
+    maximum_number_of_cached_file_systems (int): maximum number of file
+        systems, such as those of the volumes and snapshots of a storage
+        media image, that a worker keeps open between tasks, where 0 or None
+        represents that file systems are not kept open.
+    maximum_number_of_archive_members_per_task (int): maximum number of
+        members of an archive, such as TAR or ZIP, that a worker processes in
+        a single task, where the remaining members are split into ranges that
+        are processed by other workers. 0 or None represents all members of
+        an archive are processed in a single task.
+    maximum_number_of_records_per_task (int): maximum number of records,
+        such as $MFT entries or EVTX records, that a worker parses in a single
+        task, where the remaining records are split into ranges that are
+        parsed by other workers. 0 or None represents all records of a file
+        are parsed in a single task.
     process_archives (bool): True if archive files should be
         scanned for file entries.
     process_compressed_streams (bool): True if file content in
         compressed streams should be processed.
+    skip_unchanged_snapshot_files (bool): True if file entries that are
+        stored unchanged in multiple volume snapshots should only be
+        processed once.
+    snapshot_file_entry_cache_path (str): path of the database file that
+        is shared between workers to keep track of processed snapshot file
+        entries, where None represents a per worker in-memory cache.
     yara_rules_string (str): Yara rule definitions.
   """
   CONTAINER_TYPE = 'extraction_configuration'
@@ -69,10 +96,17 @@ class ExtractionConfiguration(interface.AttributeContainer):
   def __init__(self):
     """Initializes an extraction configuration object."""
     super(ExtractionConfiguration, self).__init__()
+    self.collect_from_mft = False
     self.hasher_file_size_limit = None
     self.hasher_names_string = None
+    self.maximum_archive_size_per_task = 256 * 1024 * 1024
+    self.maximum_number_of_archive_members_per_task = 1000
+    self.maximum_number_of_cached_file_systems = 8
+    self.maximum_number_of_records_per_task = 100000
     self.process_archives = False
     self.process_compressed_streams = True
+    self.skip_unchanged_snapshot_files = False
+    self.snapshot_file_entry_cache_path = None
     self.yara_rules_string = None
 
 
@@ -92,6 +126,8 @@ class ProfilingConfiguration(interface.AttributeContainer):
         * 'serializers', which profiles CPU time consumed by individual
           serializers.
         * 'storage', which profiles storage reads and writes.
+        * 'trace', which writes a trace with the processing phases, task
+          status, task queue status and sampled Python stacks.
     sample_rate (int): the profiling sample rate. Contains the number of event
         sources processed.
   """
@@ -168,6 +204,14 @@ class ProfilingConfiguration(interface.AttributeContainer):
     """
     return 'tasks' in self.profilers
 
+  def HaveProfileTrace(self):
+    """Determines if trace profiling is configured.
+
+    Returns:
+      bool: True if trace profiling is configured.
+    """
+    return 'trace' in self.profilers
+
 
 class ProcessingConfiguration(interface.AttributeContainer):
   """Configuration settings for processing.
@@ -184,11 +228,19 @@ class ProcessingConfiguration(interface.AttributeContainer):
     extraction (ExtractionConfiguration): extraction configuration.
     filter_file (str): path to a file with find specifications.
     log_filename (str): name of the log file.
+    maximum_number_of_prefetched_tasks (int): maximum number of tasks a worker
+        process requests from the task queue at once, where 1 represents
+        that tasks are not prefetched.
+    number_of_export_processes (int): maximum number of processes that export
+        events, where a value less than 2 represents that the events are
+        exported by the engine process.
     parser_filter_expression (str): parser filter expression,
         where None represents all parsers and plugins.
     preferred_year (int): preferred initial year value for year-less date and
         time values.
     profiling (ProfilingConfiguration): profiling configuration.
+    storage_file_path (str): path of the storage file, which is required to
+        export events in multiple processes.
     task_storage_format (str): format to use for storing task results.
     temporary_directory (str): path of the directory for temporary files.
   """
@@ -205,8 +257,11 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.extraction = ExtractionConfiguration()
     self.filter_file = None
     self.log_filename = None
+    self.maximum_number_of_prefetched_tasks = 1
+    self.number_of_export_processes = 0
     self.parser_filter_expression = None
     self.preferred_year = None
     self.profiling = ProfilingConfiguration()
+    self.storage_file_path = None
     self.task_storage_format = None
     self.temporary_directory = None
@@ -54,7 +54,9 @@ class BaseEngine(object):
     self._processing_profiler = None
     self._serializers_profiler = None
     self._storage_profiler = None
+    self._task_queue_latency_profiler = None
     self._task_queue_profiler = None
+    self._trace_profiler = None
 
     self.collection_filters_helper = None
     self.knowledge_base = knowledge_base.KnowledgeBase()
@@ -157,8 +159,29 @@ class BaseEngine(object):
           self._name, configuration)
       self._task_queue_profiler.Start()
 
+      self._task_queue_latency_profiler = profilers.TaskQueueLatencyProfiler(
+          self._name, configuration)
+      self._task_queue_latency_profiler.Start()
+
+    if configuration.HaveProfileTrace():
+      self._trace_profiler = profilers.TraceProfiler(
+          self._name, configuration)
+      self._trace_profiler.Start()
+
+      # The trace profiler records the processing phases, when the processing
+      # profiler is not enabled.
+      if not self._processing_profiler:
+        self._processing_profiler = self._trace_profiler
+
   def _StopProfiling(self):
     """Stops profiling."""
+    if self._trace_profiler:
+      if self._processing_profiler is self._trace_profiler:
+        self._processing_profiler = None
+
+      self._trace_profiler.Stop()
+      self._trace_profiler = None
+
     if self._memory_profiler:
       self._memory_profiler.Stop()
       self._memory_profiler = None
@@ -183,6 +206,10 @@ class BaseEngine(object):
       self._task_queue_profiler.Stop()
       self._task_queue_profiler = None
 
+    if self._task_queue_latency_profiler:
+      self._task_queue_latency_profiler.Stop()
+      self._task_queue_latency_profiler = None
+
   @classmethod
   def CreateSession(
       cls, artifact_filter_names=None, command_line_arguments=None,
@@ -8,11 +8,13 @@ from __future__ import unicode_literals
 
 import copy
 
+import pyfsntfs
 import pysigscan
 
 from dfvfs.helpers import file_system_searcher
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
+from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.engine import logger
@@ -324,6 +326,26 @@ class EventExtractor(object):
       self._ParseFileEntryWithParser(
           parser_mediator, self._filestat_parser, file_entry)
 
+  def ParseRecordRange(self, parser_mediator, file_entry, record_range):
+    """Parses a range of records of a data stream of a file entry.
+
+    Args:
+      parser_mediator (ParserMediator): parser mediator.
+      file_entry (dfvfs.FileEntry): file entry.
+      record_range (RecordRangeEventSource): range of records to parse.
+
+    Raises:
+      RuntimeError: if the file-like object or the parser object is missing.
+    """
+    parser = self._parsers.get(record_range.parser_name, None)
+    if not parser:
+      raise RuntimeError(
+          'Parser object missing for parser: {0:s}'.format(
+              record_range.parser_name))
+
+    self._ParseDataStreamWithParser(
+        parser_mediator, parser, file_entry, record_range.data_stream_name)
+
   def ParseMetadataFile(
       self, parser_mediator, file_entry, data_stream_name):
     """Parses a metadata file.
@@ -364,13 +386,23 @@ class PathSpecExtractor(object):
 
   _MAXIMUM_DEPTH = 255
 
+  # NTFS file name attribute type and name space values.
+  _NTFS_ATTRIBUTE_TYPE_FILE_NAME = 0x00000030
+  _NTFS_FILE_NAME_SPACE_DOS = 2
+
+  _NTFS_FILE_REFERENCE_MFT_ENTRY_BITMASK = 0xffffffffffff
+
+  _NTFS_ROOT_DIRECTORY_MFT_ENTRY = 5
+
   def _ExtractPathSpecs(
-      self, path_spec, find_specs=None, recurse_file_system=True,
-      resolver_context=None):
+      self, path_spec, collect_from_mft=False, find_specs=None,
+      recurse_file_system=True, resolver_context=None):
     """Extracts path specification from a specific source.
 
     Args:
       path_spec (dfvfs.PathSpec): path specification.
+      collect_from_mft (Optional[bool]): True if the file entries of a NTFS
+          file system should be collected from its $MFT.
       find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
           used in path specification extraction.
       recurse_file_system (Optional[bool]): True if extraction should
@@ -404,7 +436,7 @@ class PathSpecExtractor(object):
 
     else:
       for extracted_path_spec in self._ExtractPathSpecsFromFileSystem(
-          path_spec, find_specs=find_specs,
+          path_spec, collect_from_mft=collect_from_mft, find_specs=find_specs,
           recurse_file_system=recurse_file_system,
           resolver_context=resolver_context):
         yield extracted_path_spec
@@ -490,13 +522,15 @@ class PathSpecExtractor(object):
       yield file_entry.path_spec
 
   def _ExtractPathSpecsFromFileSystem(
-      self, path_spec, find_specs=None, recurse_file_system=True,
-      resolver_context=None):
+      self, path_spec, collect_from_mft=False, find_specs=None,
+      recurse_file_system=True, resolver_context=None):
     """Extracts path specification from a file system within a specific source.
 
     Args:
       path_spec (dfvfs.PathSpec): path specification of the root of
           the file system.
+      collect_from_mft (Optional[bool]): True if the file entries of a NTFS
+          file system should be collected from its $MFT.
       find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
           used in path specification extraction.
       recurse_file_system (Optional[bool]): True if extraction should
@@ -525,6 +559,14 @@ class PathSpecExtractor(object):
           for extracted_path_spec in searcher.Find(find_specs=find_specs):
             yield extracted_path_spec
 
+        elif (collect_from_mft and path_spec.type_indicator == (
+            dfvfs_definitions.TYPE_INDICATOR_NTFS)):
+          file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+          if file_entry:
+            for extracted_path_spec in self._ExtractPathSpecsFromNTFSMFT(
+                file_entry, resolver_context=resolver_context):
+              yield extracted_path_spec
+
         elif recurse_file_system:
           file_entry = file_system.GetFileEntryByPathSpec(path_spec)
           if file_entry:
@@ -543,13 +585,199 @@ class PathSpecExtractor(object):
       finally:
         file_system.Close()
 
+  def _ExtractPathSpecsFromNTFSMFT(self, file_entry, resolver_context=None):
+    """Extracts path specification from the $MFT of a NTFS file system.
+
+    The MFT entries are read in order, which requires considerably less
+    seeking in a storage media image than traversing the directories of
+    the file system. Only allocated file entries of which the path can be
+    resolved to the root directory are extracted, which corresponds with
+    the file entries found by traversing the directories.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry that refers to the root
+          directory of the NTFS file system.
+      resolver_context (Optional[dfvfs.Context]): resolver context.
+
+    Yields:
+      dfvfs.PathSpec: path specification of the root directory and of
+          the file entries found in the $MFT.
+    """
+    yield file_entry.path_spec
+
+    parent_path_spec = file_entry.path_spec.parent
+
+    volume_file_object = None
+    fsntfs_volume = None
+    if file_entry.IsRoot():
+      try:
+        volume_file_object = path_spec_resolver.Resolver.OpenFileObject(
+            parent_path_spec, resolver_context=resolver_context)
+
+        fsntfs_volume = pyfsntfs.volume()
+        fsntfs_volume.open_file_object(volume_file_object)
+
+      except (IOError, dfvfs_errors.BackEndError) as exception:
+        logger.warning((
+            'Unable to read $MFT with error: {0!s}, falling back to '
+            'traversing the directories.').format(exception))
+        fsntfs_volume = None
+
+    if not fsntfs_volume:
+      if volume_file_object:
+        volume_file_object.close()
+
+      for path_spec in self._ExtractPathSpecsFromDirectory(file_entry):
+        yield path_spec
+      return
+
+    directory_locations = {self._NTFS_ROOT_DIRECTORY_MFT_ENTRY: ''}
+
+    try:
+      for mft_entry in range(fsntfs_volume.number_of_file_entries):
+        if mft_entry == self._NTFS_ROOT_DIRECTORY_MFT_ENTRY:
+          continue
+
+        try:
+          fsntfs_file_entry = fsntfs_volume.get_file_entry(mft_entry)
+
+          # Extension MFT entries are part of the file entry in their base
+          # MFT entry.
+          if (not fsntfs_file_entry.is_allocated() or
+              fsntfs_file_entry.base_record_file_reference):
+            continue
+
+          file_names = self._GetNTFSFileNames(fsntfs_file_entry)
+          data_stream_names = [
+              fsntfs_data_stream.name for fsntfs_data_stream in (
+                  fsntfs_file_entry.alternate_data_streams)]
+
+        except IOError as exception:
+          logger.warning(
+              'Unable to read MFT entry: {0:d} with error: {1!s}'.format(
+                  mft_entry, exception))
+          continue
+
+        for mft_attribute, name, parent_file_reference in file_names:
+          parent_location = self._GetNTFSDirectoryLocation(
+              fsntfs_volume, parent_file_reference, directory_locations)
+          if parent_location is None:
+            continue
+
+          location = '{0:s}\\{1:s}'.format(parent_location, name)
+
+          yield path_spec_factory.Factory.NewPathSpec(
+              dfvfs_definitions.TYPE_INDICATOR_NTFS, location=location,
+              mft_attribute=mft_attribute, mft_entry=mft_entry,
+              parent=parent_path_spec)
+
+          for data_stream_name in data_stream_names:
+            yield path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_NTFS,
+                data_stream=data_stream_name, location=location,
+                mft_attribute=mft_attribute, mft_entry=mft_entry,
+                parent=parent_path_spec)
+
+    finally:
+      fsntfs_volume.close()
+      volume_file_object.close()
+
+  def _GetNTFSDirectoryLocation(
+      self, fsntfs_volume, file_reference, directory_locations):
+    """Retrieves the location of a NTFS directory.
+
+    Args:
+      fsntfs_volume (pyfsntfs.volume): NTFS volume.
+      file_reference (int): NTFS file reference of the directory.
+      directory_locations (dict[int, str]): locations of directories per
+          MFT entry, where the root directory is represented by an empty
+          string and None represents a directory that cannot be resolved
+          to the root directory. Newly resolved directories are added.
+
+    Returns:
+      str: location of the directory or None if the directory cannot be
+          resolved to the root directory, for example because it was
+          deleted.
+    """
+    directory_mft_entry = (
+        file_reference & self._NTFS_FILE_REFERENCE_MFT_ENTRY_BITMASK)
+
+    mft_entries = []
+    names = []
+
+    mft_entry = directory_mft_entry
+    while mft_entry not in directory_locations:
+      file_names = None
+      if len(mft_entries) < self._MAXIMUM_DEPTH:
+        try:
+          fsntfs_file_entry = fsntfs_volume.get_file_entry(mft_entry)
+
+          # The sequence number in the file reference differs when the MFT
+          # entry was reused after the directory was deleted.
+          if (fsntfs_file_entry.is_allocated() and
+              fsntfs_file_entry.has_directory_entries_index() and
+              fsntfs_file_entry.file_reference == file_reference):
+            file_names = self._GetNTFSFileNames(fsntfs_file_entry)
+
+        except IOError as exception:
+          logger.warning(
+              'Unable to read MFT entry: {0:d} with error: {1!s}'.format(
+                  mft_entry, exception))
+
+      mft_entries.append(mft_entry)
+      if not file_names:
+        directory_locations[mft_entry] = None
+        break
+
+      _, name, file_reference = file_names[0]
+      names.append(name)
+
+      mft_entry = file_reference & self._NTFS_FILE_REFERENCE_MFT_ENTRY_BITMASK
+
+    location = directory_locations[mft_entry]
+    for mft_entry, name in reversed(list(zip(mft_entries, names))):
+      if location is not None:
+        location = '{0:s}\\{1:s}'.format(location, name)
+      directory_locations[mft_entry] = location
+
+    return directory_locations[directory_mft_entry]
+
+  def _GetNTFSFileNames(self, fsntfs_file_entry):
+    """Retrieves the file names of a NTFS file entry.
+
+    Short (DOS) file names are ignored since a directory traversal only
+    yields the corresponding long file name.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+
+    Returns:
+      list[tuple[int, str, int]]: index of the $FILE_NAME attribute, name and
+          NTFS file reference of the parent directory per file name.
+    """
+    file_names = []
+    for attribute_index, fsntfs_attribute in enumerate(
+        fsntfs_file_entry.attributes):
+      if (fsntfs_attribute.attribute_type ==
+          self._NTFS_ATTRIBUTE_TYPE_FILE_NAME and
+          fsntfs_attribute.name_space != self._NTFS_FILE_NAME_SPACE_DOS):
+        file_names.append((
+            attribute_index, fsntfs_attribute.name,
+            fsntfs_attribute.parent_file_reference))
+
+    return file_names
+
   def ExtractPathSpecs(
-      self, path_specs, find_specs=None, recurse_file_system=True,
-      resolver_context=None):
+      self, path_specs, collect_from_mft=False, find_specs=None,
+      recurse_file_system=True, resolver_context=None):
     """Extracts path specification from a specific source.
 
     Args:
       path_specs (Optional[list[dfvfs.PathSpec]]): path specifications.
+      collect_from_mft (Optional[bool]): True if the file entries of a NTFS
+          file system should be collected from its $MFT instead of by
+          traversing its directories. This only applies when no find
+          specifications are provided.
       find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
           used in path specification extraction.
       recurse_file_system (Optional[bool]): True if extraction should
@@ -561,7 +789,7 @@ class PathSpecExtractor(object):
     """
     for path_spec in path_specs:
       for extracted_path_spec in self._ExtractPathSpecs(
-          path_spec, find_specs=find_specs,
+          path_spec, collect_from_mft=collect_from_mft, find_specs=find_specs,
           recurse_file_system=recurse_file_system,
           resolver_context=resolver_context):
         yield extracted_path_spec
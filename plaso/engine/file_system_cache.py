@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Cache of file systems that are kept open between tasks.
+
+The resolver context closes a file system, together with the file-like
+objects of the storage media image and volume that it is stored in, when
+the last file entry that references it is released, which typically is at
+the end of a task. When the next task of the same volume or snapshot is
+processed by the same worker, the storage media image, volume and file system
+need to be opened, and their metadata read, again.
+
+The file system cache keeps a reference to the file systems of the most
+recently processed tasks, such that they remain open, and cached in the
+resolver context, between tasks.
+"""
+
+from __future__ import unicode_literals
+
+import collections
+
+from dfvfs.lib import errors as dfvfs_errors
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import logger
+
+
+class FileSystemCache(object):
+  """File system cache.
+
+  Attributes:
+    number_of_hits (int): number of times the file system of a path
+        specification was already cached.
+    number_of_misses (int): number of times the file system of a path
+        specification was not cached.
+  """
+
+  def __init__(self, resolver_context, maximum_number_of_file_systems=8):
+    """Initializes a file system cache.
+
+    Args:
+      resolver_context (dfvfs.Context): resolver context, which should be able
+          to cache the file systems, and the file-like objects they depend
+          on, of the file system cache in addition to those used to process
+          a task.
+      maximum_number_of_file_systems (Optional[int]): maximum number of file
+          systems that are kept open, where 0 or None represents that no file
+          systems are kept open.
+    """
+    super(FileSystemCache, self).__init__()
+    self._file_systems = collections.OrderedDict()
+    self._maximum_number_of_file_systems = maximum_number_of_file_systems or 0
+    self._resolver_context = resolver_context
+
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  @property
+  def hit_rate(self):
+    """float: percentage of path specifications of which the file system was
+        already cached or None if no path specifications were looked up.
+    """
+    number_of_lookups = self.number_of_hits + self.number_of_misses
+    if not number_of_lookups:
+      return None
+
+    return (self.number_of_hits * 100.0) / number_of_lookups
+
+  @classmethod
+  def GetFileSystemIdentifier(cls, path_spec):
+    """Retrieves the identifier of the file system of a path specification.
+
+    Path specifications of file entries in the same file system, that is in
+    the same volume or snapshot of a storage media image, have the same
+    identifier.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      str: identifier of the file system or an empty string if the file
+          system is not stored in another file system or image, such as
+          the operating system file system.
+    """
+    if not path_spec or not path_spec.HasParent():
+      return ''
+
+    return '{0:s}type: {1:s}'.format(
+        path_spec.parent.comparable, path_spec.type_indicator)
+
+  def CacheFileSystem(self, path_spec):
+    """Caches the file system of a path specification.
+
+    The file system is opened if it is not cached, otherwise it is marked as
+    the most recently used. When the cache is full, the least recently used
+    file system is closed.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      bool: True if the file system was already cached.
+    """
+    identifier = self.GetFileSystemIdentifier(path_spec)
+    if not identifier or not self._maximum_number_of_file_systems:
+      return False
+
+    if identifier in self._file_systems:
+      self._file_systems.move_to_end(identifier)
+      self.number_of_hits += 1
+      return True
+
+    self.number_of_misses += 1
+
+    try:
+      file_system = path_spec_resolver.Resolver.OpenFileSystem(
+          path_spec, resolver_context=self._resolver_context)
+    except (IOError, dfvfs_errors.Error) as exception:
+      logger.debug((
+          'Unable to open file system of path specification with error: '
+          '{0!s}').format(exception))
+      return False
+
+    if not file_system:
+      return False
+
+    while len(self._file_systems) >= self._maximum_number_of_file_systems:
+      _, least_recently_used_file_system = self._file_systems.popitem(
+          last=False)
+      least_recently_used_file_system.Close()
+
+    self._file_systems[identifier] = file_system
+    return False
+
+  def Empty(self):
+    """Closes all cached file systems."""
+    while self._file_systems:
+      _, file_system = self._file_systems.popitem(last=False)
+      file_system.Close()
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+from plaso.filters import path_filter
+
 
 class CollectionFiltersHelper(object):
   """Helper for collection filters.
@@ -10,6 +12,8 @@ class CollectionFiltersHelper(object):
   Attributes:
     excluded_file_system_find_specs (list[dfvfs.FindSpec]): file system find
         specifications of paths to exclude from the collection.
+    excluded_file_system_path_filter (PathFilterTrie): file system paths to
+        exclude from the collection, indexed by path segment.
     included_file_system_find_specs (list[dfvfs.FindSpec]): file system find
         specifications of paths to include in the collection.
     registry_find_specs (list[dfwinreg.FindSpec]): Windows Registry find
@@ -20,5 +24,7 @@ class CollectionFiltersHelper(object):
     """Initializes a collection filters helper."""
     super(CollectionFiltersHelper, self).__init__()
     self.excluded_file_system_find_specs = []
+    self.excluded_file_system_path_filter = path_filter.PathFilterTrie(
+        case_sensitive=False)
     self.included_file_system_find_specs = []
     self.registry_find_specs = []
@@ -109,6 +109,15 @@ class PathCollectionFiltersHelper(filters_helper.CollectionFiltersHelper):
             case_sensitive=False, location_regex=path_segments)
 
         if path_filter.filter_type == PathFilter.FILTER_TYPE_EXCLUDE:
+          try:
+            self.excluded_file_system_path_filter.AddPathSegments(
+                path_segments)
+          except ValueError as exception:
+            logger.warning((
+                'Unable to add path: {0:s} to exclusion filter with error: '
+                '{1!s}').format(path, exception))
+            continue
+
           self.excluded_file_system_find_specs.append(find_spec)
 
         elif path_filter.filter_type == PathFilter.FILTER_TYPE_INCLUDE:
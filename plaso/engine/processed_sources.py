@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""Event sources processed by previous extraction sessions.
+
+A storage file records which event sources were processed by its sessions.
+The processed event sources allow a subsequent extraction into the same
+storage file to process only the event sources that were not processed
+before, either because the previous extraction was aborted, or because
+they were added or changed since.
+"""
+
+from __future__ import unicode_literals
+
+from plaso.containers import event_sources
+
+
+class ProcessedEventSources(object):
+  """Event sources processed by previous extraction sessions.
+
+  An event source is identified by its path specification and, for a record
+  range, the index of its first record. An event source is considered
+  unchanged if the identity of its file entry, its inode, size, modification
+  and change time, is the same as when it was processed.
+  """
+
+  def __init__(self):
+    """Initializes processed event sources."""
+    super(ProcessedEventSources, self).__init__()
+    self._abandoned_event_sources = {}
+    self._file_entry_identities = {}
+
+  @classmethod
+  def _GetLookupKey(cls, path_spec, record_range=None):
+    """Retrieves the lookup key of an event source.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification, where None represents all data of the
+          path specification.
+
+    Returns:
+      str: lookup key.
+    """
+    if not record_range:
+      return path_spec.comparable
+
+    return '{0:s}record_range: {1:d}\n'.format(
+        path_spec.comparable, record_range.first_record_index)
+
+  @classmethod
+  def GetFileEntryIdentity(cls, file_entry):
+    """Retrieves the identity of a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      str: identity of the file entry.
+    """
+    path_spec = file_entry.path_spec
+    inode = getattr(path_spec, 'inode', None)
+    if inode is None:
+      inode = getattr(path_spec, 'mft_entry', None)
+    if inode is None:
+      stat_object = file_entry.GetStat()
+      inode = getattr(stat_object, 'ino', None)
+
+    date_time_strings = []
+    for date_time in (file_entry.modification_time, file_entry.change_time):
+      date_time_string = None
+      if date_time:
+        date_time_string = date_time.CopyToDateTimeString()
+      date_time_strings.append(date_time_string or 'N/A')
+
+    return 'inode: {0!s}, size: {1!s}, mtime: {2:s}, ctime: {3:s}'.format(
+        inode, file_entry.size, date_time_strings[0], date_time_strings[1])
+
+  def GetAbandonedEventSources(self):
+    """Retrieves the event sources that were abandoned.
+
+    Returns:
+      list[ProcessedEventSource]: event sources that were abandoned by
+          a previous session and were not completed afterwards.
+    """
+    return list(self._abandoned_event_sources.values())
+
+  def IsCompleted(self, path_spec, file_entry_identity, record_range=None):
+    """Determines if an unchanged event source was completed.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+      file_entry_identity (str): current identity of the file entry.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification, where None represents all data of the
+          path specification.
+
+    Returns:
+      bool: True if the event source was completed by a previous session and
+          its file entry did not change since.
+    """
+    lookup_key = self._GetLookupKey(path_spec, record_range=record_range)
+    if lookup_key not in self._file_entry_identities:
+      return False
+
+    return self._file_entry_identities[lookup_key] == file_entry_identity
+
+  def IsAbandoned(self, path_spec, record_range=None):
+    """Determines if an event source was abandoned.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification, where None represents all data of the
+          path specification.
+
+    Returns:
+      bool: True if the event source was abandoned by a previous session and
+          was not completed afterwards.
+    """
+    lookup_key = self._GetLookupKey(path_spec, record_range=record_range)
+    return lookup_key in self._abandoned_event_sources
+
+  def ReadFromStorage(self, storage_reader):
+    """Reads the processed event sources from storage.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+    """
+    for processed_event_source in storage_reader.GetProcessedEventSources():
+      lookup_key = self._GetLookupKey(
+          processed_event_source.path_spec,
+          record_range=processed_event_source.record_range)
+
+      if processed_event_source.status == (
+          event_sources.ProcessedEventSource.STATUS_COMPLETED):
+        self._file_entry_identities[lookup_key] = (
+            processed_event_source.file_entry_identity)
+        self._abandoned_event_sources.pop(lookup_key, None)
+
+      elif processed_event_source.status == (
+          event_sources.ProcessedEventSource.STATUS_ABANDONED):
+        if lookup_key not in self._file_entry_identities:
+          self._abandoned_event_sources[lookup_key] = processed_event_source
@@ -55,6 +55,9 @@ class ProcessStatus(object):
         the process.
     number_of_produced_warnings_delta (int): number of warnings produced by
         the process since the last status update.
+    number_of_skipped_file_entries (int): total number of file entries
+        skipped by the process because an unchanged copy stored in another
+        volume snapshot was already processed.
     pid (int): process identifier (PID).
     status (str): human readable status indication such as "Hashing" or "Idle".
     used_memory (int): size of used memory in bytes.
@@ -86,6 +89,7 @@ class ProcessStatus(object):
     self.number_of_produced_sources_delta = 0
     self.number_of_produced_warnings = 0
     self.number_of_produced_warnings_delta = 0
+    self.number_of_skipped_file_entries = 0
     self.pid = None
     self.status = None
     self.used_memory = 0
@@ -332,6 +336,19 @@ class ProcessingStatus(object):
     self.start_time = time.time()
     self.tasks_status = None
 
+  @property
+  def number_of_skipped_file_entries(self):
+    """int: total number of file entries skipped by the foreman and workers."""
+    number_of_skipped_file_entries = sum(
+        process_status.number_of_skipped_file_entries
+        for process_status in self._workers_status.values())
+
+    if self.foreman_status:
+      number_of_skipped_file_entries += (
+          self.foreman_status.number_of_skipped_file_entries)
+
+    return number_of_skipped_file_entries
+
   @property
   def workers_status(self):
     """The worker status objects sorted by identifier."""
@@ -345,7 +362,8 @@ class ProcessingStatus(object):
       number_of_consumed_events, number_of_produced_events,
       number_of_consumed_event_tags, number_of_produced_event_tags,
       number_of_consumed_reports, number_of_produced_reports,
-      number_of_consumed_warnings, number_of_produced_warnings):
+      number_of_consumed_warnings, number_of_produced_warnings,
+      number_of_skipped_file_entries=None):
     """Updates a process status.
 
     Args:
@@ -377,6 +395,9 @@ class ProcessingStatus(object):
           the process.
       number_of_produced_warnings (int): total number of warnings produced by
           the process.
+      number_of_skipped_file_entries (Optional[int]): total number of file
+          entries skipped by the process because an unchanged copy stored in
+          another volume snapshot was already processed.
     """
     new_sources = process_status.UpdateNumberOfEventSources(
         number_of_consumed_sources, number_of_produced_sources)
@@ -393,6 +414,10 @@ class ProcessingStatus(object):
     new_reports = process_status.UpdateNumberOfEventReports(
         number_of_consumed_reports, number_of_produced_reports)
 
+    if number_of_skipped_file_entries is not None:
+      process_status.number_of_skipped_file_entries = (
+          number_of_skipped_file_entries)
+
     process_status.display_name = display_name
     process_status.identifier = identifier
     process_status.pid = pid
@@ -412,7 +437,8 @@ class ProcessingStatus(object):
       number_of_consumed_events, number_of_produced_events,
       number_of_consumed_event_tags, number_of_produced_event_tags,
       number_of_consumed_reports, number_of_produced_reports,
-      number_of_consumed_warnings, number_of_produced_warnings):
+      number_of_consumed_warnings, number_of_produced_warnings,
+      number_of_skipped_file_entries=None):
     """Updates the status of the foreman.
 
     Args:
@@ -443,6 +469,9 @@ class ProcessingStatus(object):
           by the process.
       number_of_produced_reports (int): total number of event reports produced
           by the process.
+      number_of_skipped_file_entries (Optional[int]): total number of file
+          entries skipped by the foreman because an unchanged copy stored in
+          another volume snapshot was already processed.
     """
     if not self.foreman_status:
       self.foreman_status = ProcessStatus()
@@ -453,7 +482,8 @@ class ProcessingStatus(object):
         number_of_consumed_events, number_of_produced_events,
         number_of_consumed_event_tags, number_of_produced_event_tags,
         number_of_consumed_reports, number_of_produced_reports,
-        number_of_consumed_warnings, number_of_produced_warnings)
+        number_of_consumed_warnings, number_of_produced_warnings,
+        number_of_skipped_file_entries=number_of_skipped_file_entries)
 
   def UpdateEventsStatus(self, events_status):
     """Updates the events status.
@@ -478,7 +508,8 @@ class ProcessingStatus(object):
       number_of_consumed_events, number_of_produced_events,
       number_of_consumed_event_tags, number_of_produced_event_tags,
       number_of_consumed_reports, number_of_produced_reports,
-      number_of_consumed_warnings, number_of_produced_warnings):
+      number_of_consumed_warnings, number_of_produced_warnings,
+      number_of_skipped_file_entries=None):
     """Updates the status of a worker.
 
     Args:
@@ -509,6 +540,9 @@ class ProcessingStatus(object):
           the worker.
       number_of_produced_warnings (int): total number of warnings produced by
           the worker.
+      number_of_skipped_file_entries (Optional[int]): total number of file
+          entries skipped by the worker because an unchanged copy stored in
+          another volume snapshot was already processed.
     """
     if identifier not in self._workers_status:
       self._workers_status[identifier] = ProcessStatus()
@@ -520,7 +554,8 @@ class ProcessingStatus(object):
         number_of_consumed_events, number_of_produced_events,
         number_of_consumed_event_tags, number_of_produced_event_tags,
         number_of_consumed_reports, number_of_produced_reports,
-        number_of_consumed_warnings, number_of_produced_warnings)
+        number_of_consumed_warnings, number_of_produced_warnings,
+        number_of_skipped_file_entries=number_of_skipped_file_entries)
 
 
 class EventsStatus(object):
@@ -5,7 +5,10 @@ from __future__ import unicode_literals
 
 import codecs
 import gzip
+import json
 import os
+import sys
+import threading
 import time
 
 
@@ -154,10 +157,59 @@ class MemoryProfiler(SampleFileProfiler):
 
 
 class AnalyzersProfiler(CPUTimeProfiler):
-  """The analyzers profiler."""
+  """The analyzers profiler.
+
+  Since analyzers can run concurrently in multiple threads, the analyzers
+  profiler serializes writes to the sample file.
+  """
 
   _FILENAME_PREFIX = 'analyzers'
 
+  _FILE_HEADER = 'Time\tName\tProcessing time\tData size\n'
+
+  def __init__(self, identifier, configuration):
+    """Initializes an analyzers profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(AnalyzersProfiler, self).__init__(identifier, configuration)
+    self._lock = threading.Lock()
+
+  def StartTiming(self, profile_name):
+    """Starts timing CPU time.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+    """
+    with self._lock:
+      if profile_name not in self._profile_measurements:
+        self._profile_measurements[profile_name] = CPUTimeMeasurement()
+
+    self._profile_measurements[profile_name].SampleStart()
+
+  # pylint: disable=arguments-differ
+  def StopTiming(self, profile_name, data_size=0):
+    """Stops timing CPU time.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+      data_size (Optional[int]): size of the data analyzed in bytes, which
+          is used to determine the throughput of the analyzer.
+    """
+    measurements = self._profile_measurements.get(profile_name)
+    if measurements:
+      measurements.SampleStop()
+
+      sample = '{0:f}\t{1:s}\t{2:f}\t{3:d}\n'.format(
+          measurements.start_sample_time, profile_name,
+          measurements.total_cpu_time, data_size)
+
+      with self._lock:
+        self._WritesString(sample)
+
 
 class ProcessingProfiler(CPUTimeProfiler):
   """The processing profiler."""
@@ -165,6 +217,36 @@ class ProcessingProfiler(CPUTimeProfiler):
   _FILENAME_PREFIX = 'processing'
 
 
+class ReadAheadProfiler(SampleFileProfiler):
+  """The read-ahead profiler."""
+
+  _FILENAME_PREFIX = 'read_ahead'
+
+  _FILE_HEADER = (
+      'Time\tName\tReads\tFile object reads\tReads saved\tHit rate\n')
+
+  def Sample(self, profile_name, number_of_reads, number_of_file_object_reads):
+    """Takes a sample of read-ahead window usage for profiling.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+      number_of_reads (int): number of reads.
+      number_of_file_object_reads (int): number of reads of the file-like
+          object.
+    """
+    number_of_reads_saved = max(
+        number_of_reads - number_of_file_object_reads, 0)
+    hit_rate = 0.0
+    if number_of_reads:
+      hit_rate = float(number_of_reads_saved) / number_of_reads
+
+    sample_time = time.time()
+    sample = '{0:f}\t{1:s}\t{2:d}\t{3:d}\t{4:d}\t{5:f}\n'.format(
+        sample_time, profile_name, number_of_reads,
+        number_of_file_object_reads, number_of_reads_saved, hit_rate)
+    self._WritesString(sample)
+
+
 class SerializersProfiler(CPUTimeProfiler):
   """The serializers profiler."""
 
@@ -251,6 +333,29 @@ class TaskQueueProfiler(SampleFileProfiler):
     self._WritesString(sample)
 
 
+class TaskQueueLatencyProfiler(SampleFileProfiler):
+  """The task queue latency profiler."""
+
+  _FILENAME_PREFIX = 'task_queue_latency'
+
+  _FILE_HEADER = 'Time\tName\tLatency upper bound (ms)\tNumber of tasks\n'
+
+  def Sample(self, profile_name, latency_histogram):
+    """Takes a sample of the latency histogram of a task queue for profiling.
+
+    Args:
+      profile_name (str): name of the profile to sample, such as the name of
+          the task queue.
+      latency_histogram (list[tuple[float, int]]): upper bound of the latency
+          in milliseconds and number of tasks per bucket.
+    """
+    sample_time = time.time()
+    for upper_bound, number_of_tasks in latency_histogram:
+      sample = '{0:f}\t{1:s}\t{2:g}\t{3:d}\n'.format(
+          sample_time, profile_name, upper_bound, number_of_tasks)
+      self._WritesString(sample)
+
+
 class TasksProfiler(SampleFileProfiler):
   """The tasks profiler."""
 
@@ -269,3 +374,270 @@ class TasksProfiler(SampleFileProfiler):
     sample = '{0:f}\t{1:s}\t{2:s}\n'.format(
         sample_time, task.identifier, status)
     self._WritesString(sample)
+
+
+class TraceProfiler(SampleFileProfiler):
+  """The trace profiler.
+
+  The trace profiler writes a trace in the Chrome trace event format, which
+  can be viewed with chrome://tracing, Perfetto or speedscope. Every process
+  writes its own trace file, which can be merged into a single timeline with
+  utils/merge_traces.py.
+
+  The trace contains:
+
+  * the processing phases, as complete ("X") events;
+  * the status changes of tasks, as instant ("i") events;
+  * counters, such as the task queue status and memory usage, as counter
+    ("C") events;
+  * the Python stack of the profiled thread, sampled at a fixed interval by
+    a separate thread. Consecutive samples with the same stack frames are
+    combined into complete events, to keep the trace compact.
+
+  Sampling does not add overhead to the profiled code itself, unlike the CPU
+  time profilers that time every call.
+  """
+
+  _FILENAME_PREFIX = 'trace'
+
+  # Maximum number of stack frames, counted from the outermost frame,
+  # to record per sample.
+  _MAXIMUM_STACK_DEPTH = 64
+
+  # Interval in seconds between samples of the Python stack.
+  _SAMPLING_INTERVAL = 0.01
+
+  # Identifiers of the thread tracks in the trace.
+  _TRACK_PROCESSING = 1
+  _TRACK_STACK_SAMPLES = 2
+
+  def __init__(self, identifier, configuration):
+    """Initializes a trace profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the trace filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(TraceProfiler, self).__init__(identifier, configuration)
+    self._lock = threading.Lock()
+    self._number_of_trace_events = 0
+    self._pid = os.getpid()
+    self._sampled_thread_identifier = None
+    self._sampling_event = None
+    self._sampling_thread = None
+    self._stack_frames = []
+
+  def _GetStackFrames(self, frame):
+    """Retrieves the names of the frames of a Python stack.
+
+    Args:
+      frame (frame): innermost frame of the Python stack.
+
+    Returns:
+      list[str]: names of the frames, from the outermost to the innermost
+          frame.
+    """
+    frame_names = []
+    while frame:
+      code = frame.f_code
+      frame_names.append('{0:s} ({1:s}:{2:d})'.format(
+          code.co_name, os.path.basename(code.co_filename),
+          code.co_firstlineno))
+      frame = frame.f_back
+
+    frame_names.reverse()
+    return frame_names[:self._MAXIMUM_STACK_DEPTH]
+
+  def _GetTimestamp(self, sample_time=None):
+    """Retrieves a trace timestamp.
+
+    Args:
+      sample_time (Optional[float]): POSIX timestamp in seconds, where None
+          represents the current time.
+
+    Returns:
+      int: trace timestamp, which is a POSIX timestamp in microseconds, so
+          that the traces of different processes can be merged.
+    """
+    if sample_time is None:
+      sample_time = time.time()
+    return int(sample_time * 1000000)
+
+  def _SampleStack(self, sample_time):
+    """Takes a sample of the Python stack of the profiled thread.
+
+    Args:
+      sample_time (float): POSIX timestamp in seconds of the sample.
+    """
+    # pylint: disable=protected-access
+    frame = sys._current_frames().get(self._sampled_thread_identifier, None)
+    frame_names = self._GetStackFrames(frame)
+
+    common_depth = 0
+    for frame_name, (stack_frame_name, _) in zip(
+        frame_names, self._stack_frames):
+      if frame_name != stack_frame_name:
+        break
+      common_depth += 1
+
+    self._WriteStackFrameEvents(common_depth, sample_time)
+
+    for frame_name in frame_names[common_depth:]:
+      self._stack_frames.append((frame_name, sample_time))
+
+  def _SamplingThreadMain(self):
+    """Main function of the sampling thread."""
+    while not self._sampling_event.wait(self._SAMPLING_INTERVAL):
+      self._SampleStack(time.time())
+
+    self._WriteStackFrameEvents(0, time.time())
+
+  def _WriteStackFrameEvents(self, depth, sample_time):
+    """Writes events of the stack frames that are no longer sampled.
+
+    Args:
+      depth (int): number of stack frames, counted from the outermost frame,
+          that are still sampled.
+      sample_time (float): POSIX timestamp in seconds of the sample.
+    """
+    end_timestamp = self._GetTimestamp(sample_time)
+    while len(self._stack_frames) > depth:
+      frame_name, frame_sample_time = self._stack_frames.pop()
+      start_timestamp = self._GetTimestamp(frame_sample_time)
+      self._WriteTraceEvent({
+          'cat': 'sample',
+          'dur': end_timestamp - start_timestamp,
+          'name': frame_name,
+          'ph': 'X',
+          'tid': self._TRACK_STACK_SAMPLES,
+          'ts': start_timestamp})
+
+  def _WriteTraceEvent(self, trace_event):
+    """Writes a trace event to the trace file.
+
+    Args:
+      trace_event (dict[str, object]): trace event.
+    """
+    trace_event['pid'] = self._pid
+
+    content = json.dumps(trace_event, separators=(',', ':'))
+    with self._lock:
+      if self._number_of_trace_events:
+        content = ',\n{0:s}'.format(content)
+      self._WritesString(content)
+      self._number_of_trace_events += 1
+
+  def SampleCounter(self, profile_name, values):
+    """Takes a sample of counter values for profiling.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+      values (dict[str, int]): counter values per name.
+    """
+    self._WriteTraceEvent({
+        'args': values,
+        'name': profile_name,
+        'ph': 'C',
+        'ts': self._GetTimestamp()})
+
+  def SampleTaskStatus(self, task, status):
+    """Takes a sample of the status of a task for profiling.
+
+    Args:
+      task (Task): a task.
+      status (str): status.
+    """
+    self._WriteTraceEvent({
+        'args': {'task': task.identifier},
+        'cat': 'task',
+        'name': status,
+        'ph': 'i',
+        's': 'p',
+        'tid': self._TRACK_PROCESSING,
+        'ts': self._GetTimestamp()})
+
+  def SampleTasksStatus(self, tasks_status):
+    """Takes a sample of the status of queued tasks for profiling.
+
+    Args:
+      tasks_status (TasksStatus): status information about tasks.
+    """
+    self.SampleCounter('task_queue', {
+        'abandoned': tasks_status.number_of_abandoned_tasks,
+        'processing': tasks_status.number_of_tasks_processing,
+        'queued': tasks_status.number_of_queued_tasks,
+        'to_merge': tasks_status.number_of_tasks_pending_merge})
+
+  def Start(self):
+    """Starts the profiler."""
+    filename = '{0:s}-{1:s}.json.gz'.format(
+        self._FILENAME_PREFIX, self._identifier)
+    if self._path:
+      filename = os.path.join(self._path, filename)
+
+    self._number_of_trace_events = 0
+    self._sample_file = gzip.open(filename, 'wb')
+    self._WritesString('[\n')
+
+    self._start_time = time.time()
+
+    self._WriteTraceEvent({
+        'args': {'name': self._identifier},
+        'name': 'process_name',
+        'ph': 'M'})
+
+    for track_identifier, track_name in (
+        (self._TRACK_PROCESSING, 'Processing'),
+        (self._TRACK_STACK_SAMPLES, 'Python stack samples')):
+      self._WriteTraceEvent({
+          'args': {'name': track_name},
+          'name': 'thread_name',
+          'ph': 'M',
+          'tid': track_identifier})
+
+    self._sampled_thread_identifier = threading.current_thread().ident
+    self._stack_frames = []
+
+    self._sampling_event = threading.Event()
+    self._sampling_thread = threading.Thread(
+        name='TraceSampling', target=self._SamplingThreadMain)
+    self._sampling_thread.daemon = True
+    self._sampling_thread.start()
+
+  def StartTiming(self, profile_name):
+    """Starts timing a processing phase.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+    """
+    self._profile_measurements[profile_name] = time.time()
+
+  def Stop(self):
+    """Stops the profiler."""
+    if self._sampling_thread:
+      self._sampling_event.set()
+      self._sampling_thread.join()
+      self._sampling_event = None
+      self._sampling_thread = None
+
+    self._WritesString('\n]\n')
+
+    super(TraceProfiler, self).Stop()
+
+  def StopTiming(self, profile_name):
+    """Stops timing a processing phase.
+
+    Args:
+      profile_name (str): name of the profile to sample.
+    """
+    start_time = self._profile_measurements.pop(profile_name, None)
+    if start_time is not None:
+      start_timestamp = self._GetTimestamp(start_time)
+      self._WriteTraceEvent({
+          'cat': 'processing',
+          'dur': self._GetTimestamp() - start_timestamp,
+          'name': profile_name,
+          'ph': 'X',
+          'tid': self._TRACK_PROCESSING,
+          'ts': start_timestamp})
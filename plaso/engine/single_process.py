@@ -27,6 +27,7 @@ class SingleProcessEngine(engine.BaseEngine):
     super(SingleProcessEngine, self).__init__()
     self._current_display_name = ''
     self._last_status_update_timestamp = 0.0
+    self._number_of_skipped_file_entries = 0
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._pid = os.getpid()
     self._process_information = process_info.ProcessInfo(self._pid)
@@ -44,14 +45,14 @@ class SingleProcessEngine(engine.BaseEngine):
     self._current_display_name = parser_mediator.GetDisplayNameForPathSpec(
         path_spec)
 
-    excluded_find_specs = None
+    excluded_path_filter = None
     if self.collection_filters_helper:
-      excluded_find_specs = (
-          self.collection_filters_helper.excluded_file_system_find_specs)
+      excluded_path_filter = (
+          self.collection_filters_helper.excluded_file_system_path_filter)
 
     try:
       extraction_worker.ProcessPathSpec(
-          parser_mediator, path_spec, excluded_find_specs=excluded_find_specs)
+          parser_mediator, path_spec, excluded_path_filter=excluded_path_filter)
 
     except KeyboardInterrupt:
       self._abort = True
@@ -111,8 +112,12 @@ class SingleProcessEngine(engine.BaseEngine):
       find_specs = (
           self.collection_filters_helper.included_file_system_find_specs)
 
+    extraction_configuration = self._processing_configuration.extraction
+
     path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
-        source_path_specs, find_specs=find_specs, recurse_file_system=False,
+        source_path_specs,
+        collect_from_mft=extraction_configuration.collect_from_mft,
+        find_specs=find_specs, recurse_file_system=False,
         resolver_context=parser_mediator.resolver_context)
 
     for path_spec in path_spec_generator:
@@ -150,6 +155,8 @@ class SingleProcessEngine(engine.BaseEngine):
       self._ProcessPathSpec(
           extraction_worker, parser_mediator, event_source.path_spec)
       number_of_consumed_sources += 1
+      self._number_of_skipped_file_entries = (
+          extraction_worker.number_of_skipped_file_entries)
 
       self._UpdateStatus(
           extraction_worker.processing_status, self._current_display_name,
@@ -205,7 +212,8 @@ class SingleProcessEngine(engine.BaseEngine):
         self._name, status, self._pid, used_memory, display_name,
         number_of_consumed_sources, storage_writer.number_of_event_sources, 0,
         storage_writer.number_of_events, 0, 0, 0, 0, 0,
-        storage_writer.number_of_warnings)
+        storage_writer.number_of_warnings,
+        number_of_skipped_file_entries=self._number_of_skipped_file_entries)
 
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
@@ -300,6 +308,8 @@ class SingleProcessEngine(engine.BaseEngine):
       self._StopProfiling()
       parser_mediator.StopProfiling()
 
+      extraction_worker.Close()
+
     if self._abort:
       logger.debug('Processing aborted.')
       self._processing_status.aborted = True
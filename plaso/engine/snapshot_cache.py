@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Cache of file entries that are shared between volume snapshots.
+
+When the current volume and its Volume Shadow Snapshots (VSS) are processed
+the same unchanged file is stored in every snapshot. The snapshot file entry
+cache keeps track of which file entries were already processed, so that
+unchanged copies of a file entry stored in other snapshots can be skipped.
+
+The cache is backed by a SQLite database so that it can be shared between
+the worker processes.
+"""
+
+from __future__ import unicode_literals
+
+import sqlite3
+
+from dfvfs.lib import definitions as dfvfs_definitions
+
+
+class SnapshotFileEntryCache(object):
+  """Snapshot file entry cache.
+
+  A file entry is identified by its location and inode in the file system,
+  independent of the snapshot it is stored in, together with its size,
+  modification and change time. The first path specification registered
+  with a specific identifier is the owner of that identifier.
+  """
+
+  _CREATE_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS file_entries ('
+      'identifier TEXT PRIMARY KEY, owner TEXT)')
+
+  _INSERT_QUERY = (
+      'INSERT OR IGNORE INTO file_entries (identifier, owner) VALUES (?, ?)')
+
+  _SELECT_QUERY = 'SELECT owner FROM file_entries WHERE identifier = ?'
+
+  # Maximum number of seconds to wait for a lock held by another process.
+  _LOCK_TIMEOUT = 60.0
+
+  # Type indicators of path specifications that can be stacked between
+  # the file system and the source, such as storage media images and
+  # volume systems.
+  _SUPPORTED_PARENT_TYPE_INDICATORS = frozenset(
+      [dfvfs_definitions.TYPE_INDICATOR_OS]).union(
+          dfvfs_definitions.ENCRYPTED_VOLUME_TYPE_INDICATORS,
+          dfvfs_definitions.STORAGE_MEDIA_IMAGE_TYPE_INDICATORS,
+          dfvfs_definitions.VOLUME_SYSTEM_TYPE_INDICATORS)
+
+  def __init__(self, path=None):
+    """Initializes a snapshot file entry cache.
+
+    Args:
+      path (Optional[str]): path of the SQLite database file that backs
+          the cache, where None represents an in-memory database that is
+          only available to the current process.
+    """
+    super(SnapshotFileEntryCache, self).__init__()
+    self._connection = None
+    self._path = path or ':memory:'
+
+  def _GetIdentifier(self, file_entry):
+    """Retrieves the snapshot independent identifier of a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      str: identifier of the file entry or None if the file entry is not
+          supported.
+    """
+    if file_entry.type_indicator not in (
+        dfvfs_definitions.FILE_SYSTEM_TYPE_INDICATORS):
+      return None
+
+    if not file_entry.IsFile():
+      return None
+
+    modification_time = file_entry.modification_time
+    change_time = file_entry.change_time
+    if not modification_time or not change_time:
+      return None
+
+    comparables = []
+    path_spec = file_entry.path_spec
+    while path_spec:
+      if path_spec is not file_entry.path_spec and (
+          path_spec.type_indicator not in (
+              self._SUPPORTED_PARENT_TYPE_INDICATORS)):
+        # File entries within archives and compressed streams do not have
+        # their own change time.
+        return None
+
+      if path_spec.type_indicator != dfvfs_definitions.TYPE_INDICATOR_VSHADOW:
+        comparables.append(path_spec.comparable.split('\n')[-2])
+
+      path_spec = path_spec.parent
+
+    comparables.reverse()
+    comparables.append('size: {0:d}, mtime: {1:s}, ctime: {2:s}'.format(
+        file_entry.size or 0, modification_time.CopyToDateTimeString(),
+        change_time.CopyToDateTimeString()))
+
+    return '\n'.join(comparables)
+
+  def _Open(self):
+    """Opens the cache database."""
+    self._connection = sqlite3.connect(
+        self._path, isolation_level=None, timeout=self._LOCK_TIMEOUT)
+
+    if self._path != ':memory:':
+      self._connection.execute('PRAGMA journal_mode=WAL')
+
+    # The cache is discarded after extraction hence it does not need to
+    # survive a system crash.
+    self._connection.execute('PRAGMA synchronous=OFF')
+    self._connection.execute(self._CREATE_TABLE_QUERY)
+
+  def Close(self):
+    """Closes the cache."""
+    if self._connection:
+      self._connection.close()
+      self._connection = None
+
+  def RegisterFileEntry(self, file_entry):
+    """Registers a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry should be processed, False if an unchanged
+          copy of the file entry, stored in another snapshot, was already
+          registered.
+    """
+    identifier = self._GetIdentifier(file_entry)
+    if not identifier:
+      return True
+
+    if not self._connection:
+      self._Open()
+
+    owner = file_entry.path_spec.comparable
+    self._connection.execute(self._INSERT_QUERY, (identifier, owner))
+
+    cursor = self._connection.execute(self._SELECT_QUERY, (identifier, ))
+    row = cursor.fetchone()
+
+    # Note that the owner can register the same file entry more than once,
+    # for example when a task is retried.
+    return not row or row[0] == owner
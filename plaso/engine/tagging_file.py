@@ -3,13 +3,298 @@
 
 from __future__ import unicode_literals
 
+import collections
 import io
 import re
+import time
 
 from plaso.filters import event_filter
+from plaso.filters import expression_parser
+from plaso.filters import filters
 from plaso.lib import errors
 
 
+class TaggingRulesIndex(object):
+  """Index of event tagging rules.
+
+  The index groups the tagging rules by the event data types they can match,
+  so that an event is only evaluated against the rules that apply to its
+  data type. Rules that do not restrict the data type are evaluated against
+  every event.
+  """
+
+  # Regular expression to determine if a regular expression contains
+  # back references, which cannot be merged into a combined alternation.
+  _BACK_REFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+  def __init__(self):
+    """Initializes an event tagging rules index."""
+    super(TaggingRulesIndex, self).__init__()
+    self._filters_per_data_type = None
+    self._generic_filters = None
+    self._label_names = []
+    self._number_of_matches = collections.Counter()
+    self._residual_filters_per_data_type = collections.defaultdict(
+        lambda: collections.defaultdict(list))
+    self._time_spent = collections.Counter()
+
+  @property
+  def label_names(self):
+    """list[str]: names of the labels in the index."""
+    return list(self._label_names)
+
+  def _BuildIndex(self):
+    """Builds the per data type lists of filters to evaluate."""
+    label_indexes = {
+        label_name: label_index
+        for label_index, label_name in enumerate(self._label_names)}
+
+    filters_per_data_type = {}
+    for data_type, residual_filters_per_label in (
+        self._residual_filters_per_data_type.items()):
+      data_type_filters = []
+      for label_name, residual_filters in residual_filters_per_label.items():
+        filter_object = self._MergeRegularExpressions(
+            filters.OrFilter(arguments=residual_filters))
+        data_type_filters.append((label_name, filter_object))
+
+      filters_per_data_type[data_type] = data_type_filters
+
+    self._generic_filters = sorted(
+        filters_per_data_type.pop(None, []),
+        key=lambda item: label_indexes[item[0]])
+
+    # Every data type specific list also contains the generic filters.
+    self._filters_per_data_type = {
+        data_type: sorted(
+            data_type_filters + self._generic_filters,
+            key=lambda item: label_indexes[item[0]])
+        for data_type, data_type_filters in filters_per_data_type.items()}
+
+  def _FlattenFilters(self, filter_class, filter_object):
+    """Flattens nested filters of the same boolean filter class.
+
+    Args:
+      filter_class (type): boolean filter class, such as AndFilter or
+          OrFilter.
+      filter_object (Filter): filter.
+
+    Returns:
+      list[Filter]: filters that are combined with the boolean filter class.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    if type(filter_object) != filter_class or not filter_object.args:
+      return [filter_object]
+
+    flattened_filters = []
+    for sub_filter in filter_object.args:
+      flattened_filters.extend(self._FlattenFilters(filter_class, sub_filter))
+
+    return flattened_filters
+
+  def _GetDataTypes(self, filter_object):
+    """Determines the data types of the events a filter can match.
+
+    Args:
+      filter_object (Filter): filter.
+
+    Returns:
+      frozenset[str]: data types of the events the filter can match or None
+          if the filter does not restrict the data type.
+    """
+    if isinstance(filter_object, filters.AndFilter):
+      data_types = None
+      for sub_filter in self._FlattenFilters(filters.AndFilter, filter_object):
+        sub_filter_data_types = self._GetDataTypes(sub_filter)
+        if sub_filter_data_types is not None:
+          if data_types is None:
+            data_types = sub_filter_data_types
+          else:
+            data_types = data_types.intersection(sub_filter_data_types)
+
+      return data_types
+
+    if isinstance(filter_object, filters.OrFilter):
+      sub_filters = self._FlattenFilters(filters.OrFilter, filter_object)
+
+      data_types = set()
+      for sub_filter in sub_filters:
+        sub_filter_data_types = self._GetDataTypes(sub_filter)
+        if sub_filter_data_types is None:
+          return None
+
+        data_types.update(sub_filter_data_types)
+
+      return frozenset(data_types)
+
+    if self._IsDataTypeFilter(filter_object):
+      return frozenset([filter_object.right_operand])
+
+    return None
+
+  def _GetResidualFilter(self, filter_object):
+    """Retrieves the part of a filter that is not a data type restriction.
+
+    Args:
+      filter_object (Filter): filter.
+
+    Returns:
+      Filter: filter without top-level data type restrictions.
+    """
+    sub_filters = self._FlattenFilters(filters.AndFilter, filter_object)
+
+    residual_filters = []
+    for sub_filter in sub_filters:
+      if self._IsDataTypeFilter(sub_filter):
+        continue
+
+      if isinstance(sub_filter, filters.OrFilter):
+        or_sub_filters = self._FlattenFilters(filters.OrFilter, sub_filter)
+        if all(self._IsDataTypeFilter(or_sub_filter)
+               for or_sub_filter in or_sub_filters):
+          continue
+
+      residual_filters.append(sub_filter)
+
+    if not residual_filters:
+      return filters.IdentityFilter()
+
+    if len(residual_filters) == 1:
+      return residual_filters[0]
+
+    return filters.AndFilter(arguments=residual_filters)
+
+  def _IsDataTypeFilter(self, filter_object):
+    """Determines if a filter is a data type equality comparison.
+
+    Args:
+      filter_object (Filter): filter.
+
+    Returns:
+      bool: True if the filter only matches events of a specific data type.
+    """
+    # pylint: disable=protected-access,unidiomatic-typecheck
+    return bool(
+        type(filter_object) == filters.EqualsOperator and
+        filter_object.left_operand == 'data_type' and
+        filter_object._bool_value and
+        isinstance(filter_object.right_operand, str))
+
+  def _MergeRegularExpressions(self, filter_object):
+    """Merges regular expressions on the same attribute into alternations.
+
+    Args:
+      filter_object (OrFilter): filter.
+
+    Returns:
+      Filter: filter where regular expression operators on the same attribute
+          are merged into a single regular expression operator.
+    """
+    sub_filters = self._FlattenFilters(filters.OrFilter, filter_object)
+
+    merged_sub_filters = []
+    regexp_filters = collections.OrderedDict()
+    for sub_filter in sub_filters:
+      # pylint: disable=protected-access,unidiomatic-typecheck
+      if (type(sub_filter) not in (filters.Regexp, filters.RegexpInsensitive)
+          or not sub_filter._bool_value or
+          self._BACK_REFERENCE_RE.search(sub_filter.compiled_re.pattern)):
+        merged_sub_filters.append(sub_filter)
+        continue
+
+      lookup_key = (type(sub_filter), sub_filter.left_operand)
+      regexp_filters.setdefault(lookup_key, []).append(sub_filter)
+
+    for (filter_class, attribute_name), sub_filters in regexp_filters.items():
+      if len(sub_filters) > 1:
+        expression = '|'.join([
+            '(?:{0:s})'.format(sub_filter.compiled_re.pattern)
+            for sub_filter in sub_filters])
+        try:
+          sub_filters = [filter_class(arguments=[attribute_name, expression])]
+        except ValueError:
+          pass
+
+      merged_sub_filters.extend(sub_filters)
+
+    if len(merged_sub_filters) == 1:
+      return merged_sub_filters[0]
+
+    return filters.OrFilter(arguments=merged_sub_filters)
+
+  def AddRule(self, label_name, filter_object):
+    """Adds an event tagging rule.
+
+    Args:
+      label_name (str): name of the label the rule applies.
+      filter_object (Filter): filter of the rule.
+    """
+    if label_name not in self._label_names:
+      self._label_names.append(label_name)
+
+    data_types = self._GetDataTypes(filter_object)
+    if data_types is None:
+      self._residual_filters_per_data_type[None][label_name].append(
+          filter_object)
+    else:
+      residual_filter = self._GetResidualFilter(filter_object)
+      for data_type in data_types:
+        self._residual_filters_per_data_type[data_type][label_name].append(
+            residual_filter)
+
+    self._filters_per_data_type = None
+    self._generic_filters = None
+
+  def GetMatchingLabels(self, event, event_data, event_data_stream):
+    """Retrieves the labels of the rules that match an event.
+
+    Args:
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+
+    Returns:
+      list[str]: names of the labels of the rules that match the event.
+    """
+    if self._filters_per_data_type is None:
+      self._BuildIndex()
+
+    data_type = getattr(event_data, 'data_type', None)
+    label_filters = self._filters_per_data_type.get(
+        data_type, self._generic_filters)
+
+    matched_label_names = []
+    for label_name, filter_object in label_filters:
+      if matched_label_names and label_name == matched_label_names[-1]:
+        continue
+
+      start_time = time.time()
+
+      # Note that tagging events based on existing labels is currently
+      # not supported.
+      match = filter_object.Matches(event, event_data, event_data_stream, None)
+
+      self._time_spent[label_name] += time.time() - start_time
+
+      if match:
+        self._number_of_matches[label_name] += 1
+        matched_label_names.append(label_name)
+
+    return matched_label_names
+
+  def GetStatistics(self):
+    """Retrieves the number of matches and time spent per label.
+
+    Returns:
+      list[tuple[str, int, float]]: label name, number of matched events and
+          number of seconds spent evaluating the rules of the label.
+    """
+    return [
+        (label_name, self._number_of_matches[label_name],
+         self._time_spent[label_name])
+        for label_name in self._label_names]
+
+
 class TaggingFile(object):
   """Tagging file that defines one or more event tagging rules."""
 
@@ -32,17 +317,14 @@ class TaggingFile(object):
     super(TaggingFile, self).__init__()
     self._path = path
 
-  def GetEventTaggingRules(self):
-    """Retrieves the event tagging rules from the tagging file.
+  def _ReadRulesPerLabel(self):
+    """Reads the event tagging rules per label from the tagging file.
 
     Returns:
-      dict[str, FilterObject]: tagging rules, that consists of one or more
-          filter objects per label.
-
-    Raises:
-      TaggingFileError: if a filter expression cannot be compiled.
+      collections.OrderedDict[str, list[str]]: filter expressions of
+          the tagging rules per label.
     """
-    rules_per_label = {}
+    rules_per_label = collections.OrderedDict()
 
     label_name = None
     with io.open(self._path, 'r', encoding='utf-8') as tagging_file:
@@ -64,6 +346,20 @@ class TaggingFile(object):
         elif label_name:
           rules_per_label[label_name].append(stripped_line)
 
+    return rules_per_label
+
+  def GetEventTaggingRules(self):
+    """Retrieves the event tagging rules from the tagging file.
+
+    Returns:
+      dict[str, FilterObject]: tagging rules, that consists of one or more
+          filter objects per label.
+
+    Raises:
+      TaggingFileError: if a filter expression cannot be compiled.
+    """
+    rules_per_label = self._ReadRulesPerLabel()
+
     filter_objects_per_label = {}
 
     for label_name, rules in rules_per_label.items():
@@ -81,3 +377,31 @@ class TaggingFile(object):
       filter_objects_per_label[label_name] = [filter_object]
 
     return filter_objects_per_label
+
+  def GetEventTaggingRulesIndex(self):
+    """Retrieves the event tagging rules index from the tagging file.
+
+    Returns:
+      TaggingRulesIndex: event tagging rules index.
+
+    Raises:
+      TaggingFileError: if a filter expression cannot be compiled.
+    """
+    rules_per_label = self._ReadRulesPerLabel()
+
+    parser = expression_parser.EventFilterExpressionParser()
+    tagging_rules_index = TaggingRulesIndex()
+
+    for label_name, rules in rules_per_label.items():
+      for rule in rules:
+        try:
+          expression = parser.Parse(rule)
+          filter_object = expression.Compile()
+        except errors.ParseError as exception:
+          raise errors.TaggingFileError((
+              'Unable to compile filter for label: {0:s} with error: '
+              '{1!s}').format(label_name, exception))
+
+        tagging_rules_index.AddRule(label_name, filter_object)
+
+    return tagging_rules_index
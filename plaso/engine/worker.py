@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import collections
+import concurrent.futures
 import copy
 import os
 import re
@@ -20,6 +22,8 @@ from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.engine import extractors
 from plaso.engine import logger
+from plaso.engine import processed_sources
+from plaso.engine import snapshot_cache
 from plaso.lib import definitions
 from plaso.lib import errors
 
@@ -33,8 +37,14 @@ class EventExtractionWorker(object):
   parser mediator for further processing.
 
   Attributes:
+    file_entry_identity (str): identity of the file entry of the last
+        processed path specification, or None if the file entry could not be
+        opened.
     last_activity_timestamp (int): timestamp received that indicates the last
         time activity was observed.
+    number_of_skipped_file_entries (int): number of file entries that were
+        skipped because an unchanged copy stored in another volume snapshot
+        was already processed.
     processing_status (str): human readable status indication such as:
         'Extracting', 'Hashing'.
   """
@@ -92,6 +102,11 @@ class EventExtractionWorker(object):
   _FIREFOX_CACHE_DATA_FILE_RE = re.compile(r'^[0-9a-fA-F]{5}[dm][0-9]{2}$')
   _FIREFOX_CACHE2_DATA_FILE_RE = re.compile(r'^[0-9a-fA-F]{40}$')
 
+  # Minimum size of a data stream to run the analyzers concurrently on
+  # the same data block. Hashing and YARA release the GIL while analyzing
+  # a data block, hence they can effectively run in parallel threads.
+  _MINIMUM_CONCURRENT_ANALYSIS_SIZE = 4 * 1024 * 1024
+
   _TYPES_WITH_ROOT_METADATA = frozenset([
       dfvfs_definitions.TYPE_INDICATOR_GZIP])
 
@@ -113,15 +128,22 @@ class EventExtractionWorker(object):
     self._abort = False
     self._analyzers = []
     self._analyzers_profiler = None
+    self._collect_from_mft = False
     self._event_extractor = extractors.EventExtractor(
         parser_filter_expression=parser_filter_expression)
     self._hasher_file_size_limit = None
+    self._maximum_archive_size_per_task = None
+    self._maximum_number_of_archive_members_per_task = None
     self._path_spec_extractor = extractors.PathSpecExtractor()
+    self._pending_archive_member_path_specs = collections.deque()
     self._process_archives = None
     self._process_compressed_streams = None
     self._processing_profiler = None
+    self._snapshot_file_entry_cache = None
 
+    self.file_entry_identity = None
     self.last_activity_timestamp = 0.0
+    self.number_of_skipped_file_entries = 0
     self.processing_status = definitions.STATUS_INDICATOR_IDLE
 
   def _AnalyzeDataStream(
@@ -170,6 +192,25 @@ class EventExtractionWorker(object):
     logger.debug('[AnalyzeDataStream] completed analyzing file: {0:s}'.format(
         display_name))
 
+  def _AnalyzeData(self, analyzer_object, data):
+    """Analyzes a block of data with an analyzer.
+
+    Args:
+      analyzer_object (BaseAnalyzer): analyzer.
+      data (bytes): block of data to analyze.
+    """
+    self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
+
+    if self._analyzers_profiler:
+      self._analyzers_profiler.StartTiming(analyzer_object.NAME)
+
+    try:
+      analyzer_object.Analyze(data)
+    finally:
+      if self._analyzers_profiler:
+        self._analyzers_profiler.StopTiming(
+            analyzer_object.NAME, data_size=len(data))
+
   def _AnalyzeFileObject(self, file_object, display_name, event_data_stream):
     """Processes a file-like object with analyzers.
 
@@ -195,40 +236,60 @@ class EventExtractionWorker(object):
         file_size > self._hasher_file_size_limit):
       return
 
-    file_object.seek(0, os.SEEK_SET)
+    analyzers = []
+    for analyzer_object in self._analyzers:
+      if (not analyzer_object.INCREMENTAL_ANALYZER and
+          file_size > analyzer_object.SIZE_LIMIT):
+        continue
 
-    data = file_object.read(maximum_read_size)
-    while data:
-      if self._abort:
-        break
+      if (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
+          self._hasher_file_size_limit and
+          file_size > self._hasher_file_size_limit):
+        continue
+
+      analyzers.append(analyzer_object)
+
+    thread_pool = None
+    if (len(analyzers) > 1 and
+        file_size >= self._MINIMUM_CONCURRENT_ANALYSIS_SIZE):
+      thread_pool = concurrent.futures.ThreadPoolExecutor(
+          max_workers=len(analyzers))
+
+    try:
+      file_object.seek(0, os.SEEK_SET)
+
+      data = None
+      if analyzers:
+        data = file_object.read(maximum_read_size)
 
-      for analyzer_object in self._analyzers:
+      while data:
         if self._abort:
           break
 
-        if (not analyzer_object.INCREMENTAL_ANALYZER and
-            file_size > analyzer_object.SIZE_LIMIT):
-          continue
-
-        if (isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer) and
-            self._hasher_file_size_limit and
-            file_size > self._hasher_file_size_limit):
-          continue
+        if thread_pool:
+          futures = [
+              thread_pool.submit(self._AnalyzeData, analyzer_object, data)
+              for analyzer_object in analyzers]
 
-        self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
+          # Wait for all analyzers to complete the data block and raise any
+          # exception that occurred in an analyzer thread.
+          for future in futures:
+            future.result()
 
-        if self._analyzers_profiler:
-          self._analyzers_profiler.StartTiming(analyzer_object.NAME)
+        else:
+          for analyzer_object in analyzers:
+            if self._abort:
+              break
 
-        try:
-          analyzer_object.Analyze(data)
-        finally:
-          if self._analyzers_profiler:
-            self._analyzers_profiler.StopTiming(analyzer_object.NAME)
+            self._AnalyzeData(analyzer_object, data)
 
         self.last_activity_timestamp = time.time()
 
-      data = file_object.read(maximum_read_size)
+        data = file_object.read(maximum_read_size)
+
+    finally:
+      if thread_pool:
+        thread_pool.shutdown()
 
     for analyzer_object in self._analyzers:
       for result in analyzer_object.GetResults():
@@ -456,6 +517,26 @@ class EventExtractionWorker(object):
 
     return type_indicators
 
+  def _IsExcludedFileEntry(self, file_entry, excluded_path_filter):
+    """Determines if the file entry is excluded from processing.
+
+    Args:
+      file_entry (dfvfs.FileEntry): a file entry object.
+      excluded_path_filter (PathFilterTrie): paths that are excluded from
+          processing.
+
+    Returns:
+      bool: True if the location of the file entry, or one of its parent
+          directories, is excluded from processing.
+    """
+    location = getattr(file_entry.path_spec, 'location', None)
+    if not location or not excluded_path_filter.number_of_paths:
+      return False
+
+    file_system = file_entry.GetFileSystem()
+    path_segments = file_system.SplitPath(location)
+    return excluded_path_filter.CheckPathSegments(path_segments)
+
   def _IsMetadataFile(self, file_entry):
     """Determines if the file entry is a metadata file.
 
@@ -475,12 +556,155 @@ class EventExtractionWorker(object):
 
     return False
 
-  def _ProcessArchiveTypes(self, mediator, path_spec, type_indicators):
+  def _GetArchiveMemberPathSpecs(self, mediator, archive_path_spec):
+    """Retrieves the path specifications of the members of an archive.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      archive_path_spec (dfvfs.PathSpec): path specification of the root of
+          the archive.
+
+    Returns:
+      list[dfvfs.PathSpec]: path specifications of the members of the archive.
+
+    Raises:
+      IOError: if the archive cannot be read.
+      MaximumRecursionDepth: when the maximum recursion depth is reached.
+    """
+    path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
+        [archive_path_spec], resolver_context=mediator.resolver_context)
+
+    return list(path_spec_generator)
+
+  def _GetNumberOfArchiveMembersPerTask(self, number_of_members, archive_size):
+    """Determines the number of members of an archive to process per task.
+
+    Args:
+      number_of_members (int): number of members of the archive.
+      archive_size (int): size of the archive data stream in bytes.
+
+    Returns:
+      int: number of members to process per task.
+    """
+    members_per_task = (
+        self._maximum_number_of_archive_members_per_task or number_of_members)
+
+    maximum_size = self._maximum_archive_size_per_task
+    if maximum_size and archive_size and archive_size > maximum_size:
+      # Spread the members of a large archive over enough tasks that each task
+      # processes about the maximum size of archive data.
+      number_of_tasks = (archive_size + maximum_size - 1) // maximum_size
+      members_per_task = min(
+          members_per_task,
+          (number_of_members + number_of_tasks - 1) // number_of_tasks)
+
+    return max(members_per_task, 1)
+
+  def _ProcessArchiveMembers(self, mediator):
+    """Processes the pending members of archives in place.
+
+    The members are processed with the same resolver context as the archive,
+    which caches the archive file system, so that the archive is not
+    re-opened, nor its index re-read, for every member. Members that are
+    archives themselves add their members to the pending members.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+    """
+    while self._pending_archive_member_path_specs:
+      if self._abort:
+        break
+
+      member_path_spec = self._pending_archive_member_path_specs.popleft()
+
+      try:
+        file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+            member_path_spec, resolver_context=mediator.resolver_context)
+      except (IOError, dfvfs_errors.Error) as exception:
+        file_entry = None
+
+        warning_message = (
+            'unable to open archive member with error: {0!s}').format(
+                exception)
+        mediator.ProduceExtractionWarning(
+            warning_message, path_spec=member_path_spec)
+
+      if not file_entry:
+        continue
+
+      mediator.SetFileEntry(file_entry)
+
+      try:
+        # The sub file entries of a directory in an archive were already
+        # collected together with the other members.
+        self._ProcessFileEntry(mediator, file_entry)
+
+      # We cannot recover from a CacheFullError, which is handled by
+      # the caller.
+      except dfvfs_errors.CacheFullError:
+        raise
+
+      # An error in one member should not prevent the remaining members of
+      # the archive from being processed.
+      except Exception as exception:  # pylint: disable=broad-except
+        warning_message = (
+            'unable to process archive member with error: {0!s}').format(
+                exception)
+        mediator.ProduceExtractionWarning(
+            warning_message, path_spec=member_path_spec)
+
+      finally:
+        mediator.ResetFileEntry()
+
+      self.last_activity_timestamp = time.time()
+
+    self._pending_archive_member_path_specs.clear()
+
+  def _ProcessArchiveMemberRange(self, mediator, path_spec, record_range):
+    """Processes a range of members of an archive.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      path_spec (dfvfs.PathSpec): path specification of the root of
+          the archive.
+      record_range (RecordRangeEventSource): range of archive members to
+          process.
+    """
+    self.processing_status = definitions.STATUS_INDICATOR_COLLECTING
+
+    try:
+      member_path_specs = self._GetArchiveMemberPathSpecs(mediator, path_spec)
+    except (IOError, errors.MaximumRecursionDepth) as exception:
+      warning_message = (
+          'unable to process archive file with error: {0!s}').format(
+              exception)
+      mediator.ProduceExtractionWarning(warning_message, path_spec=path_spec)
+      return
+
+    first_member_index = record_range.first_record_index
+    last_member_index = first_member_index + record_range.number_of_records
+
+    self._pending_archive_member_path_specs.extend(
+        member_path_specs[first_member_index:last_member_index])
+    self._ProcessArchiveMembers(mediator)
+
+  def _ProcessArchiveTypes(
+      self, mediator, file_entry, path_spec, type_indicators):
     """Processes a data stream containing archive types such as: TAR or ZIP.
 
+    The members of an archive are processed in place, by the worker that
+    processes the archive, after the file entry that contains the archive.
+    Only the members of archives that have more members or archive data than
+    the worker should process per task, are split into ranges of members that
+    are processed by other workers.
+
     Args:
       mediator (ParserMediator): mediates the interactions between
           parsers and other components, such as storage and abort signals.
+      file_entry (dfvfs.FileEntry): file entry containing the archive.
       path_spec (dfvfs.PathSpec): path specification.
       type_indicators(list[str]): dfVFS archive type indicators found in
           the data stream.
@@ -517,29 +741,38 @@ class EventExtractionWorker(object):
         mediator.ProduceExtractionWarning(
             warning_message, path_spec=path_spec)
 
-      if archive_path_spec:
-        try:
-          path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
-              [archive_path_spec], resolver_context=mediator.resolver_context)
+      if not archive_path_spec:
+        continue
 
-          for generated_path_spec in path_spec_generator:
-            if self._abort:
-              break
+      try:
+        member_path_specs = self._GetArchiveMemberPathSpecs(
+            mediator, archive_path_spec)
+      except (IOError, errors.MaximumRecursionDepth) as exception:
+        warning_message = (
+            'unable to process archive file with error: {0!s}').format(
+                exception)
+        mediator.ProduceExtractionWarning(
+            warning_message, path_spec=archive_path_spec)
+        continue
 
-            event_source = event_sources.FileEntryEventSource(
-                path_spec=generated_path_spec)
-            event_source.file_entry_type = (
-                dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
-            mediator.ProduceEventSource(event_source)
+      number_of_members = len(member_path_specs)
+      members_per_task = self._GetNumberOfArchiveMembersPerTask(
+          number_of_members, file_entry.size)
+
+      for first_member_index in range(
+          members_per_task, number_of_members, members_per_task):
+        event_source = event_sources.RecordRangeEventSource(
+            path_spec=archive_path_spec)
+        event_source.data_stream_name = ''
+        event_source.first_record_index = first_member_index
+        event_source.number_of_records = min(
+            members_per_task, number_of_members - first_member_index)
+        mediator.ProduceEventSource(event_source)
 
-            self.last_activity_timestamp = time.time()
+      self._pending_archive_member_path_specs.extend(
+          member_path_specs[:members_per_task])
 
-        except (IOError, errors.MaximumRecursionDepth) as exception:
-          warning_message = (
-              'unable to process archive file with error: {0!s}').format(
-                  exception)
-          mediator.ProduceExtractionWarning(
-              warning_message, path_spec=generated_path_spec)
+      self.last_activity_timestamp = time.time()
 
   def _ProcessCompressedStreamTypes(self, mediator, path_spec, type_indicators):
     """Processes a data stream containing compressed stream types such as: bz2.
@@ -776,7 +1009,8 @@ class EventExtractionWorker(object):
 
     if archive_types:
       if self._process_archives:
-        self._ProcessArchiveTypes(mediator, path_spec, archive_types)
+        self._ProcessArchiveTypes(
+            mediator, file_entry, path_spec, archive_types)
 
       if dfvfs_definitions.TYPE_INDICATOR_ZIP in archive_types:
         # ZIP files are the base of certain file formats like docx.
@@ -849,6 +1083,12 @@ class EventExtractionWorker(object):
     analyzer_object.SetRules(yara_rules_string)
     self._analyzers.append(analyzer_object)
 
+  def Close(self):
+    """Closes the resources, such as caches, used by the extraction worker."""
+    if self._snapshot_file_entry_cache:
+      self._snapshot_file_entry_cache.Close()
+      self._snapshot_file_entry_cache = None
+
   def GetAnalyzerNames(self):
     """Gets the names of the active analyzers.
 
@@ -857,16 +1097,52 @@ class EventExtractionWorker(object):
     """
     return [analyzer_instance.NAME for analyzer_instance in self._analyzers]
 
-  def ProcessPathSpec(self, mediator, path_spec, excluded_find_specs=None):
+  def _ProcessRecordRange(self, mediator, file_entry, record_range):
+    """Processes a range of records of a file entry.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      file_entry (dfvfs.FileEntry): file entry that contains the records.
+      record_range (RecordRangeEventSource): range of records to process.
+    """
+    # The event data stream was already analyzed by the task that produced
+    # the record range.
+    mediator.ProduceEventDataStream(record_range.event_data_stream)
+    mediator.SetRecordRange(record_range)
+
+    self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
+
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('extracting')
+
+    try:
+      self._event_extractor.ParseRecordRange(
+          mediator, file_entry, record_range)
+
+    finally:
+      mediator.SetRecordRange(None)
+
+      if self._processing_profiler:
+        self._processing_profiler.StopTiming('extracting')
+
+    self.processing_status = definitions.STATUS_INDICATOR_RUNNING
+
+  def ProcessPathSpec(
+      self, mediator, path_spec, excluded_path_filter=None, record_range=None):
     """Processes a path specification.
 
     Args:
       mediator (ParserMediator): mediates the interactions between
           parsers and other components, such as storage and abort signals.
       path_spec (dfvfs.PathSpec): path specification.
-      excluded_find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
-         that are excluded from processing.
+      excluded_path_filter (Optional[PathFilterTrie]): paths that are excluded
+          from processing.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification to process, where None represents all data
+          of the path specification.
     """
+    self.file_entry_identity = None
     self.last_activity_timestamp = time.time()
     self.processing_status = definitions.STATUS_INDICATOR_RUNNING
 
@@ -881,21 +1157,70 @@ class EventExtractionWorker(object):
       self.processing_status = definitions.STATUS_INDICATOR_IDLE
       return
 
-    for find_spec in excluded_find_specs or []:
-      if find_spec.CompareLocation(file_entry):
-        logger.info('Skipped: {0:s} because of exclusion filter.'.format(
-            file_entry.path_spec.location))
+    # The identity is determined here so that the file entry does not need
+    # to be opened again to record that it was processed.
+    self.file_entry_identity = (
+        processed_sources.ProcessedEventSources.GetFileEntryIdentity(
+            file_entry))
+
+    if record_range:
+      mediator.SetFileEntry(file_entry)
+
+      try:
+        # A record range without a parser is a range of archive members.
+        if record_range.parser_name is None:
+          self._ProcessArchiveMemberRange(mediator, path_spec, record_range)
+        else:
+          self._ProcessRecordRange(mediator, file_entry, record_range)
+
+      finally:
+        self._pending_archive_member_path_specs.clear()
+
+        mediator.ResetFileEntry()
+
+        self.last_activity_timestamp = time.time()
         self.processing_status = definitions.STATUS_INDICATOR_IDLE
-        return
+
+      return
+
+    if excluded_path_filter and self._IsExcludedFileEntry(
+        file_entry, excluded_path_filter):
+      logger.info('Skipped: {0:s} because of exclusion filter.'.format(
+          file_entry.path_spec.location))
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+      return
+
+    # The content of metadata files changes without their time values being
+    # updated hence they are always processed.
+    if (self._snapshot_file_entry_cache and
+        not self._IsMetadataFile(file_entry) and
+        not self._snapshot_file_entry_cache.RegisterFileEntry(file_entry)):
+      display_name = mediator.GetDisplayNameForPathSpec(path_spec)
+      logger.debug((
+          'Skipped: {0:s} because an unchanged copy in another snapshot was '
+          'already processed.').format(display_name))
+      self.number_of_skipped_file_entries += 1
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+      return
 
     mediator.SetFileEntry(file_entry)
 
     try:
-      if file_entry.IsDirectory():
+      # The sub file entries of a NTFS directory were already collected from
+      # the $MFT.
+      if file_entry.IsDirectory() and not (
+          self._collect_from_mft and file_entry.type_indicator == (
+              dfvfs_definitions.TYPE_INDICATOR_NTFS)):
         self._ProcessDirectory(mediator, file_entry)
       self._ProcessFileEntry(mediator, file_entry)
 
+      # The members of archives are processed after the file entry that
+      # contains the archive, once its file-objects have been closed.
+      self._ProcessArchiveMembers(mediator)
+
     finally:
+      self._pending_archive_member_path_specs.clear()
+
       mediator.ResetFileEntry()
 
       self.last_activity_timestamp = time.time()
@@ -908,12 +1233,24 @@ class EventExtractionWorker(object):
     Args:
       configuration (ExtractionConfiguration): extraction configuration.
     """
+    self._collect_from_mft = configuration.collect_from_mft
     self._hasher_file_size_limit = configuration.hasher_file_size_limit
+    self._maximum_archive_size_per_task = (
+        configuration.maximum_archive_size_per_task)
+    self._maximum_number_of_archive_members_per_task = (
+        configuration.maximum_number_of_archive_members_per_task)
     self._SetHashers(configuration.hasher_names_string)
     self._process_archives = configuration.process_archives
     self._process_compressed_streams = configuration.process_compressed_streams
     self._SetYaraRules(configuration.yara_rules_string)
 
+    # Close the snapshot file entry cache of a previous configuration.
+    self.Close()
+
+    if configuration.skip_unchanged_snapshot_files:
+      self._snapshot_file_entry_cache = snapshot_cache.SnapshotFileEntryCache(
+          path=configuration.snapshot_file_entry_cache_path)
+
   def SetAnalyzersProfiler(self, analyzers_profiler):
     """Sets the parsers profiler.
 
@@ -4,6 +4,8 @@
 from __future__ import unicode_literals
 
 import abc
+import bisect
+import collections
 import errno
 import threading
 import time
@@ -481,6 +483,48 @@ class ZeroMQRequestQueue(ZeroMQQueue):
 
   _SOCKET_TYPE = zmq.REQ
 
+  def __init__(
+      self, delay_open=True, linger_seconds=10, maximum_items=1000,
+      maximum_number_of_prefetched_items=1, name='Unnamed', port=None,
+      timeout_seconds=5):
+    """Initializes a ZeroMQ backed request queue.
+
+    Args:
+      delay_open (Optional[bool]): whether a ZeroMQ socket should be created
+          the first time the queue is pushed to or popped from, rather than at
+          queue object initialization. This is useful if a queue needs to be
+          passed to a child process from a parent process.
+      linger_seconds (Optional[int]): number of seconds that the underlying
+          ZeroMQ socket can remain open after the queue has been closed,
+          to allow queued items to be transferred to other ZeroMQ sockets.
+      maximum_items (Optional[int]): maximum number of items to queue on the
+          ZeroMQ socket. ZeroMQ refers to this value as "high water mark" or
+          "hwm". Note that this limit only applies at one "end" of the queue.
+          The default of 1000 is the ZeroMQ default value.
+      maximum_number_of_prefetched_items (Optional[int]): maximum number of
+          items to request at once. If more than 1, the items are requested
+          in batches from a buffered reply queue and the items of a batch
+          that have not been popped yet are kept in memory, which saves
+          a request and reply round trip per item.
+      name (Optional[str]): Optional name to identify the queue.
+      port (Optional[int]): The TCP port to use for the queue. The default is
+          None, which indicates that the queue should choose a random port to
+          bind to.
+      timeout_seconds (Optional[int]): number of seconds that calls to PopItem
+          and PushItem may block for, before returning queue.QueueEmpty.
+
+    Raises:
+      ValueError: if the queue is configured to connect to an endpoint,
+          but no port is specified.
+    """
+    super(ZeroMQRequestQueue, self).__init__(
+        delay_open=delay_open, linger_seconds=linger_seconds,
+        maximum_items=maximum_items, name=name, port=port,
+        timeout_seconds=timeout_seconds)
+    self._maximum_number_of_prefetched_items = (
+        maximum_number_of_prefetched_items)
+    self._prefetched_items = collections.deque()
+
   def PopItem(self):
     """Pops an item off the queue.
 
@@ -498,6 +542,9 @@ class ZeroMQRequestQueue(ZeroMQQueue):
       RuntimeError: if terminate event is missing.
       zmq.error.ZMQError: if an error occurs in ZeroMQ.
     """
+    if self._prefetched_items:
+      return self._prefetched_items.popleft()
+
     if not self._zmq_socket:
       self._CreateZMQSocket()
 
@@ -507,10 +554,16 @@ class ZeroMQRequestQueue(ZeroMQQueue):
     logger.debug('Pop on {0:s} queue, port {1:d}'.format(
         self.name, self.port))
 
+    # A request of None asks for a single item, a request of a number asks
+    # for a batch of up to that number of items.
+    request = None
+    if self._maximum_number_of_prefetched_items > 1:
+      request = self._maximum_number_of_prefetched_items
+
     last_retry_time = time.time() + self.timeout_seconds
     while not self._terminate_event.is_set():
       try:
-        self._zmq_socket.send_pyobj(None)
+        self._zmq_socket.send_pyobj(request)
         break
 
       except zmq.error.Again:
@@ -524,7 +577,7 @@ class ZeroMQRequestQueue(ZeroMQQueue):
 
     while not self._terminate_event.is_set():
       try:
-        return self._ReceiveItemOnActivity(self._zmq_socket)
+        reply = self._ReceiveItemOnActivity(self._zmq_socket)
       except errors.QueueEmpty:
         continue
 
@@ -532,6 +585,23 @@ class ZeroMQRequestQueue(ZeroMQQueue):
         self.Close(abort=True)
         raise
 
+      if request is None:
+        return reply
+
+      self._prefetched_items.extend(reply)
+      return self._prefetched_items.popleft()
+
+  def GetPrefetchedItems(self):
+    """Retrieves the items that were prefetched but not popped yet.
+
+    This method can be called from another thread than the one popping items,
+    since the items are copied without executing Python code.
+
+    Returns:
+      list[object]: prefetched items, in the order they will be popped.
+    """
+    return list(self._prefetched_items)
+
   def PushItem(self, item, block=True):
     """Pushes an item on to the queue.
 
@@ -690,9 +760,73 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
   _SOCKET_TYPE = zmq.REP
 
+  # Upper bounds, in milliseconds, of the buckets of the latency histogram.
+  # Latencies that exceed the last upper bound are counted in an additional
+  # bucket.
+  _LATENCY_HISTOGRAM_UPPER_BOUNDS = (
+      1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 60000)
+
+  def __init__(
+      self, buffer_timeout_seconds=2, buffer_max_size=10000, delay_open=True,
+      linger_seconds=10, maximum_items=1000, name='Unnamed', port=None,
+      timeout_seconds=5):
+    """Initializes a buffered, ZeroMQ backed reply queue.
+
+    Args:
+      buffer_max_size (Optional[int]): maximum number of items to store in
+          the buffer, before or after they are sent/received via ZeroMQ.
+      buffer_timeout_seconds(Optional[int]): number of seconds to wait when
+          doing a put or get to/from the internal buffer.
+      delay_open (Optional[bool]): whether a ZeroMQ socket should be created
+          the first time the queue is pushed to or popped from, rather than at
+          queue object initialization. This is useful if a queue needs to be
+          passed to a child process from a parent process.
+      linger_seconds (Optional[int]): number of seconds that the underlying
+          ZeroMQ socket can remain open after the queue object has been closed,
+          to allow queued items to be transferred to other ZeroMQ sockets.
+      maximum_items (Optional[int]): maximum number of items to queue on the
+          ZeroMQ socket. ZeroMQ refers to this value as "high water mark" or
+          "hwm". Note that this limit only applies at one "end" of the queue.
+          The default of 1000 is the ZeroMQ default value.
+      name (Optional[str]): name to identify the queue.
+      port (Optional[int]): The TCP port to use for the queue. None indicates
+          that the queue should choose a random port to bind to.
+      timeout_seconds (Optional[int]): number of seconds that calls to PopItem
+          and PushItem may block for, before returning queue.QueueEmpty.
+    """
+    # The latency histogram is only updated by the responder thread.
+    self._latency_histogram = [0] * (
+        len(self._LATENCY_HISTOGRAM_UPPER_BOUNDS) + 1)
+
+    super(ZeroMQBufferedReplyQueue, self).__init__(
+        buffer_timeout_seconds=buffer_timeout_seconds,
+        buffer_max_size=buffer_max_size, delay_open=delay_open,
+        linger_seconds=linger_seconds, maximum_items=maximum_items, name=name,
+        port=port, timeout_seconds=timeout_seconds)
+
+  def _UpdateLatencyHistogram(self, push_time, send_time):
+    """Updates the latency histogram with the latency of an item.
+
+    Args:
+      push_time (float): POSIX timestamp in seconds at which the item was
+          pushed on to the queue.
+      send_time (float): POSIX timestamp in seconds at which the item was
+          sent to a client.
+    """
+    latency = (send_time - push_time) * 1000.0
+    bucket_index = bisect.bisect_left(
+        self._LATENCY_HISTOGRAM_UPPER_BOUNDS, latency)
+    self._latency_histogram[bucket_index] += 1
+
   def _ZeroMQResponder(self, source_queue):
     """Listens for requests and replies to clients.
 
+    A request of None is replied to with a single item. A request of
+    a number is replied to with a list of up to that number of items, which
+    contains the items that are available in the buffer without waiting.
+    A list contains at most one QueueAbort, as its last item, so that every
+    client that is sent a QueueAbort stops requesting items.
+
     Args:
       source_queue (Queue.queue): queue to use to pull items from.
 
@@ -704,14 +838,15 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
     logger.debug('{0:s} responder thread started'.format(self.name))
 
-    item = None
+    buffered_item = None
     while not self._terminate_event.is_set():
-      if not item:
+      if not buffered_item:
         try:
           if self._closed_event.is_set():
-            item = source_queue.get_nowait()
+            buffered_item = source_queue.get_nowait()
           else:
-            item = source_queue.get(True, self._buffer_timeout_seconds)
+            buffered_item = source_queue.get(
+                True, self._buffer_timeout_seconds)
 
         except Queue.Empty:
           if self._closed_event.is_set():
@@ -721,7 +856,7 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
       try:
         # We need to receive a request before we can reply with the item.
-        self._ReceiveItemOnActivity(self._zmq_socket)
+        request = self._ReceiveItemOnActivity(self._zmq_socket)
 
       except errors.QueueEmpty:
         if self._closed_event.is_set() and self._queue.empty():
@@ -729,15 +864,49 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
         continue
 
-      sent_successfully = self._SendItem(self._zmq_socket, item)
-      item = None
+      buffered_items = [buffered_item]
+      buffered_item = None
+
+      if not isinstance(request, int) or request <= 1:
+        reply = buffered_items[0][1]
+
+      else:
+        while (len(buffered_items) < request and
+               not isinstance(buffered_items[-1][1], plaso_queue.QueueAbort)):
+          try:
+            buffered_items.append(source_queue.get_nowait())
+          except Queue.Empty:
+            break
+
+        reply = [item for _, item in buffered_items]
+
+      sent_successfully = self._SendItem(self._zmq_socket, reply)
       if not sent_successfully:
         logger.error('Queue {0:s} unable to send item.'.format(self.name))
         break
 
+      send_time = time.time()
+      for push_time, _ in buffered_items:
+        self._UpdateLatencyHistogram(push_time, send_time)
+
     logger.info('Queue {0:s} responder exiting.'.format(self.name))
     self._zmq_socket.close(self._linger_seconds)
 
+  def GetLatencyHistogram(self):
+    """Retrieves the latency histogram.
+
+    The latency of an item is the time between the item being pushed on to
+    the queue and the item being sent to a client.
+
+    Returns:
+      list[tuple[float, int]]: upper bound of the latency in milliseconds and
+          number of items per bucket, where the upper bound of the last bucket
+          is infinity.
+    """
+    upper_bounds = list(self._LATENCY_HISTOGRAM_UPPER_BOUNDS)
+    upper_bounds.append(float('inf'))
+    return list(zip(upper_bounds, list(self._latency_histogram)))
+
   def PopItem(self):
     """Pops an item of the queue.
 
@@ -774,11 +943,15 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
     if not self._zmq_socket:
       self._CreateZMQSocket()
 
+    # The time the item is pushed is buffered together with the item to
+    # determine its latency.
+    buffered_item = (time.time(), item)
+
     try:
       if block:
-        self._queue.put(item, timeout=self.timeout_seconds)
+        self._queue.put(buffered_item, timeout=self.timeout_seconds)
       else:
-        self._queue.put(item, block=False)
+        self._queue.put(buffered_item, block=False)
     except Queue.Full as exception:
       raise errors.QueueFull(exception)
 
@@ -8,13 +8,20 @@ from plaso.filters import interface
 
 
 class EventObjectFilter(interface.FilterObject):
-  """Event filter."""
+  """Event filter.
+
+  The filter expression is compiled into a tree of filters, which in turn is
+  compiled into a match function, in which the source of attribute values
+  and the conversion of filter values are determined in advance and the
+  boolean operations are evaluated in order of estimated cost.
+  """
 
   def __init__(self):
     """Initializes an event filter."""
     super(EventObjectFilter, self).__init__()
     self._event_filter = None
     self._filter_expression = None
+    self._match_function = None
 
   def CompileFilter(self, filter_expression):
     """Compiles the filter expression.
@@ -32,6 +39,7 @@ class EventObjectFilter(interface.FilterObject):
 
     self._event_filter = expression.Compile()
     self._filter_expression = filter_expression
+    self._match_function = self._event_filter.CompileMatchFunction()
 
   def Match(self, event, event_data, event_data_stream, event_tag):
     """Determines if an event matches the filter.
@@ -45,8 +53,8 @@ class EventObjectFilter(interface.FilterObject):
     Returns:
       bool: True if the event matches the filter, False otherwise.
     """
-    if not self._event_filter:
+    if not self._match_function:
       return True
 
-    return self._event_filter.Matches(
+    return self._match_function(
         event, event_data, event_data_stream, event_tag)
@@ -20,6 +20,10 @@ class Filter(object):
     args (list[object]): arguments provided to the filter.
   """
 
+  # Estimated relative cost of matching an event against the filter, which
+  # is used to evaluate cheaper filters first.
+  _ESTIMATED_COST = 1
+
   def __init__(self, arguments=None):
     """Initializes a filter.
 
@@ -53,6 +57,126 @@ class Filter(object):
       return codecs.decode(value, 'utf8', 'ignore')
     return value
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    The match function has the same arguments and return value as Matches,
+    but values that do not depend on the event, such as the source of the
+    attribute value and the conversion of the filter value, are determined
+    in advance.
+
+    Returns:
+      function: match function.
+    """
+    return self.Matches
+
+  def EstimateCost(self):
+    """Estimates the relative cost of matching an event against the filter.
+
+    Returns:
+      int: estimated cost.
+    """
+    return self._ESTIMATED_COST
+
+  def IsReorderable(self):
+    """Determines if the filter can be evaluated out of expression order.
+
+    Returns:
+      bool: True if matching an event against the filter cannot raise, False
+          otherwise.
+    """
+    return False
+
+  @abc.abstractmethod
+  def Matches(self, event, event_data, event_data_stream, event_tag):
+    """Determines if the event, data and tag match the filter.
+
+    Args:
+      event (EventObject): event to compare against the filter.
+      event_data (EventData): event data to compare against the filter.
+      event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag to compare against the filter.
+
+    Returns:
+      bool: True if the event, data and tag match the filter, False otherwise.
+    """
+
+
+class BooleanFilter(Filter):
+  """Interface for filters that perform a boolean operation on the arguments.
+
+  Nested filters of the same boolean operation are flattened and the match
+  function evaluates the filters in order of estimated cost, which does not
+  change the result of the boolean operation but allows it to short-circuit
+  before the more expensive filters are evaluated.
+
+  A filter that can raise, such as a comparison of values of which the types
+  are not known in advance, is evaluated in the order of the expression, since
+  the filters before it could have short-circuited the boolean operation.
+  """
+
+  def _GetSubFilters(self):
+    """Retrieves the sub filters, with nested filters of the same type merged.
+
+    Returns:
+      list[Filter]: sub filters.
+    """
+    # pylint: disable=protected-access
+    sub_filters = []
+    for sub_filter in self.args:
+      if isinstance(sub_filter, self.__class__):
+        sub_filters.extend(sub_filter._GetSubFilters())
+      else:
+        sub_filters.append(sub_filter)
+
+    return sub_filters
+
+  def _GetSortedMatchFunctions(self):
+    """Compiles the sub filters into match functions sorted by estimated cost.
+
+    Only the sub filters between sub filters that are not reorderable are
+    sorted, such that the latter remain in the order of the expression.
+
+    Returns:
+      tuple[function]: match functions of the sub filters.
+    """
+    sub_filters = []
+    reorderable_sub_filters = []
+    for sub_filter in self._GetSubFilters():
+      if sub_filter.IsReorderable():
+        reorderable_sub_filters.append(sub_filter)
+        continue
+
+      sub_filters.extend(sorted(
+          reorderable_sub_filters,
+          key=lambda sub_filter: sub_filter.EstimateCost()))
+      sub_filters.append(sub_filter)
+      reorderable_sub_filters = []
+
+    sub_filters.extend(sorted(
+        reorderable_sub_filters,
+        key=lambda sub_filter: sub_filter.EstimateCost()))
+
+    return tuple(
+        sub_filter.CompileMatchFunction() for sub_filter in sub_filters)
+
+  def EstimateCost(self):
+    """Estimates the relative cost of matching an event against the filter.
+
+    Returns:
+      int: estimated cost.
+    """
+    return sum(sub_filter.EstimateCost() for sub_filter in self.args)
+
+  def IsReorderable(self):
+    """Determines if the filter can be evaluated out of expression order.
+
+    Returns:
+      bool: True if matching an event against the filter cannot raise, False
+          otherwise.
+    """
+    return all(sub_filter.IsReorderable() for sub_filter in self.args)
+
   @abc.abstractmethod
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
@@ -68,12 +192,31 @@ class Filter(object):
     """
 
 
-class AndFilter(Filter):
+class AndFilter(BooleanFilter):
   """A filter that performs a boolean AND on the arguments.
 
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: match function.
+    """
+    match_functions = self._GetSortedMatchFunctions()
+    if len(match_functions) == 1:
+      return match_functions[0]
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      """Determines if the event, data and tag match all sub filters."""
+      for match_function in match_functions:
+        if not match_function(event, event_data, event_data_stream, event_tag):
+          return False
+      return True
+
+    return _Matches
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -94,12 +237,34 @@ class AndFilter(Filter):
     return True
 
 
-class OrFilter(Filter):
+class OrFilter(BooleanFilter):
   """A filter that performs a boolean OR on the arguments.
 
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: match function.
+    """
+    match_functions = self._GetSortedMatchFunctions()
+    if not match_functions:
+      return IdentityFilter().Matches
+
+    if len(match_functions) == 1:
+      return match_functions[0]
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      """Determines if the event, data and tag match any sub filter."""
+      for match_function in match_functions:
+        if match_function(event, event_data, event_data_stream, event_tag):
+          return True
+      return False
+
+    return _Matches
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -144,6 +309,17 @@ class Operator(Filter):
 class IdentityFilter(Operator):
   """A filter which always evaluates to True."""
 
+  _ESTIMATED_COST = 0
+
+  def IsReorderable(self):
+    """Determines if the filter can be evaluated out of expression order.
+
+    Returns:
+      bool: True if matching an event against the filter cannot raise, False
+          otherwise.
+    """
+    return True
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -204,12 +380,25 @@ class BinaryOperator(Operator):
 class GenericBinaryOperator(BinaryOperator):
   """Shared functionality for common binary operators."""
 
+  # Value to indicate the operator compares integer timestamps the same way
+  # as date and time values.
+  _COMPARES_INTEGER_TIMESTAMPS = False
+
+  # Value to indicate the comparison raises TypeError if the types of
+  # the event and filter values are not compatible.
+  _RAISES_ON_INCOMPATIBLE_TYPES = False
+
   _DEPRECATED_ATTRIBUTE_NAMES = frozenset([
       'message', 'source', 'source_long', 'source_short', 'sourcetype'])
 
   # Attributes that are stored in the event attribute container.
   _EVENT_ATTRIBUTE_NAMES = frozenset(['timestamp', 'timestamp_desc'])
 
+  # Attributes that are stored in the event data stream attribute container.
+  _EVENT_DATA_STREAM_ATTRIBUTE_NAMES = frozenset([
+      'file_entropy', 'md5_hash', 'path_spec', 'sha1_hash', 'sha256_hash',
+      'yara_match'])
+
   def __init__(self, arguments=None, **kwargs):
     """Initializes a generic binary operator.
 
@@ -231,6 +420,118 @@ class GenericBinaryOperator(BinaryOperator):
       bool: True if the values match according to the operator, False otherwise.
     """
 
+  def _CompileCompareValueFunction(self):
+    """Compiles a function that compares an event value with the filter value.
+
+    Returns:
+      function: function that takes the event value as argument and returns
+          True if the event value matches the filter value according to the
+          operator, False otherwise.
+    """
+    compare_value_function = self._CompareValue
+    filter_value = self.right_operand
+    return lambda event_value: compare_value_function(event_value, filter_value)
+
+  def _CompileGetValueFunction(self):
+    """Compiles a function that retrieves the value of the attribute.
+
+    The source of the attribute value is determined in advance, based on the
+    name of the attribute, instead of for every event.
+
+    Returns:
+      function: function that takes an event, event data, event data stream
+          and event tag as arguments and returns the attribute value or None
+          if not available.
+    """
+    # pylint: disable=unused-argument
+    attribute_name = self.left_operand
+    if attribute_name in self._DEPRECATED_ATTRIBUTE_NAMES:
+      logging.warning(
+          'Expansion of {0:s} in event filter no longer supported'.format(
+              attribute_name))
+
+    if attribute_name == 'timestamp':
+      def _GetTimestamp(event, event_data, event_data_stream, event_tag):
+        """Retrieves the timestamp as a date and time object."""
+        timestamp = getattr(event, 'timestamp', None)
+        if isinstance(timestamp, dfdatetime_posix_time.PosixTimeInMicroseconds):
+          return timestamp
+        return dfdatetime_posix_time.PosixTimeInMicroseconds(
+            timestamp=timestamp)
+
+      return _GetTimestamp
+
+    if attribute_name in self._EVENT_ATTRIBUTE_NAMES:
+      return lambda event, event_data, event_data_stream, event_tag: getattr(
+          event, attribute_name, None)
+
+    if attribute_name in self._EVENT_DATA_STREAM_ATTRIBUTE_NAMES:
+      def _GetEventDataStreamValue(
+          event, event_data, event_data_stream, event_tag):
+        """Retrieves the value from the event data stream or event data."""
+        if event_data_stream and hasattr(event_data_stream, attribute_name):
+          return getattr(event_data_stream, attribute_name, None)
+        return getattr(event_data, attribute_name, None)
+
+      return _GetEventDataStreamValue
+
+    if attribute_name == 'tag':
+      return lambda event, event_data, event_data_stream, event_tag: getattr(
+          event_tag, 'labels', None)
+
+    # Attributes that are not known in advance, such as the digest hashes of
+    # additional hashers, can be added to the event data stream. The names
+    # of the public attributes are the same as those returned by
+    # GetAttributeNames(), which creates a list for every event.
+    if attribute_name[0] == '_':
+      def _IsEventDataStreamAttribute(event_data_stream):
+        """Determines if the attribute is stored in the event data stream."""
+        return attribute_name in event_data_stream.GetAttributeNames()
+
+    else:
+      def _IsEventDataStreamAttribute(event_data_stream):
+        """Determines if the attribute is stored in the event data stream."""
+        return attribute_name in vars(event_data_stream)
+
+    def _GetEventDataValue(event, event_data, event_data_stream, event_tag):
+      """Retrieves the value from the event data or event data stream."""
+      if event_data_stream and _IsEventDataStreamAttribute(event_data_stream):
+        return getattr(event_data_stream, attribute_name, None)
+      return getattr(event_data, attribute_name, None)
+
+    return _GetEventDataValue
+
+  def _CompileTimestampMatchFunction(self):
+    """Compiles a match function that compares integer timestamps.
+
+    Comparing the timestamp of the event, which is an integer, with the
+    timestamp of the filter value is considerably faster than creating a date
+    and time object for the timestamp of every event.
+
+    Returns:
+      function: match function or None if the filter does not compare the
+          timestamp of the event with a date and time value.
+    """
+    if not self._IsTimestampComparison():
+      return None
+
+    bool_value = self._bool_value
+    compare_value_function = self._CompareValue
+    filter_timestamp = self.right_operand.timestamp
+    matches_function = self.Matches
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      """Determines if the timestamp of the event matches the filter."""
+      timestamp = getattr(event, 'timestamp', None)
+      if not isinstance(timestamp, int):
+        return matches_function(event, event_data, event_data_stream, event_tag)
+
+      if compare_value_function(timestamp, filter_timestamp):
+        return bool_value
+      return not bool_value
+
+    return _Matches
+
   def _GetValue(
       self, attribute_name, event, event_data, event_data_stream, event_tag):
     """Retrieves the value of a specific event, data or tag attribute.
@@ -273,6 +574,71 @@ class GenericBinaryOperator(BinaryOperator):
 
     return attribute_value
 
+  def _IsTimestampComparison(self):
+    """Determines if the filter compares the timestamp with a date and time.
+
+    Returns:
+      bool: True if the filter compares the timestamp of the event with a date
+          and time value, which can be compared as integer timestamps, False
+          otherwise.
+    """
+    if (not self._COMPARES_INTEGER_TIMESTAMPS or
+        self.left_operand != 'timestamp' or not isinstance(
+            self.right_operand, dfdatetime_posix_time.PosixTimeInMicroseconds)):
+      return False
+
+    return self.right_operand.timestamp is not None
+
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: match function.
+    """
+    match_function = self._CompileTimestampMatchFunction()
+    if match_function:
+      return match_function
+
+    bool_value = self._bool_value
+    compare_value_function = self._CompileCompareValueFunction()
+    get_value_function = self._CompileGetValueFunction()
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      """Determines if the event, data and tag match the filter."""
+      value = get_value_function(
+          event, event_data, event_data_stream, event_tag)
+
+      if value and compare_value_function(value):
+        return bool_value
+      return not bool_value
+
+    return _Matches
+
+  def EstimateCost(self):
+    """Estimates the relative cost of matching an event against the filter.
+
+    Returns:
+      int: estimated cost.
+    """
+    # Attributes of the event are cheaper to retrieve than those of the event
+    # data, which can also be stored in the event data stream.
+    if self.left_operand in self._EVENT_ATTRIBUTE_NAMES:
+      return self._ESTIMATED_COST
+
+    return self._ESTIMATED_COST + 1
+
+  def IsReorderable(self):
+    """Determines if the filter can be evaluated out of expression order.
+
+    Returns:
+      bool: True if matching an event against the filter cannot raise, False
+          otherwise.
+    """
+    # Integer timestamps are always compatible.
+    return (
+        not self._RAISES_ON_INCOMPATIBLE_TYPES or
+        self._IsTimestampComparison())
+
   def FlipBool(self):
     """Negates the internal boolean value attribute."""
     logging.debug('Negative matching.')
@@ -301,6 +667,8 @@ class GenericBinaryOperator(BinaryOperator):
 class EqualsOperator(GenericBinaryOperator):
   """Equals (==) operator."""
 
+  _COMPARES_INTEGER_TIMESTAMPS = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are equal.
 
@@ -317,6 +685,8 @@ class EqualsOperator(GenericBinaryOperator):
 class NotEqualsOperator(GenericBinaryOperator):
   """Not equals (!=) operator."""
 
+  _COMPARES_INTEGER_TIMESTAMPS = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are not equal.
 
@@ -333,6 +703,9 @@ class NotEqualsOperator(GenericBinaryOperator):
 class LessThanOperator(GenericBinaryOperator):
   """Less than (<) operator."""
 
+  _COMPARES_INTEGER_TIMESTAMPS = True
+  _RAISES_ON_INCOMPATIBLE_TYPES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is less than the second.
 
@@ -349,6 +722,9 @@ class LessThanOperator(GenericBinaryOperator):
 class LessEqualOperator(GenericBinaryOperator):
   """Less than or equals (<=) operator."""
 
+  _COMPARES_INTEGER_TIMESTAMPS = True
+  _RAISES_ON_INCOMPATIBLE_TYPES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is less than or equals the second.
 
@@ -366,6 +742,9 @@ class LessEqualOperator(GenericBinaryOperator):
 class GreaterThanOperator(GenericBinaryOperator):
   """Greater than (>) operator."""
 
+  _COMPARES_INTEGER_TIMESTAMPS = True
+  _RAISES_ON_INCOMPATIBLE_TYPES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is greater than the second.
 
@@ -382,6 +761,9 @@ class GreaterThanOperator(GenericBinaryOperator):
 class GreaterEqualOperator(GenericBinaryOperator):
   """Greater than or equals (>=) operator."""
 
+  _COMPARES_INTEGER_TIMESTAMPS = True
+  _RAISES_ON_INCOMPATIBLE_TYPES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is greater than or equals the second.
 
@@ -399,6 +781,34 @@ class GreaterEqualOperator(GenericBinaryOperator):
 class Contains(GenericBinaryOperator):
   """Operator to determine if a value contains another value."""
 
+  _ESTIMATED_COST = 2
+
+  def _CompileCompareValueFunction(self):
+    """Compiles a function that compares an event value with the filter value.
+
+    Returns:
+      function: function that takes the event value as argument and returns
+          True if the filter value is part of the event value, False otherwise.
+    """
+    filter_value = self.right_operand
+    lower_case_filter_value = None
+    if isinstance(filter_value, str):
+      lower_case_filter_value = filter_value.lower()
+
+    def _CompareValue(event_value):
+      """Compares if the filter value is part of the event value."""
+      if isinstance(event_value, str):
+        if lower_case_filter_value is None:
+          return False
+        return lower_case_filter_value in event_value.lower()
+
+      try:
+        return filter_value in event_value
+      except (AttributeError, TypeError):
+        return False
+
+    return _CompareValue
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the second value is part of the first.
 
@@ -425,6 +835,9 @@ class Contains(GenericBinaryOperator):
 class InSet(GenericBinaryOperator):
   """Operator to determine if a value is part of another value."""
 
+  _ESTIMATED_COST = 2
+  _RAISES_ON_INCOMPATIBLE_TYPES = True
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is part of the second.
 
@@ -464,6 +877,8 @@ class Regexp(GenericBinaryOperator):
     compiled_re (???): compiled regular expression.
   """
 
+  _ESTIMATED_COST = 4
+
   def __init__(self, arguments=None, **kwargs):
     """Initializes a regular expression operator.
 
@@ -489,6 +904,30 @@ class Regexp(GenericBinaryOperator):
 
     self.compiled_re = compiled_re
 
+  def _CompileCompareValueFunction(self):
+    """Compiles a function that compares an event value with the filter value.
+
+    Returns:
+      function: function that takes the event value as argument and returns
+          True if the event value matches the regular expression, False
+          otherwise.
+    """
+    search_function = self.compiled_re.search
+    copy_value_to_string_function = self._CopyValueToString
+
+    def _CompareValue(event_value):
+      """Compares if the event value matches the regular expression."""
+      # Most event values are strings, which do not need to be converted.
+      if not isinstance(event_value, str):
+        try:
+          event_value = copy_value_to_string_function(event_value)
+        except TypeError:
+          return False
+
+      return search_function(event_value) is not None
+
+    return _CompareValue
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value matches a regular expression.
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-"""A scan tree-based path filter implementation.
+"""Scan tree and trie-based path filter implementations.
 
 The scan tree is a tree based on multiple paths that contains the path
 segments per node. The most significant path segment is at the root and
@@ -7,10 +7,16 @@ therefore compared first. More information can be found here:
 https://github.com/libyal/libsigscan/wiki/Internals#scanning-tree-based-signature-scanning
 
 The scan tree is used in the filter to filter provided paths.
+
+The trie is a tree based on multiple paths of which the path segments are
+regular expressions, with a node per path segment, from the root onwards.
+The trie is used in the filter to match the leading path segments of paths.
 """
 
 from __future__ import unicode_literals
 
+import re
+
 
 class _PathFilterTable(object):
   """Path filter table.
@@ -676,3 +682,192 @@ class PathFilterScanTreeNode(object):
     text_parts.append('\n')
 
     return ''.join(text_parts)
+
+
+class PathFilterTrie(object):
+  """Path filter trie.
+
+  The trie matches a path when its leading path segments match all the path
+  segments of one of the path filters, which are regular expressions. Path
+  segments without special characters are looked up instead of compared
+  with every regular expression, hence checking a path costs roughly its
+  number of path segments, independent of the number of path filters.
+
+  Attributes:
+    number_of_paths (int): number of paths added to the trie.
+  """
+
+  # Path segment that only contains characters that are not special in
+  # a regular expression or are escaped.
+  _LITERAL_PATH_SEGMENT_RE = re.compile(
+      r'^(?:[^\\.^$*+?{}\[\]|()]|\\[^0-9A-Za-z])*$')
+
+  _ESCAPED_CHARACTER_RE = re.compile(r'\\(.)')
+
+  def __init__(self, case_sensitive=True):
+    """Initializes a path filter trie.
+
+    Args:
+      case_sensitive (Optional[bool]): True if path segments should be
+          matched case sensitive.
+    """
+    super(PathFilterTrie, self).__init__()
+    self._case_sensitive = case_sensitive
+    self._root_node = PathFilterTrieNode()
+
+    self.number_of_paths = 0
+
+  def AddPathSegments(self, path_segments):
+    """Adds the path segments of a path.
+
+    Args:
+      path_segments (list[str]): path segments relative from the root, which
+          are regular expressions.
+
+    Raises:
+      ValueError: if there are no path segments or if a path segment is not
+          a valid regular expression.
+    """
+    if not path_segments:
+      raise ValueError('Missing path segments.')
+
+    flags = re.DOTALL | re.UNICODE
+    if not self._case_sensitive:
+      flags |= re.IGNORECASE
+
+    trie_node = self._root_node
+    for path_segment in path_segments:
+      if self._LITERAL_PATH_SEGMENT_RE.match(path_segment):
+        literal_path_segment = self._ESCAPED_CHARACTER_RE.sub(
+            r'\1', path_segment)
+        if not self._case_sensitive:
+          literal_path_segment = literal_path_segment.lower()
+
+        trie_node = trie_node.AddLiteralSubNode(literal_path_segment)
+
+      else:
+        try:
+          regular_expression = re.compile(
+              r'^{0:s}$'.format(path_segment), flags=flags)
+        except re.error as exception:
+          raise ValueError((
+              'Unsupported path segment: {0:s} with error: {1!s}').format(
+                  path_segment, exception))
+
+        trie_node = trie_node.AddRegularExpressionSubNode(regular_expression)
+
+    trie_node.is_last_path_segment = True
+
+    self.number_of_paths += 1
+
+  def CheckPathSegments(self, path_segments):
+    """Checks if the leading path segments of a path match the trie.
+
+    Args:
+      path_segments (list[str]): path segments relative from the root.
+
+    Returns:
+      bool: True if the leading path segments match all the path segments of
+          a path in the trie, False otherwise.
+    """
+    trie_nodes = [self._root_node]
+    for path_segment in path_segments:
+      if self._case_sensitive:
+        literal_path_segment = path_segment
+      else:
+        literal_path_segment = path_segment.lower()
+
+      sub_nodes = []
+      for trie_node in trie_nodes:
+        sub_nodes.extend(trie_node.GetSubNodes(
+            path_segment, literal_path_segment))
+
+      if not sub_nodes:
+        return False
+
+      for trie_node in sub_nodes:
+        if trie_node.is_last_path_segment:
+          return True
+
+      trie_nodes = sub_nodes
+
+    return False
+
+
+class PathFilterTrieNode(object):
+  """Path filter trie node.
+
+  Attributes:
+    is_last_path_segment (bool): True if the node represents the last path
+        segment of a path.
+  """
+
+  def __init__(self):
+    """Initializes a path filter trie node."""
+    super(PathFilterTrieNode, self).__init__()
+    self._literal_sub_nodes = {}
+    self._regular_expression_sub_nodes = {}
+    self.is_last_path_segment = False
+
+  def AddLiteralSubNode(self, path_segment):
+    """Adds a sub node for a literal path segment.
+
+    Args:
+      path_segment (str): path segment.
+
+    Returns:
+      PathFilterTrieNode: sub node of the path segment, which is an existing
+          sub node if the path segment was added before.
+    """
+    sub_node = self._literal_sub_nodes.get(path_segment, None)
+    if not sub_node:
+      sub_node = PathFilterTrieNode()
+      self._literal_sub_nodes[path_segment] = sub_node
+
+    return sub_node
+
+  def AddRegularExpressionSubNode(self, regular_expression):
+    """Adds a sub node for a regular expression path segment.
+
+    Args:
+      regular_expression (re.Pattern): compiled regular expression of the path
+          segment.
+
+    Returns:
+      PathFilterTrieNode: sub node of the path segment, which is an existing
+          sub node if the path segment was added before.
+    """
+    _, sub_node = self._regular_expression_sub_nodes.get(
+        regular_expression.pattern, (None, None))
+    if not sub_node:
+      sub_node = PathFilterTrieNode()
+      self._regular_expression_sub_nodes[regular_expression.pattern] = (
+          regular_expression, sub_node)
+
+    return sub_node
+
+  def GetSubNodes(self, path_segment, literal_path_segment):
+    """Retrieves the sub nodes that match a path segment.
+
+    Args:
+      path_segment (str): path segment, which is matched against the regular
+          expression path segments.
+      literal_path_segment (str): path segment, which is looked up in the
+          literal path segments, and is expected to be in lower case if the
+          trie is not case sensitive.
+
+    Returns:
+      list[PathFilterTrieNode]: sub nodes that match the path segment.
+    """
+    sub_nodes = []
+
+    sub_node = self._literal_sub_nodes.get(literal_path_segment, None)
+    if sub_node:
+      sub_nodes.append(sub_node)
+
+    for regular_expression, sub_node in (
+        self._regular_expression_sub_nodes.values()):
+      if regular_expression.match(path_segment):
+        sub_nodes.append(sub_node)
+
+    return sub_nodes
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import pickle
 import threading
 
 from plaso.analysis import mediator as analysis_mediator
@@ -79,6 +80,9 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
     if self._memory_profiler:
       self._memory_profiler.Sample('main', used_memory)
 
+    if self._trace_profiler:
+      self._trace_profiler.SampleCounter('memory', {'used': used_memory})
+
     # XML RPC does not support integer values > 2 GiB so we format them
     # as a string.
     used_memory = '{0:d}'.format(used_memory)
@@ -168,9 +172,14 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
           logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
           break
 
-        self._ProcessEvent(self._analysis_mediator, *queued_object)
+        # The foreman pushes batches of serialized events onto the queue.
+        for serialized_event in queued_object:
+          event, event_data, event_data_stream = pickle.loads(serialized_event)
+
+          self._ProcessEvent(
+              self._analysis_mediator, event, event_data, event_data_stream)
 
-        self._number_of_consumed_events += 1
+          self._number_of_consumed_events += 1
 
       logger.debug(
           '{0!s} (PID: {1:d}) stopped monitoring event queue.'.format(
@@ -59,6 +59,7 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     self._status_is_running = False
     self._storage_profiler = None
     self._tasks_profiler = None
+    self._trace_profiler = None
 
     if self._processing_configuration:
       self._debug_output = self._processing_configuration.debug_output
@@ -214,6 +215,16 @@ class MultiProcessBaseProcess(multiprocessing.Process):
       self._tasks_profiler = profilers.TasksProfiler(self._name, configuration)
       self._tasks_profiler.Start()
 
+    if configuration.HaveProfileTrace():
+      self._trace_profiler = profilers.TraceProfiler(
+          self._name, configuration)
+      self._trace_profiler.Start()
+
+      # The trace profiler records the processing phases, when the processing
+      # profiler is not enabled.
+      if not self._processing_profiler:
+        self._processing_profiler = self._trace_profiler
+
   def _StopProcessStatusRPCServer(self):
     """Stops the process status RPC server."""
     if not self._rpc_server:
@@ -232,6 +243,13 @@ class MultiProcessBaseProcess(multiprocessing.Process):
 
   def _StopProfiling(self):
     """Stops profiling."""
+    if self._trace_profiler:
+      if self._processing_profiler is self._trace_profiler:
+        self._processing_profiler = None
+
+      self._trace_profiler.Stop()
+      self._trace_profiler = None
+
     if self._memory_profiler:
       self._memory_profiler.Stop()
       self._memory_profiler = None
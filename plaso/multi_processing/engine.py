@@ -121,12 +121,17 @@ class MultiProcessEngine(engine.BaseEngine):
     process_information = self._process_information_per_pid[pid]
     used_memory = process_information.GetUsedMemory() or 0
 
-    if self._worker_memory_limit and used_memory > self._worker_memory_limit:
+    memory_limit = self._GetWorkerMemoryLimit(pid)
+    if memory_limit and used_memory > memory_limit:
       logger.warning((
           'Process: {0:s} (PID: {1:d}) killed because it exceeded the '
-          'memory limit: {2:d}.').format(
-              process.name, pid, self._worker_memory_limit))
-      self._KillProcess(pid)
+          'memory limit: {2:d}.').format(process.name, pid, memory_limit))
+      self._HandleWorkerMemoryLimitExceeded(pid, process_status)
+
+      # The killed worker process is replaced without waiting for it to
+      # stop responding.
+      process_status = {
+          'processing_status': definitions.STATUS_INDICATOR_KILLED}
 
     if isinstance(process_status, dict):
       self._rpc_errors_per_pid[pid] = 0
@@ -190,6 +195,30 @@ class MultiProcessEngine(engine.BaseEngine):
             'Unable to create replacement worker process for: {0:s}'.format(
                 process.name))
 
+  # pylint: disable=unused-argument
+  def _GetWorkerMemoryLimit(self, pid):
+    """Retrieves the memory limit of a worker process.
+
+    Args:
+      pid (int): process ID (PID) of a registered worker process.
+
+    Returns:
+      int: maximum amount of memory the worker process is allowed to consume
+          in bytes, where 0 or None represents no limit.
+    """
+    return self._worker_memory_limit
+
+  # pylint: disable=unused-argument
+  def _HandleWorkerMemoryLimitExceeded(self, pid, process_status):
+    """Handles a worker process that exceeded its memory limit.
+
+    Args:
+      pid (int): process ID (PID) of a registered worker process.
+      process_status (dict[str, object]): status values received from
+          the worker process or None if not available.
+    """
+    self._KillProcess(pid)
+
   def _KillProcess(self, pid):
     """Issues a SIGKILL or equivalent to the process.
 
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""The event source queue."""
+
+from __future__ import unicode_literals
+
+import collections
+import os
+import tempfile
+
+from plaso.serializer import json_serializer
+
+
+class EventSourceQueue(object):
+  """Queue of event sources that are pending to be scheduled.
+
+  The queue keeps a bounded number of event sources in memory. Event sources
+  that are pushed when the queue is full are spilled to a temporary file and
+  read back, in order, when the event sources in memory have been popped.
+  """
+
+  _SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
+  def __init__(self, maximum_number_of_items=100000, temporary_directory=None):
+    """Initializes an event source queue.
+
+    Args:
+      maximum_number_of_items (Optional[int]): maximum number of event sources
+          kept in memory.
+      temporary_directory (Optional[str]): path of the directory for the
+          temporary file that event sources are spilled to, where None
+          represents the default temporary directory.
+    """
+    super(EventSourceQueue, self).__init__()
+    self._event_sources = collections.deque()
+    self._maximum_number_of_items = maximum_number_of_items
+    self._number_of_spilled_event_sources = 0
+    self._spill_file = None
+    self._spill_file_read_offset = 0
+    self._temporary_directory = temporary_directory
+
+  def __len__(self):
+    """Determines the number of event sources in the queue.
+
+    Returns:
+      int: number of event sources in the queue.
+    """
+    return len(self._event_sources) + self._number_of_spilled_event_sources
+
+  @property
+  def number_of_spilled_event_sources(self):
+    """int: number of event sources that are spilled to the temporary file."""
+    return self._number_of_spilled_event_sources
+
+  def _ReadSpilledEventSources(self):
+    """Reads event sources spilled to the temporary file back into memory."""
+    self._spill_file.seek(self._spill_file_read_offset, os.SEEK_SET)
+
+    while (self._number_of_spilled_event_sources > 0 and
+           len(self._event_sources) < self._maximum_number_of_items):
+      json_string = self._spill_file.readline()
+      event_source = self._SERIALIZER.ReadSerialized(json_string.rstrip('\n'))
+      self._event_sources.append(event_source)
+      self._number_of_spilled_event_sources -= 1
+
+    self._spill_file_read_offset = self._spill_file.tell()
+
+    if not self._number_of_spilled_event_sources:
+      self._spill_file.seek(0, os.SEEK_SET)
+      self._spill_file.truncate()
+      self._spill_file_read_offset = 0
+
+  def Close(self):
+    """Closes the queue and removes the temporary file."""
+    self._event_sources.clear()
+    self._number_of_spilled_event_sources = 0
+
+    if self._spill_file:
+      self._spill_file.close()
+      self._spill_file = None
+
+  def PopEventSource(self):
+    """Pops an event source from the queue.
+
+    Returns:
+      EventSource: event source or None if the queue is empty.
+    """
+    if not self._event_sources and self._number_of_spilled_event_sources:
+      self._ReadSpilledEventSources()
+
+    try:
+      return self._event_sources.popleft()
+    except IndexError:
+      return None
+
+  def PushEventSource(self, event_source):
+    """Pushes an event source onto the queue.
+
+    Args:
+      event_source (EventSource): event source.
+    """
+    # Once event sources are spilled newer event sources are spilled as well
+    # to preserve the order of the queue.
+    if (not self._number_of_spilled_event_sources and
+        len(self._event_sources) < self._maximum_number_of_items):
+      self._event_sources.append(event_source)
+      return
+
+    if not self._spill_file:
+      # The temporary file is removed automatically when it is closed.
+      self._spill_file = tempfile.TemporaryFile(
+          mode='w+', encoding='utf-8', dir=self._temporary_directory,
+          prefix='plaso-event_sources-')
+
+    json_string = self._SERIALIZER.WriteSerialized(event_source)
+
+    self._spill_file.seek(0, os.SEEK_END)
+    self._spill_file.write('{0:s}\n'.format(json_string))
+    self._number_of_spilled_event_sources += 1
@@ -5,7 +5,11 @@ from __future__ import unicode_literals
 
 import collections
 import heapq
+import multiprocessing
 import os
+import pickle
+import shutil
+import tempfile
 import time
 
 from plaso.containers import tasks
@@ -15,9 +19,11 @@ from plaso.engine import zeromq_queue
 from plaso.lib import bufferlib
 from plaso.lib import definitions
 from plaso.multi_processing import analysis_process
+from plaso.multi_processing import base_process
 from plaso.multi_processing import engine as multi_process_engine
 from plaso.multi_processing import logger
 from plaso.storage import event_tag_index
+from plaso.storage import factory as storage_factory
 from plaso.storage import time_range as storage_time_range
 
 
@@ -200,9 +206,208 @@ class PsortEventHeap(object):
     heapq.heappush(self._heap, heap_values)
 
 
+class PsortExportOutputWriter(object):
+  """Psort export output writer.
+
+  The export output writer writes the output of an export process to a
+  temporary file, from which the output is copied to the output of the output
+  module of the psort multi-processing engine.
+  """
+
+  def __init__(self, file_object):
+    """Initializes an export output writer.
+
+    Args:
+      file_object (file): text file-like object to write to.
+    """
+    super(PsortExportOutputWriter, self).__init__()
+    self._file_object = file_object
+
+  def Write(self, string):
+    """Writes a string to the output.
+
+    Args:
+      string (str): output.
+    """
+    self._file_object.write(string)
+
+
+class PsortExportProcess(base_process.MultiProcessBaseProcess):
+  """Psort export process.
+
+  The export process exports the events in a specific time range to a
+  temporary file.
+
+  Attributes:
+    number_of_duplicate_events (multiprocessing.Value): number of events
+        that were not exported because they are duplicates.
+    number_of_exported_events (multiprocessing.Value): number of exported
+        events, which is also updated when the status is retrieved, such that
+        the engine process can determine if the export process is active.
+    number_of_filtered_events (multiprocessing.Value): number of events
+        that were not exported because they did not match the event filter.
+    number_of_macb_grouped_events (multiprocessing.Value): number of events
+        that were exported as part of a MACB group.
+  """
+
+  # Encoding and error handling of the temporary file, where "surrogatepass"
+  # ensures that strings that cannot be encoded are written to the output as
+  # if they were exported by the engine process.
+  ENCODING = 'utf-8'
+  ENCODING_ERRORS = 'surrogatepass'
+
+  def __init__(
+      self, storage_file_path, output_module, output_path, time_range,
+      processing_configuration, deduplicate_events=True, event_filter=None,
+      **kwargs):
+    """Initializes an export process.
+
+    Non-specified keyword arguments (kwargs) are directly passed to
+    multiprocessing.Process.
+
+    Args:
+      storage_file_path (str): path of the storage file to export events from.
+      output_module (LinearOutputModule): output module.
+      output_path (str): path of the temporary file to write the output to.
+      time_range (TimeRange): time range of the events to export.
+      processing_configuration (ProcessingConfiguration): processing
+          configuration.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[FilterObject]): event filter.
+    """
+    super(PsortExportProcess, self).__init__(processing_configuration, **kwargs)
+    self._deduplicate_events = deduplicate_events
+    self._event_filter = event_filter
+    self._export_engine = None
+    self._output_module = output_module
+    self._output_path = output_path
+    self._status = definitions.STATUS_INDICATOR_INITIALIZED
+    self._storage_file_path = storage_file_path
+    self._time_range = time_range
+
+    # We need to share the export counters with the engine process.
+    self.number_of_duplicate_events = multiprocessing.Value('Q', 0)
+    self.number_of_exported_events = multiprocessing.Value('Q', 0)
+    self.number_of_filtered_events = multiprocessing.Value('Q', 0)
+    self.number_of_macb_grouped_events = multiprocessing.Value('Q', 0)
+
+  def _GetStatus(self):
+    """Retrieves status information.
+
+    Returns:
+      dict[str, object]: status attributes, indexed by name.
+    """
+    # pylint: disable=protected-access
+    number_of_consumed_events = None
+    if self._export_engine:
+      number_of_consumed_events = self._export_engine._number_of_consumed_events
+      self.number_of_exported_events.value = number_of_consumed_events
+
+    if self._process_information:
+      used_memory = self._process_information.GetUsedMemory() or 0
+    else:
+      used_memory = 0
+
+    if self._memory_profiler:
+      self._memory_profiler.Sample('main', used_memory)
+
+    # XML RPC does not support integer values > 2 GiB so we format them
+    # as a string.
+    used_memory = '{0:d}'.format(used_memory)
+
+    status = {
+        'display_name': '',
+        'identifier': self._name,
+        'number_of_consumed_event_tags': None,
+        'number_of_consumed_events': number_of_consumed_events,
+        'number_of_consumed_reports': None,
+        'number_of_consumed_sources': None,
+        'number_of_consumed_warnings': None,
+        'number_of_produced_event_tags': None,
+        'number_of_produced_events': None,
+        'number_of_produced_reports': None,
+        'number_of_produced_sources': None,
+        'number_of_produced_warnings': None,
+        'processing_status': self._status,
+        'task_identifier': None,
+        'used_memory': used_memory}
+
+    # The engine process has received the completed status, hence the process
+    # does not need to wait for another status update before it stops.
+    if self._status == definitions.STATUS_INDICATOR_COMPLETED:
+      self._status_is_running = False
+
+    return status
+
+  def _Main(self):
+    """The main loop."""
+    # pylint: disable=protected-access
+    self._StartProfiling(self._processing_configuration.profiling)
+
+    logger.debug('Export process: {0!s} (PID: {1:d}) started'.format(
+        self._name, self._pid))
+
+    self._status = definitions.STATUS_INDICATOR_EXPORTING
+
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        self._storage_file_path)
+
+    self._export_engine = PsortMultiProcessEngine()
+
+    try:
+      with open(
+          self._output_path, 'w', encoding=self.ENCODING,
+          errors=self.ENCODING_ERRORS) as file_object:
+        output_writer = PsortExportOutputWriter(file_object)
+        self._output_module.SetOutputWriter(output_writer)
+
+        self._export_engine._ExportEvents(
+            storage_reader, self._output_module,
+            deduplicate_events=self._deduplicate_events,
+            event_filter=self._event_filter, time_range=self._time_range)
+
+    finally:
+      storage_reader.Close()
+
+    events_status = self._export_engine._events_status
+
+    self.number_of_duplicate_events.value = (
+        events_status.number_of_duplicate_events)
+    self.number_of_exported_events.value = (
+        self._export_engine._number_of_consumed_events)
+    self.number_of_filtered_events.value = (
+        events_status.number_of_filtered_events)
+    self.number_of_macb_grouped_events.value = (
+        events_status.number_of_macb_grouped_events)
+
+    self._status = definitions.STATUS_INDICATOR_COMPLETED
+
+    logger.debug('Export process: {0!s} (PID: {1:d}) stopped'.format(
+        self._name, self._pid))
+
+    self._StopProfiling()
+
+  def SignalAbort(self):
+    """Signals the process to abort."""
+    self._status = definitions.STATUS_INDICATOR_ABORTED
+
+
 class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
   """Psort multi-processing engine."""
 
+  # Maximum number of serialized events that are pushed onto an analysis
+  # plugin event queue as a single item.
+  _EVENT_QUEUE_BATCH_SIZE = 128
+
+  # Maximum number of characters that are copied from the output of an export
+  # process at once.
+  _EXPORT_OUTPUT_BUFFER_SIZE = 16 * 1024 * 1024
+
+  # Minimum number of events per export process, below which the overhead
+  # of starting an export process outweighs exporting the events in parallel.
+  _MINIMUM_NUMBER_OF_EVENTS_PER_EXPORT_PROCESS = 50000
+
   _PROCESS_JOIN_TIMEOUT = 5.0
 
   _QUEUE_TIMEOUT = 10 * 60
@@ -289,6 +494,14 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     filter_limit = getattr(event_filter, 'limit', None)
 
+    supported_data_types_per_plugin = {
+        analysis_plugin.NAME: analysis_plugin.GetSupportedEventDataTypes()
+        for analysis_plugin in analysis_plugins.values()}
+
+    event_queue_batches = {
+        plugin_name: [] for plugin_name in self._event_queues}
+    plugin_names_per_data_type = {}
+
     for event in storage_writer.GetSortedEvents():
       event_data_identifier = event.GetEventDataIdentifier()
       event_data = storage_writer.GetEventDataByIdentifier(
@@ -316,9 +529,31 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         number_of_filtered_events += 1
         continue
 
-      for event_queue in self._event_queues.values():
-        # TODO: Check for premature exit of analysis plugins.
-        event_queue.PushItem((event, event_data, event_data_stream))
+      data_type = getattr(event_data, 'data_type', None)
+      plugin_names = plugin_names_per_data_type.get(data_type, None)
+      if plugin_names is None:
+        plugin_names = [
+            plugin_name for plugin_name, supported_data_types in (
+                supported_data_types_per_plugin.items())
+            if plugin_name in event_queue_batches and (
+                not supported_data_types or data_type in supported_data_types)]
+        plugin_names_per_data_type[data_type] = plugin_names
+
+      if plugin_names:
+        # The event is serialized only once, independent of the number of
+        # analysis plugins it is sent to.
+        serialized_event = pickle.dumps(
+            (event, event_data, event_data_stream),
+            protocol=pickle.HIGHEST_PROTOCOL)
+
+        for plugin_name in plugin_names:
+          event_queue_batch = event_queue_batches[plugin_name]
+          event_queue_batch.append(serialized_event)
+
+          if len(event_queue_batch) >= self._EVENT_QUEUE_BATCH_SIZE:
+            # TODO: Check for premature exit of analysis plugins.
+            self._event_queues[plugin_name].PushItem(event_queue_batch)
+            event_queue_batches[plugin_name] = []
 
       self._number_of_consumed_events += 1
 
@@ -326,6 +561,10 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
           filter_limit == self._number_of_consumed_events):
         break
 
+    for plugin_name, event_queue_batch in event_queue_batches.items():
+      if event_queue_batch:
+        self._event_queues[plugin_name].PushItem(event_queue_batch)
+
     logger.debug('Finished pushing events to analysis plugins.')
     # Signal that we have finished adding events.
     for event_queue in self._event_queues.values():
@@ -487,7 +726,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
   def _ExportEvents(
       self, storage_reader, output_module, deduplicate_events=True,
-      event_filter=None, time_slice=None, use_time_slicer=False):
+      event_filter=None, time_range=None, time_slice=None,
+      use_time_slicer=False):
     """Exports events using an output module.
 
     Args:
@@ -496,6 +736,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
       event_filter (Optional[FilterObject]): event filter.
+      time_range (Optional[TimeRange]): time range of the events to export,
+          where None represents all events. The time range is ignored when
+          a time slice is defined.
       time_slice (Optional[TimeRange]): time range that defines a time slice
           to filter events.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
@@ -518,10 +761,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     filter_limit = getattr(event_filter, 'limit', None)
     forward_entries = 0
 
-    self._events_status.number_of_filtered_events = 0
-    self._events_status.number_of_events_from_time_slice = 0
-
-    for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
+    for event in storage_reader.GetSortedEvents(
+        time_range=time_slice_range or time_range):
       event_data_identifier = event.GetEventDataIdentifier()
       event_data = storage_reader.GetEventDataByIdentifier(
           event_data_identifier)
@@ -597,6 +838,123 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     self._FlushExportBuffer(storage_reader, output_module)
 
+  def _ExportEventsInParallel(
+      self, storage_reader, storage_file_path, output_module, time_ranges,
+      deduplicate_events=True, event_filter=None):
+    """Exports events in time ranges in parallel using an output module.
+
+    The events of every time range are exported by a separate export process
+    to a temporary file. The temporary files are copied to the output of
+    the output module in order of their time range. Since the time ranges do
+    not overlap and events are only deduplicated and grouped by MACB with
+    events that have the same timestamp, the output is the same as when the
+    events are exported by a single process.
+
+    Time ranges of export processes that failed or did not export events
+    within the worker timeout are exported by the engine process.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      storage_file_path (str): path of the storage file.
+      output_module (LinearOutputModule): output module that supports
+          concatenation of its output.
+      time_ranges (list[TimeRange]): consecutive time ranges of the events
+          to export.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[FilterObject]): event filter.
+    """
+    self._status = definitions.STATUS_INDICATOR_EXPORTING
+
+    temporary_directory = tempfile.mkdtemp(
+        prefix='psort_', dir=self._processing_configuration.temporary_directory)
+
+    processes = []
+
+    try:
+      for index, time_range in enumerate(time_ranges):
+        process_name = 'Export_{0:02d}'.format(index)
+        output_path = os.path.join(
+            temporary_directory, '{0:s}.txt'.format(process_name))
+
+        process = PsortExportProcess(
+            storage_file_path, output_module, output_path, time_range,
+            self._processing_configuration,
+            deduplicate_events=deduplicate_events, event_filter=event_filter,
+            name=process_name)
+
+        process.start()
+
+        logger.debug('Started export process: {0:s} (PID: {1:d}).'.format(
+            process_name, process.pid))
+
+        try:
+          self._StartMonitoringProcess(process)
+        except (IOError, KeyError) as exception:
+          logger.error((
+              'Unable to monitor export process: {0:s} (PID: {1:d}) '
+              'with error: {2!s}').format(process_name, process.pid, exception))
+
+        self._RegisterProcess(process)
+        processes.append((process, output_path, time_range))
+
+      for process, output_path, time_range in processes:
+        if not self._JoinExportProcess(process):
+          logger.warning((
+              'Export process: {0:s} (PID: {1:d}) did not export events within '
+              'the worker timeout, exporting its events in the engine '
+              'process.').format(process.name, process.pid))
+
+          self._TerminateProcess(process)
+
+          self._ExportEvents(
+              storage_reader, output_module,
+              deduplicate_events=deduplicate_events, event_filter=event_filter,
+              time_range=time_range)
+          continue
+
+        if process.exitcode != 0 or not os.path.exists(output_path):
+          logger.warning((
+              'Export process: {0:s} (PID: {1:d}) failed with exit code: '
+              '{2!s}, exporting its events in the engine process.').format(
+                  process.name, process.pid, process.exitcode))
+
+          self._ExportEvents(
+              storage_reader, output_module,
+              deduplicate_events=deduplicate_events, event_filter=event_filter,
+              time_range=time_range)
+          continue
+
+        with open(
+            output_path, 'r', encoding=process.ENCODING,
+            errors=process.ENCODING_ERRORS) as file_object:
+          text = file_object.read(self._EXPORT_OUTPUT_BUFFER_SIZE)
+          while text:
+            output_module.WriteText(text)
+            text = file_object.read(self._EXPORT_OUTPUT_BUFFER_SIZE)
+
+        os.remove(output_path)
+
+        self._events_status.number_of_duplicate_events += (
+            process.number_of_duplicate_events.value)
+        self._events_status.number_of_filtered_events += (
+            process.number_of_filtered_events.value)
+        self._events_status.number_of_macb_grouped_events += (
+            process.number_of_macb_grouped_events.value)
+        self._number_of_consumed_events += (
+            process.number_of_exported_events.value)
+
+    finally:
+      for process, _, _ in processes:
+        if process.is_alive():
+          logger.warning((
+              'Terminating export process: {0:s} (PID: {1:d}).').format(
+                  process.name, process.pid))
+          process.terminate()
+          process.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+
+      shutil.rmtree(temporary_directory, ignore_errors=True)
+
   def _FlushExportBuffer(
       self, storage_reader, output_module, deduplicate_events=True):
     """Flushes buffered events and writes them to the output module.
@@ -648,6 +1006,69 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     if macb_group:
       output_module.WriteEventMACBGroup(macb_group)
 
+  def _GetExportTimeRanges(self, storage_reader, number_of_time_ranges):
+    """Retrieves consecutive time ranges with a similar number of events.
+
+    The time ranges are determined based on quantiles of the timestamps of
+    the events, where events with the same timestamp are always part of
+    the same time range.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      number_of_time_ranges (int): maximum number of time ranges.
+
+    Returns:
+      list[TimeRange]: consecutive time ranges that contain all events,
+          which can be less than the maximum number of time ranges if many
+          events have the same timestamp.
+    """
+    quantiles = storage_reader.GetEventTimestampQuantiles(
+        number_of_time_ranges)
+    if not quantiles:
+      return []
+
+    first_timestamp = quantiles[0]
+    last_timestamp = quantiles[-1]
+
+    start_timestamps = [first_timestamp]
+    for timestamp in quantiles[1:-1]:
+      if timestamp > start_timestamps[-1]:
+        start_timestamps.append(timestamp)
+
+    end_timestamps = [timestamp - 1 for timestamp in start_timestamps[1:]]
+    end_timestamps.append(last_timestamp)
+
+    return [
+        storage_time_range.TimeRange(start_timestamp, end_timestamp)
+        for start_timestamp, end_timestamp in zip(
+            start_timestamps, end_timestamps)]
+
+  def _JoinExportProcess(self, process):
+    """Waits for an export process to stop.
+
+    Args:
+      process (PsortExportProcess): export process.
+
+    Returns:
+      bool: True if the export process stopped, False if it did not export
+          events within the worker timeout.
+    """
+    last_activity_time = time.time()
+    number_of_exported_events = process.number_of_exported_events.value
+
+    while True:
+      process.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+      if not process.is_alive():
+        return True
+
+      current_time = time.time()
+      if process.number_of_exported_events.value != number_of_exported_events:
+        last_activity_time = current_time
+        number_of_exported_events = process.number_of_exported_events.value
+
+      elif current_time - last_activity_time > self._worker_timeout:
+        return False
+
   def _MergeEventTag(self, storage_writer, attribute_container):
     """Merges an event tag with the last stored event tag.
 
@@ -1003,6 +1424,13 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       status_update_callback=None, time_slice=None, use_time_slicer=False):
     """Exports events using an output module.
 
+    The events are exported by multiple export processes, each exporting
+    the events of a different time range, when the processing configuration
+    requests multiple export processes and specifies the storage file path,
+    the output of the output module can be concatenated and there are
+    sufficient events. Otherwise the events are exported by the engine
+    process.
+
     Args:
       knowledge_base_object (KnowledgeBase): contains information from
           the source data needed for processing.
@@ -1031,6 +1459,24 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     self._events_status.total_number_of_events = total_number_of_events
 
+    number_of_export_processes = (
+        processing_configuration.number_of_export_processes)
+    storage_file_path = processing_configuration.storage_file_path
+
+    time_ranges = []
+    # The time slice, the limit of the event filter and output that cannot
+    # be concatenated, such as a JSON array, require sequential export.
+    if (number_of_export_processes > 1 and storage_file_path and
+        not time_slice and not getattr(event_filter, 'limit', None) and
+        output_module.SUPPORTS_CONCATENATION):
+      number_of_export_processes = min(
+          number_of_export_processes, total_number_of_events //
+          self._MINIMUM_NUMBER_OF_EVENTS_PER_EXPORT_PROCESS)
+
+      if number_of_export_processes > 1:
+        time_ranges = self._GetExportTimeRanges(
+            storage_reader, number_of_export_processes)
+
     output_module.Open()
     output_module.WriteHeader()
 
@@ -1039,15 +1485,22 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     self._StartProfiling(self._processing_configuration.profiling)
 
     try:
-      self._ExportEvents(
-          storage_reader, output_module, deduplicate_events=deduplicate_events,
-          event_filter=event_filter, time_slice=time_slice,
-          use_time_slicer=use_time_slicer)
+      if len(time_ranges) > 1:
+        self._ExportEventsInParallel(
+            storage_reader, storage_file_path, output_module, time_ranges,
+            deduplicate_events=deduplicate_events, event_filter=event_filter)
+
+      else:
+        self._ExportEvents(
+            storage_reader, output_module,
+            deduplicate_events=deduplicate_events, event_filter=event_filter,
+            time_slice=time_slice, use_time_slicer=use_time_slicer)
 
     finally:
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
+      self._StopMonitoringProcesses()
 
     output_module.WriteFooter()
     output_module.Close()
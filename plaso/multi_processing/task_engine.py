@@ -7,29 +7,45 @@ import heapq
 import logging
 import multiprocessing
 import os
+import shutil
+import tempfile
 import time
 import traceback
 
 from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.containers import event_sources
+from plaso.containers import events
+from plaso.containers import tasks
 from plaso.containers import warnings
 from plaso.engine import extractors
+from plaso.engine import file_system_cache
 from plaso.engine import plaso_queue
+from plaso.engine import processed_sources
 from plaso.engine import zeromq_queue
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.lib import loggers
 from plaso.multi_processing import engine
+from plaso.multi_processing import event_source_queue
 from plaso.multi_processing import logger
 from plaso.multi_processing import task_manager
 from plaso.multi_processing import worker_process
+from plaso.serializer import compact_serializer
 from plaso.storage.redis import redis_store
 
 
 class _EventSourceHeap(object):
-  """Class that defines an event source heap."""
+  """Class that defines an event source heap.
+
+  Event sources of the same weight are ordered by the file system they are
+  stored in, such that the tasks of the same volume or snapshot are scheduled
+  consecutively. Since a worker process requests multiple tasks at once, this
+  results in it processing tasks of the file systems it keeps open.
+  """
 
   def __init__(self, maximum_number_of_items=50000):
     """Initializes an event source heap.
@@ -57,7 +73,7 @@ class _EventSourceHeap(object):
       EventSource: an event source or None on if no event source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, _, _, event_source = heapq.heappop(self._heap)
 
     except IndexError:
       return None
@@ -73,13 +89,98 @@ class _EventSourceHeap(object):
     if event_source.file_entry_type == (
         dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
       weight = 1
+    elif event_source.data_type == (
+        event_sources.RecordRangeEventSource.DATA_TYPE):
+      # Record ranges are scheduled before other files so that the parsing
+      # of a large file is spread over the worker processes early on.
+      weight = 10
     else:
       weight = 100
 
-    heap_values = (weight, time.time(), event_source)
+    file_system_identifier = (
+        file_system_cache.FileSystemCache.GetFileSystemIdentifier(
+            event_source.path_spec))
+
+    heap_values = (weight, file_system_identifier, time.time(), event_source)
     heapq.heappush(self._heap, heap_values)
 
 
+class _MergedEventsCollector(object):
+  """Class that collects the events merged from a task storage.
+
+  The storage merge reader calls the merge callback before an attribute
+  container is added to the session storage, hence the collected events are
+  only resolved to their event data and event data stream after the task
+  storage has been fully merged and the attribute containers have their
+  session storage identifiers.
+  """
+
+  def __init__(self):
+    """Initializes a merged events collector."""
+    super(_MergedEventsCollector, self).__init__()
+    self._event_data = []
+    self._event_data_streams = []
+    self._events = []
+
+  def CollectAttributeContainer(self, unused_storage_writer, container):
+    """Collects an attribute container that is being merged.
+
+    This function is used as the callback of the storage merge reader.
+
+    Args:
+      unused_storage_writer (StorageWriter): storage writer for a session
+          storage.
+      container (AttributeContainer): attribute container.
+    """
+    if container.CONTAINER_TYPE == events.EventObject.CONTAINER_TYPE:
+      self._events.append(container)
+    elif container.CONTAINER_TYPE == events.EventData.CONTAINER_TYPE:
+      self._event_data.append(container)
+    elif container.CONTAINER_TYPE == events.EventDataStream.CONTAINER_TYPE:
+      self._event_data_streams.append(container)
+
+  def PopEvents(self):
+    """Pops the merged events.
+
+    Events of which the event data could not be merged are skipped.
+
+    Yields:
+      tuple[EventObject, EventData, EventDataStream]: event, event data and
+          event data stream, where the event data stream is None if not
+          available.
+    """
+    event_data_per_identifier = {
+        event_data.GetIdentifier().CopyToString(): event_data
+        for event_data in self._event_data}
+    event_data_streams_per_identifier = {
+        event_data_stream.GetIdentifier().CopyToString(): event_data_stream
+        for event_data_stream in self._event_data_streams}
+
+    merged_events = self._events
+
+    self._event_data = []
+    self._event_data_streams = []
+    self._events = []
+
+    for event in merged_events:
+      event_data_identifier = event.GetEventDataIdentifier()
+      if not event_data_identifier:
+        continue
+
+      event_data = event_data_per_identifier.get(
+          event_data_identifier.CopyToString(), None)
+      if not event_data:
+        continue
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = event_data_streams_per_identifier.get(
+            event_data_stream_identifier.CopyToString(), None)
+
+      yield event, event_data, event_data_stream
+
+
 class TaskMultiProcessEngine(engine.MultiProcessEngine):
   """Class that defines the task multi-process engine.
 
@@ -88,6 +189,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   * merge results returned by extraction workers.
   """
 
+  # Maximum number of event sources to collect per loop.
+  _MAXIMUM_NUMBER_OF_COLLECTED_EVENT_SOURCES = 100
+
   # Maximum number of attribute containers to merge per loop.
   _MAXIMUM_NUMBER_OF_CONTAINERS = 50
 
@@ -99,16 +203,33 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
   _TASK_QUEUE_TIMEOUT_SECONDS = 2
 
+  # Tasks are passed to the worker processes in compact serialized form.
+  _TASK_SERIALIZER = compact_serializer.CompactAttributeContainerSerializer
+
+  # Ratio of the memory limit of a worker process at which the worker process
+  # starts to handle memory pressure itself, before it is killed by
+  # the foreman.
+  _WORKER_MEMORY_SOFT_LIMIT_RATIO = 0.8
+
   _ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS = 10 * 60
 
+  _SNAPSHOT_FILE_ENTRY_CACHE_FILENAME = 'snapshot_file_entries.db'
+
   def __init__(
-      self, maximum_number_of_tasks=None, number_of_worker_processes=0,
+      self, high_memory_worker_memory_limit=None, maximum_number_of_tasks=None,
+      number_of_high_memory_worker_processes=0, number_of_worker_processes=0,
       worker_memory_limit=None, worker_timeout=None):
     """Initializes an engine.
 
     Args:
+      high_memory_worker_memory_limit (Optional[int]): maximum amount of
+          memory a high-memory worker is allowed to consume, where None or 0
+          represents no limit.
       maximum_number_of_tasks (Optional[int]): maximum number of concurrent
           tasks, where 0 represents no limit.
+      number_of_high_memory_worker_processes (Optional[int]): number of
+          high-memory worker processes, which process the tasks that exceeded
+          the memory limit of the other worker processes.
       number_of_worker_processes (Optional[int]): number of worker processes.
       worker_memory_limit (Optional[int]): maximum amount of memory a worker is
           allowed to consume, where None represents the default memory limit
@@ -153,10 +274,20 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     super(TaskMultiProcessEngine, self).__init__()
     self._enable_sigsegv_handler = False
+    self._event_source_queue = None
+    self._file_system_cache_statistics_per_process = {}
+    self._high_memory_task_queue = None
+    self._high_memory_task_queue_port = None
+    self._high_memory_worker_memory_limit = high_memory_worker_memory_limit
+    self._high_memory_worker_process_names = set()
     self._last_worker_number = 0
     self._maximum_number_of_tasks = maximum_number_of_tasks
+    self._memory_intensive_parsers = set()
     self._merge_task = None
     self._merge_task_on_hold = None
+    self._merged_event_callback = None
+    self._merged_events_collector = None
+    self._merged_events_collector_on_hold = None
     self._number_of_consumed_event_tags = 0
     self._number_of_consumed_events = 0
     self._number_of_consumed_reports = 0
@@ -167,8 +298,13 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._number_of_produced_reports = 0
     self._number_of_produced_sources = 0
     self._number_of_produced_warnings = 0
+    self._number_of_high_memory_worker_processes = (
+        number_of_high_memory_worker_processes)
     self._number_of_worker_processes = number_of_worker_processes
     self._path_spec_extractor = extractors.PathSpecExtractor()
+    self._peak_memory_per_parser = {}
+    self._prefetched_task_identifiers_per_pid = {}
+    self._processed_event_sources = None
     self._processing_configuration = None
     self._redis_client = None
     self._resolver_context = context.Context()
@@ -182,47 +318,203 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
-  def _FillEventSourceHeap(
-      self, storage_writer, event_source_heap, start_with_first=False):
-    """Fills the event source heap with the available written event sources.
+  def _AbandonPrefetchedTasks(self, pid):
+    """Abandons the tasks prefetched by a worker process that stopped.
+
+    The tasks that a worker process prefetched from the task queue, but did
+    not process, are lost when the worker process stops, hence they are
+    abandoned, so that they are retried, without waiting for them to become
+    inactive.
+
+    Args:
+      pid (int): process identifier (PID) of the worker process.
+    """
+    task_identifiers = self._prefetched_task_identifiers_per_pid.pop(pid, [])
+    for task_identifier in task_identifiers:
+      try:
+        self._task_manager.UpdateTaskAsAbandonedByIdentifier(task_identifier)
+      except KeyError:
+        pass
+
+  def _CollectMergedAttributeContainer(self, storage_writer, container):
+    """Collects an attribute container that is being merged.
+
+    This function is used as the callback of the storage merge reader.
 
     Args:
       storage_writer (StorageWriter): storage writer for a session storage.
-      event_source_heap (_EventSourceHeap): event source heap.
-      start_with_first (Optional[bool]): True if the function should start
-          with the first written event source.
+      container (AttributeContainer): attribute container.
     """
-    if self._processing_profiler:
-      self._processing_profiler.StartTiming('fill_event_source_heap')
+    # Event sources produced by the worker processes are queued directly
+    # instead of being read back from the session storage.
+    if container.CONTAINER_TYPE == event_sources.EventSource.CONTAINER_TYPE:
+      self._event_source_queue.PushEventSource(container)
 
-    if self._processing_profiler:
-      self._processing_profiler.StartTiming('get_event_source')
+    if self._merged_events_collector:
+      self._merged_events_collector.CollectAttributeContainer(
+          storage_writer, container)
 
-    if start_with_first:
-      event_source = storage_writer.GetFirstWrittenEventSource()
-    else:
-      event_source = storage_writer.GetNextWrittenEventSource()
+  def _FillEventSourceHeap(self, event_source_heap):
+    """Fills the event source heap with the queued event sources.
 
+    Args:
+      event_source_heap (_EventSourceHeap): event source heap.
+    """
     if self._processing_profiler:
-      self._processing_profiler.StopTiming('get_event_source')
-
-    while event_source:
-      event_source_heap.PushEventSource(event_source)
-      if event_source_heap.IsFull():
-        logger.debug('Source heap is full.')
-        break
+      self._processing_profiler.StartTiming('fill_event_source_heap')
 
+    while not event_source_heap.IsFull():
       if self._processing_profiler:
         self._processing_profiler.StartTiming('get_event_source')
 
-      event_source = storage_writer.GetNextWrittenEventSource()
+      event_source = self._event_source_queue.PopEventSource()
 
       if self._processing_profiler:
         self._processing_profiler.StopTiming('get_event_source')
 
+      if not event_source:
+        break
+
+      event_source_heap.PushEventSource(event_source)
+
+    if event_source_heap.IsFull():
+      logger.debug('Source heap is full.')
+
     if self._processing_profiler:
       self._processing_profiler.StopTiming('fill_event_source_heap')
 
+  def _GetParserName(self, parser_chain):
+    """Retrieves the name of the parser of a file type from a parser chain.
+
+    Args:
+      parser_chain (str): parser chain, such as "sqlite/chrome_27_history".
+
+    Returns:
+      str: name of the first parser in the parser chain, such as "sqlite",
+          or None if the parser chain is empty.
+    """
+    if not parser_chain:
+      return None
+
+    return parser_chain.split('/')[0]
+
+  def _GetWorkerMemoryLimit(self, pid):
+    """Retrieves the memory limit of a worker process.
+
+    Args:
+      pid (int): process ID (PID) of a registered worker process.
+
+    Returns:
+      int: maximum amount of memory the worker process is allowed to consume
+          in bytes, where 0 or None represents no limit.
+    """
+    process = self._processes_per_pid[pid]
+    if process.name in self._high_memory_worker_process_names:
+      return self._high_memory_worker_memory_limit
+
+    return self._worker_memory_limit
+
+  def _HandleWorkerMemoryLimitExceeded(self, pid, process_status):
+    """Handles a worker process that exceeded its memory limit.
+
+    The worker process is killed and the task it was processing is abandoned,
+    so that it is retried without waiting for the task to become inactive.
+    The retry task is processed by a high-memory worker process, if
+    available, as are the record ranges produced for the parser that was
+    parsing when the memory limit was exceeded.
+
+    Args:
+      pid (int): process ID (PID) of a registered worker process.
+      process_status (dict[str, object]): status values received from
+          the worker process or None if not available.
+    """
+    super(TaskMultiProcessEngine, self)._HandleWorkerMemoryLimitExceeded(
+        pid, process_status)
+
+    if not isinstance(process_status, dict):
+      return
+
+    parser_name = self._GetParserName(process_status.get('parser_chain', ''))
+    if parser_name:
+      logger.warning((
+          'Parser: {0:s} exceeded the memory limit and is considered memory '
+          'intensive.').format(parser_name))
+      self._memory_intensive_parsers.add(parser_name)
+
+    task_identifier = process_status.get('task_identifier', '')
+    if not task_identifier:
+      return
+
+    try:
+      task = self._task_manager.UpdateTaskAsAbandonedByIdentifier(
+          task_identifier)
+    except KeyError:
+      logger.debug('Worker killed while processing unknown task: {0:s}.'.format(
+          task_identifier))
+      return
+
+    task.requires_high_memory = True
+
+  def _IsProcessedEventSource(self, event_source):
+    """Determines if an event source was processed by a previous session.
+
+    Args:
+      event_source (EventSource): event source.
+
+    Returns:
+      bool: True if the event source was completed by a previous session and
+          did not change since, or was abandoned by a previous session, in
+          which case it has been restored as an abandoned task.
+    """
+    record_range = None
+    if event_source.data_type == (
+        event_sources.RecordRangeEventSource.DATA_TYPE):
+      record_range = event_source
+
+    if self._processed_event_sources.IsAbandoned(
+        event_source.path_spec, record_range=record_range):
+      return True
+
+    try:
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+          event_source.path_spec, resolver_context=self._resolver_context)
+    except (IOError, dfvfs_errors.Error):
+      file_entry = None
+
+    if not file_entry:
+      return False
+
+    file_entry_identity = (
+        processed_sources.ProcessedEventSources.GetFileEntryIdentity(
+            file_entry))
+
+    return self._processed_event_sources.IsCompleted(
+        event_source.path_spec, file_entry_identity, record_range=record_range)
+
+  def _LogFileSystemCacheStatistics(self):
+    """Logs the file system cache hits and misses reported by the workers."""
+    total_number_of_hits = 0
+    total_number_of_misses = 0
+    for process_name, (number_of_hits, number_of_misses) in sorted(
+        self._file_system_cache_statistics_per_process.items()):
+      if not number_of_hits and not number_of_misses:
+        continue
+
+      logger.debug((
+          'Worker: {0:s} file system cache hits: {1:d}, misses: '
+          '{2:d}.').format(process_name, number_of_hits, number_of_misses))
+
+      total_number_of_hits += number_of_hits
+      total_number_of_misses += number_of_misses
+
+    number_of_lookups = total_number_of_hits + total_number_of_misses
+    if number_of_lookups:
+      logger.info((
+          'File system cache hits: {0:d}, misses: {1:d}, hit rate: '
+          '{2:.1f}%.').format(
+              total_number_of_hits, total_number_of_misses,
+              (total_number_of_hits * 100.0) / number_of_lookups))
+
   def _MergeTaskStorage(self, storage_writer):
     """Merges a task storage with the session storage.
 
@@ -289,6 +581,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       if task:
         if self._storage_merge_reader:
           self._merge_task_on_hold = self._merge_task
+          self._merged_events_collector_on_hold = (
+              self._merged_events_collector)
           self._storage_merge_reader_on_hold = self._storage_merge_reader
 
           self._task_manager.SampleTaskStatus(
@@ -299,6 +593,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           self._storage_merge_reader = storage_writer.StartMergeTaskStorage(
               task)
 
+          if self._merged_event_callback:
+            self._merged_events_collector = _MergedEventsCollector()
+
           self._task_manager.SampleTaskStatus(task, 'merge_started')
 
         except IOError as exception:
@@ -309,6 +606,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
       if self._storage_merge_reader:
         fully_merged = self._storage_merge_reader.MergeAttributeContainers(
+            callback=self._CollectMergedAttributeContainer,
             maximum_number_of_containers=self._MAXIMUM_NUMBER_OF_CONTAINERS)
       else:
         # TODO: Do something more sensible when this happens, perhaps
@@ -320,6 +618,11 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         self._processing_profiler.StopTiming('merge')
 
       if fully_merged:
+        if self._merged_events_collector:
+          for event, event_data, event_data_stream in (
+              self._merged_events_collector.PopEvents()):
+            self._merged_event_callback(event, event_data, event_data_stream)
+
         try:
           self._task_manager.CompleteTask(self._merge_task)
 
@@ -330,12 +633,15 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
         if not self._storage_merge_reader_on_hold:
           self._merge_task = None
+          self._merged_events_collector = None
           self._storage_merge_reader = None
         else:
           self._merge_task = self._merge_task_on_hold
+          self._merged_events_collector = self._merged_events_collector_on_hold
           self._storage_merge_reader = self._storage_merge_reader_on_hold
 
           self._merge_task_on_hold = None
+          self._merged_events_collector_on_hold = None
           self._storage_merge_reader_on_hold = None
 
           self._task_manager.SampleTaskStatus(
@@ -375,28 +681,19 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       find_specs = (
           self.collection_filters_helper.included_file_system_find_specs)
 
+    extraction_configuration = self._processing_configuration.extraction
+
     path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
-        source_path_specs, find_specs=find_specs, recurse_file_system=False,
+        source_path_specs,
+        collect_from_mft=extraction_configuration.collect_from_mft,
+        find_specs=find_specs, recurse_file_system=False,
         resolver_context=self._resolver_context)
 
-    for path_spec in path_spec_generator:
-      if self._abort:
-        break
-
-      # TODO: determine if event sources should be DataStream or FileEntry
-      # or both.
-      event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
-      storage_writer.AddEventSource(event_source)
-
-      self._number_of_produced_sources = storage_writer.number_of_event_sources
-
-      # Update the foreman process status in case we are using a filter file.
-      self._UpdateForemanProcessStatus()
-
-      if self._status_update_callback:
-        self._status_update_callback(self._processing_status)
-
-    self._ScheduleTasks(storage_writer)
+    # The path specifications are collected while tasks are scheduled so
+    # that the worker processes do not have to wait for the collection
+    # to complete.
+    self._ScheduleTasks(
+        storage_writer, path_spec_generator=path_spec_generator)
 
     if self._abort:
       self._status = definitions.STATUS_INDICATOR_ABORTED
@@ -418,11 +715,56 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     if self._task_queue_profiler:
       self._task_queue_profiler.Sample(tasks_status)
 
+    if self._trace_profiler:
+      self._trace_profiler.SampleTasksStatus(tasks_status)
+
     self._processing_status.UpdateTasksStatus(tasks_status)
 
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _CollectEventSources(self, storage_writer, path_spec_generator):
+    """Collects event sources from a path specification generator.
+
+    At most _MAXIMUM_NUMBER_OF_COLLECTED_EVENT_SOURCES are collected per call,
+    so that collection can be interleaved with task scheduling.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      path_spec_generator (generator[dfvfs.PathSpec]): path specification
+          generator.
+
+    Returns:
+      bool: True if the generator can produce more path specifications.
+    """
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('collect_event_sources')
+
+    has_more_path_specs = True
+    for _ in range(self._MAXIMUM_NUMBER_OF_COLLECTED_EVENT_SOURCES):
+      if self._abort:
+        break
+
+      try:
+        path_spec = next(path_spec_generator)
+      except StopIteration:
+        has_more_path_specs = False
+        break
+
+      # TODO: determine if event sources should be DataStream or FileEntry
+      # or both.
+      event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+      storage_writer.AddEventSource(event_source)
+
+      self._event_source_queue.PushEventSource(event_source)
+
+    self._number_of_produced_sources = storage_writer.number_of_event_sources
+
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('collect_event_sources')
+
+    return has_more_path_specs
+
   def _ScheduleTask(self, task):
     """Schedules a task.
 
@@ -435,8 +777,17 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     if self._processing_profiler:
       self._processing_profiler.StartTiming('schedule_task')
 
+    task_queue = self._task_queue
+    if task.requires_high_memory and self._high_memory_task_queue:
+      task_queue = self._high_memory_task_queue
+
+    # The task identifier is passed together with the serialized task so that
+    # a worker process can determine the identifiers of the tasks it prefetched
+    # without deserializing them.
+    serialized_task = self._TASK_SERIALIZER.WriteSerialized(task)
+
     try:
-      self._task_queue.PushItem(task, block=False)
+      task_queue.PushItem((task.identifier, serialized_task), block=False)
       is_scheduled = True
 
     except errors.QueueFull:
@@ -447,43 +798,85 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     return is_scheduled
 
-  def _ScheduleTasks(self, storage_writer):
+  def _ScheduleTasks(self, storage_writer, path_spec_generator=None):
     """Schedules tasks.
 
     Args:
       storage_writer (StorageWriter): storage writer for a session storage.
+      path_spec_generator (Optional[generator[dfvfs.PathSpec]]): path
+          specification generator of the sources that are still being
+          collected, where None represents that all event sources were
+          already written to the storage writer.
     """
     logger.debug('Task scheduler started')
 
-    self._status = definitions.STATUS_INDICATOR_RUNNING
+    is_collecting = path_spec_generator is not None
+    if is_collecting:
+      is_collecting = self._CollectEventSources(
+          storage_writer, path_spec_generator)
 
-    # TODO: make tasks persistent.
+    if not is_collecting:
+      self._status = definitions.STATUS_INDICATOR_RUNNING
 
     # TODO: protect task scheduler loop by catch all and
     # handle abort path.
 
+    number_of_skipped_event_sources = 0
+    if self._processed_event_sources:
+      # Tasks abandoned by a previous session are retried first.
+      for processed_event_source in (
+          self._processed_event_sources.GetAbandonedEventSources()):
+        task = tasks.Task(session_identifier=self._session_identifier)
+        task.file_entry_type = processed_event_source.file_entry_type
+        task.path_spec = processed_event_source.path_spec
+        task.record_range = processed_event_source.record_range
+        task.storage_format = (
+            self._processing_configuration.task_storage_format)
+
+        self._task_manager.RestoreAbandonedTask(task)
+
     event_source_heap = _EventSourceHeap()
 
-    self._FillEventSourceHeap(
-        storage_writer, event_source_heap, start_with_first=True)
+    self._FillEventSourceHeap(event_source_heap)
 
     event_source = event_source_heap.PopEventSource()
 
     task = None
-    while event_source or self._task_manager.HasPendingTasks():
+    while (is_collecting or event_source or
+           self._task_manager.HasPendingTasks()):
       if self._abort:
         break
 
       try:
+        if is_collecting:
+          is_collecting = self._CollectEventSources(
+              storage_writer, path_spec_generator)
+          if not is_collecting:
+            self._status = definitions.STATUS_INDICATOR_RUNNING
+
         if not task:
           task = self._task_manager.CreateRetryTask()
 
+        if (not task and event_source and self._processed_event_sources and
+            self._IsProcessedEventSource(event_source)):
+          event_source = None
+
+          number_of_skipped_event_sources += 1
+          self._number_of_consumed_sources += 1
+
         if not task and event_source:
           task = self._task_manager.CreateTask(
               self._session_identifier,
               storage_format=self._processing_configuration.task_storage_format)
           task.file_entry_type = event_source.file_entry_type
           task.path_spec = event_source.path_spec
+
+          if event_source.data_type == (
+              event_sources.RecordRangeEventSource.DATA_TYPE):
+            task.record_range = event_source
+            task.requires_high_memory = (
+                event_source.parser_name in self._memory_intensive_parsers)
+
           event_source = None
 
           self._number_of_consumed_sources += 1
@@ -505,9 +898,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         self._MergeTaskStorage(storage_writer)
 
         if not event_source_heap.IsFull():
-          self._FillEventSourceHeap(storage_writer, event_source_heap)
-        else:
-          logger.debug('Source heap is full.')
+          self._FillEventSourceHeap(event_source_heap)
 
         if not task and not event_source:
           event_source = event_source_heap.PopEventSource()
@@ -528,6 +919,18 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._storage_writer.AddWarning(warning)
       self._processing_status.error_path_specs.append(task.path_spec)
 
+      processed_event_source = event_sources.ProcessedEventSource(
+          path_spec=task.path_spec,
+          status=event_sources.ProcessedEventSource.STATUS_ABANDONED)
+      processed_event_source.file_entry_type = task.file_entry_type
+      processed_event_source.record_range = task.record_range
+      self._storage_writer.AddProcessedEventSource(processed_event_source)
+
+    if number_of_skipped_event_sources:
+      logger.info((
+          'Skipped {0:d} event sources processed by a previous '
+          'session.').format(number_of_skipped_event_sources))
+
     self._status = definitions.STATUS_INDICATOR_IDLE
 
     if self._abort:
@@ -539,7 +942,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     """Creates, starts, monitors and registers a worker process.
 
     Args:
-      process_name (str): process name.
+      process_name (str): process name, which is only used to determine if
+          the worker process is a high-memory worker process, since the other
+          worker processes are numbered.
       storage_writer (StorageWriter): storage writer for a session storage used
           to create task storage.
 
@@ -547,20 +952,37 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       MultiProcessWorkerProcess: extraction worker process or None if the
           process could not be started.
     """
-    process_name = 'Worker_{0:02d}'.format(self._last_worker_number)
+    if process_name in self._high_memory_worker_process_names:
+      memory_limit = self._high_memory_worker_memory_limit
+      task_queue_port = self._high_memory_task_queue_port
+    else:
+      process_name = 'Worker_{0:02d}'.format(self._last_worker_number)
+      memory_limit = self._worker_memory_limit
+      task_queue_port = self._task_queue_port
+
     logger.debug('Starting worker process {0:s}'.format(process_name))
 
     queue_name = '{0:s} task queue'.format(process_name)
     task_queue = zeromq_queue.ZeroMQRequestConnectQueue(
-        delay_open=True, linger_seconds=0, name=queue_name,
-        port=self._task_queue_port,
+        delay_open=True, linger_seconds=0,
+        maximum_number_of_prefetched_items=(
+            self._processing_configuration.maximum_number_of_prefetched_tasks),
+        name=queue_name, port=task_queue_port,
         timeout_seconds=self._TASK_QUEUE_TIMEOUT_SECONDS)
 
+    # The worker process handles memory pressure itself before it reaches
+    # the memory limit at which it is killed.
+    memory_soft_limit = None
+    if memory_limit:
+      memory_soft_limit = int(
+          memory_limit * self._WORKER_MEMORY_SOFT_LIMIT_RATIO)
+
     process = worker_process.WorkerProcess(
         task_queue, storage_writer, self.collection_filters_helper,
         self.knowledge_base, self._session_identifier,
         self._processing_configuration,
-        enable_sigsegv_handler=self._enable_sigsegv_handler, name=process_name)
+        enable_sigsegv_handler=self._enable_sigsegv_handler,
+        memory_limit=memory_soft_limit, name=process_name)
 
     # Remove all possible log handlers to prevent a child process from logging
     # to the main process log file and garbling the log. The log handlers are
@@ -608,6 +1030,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       if self._task_queue_profiler:
         self._task_queue_profiler.Sample(tasks_status)
 
+      if self._trace_profiler:
+        self._trace_profiler.SampleTasksStatus(tasks_status)
+
       self._processing_status.UpdateTasksStatus(tasks_status)
 
       if self._status_update_callback:
@@ -628,26 +1053,37 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       # Signal all the processes to abort.
       self._AbortTerminate()
 
+    task_queues = [self._task_queue]
+    if self._high_memory_task_queue:
+      task_queues.append(self._high_memory_task_queue)
+
     logger.debug('Emptying task queue.')
-    self._task_queue.Empty()
+    for task_queue in task_queues:
+      task_queue.Empty()
 
     # Wake the processes to make sure that they are not blocking
     # waiting for the queue new items.
-    for _ in self._processes_per_pid:
+    for process in self._processes_per_pid.values():
+      task_queue = self._task_queue
+      if process.name in self._high_memory_worker_process_names:
+        task_queue = self._high_memory_task_queue
+
       try:
-        self._task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
+        task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
       except errors.QueueFull:
         logger.warning('Task queue full, unable to push abort message.')
 
     # Try waiting for the processes to exit normally.
     self._AbortJoin(timeout=self._PROCESS_JOIN_TIMEOUT)
-    self._task_queue.Close(abort=abort)
+    for task_queue in task_queues:
+      task_queue.Close(abort=abort)
 
     if not abort:
       # Check if the processes are still alive and terminate them if necessary.
       self._AbortTerminate()
       self._AbortJoin(timeout=self._PROCESS_JOIN_TIMEOUT)
-      self._task_queue.Close(abort=True)
+      for task_queue in task_queues:
+        task_queue.Close(abort=True)
 
     # Kill any lingering processes.
     self._AbortKill()
@@ -659,6 +1095,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     if self._memory_profiler:
       self._memory_profiler.Sample('main', used_memory)
 
+    if self._trace_profiler:
+      self._trace_profiler.SampleCounter('memory', {'used': used_memory})
+
     display_name = getattr(self._merge_task, 'identifier', '')
 
     self._processing_status.UpdateForemanStatus(
@@ -720,6 +1159,16 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     number_of_produced_warnings = process_status.get(
         'number_of_produced_warnings', None)
 
+    number_of_skipped_file_entries = process_status.get(
+        'number_of_skipped_file_entries', None)
+
+    # The memory used by the worker process is attributed to the parser that
+    # it was running at the time, to track the peak memory usage per parser.
+    parser_name = self._GetParserName(process_status.get('parser_chain', ''))
+    if parser_name:
+      peak_memory = self._peak_memory_per_parser.get(parser_name, 0)
+      self._peak_memory_per_parser[parser_name] = max(peak_memory, used_memory)
+
     if processing_status != definitions.STATUS_INDICATOR_IDLE:
       last_activity_timestamp = process_status.get(
           'last_activity_timestamp', 0.0)
@@ -740,7 +1189,26 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         number_of_consumed_events, number_of_produced_events,
         number_of_consumed_event_tags, number_of_produced_event_tags,
         number_of_consumed_reports, number_of_produced_reports,
-        number_of_consumed_warnings, number_of_produced_warnings)
+        number_of_consumed_warnings, number_of_produced_warnings,
+        number_of_skipped_file_entries=number_of_skipped_file_entries)
+
+    prefetched_task_identifiers = process_status.get(
+        'prefetched_task_identifiers', None)
+    if prefetched_task_identifiers is not None:
+      self._prefetched_task_identifiers_per_pid[pid] = (
+          prefetched_task_identifiers)
+
+    if processing_status in definitions.ERROR_STATUS_INDICATORS:
+      self._AbandonPrefetchedTasks(pid)
+
+    number_of_file_system_cache_hits = process_status.get(
+        'number_of_file_system_cache_hits', None)
+    number_of_file_system_cache_misses = process_status.get(
+        'number_of_file_system_cache_misses', None)
+    if (number_of_file_system_cache_hits is not None and
+        number_of_file_system_cache_misses is not None):
+      self._file_system_cache_statistics_per_process[process.name] = (
+          number_of_file_system_cache_hits, number_of_file_system_cache_misses)
 
     task_identifier = process_status.get('task_identifier', '')
     if not task_identifier:
@@ -757,6 +1225,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   def ProcessSources(
       self, session, source_path_specs, storage_writer,
       processing_configuration, enable_sigsegv_handler=False,
+      merged_event_callback=None, processed_event_sources=None,
       status_update_callback=None):
     """Processes the sources and extract events.
 
@@ -769,6 +1238,15 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           configuration.
       enable_sigsegv_handler (Optional[bool]): True if the SIGSEGV handler
           should be enabled.
+      merged_event_callback (Optional[function]): callback function that is
+          called with every event (EventObject), its event data (EventData)
+          and event data stream (EventDataStream), after the task storage
+          that contains the event has been merged with the session storage.
+          The events are passed in the order in which they are merged, which
+          is not chronological.
+      processed_event_sources (Optional[ProcessedEventSources]): event sources
+          processed by previous sessions, which are not processed again unless
+          they changed, where None represents all event sources are processed.
       status_update_callback (Optional[function]): callback function for status
           updates.
 
@@ -776,6 +1254,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       ProcessingStatus: processing status.
     """
     self._enable_sigsegv_handler = enable_sigsegv_handler
+    self._merged_event_callback = merged_event_callback
+    self._processed_event_sources = processed_event_sources
 
     # Keep track of certain values so we can spawn new extraction workers.
     self._processing_configuration = processing_configuration
@@ -786,6 +1266,11 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._status_update_callback = status_update_callback
     self._storage_writer = storage_writer
 
+    # Event sources that are pending to be scheduled are kept in memory and
+    # spilled to a temporary file when there are too many.
+    self._event_source_queue = event_source_queue.EventSourceQueue(
+        temporary_directory=processing_configuration.temporary_directory)
+
     # Set up the task queue.
     task_outbound_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
         delay_open=True, linger_seconds=0, maximum_items=1,
@@ -799,9 +1284,20 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._task_queue.Open()
     self._task_queue_port = self._task_queue.port
 
+    # Tasks that exceeded the memory limit of a worker process are processed
+    # by the high-memory worker processes, which have their own task queue.
+    if self._number_of_high_memory_worker_processes:
+      self._high_memory_task_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+          delay_open=True, linger_seconds=0, maximum_items=1,
+          name='high_memory_task_queue',
+          timeout_seconds=self._ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS)
+      self._high_memory_task_queue.Open()
+      self._high_memory_task_queue_port = self._high_memory_task_queue.port
+
     self._StartProfiling(self._processing_configuration.profiling)
     self._task_manager.StartProfiling(
         self._processing_configuration.profiling, self._name)
+    self._task_manager.SetTraceProfiler(self._trace_profiler)
 
     if self._serializers_profiler:
       storage_writer.SetSerializersProfiler(self._serializers_profiler)
@@ -812,13 +1308,36 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # Set up the storage writer before the worker processes.
     storage_writer.StartTaskStorage()
 
+    # The snapshot file entry cache is shared by the worker processes and
+    # hence needs to be set up before the worker processes are started.
+    snapshot_cache_directory = None
+    extraction_configuration = processing_configuration.extraction
+    if (extraction_configuration.skip_unchanged_snapshot_files and
+        not extraction_configuration.snapshot_file_entry_cache_path):
+      snapshot_cache_directory = tempfile.mkdtemp(
+          dir=processing_configuration.temporary_directory)
+      extraction_configuration.snapshot_file_entry_cache_path = os.path.join(
+          snapshot_cache_directory, self._SNAPSHOT_FILE_ENTRY_CACHE_FILENAME)
+
     for worker_number in range(self._number_of_worker_processes):
-      # First argument to _StartWorkerProcess is not used.
+      # First argument to _StartWorkerProcess is only used for high-memory
+      # worker processes.
       extraction_process = self._StartWorkerProcess('', storage_writer)
       if not extraction_process:
         logger.error('Unable to create worker process: {0:d}'.format(
             worker_number))
 
+    for worker_number in range(self._number_of_high_memory_worker_processes):
+      process_name = 'HighMemoryWorker_{0:02d}'.format(worker_number)
+      self._high_memory_worker_process_names.add(process_name)
+
+      extraction_process = self._StartWorkerProcess(
+          process_name, storage_writer)
+      if not extraction_process:
+        logger.error(
+            'Unable to create high-memory worker process: {0:d}'.format(
+                worker_number))
+
     self._StartStatusUpdateThread()
 
     # TODO: decouple session and storage writer?
@@ -847,12 +1366,22 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
 
+      self._event_source_queue.Close()
+      self._event_source_queue = None
+
       if self._serializers_profiler:
         storage_writer.SetSerializersProfiler(None)
 
       if self._storage_profiler:
         storage_writer.SetStorageProfiler(None)
 
+      if self._task_queue_latency_profiler:
+        for task_queue in (self._task_queue, self._high_memory_task_queue):
+          if task_queue:
+            self._task_queue_latency_profiler.Sample(
+                task_queue.name, task_queue.GetLatencyHistogram())
+
+      self._task_manager.SetTraceProfiler(None)
       self._task_manager.StopProfiling()
       self._StopProfiling()
 
@@ -870,6 +1399,26 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # close is a failsafe.
     self._task_queue.Close(abort=True)
 
+    if self._high_memory_task_queue:
+      self._high_memory_task_queue.Close(abort=True)
+      self._high_memory_task_queue = None
+      self._high_memory_task_queue_port = None
+
+    self._high_memory_worker_process_names = set()
+    self._prefetched_task_identifiers_per_pid = {}
+
+    for parser_name, peak_memory in sorted(
+        self._peak_memory_per_parser.items()):
+      logger.debug('Parser: {0:s} peak memory usage: {1:d} bytes.'.format(
+          parser_name, peak_memory))
+
+    self._LogFileSystemCacheStatistics()
+    self._file_system_cache_statistics_per_process = {}
+
+    if snapshot_cache_directory:
+      extraction_configuration.snapshot_file_entry_cache_path = None
+      shutil.rmtree(snapshot_cache_directory, ignore_errors=True)
+
     if self._processing_status.error_path_specs:
       task_storage_abort = True
     else:
@@ -890,6 +1439,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # Reset values.
     self._enable_sigsegv_handler = None
 
+    self._processed_event_sources = None
     self._processing_configuration = None
 
     self._session_identifier = None
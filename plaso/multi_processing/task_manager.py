@@ -165,6 +165,7 @@ class TaskManager(object):
     self._tasks_processing = {}
 
     self._tasks_profiler = None
+    self._trace_profiler = None
 
     # TODO: implement a limit on the number of tasks.
     self._total_number_of_tasks = 0
@@ -514,6 +515,22 @@ class TaskManager(object):
 
       logger.debug('Removed task {0:s}.'.format(task.identifier))
 
+  def RestoreAbandonedTask(self, task):
+    """Restores a task that was abandoned by a previous session.
+
+    The restored task is retried as any other abandoned task.
+
+    Args:
+      task (Task): task.
+    """
+    with self._lock:
+      self._tasks_abandoned[task.identifier] = task
+      self._total_number_of_tasks += 1
+
+      logger.debug('Restored abandoned task: {0:s}.'.format(task.identifier))
+
+      self.SampleTaskStatus(task, 'restored_abandoned')
+
   def SampleTaskStatus(self, task, status):
     """Takes a sample of the status of the task for profiling.
 
@@ -524,6 +541,18 @@ class TaskManager(object):
     if self._tasks_profiler:
       self._tasks_profiler.Sample(task, status)
 
+    if self._trace_profiler:
+      self._trace_profiler.SampleTaskStatus(task, status)
+
+  def SetTraceProfiler(self, trace_profiler):
+    """Sets the trace profiler.
+
+    Args:
+      trace_profiler (TraceProfiler): trace profiler, where None disables
+          tracing of the status of tasks.
+    """
+    self._trace_profiler = trace_profiler
+
   def StartProfiling(self, configuration, identifier):
     """Starts profiling.
 
@@ -545,6 +574,38 @@ class TaskManager(object):
       self._tasks_profiler.Stop()
       self._tasks_profiler = None
 
+  def UpdateTaskAsAbandonedByIdentifier(self, task_identifier):
+    """Updates the task manager to reflect the task is abandoned.
+
+    This is used when the worker process that was processing the task is
+    known to have failed, so that the task can be retried without waiting
+    for it to become inactive.
+
+    Args:
+      task_identifier (str): unique identifier of the task.
+
+    Returns:
+      Task: task that was abandoned.
+
+    Raises:
+      KeyError: if the task was not queued or processing.
+    """
+    with self._lock:
+      task = self._tasks_processing.pop(task_identifier, None)
+      if not task:
+        task = self._tasks_queued.pop(task_identifier, None)
+      if not task:
+        raise KeyError('Task {0:s} was not queued or processing.'.format(
+            task_identifier))
+
+      logger.debug('Abandoned task: {0:s}.'.format(task_identifier))
+
+      self._tasks_abandoned[task_identifier] = task
+
+      self.SampleTaskStatus(task, 'abandoned_processing')
+
+    return task
+
   def UpdateTaskAsPendingMerge(self, task):
     """Updates the task manager to reflect that the task is ready to be merged.
 
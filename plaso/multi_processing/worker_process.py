@@ -7,6 +7,8 @@ from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 
+from plaso.containers import event_sources
+from plaso.engine import file_system_cache
 from plaso.engine import plaso_queue
 from plaso.engine import worker
 from plaso.lib import definitions
@@ -14,14 +16,30 @@ from plaso.lib import errors
 from plaso.multi_processing import base_process
 from plaso.multi_processing import logger
 from plaso.parsers import mediator as parsers_mediator
+from plaso.serializer import compact_serializer
 
 
 class WorkerProcess(base_process.MultiProcessBaseProcess):
   """Class that defines a multi-processing worker process."""
 
+  # Tasks are received from the task queue in compact serialized form.
+  _TASK_SERIALIZER = compact_serializer.CompactAttributeContainerSerializer
+
+  # Default maximum number of file-like objects and file systems cached in
+  # the resolver context, in addition to those kept open by the file system
+  # cache.
+  _MAXIMUM_NUMBER_OF_CACHED_FILE_OBJECTS = 128
+  _MAXIMUM_NUMBER_OF_CACHED_FILE_SYSTEMS = 16
+
+  # Number of file-like objects, such as those of the storage media image
+  # and volume, a file system kept open by the file system cache is expected
+  # to depend on.
+  _NUMBER_OF_FILE_OBJECTS_PER_CACHED_FILE_SYSTEM = 4
+
   def __init__(
       self, task_queue, storage_writer, collection_filters_helper,
-      knowledge_base, session_identifier, processing_configuration, **kwargs):
+      knowledge_base, session_identifier, processing_configuration,
+      memory_limit=None, **kwargs):
     """Initializes a worker process.
 
     Non-specified keyword arguments (kwargs) are directly passed to
@@ -37,6 +55,12 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       session_identifier (str): identifier of the session.
       processing_configuration (ProcessingConfiguration): processing
           configuration.
+      memory_limit (Optional[int]): soft limit of the amount of memory, in
+          bytes, the worker process is allowed to consume, where None
+          represents no limit. When the limit is exceeded the worker process
+          writes buffered attribute containers, collects garbage and hands off
+          records that remain to be parsed. This limit should be lower than
+          the limit at which the foreman kills the worker process.
       kwargs: keyword arguments to pass to multiprocessing.Process.
     """
     super(WorkerProcess, self).__init__(processing_configuration, **kwargs)
@@ -45,10 +69,13 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._buffer_size = 0
     self._current_display_name = ''
     self._extraction_worker = None
+    self._file_system_cache = None
     self._knowledge_base = knowledge_base
+    self._memory_limit = memory_limit
     self._number_of_consumed_events = 0
     self._number_of_consumed_sources = 0
     self._parser_mediator = None
+    self._prefetched_task_identifiers = []
     self._session_identifier = session_identifier
     self._status = definitions.STATUS_INDICATOR_INITIALIZED
     self._storage_writer = storage_writer
@@ -68,18 +95,31 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
           self._parser_mediator.number_of_produced_event_sources)
       number_of_produced_warnings = (
           self._parser_mediator.number_of_produced_warnings)
+      parser_chain = self._parser_mediator.GetParserChain()
     else:
       number_of_produced_events = None
       number_of_produced_sources = None
       number_of_produced_warnings = None
+      parser_chain = ''
+
+    if self._file_system_cache:
+      number_of_file_system_cache_hits = self._file_system_cache.number_of_hits
+      number_of_file_system_cache_misses = (
+          self._file_system_cache.number_of_misses)
+    else:
+      number_of_file_system_cache_hits = None
+      number_of_file_system_cache_misses = None
 
     if self._extraction_worker and self._parser_mediator:
       last_activity_timestamp = max(
           self._extraction_worker.last_activity_timestamp,
           self._parser_mediator.last_activity_timestamp)
+      number_of_skipped_file_entries = (
+          self._extraction_worker.number_of_skipped_file_entries)
       processing_status = self._extraction_worker.processing_status
     else:
       last_activity_timestamp = 0.0
+      number_of_skipped_file_entries = None
       processing_status = self._status
 
     task_identifier = getattr(self._task, 'identifier', '')
@@ -92,6 +132,9 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     if self._memory_profiler:
       self._memory_profiler.Sample('main', used_memory)
 
+    if self._trace_profiler:
+      self._trace_profiler.SampleCounter('memory', {'used': used_memory})
+
     # XML RPC does not support integer values > 2 GiB so we format them
     # as a string.
     used_memory = '{0:d}'.format(used_memory)
@@ -104,10 +147,16 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
         'number_of_consumed_events': self._number_of_consumed_events,
         'number_of_consumed_sources': self._number_of_consumed_sources,
         'number_of_consumed_warnings': None,
+        'number_of_file_system_cache_hits': number_of_file_system_cache_hits,
+        'number_of_file_system_cache_misses': (
+            number_of_file_system_cache_misses),
         'number_of_produced_event_tags': None,
         'number_of_produced_events': number_of_produced_events,
         'number_of_produced_sources': number_of_produced_sources,
         'number_of_produced_warnings': number_of_produced_warnings,
+        'number_of_skipped_file_entries': number_of_skipped_file_entries,
+        'parser_chain': parser_chain,
+        'prefetched_task_identifiers': self._prefetched_task_identifiers,
         'processing_status': processing_status,
         'task_identifier': task_identifier,
         'used_memory': used_memory}
@@ -116,9 +165,25 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
   def _Main(self):
     """The main loop."""
+    extraction_configuration = self._processing_configuration.extraction
+
+    maximum_number_of_cached_file_systems = (
+        extraction_configuration.maximum_number_of_cached_file_systems or 0)
+
     # We need a resolver context per process to prevent multi processing
     # issues with file objects stored in images.
-    resolver_context = context.Context()
+    resolver_context = context.Context(
+        maximum_number_of_file_objects=(
+            self._MAXIMUM_NUMBER_OF_CACHED_FILE_OBJECTS + (
+                maximum_number_of_cached_file_systems *
+                self._NUMBER_OF_FILE_OBJECTS_PER_CACHED_FILE_SYSTEM)),
+        maximum_number_of_file_systems=(
+            self._MAXIMUM_NUMBER_OF_CACHED_FILE_SYSTEMS +
+            maximum_number_of_cached_file_systems))
+
+    self._file_system_cache = file_system_cache.FileSystemCache(
+        resolver_context, maximum_number_of_file_systems=(
+            maximum_number_of_cached_file_systems))
 
     for credential_configuration in self._processing_configuration.credentials:
       resolver.Resolver.key_chain.SetCredential(
@@ -126,9 +191,14 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
           credential_configuration.credential_type,
           credential_configuration.credential_data)
 
+    # Only worker processes split large files into record ranges, since
+    # the record ranges are parsed in parallel by the other worker processes.
     self._parser_mediator = parsers_mediator.ParserMediator(
         None, self._knowledge_base,
         collection_filters_helper=self._collection_filters_helper,
+        maximum_number_of_records_per_task=(
+            extraction_configuration.maximum_number_of_records_per_task),
+        memory_limit=self._memory_limit,
         preferred_year=self._processing_configuration.preferred_year,
         resolver_context=resolver_context,
         temporary_directory=self._processing_configuration.temporary_directory)
@@ -141,7 +211,7 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
             self._processing_configuration.parser_filter_expression))
 
     self._extraction_worker.SetExtractionConfiguration(
-        self._processing_configuration.extraction)
+        extraction_configuration)
 
     self._parser_mediator.StartProfiling(
         self._processing_configuration.profiling, self._name,
@@ -181,6 +251,10 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
           logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
           break
 
+        task_identifier, serialized_task = task
+        self._UpdatePrefetchedTaskIdentifiers(task_identifier)
+
+        task = self._TASK_SERIALIZER.ReadSerialized(serialized_task)
         self._ProcessTask(task)
 
       logger.debug('{0!s} (PID: {1:d}) stopped monitoring task queue.'.format(
@@ -211,6 +285,17 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._StopProfiling()
     self._parser_mediator.StopProfiling()
 
+    hit_rate = self._file_system_cache.hit_rate
+    if hit_rate is not None:
+      logger.debug((
+          'Worker: {0!s} (PID: {1:d}) file system cache hits: {2:d}, misses: '
+          '{3:d}, hit rate: {4:.1f}%.').format(
+              self._name, self._pid, self._file_system_cache.number_of_hits,
+              self._file_system_cache.number_of_misses, hit_rate))
+
+    self._file_system_cache.Empty()
+    self._extraction_worker.Close()
+
     self._extraction_worker = None
     self._parser_mediator = None
     self._storage_writer = None
@@ -228,25 +313,61 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     except errors.QueueAlreadyClosed:
       logger.error('Queue for {0:s} was already closed.'.format(self.name))
 
-  def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
+  def _CreateProcessedEventSource(self, task):
+    """Creates a processed event source of a completed task.
+
+    The identity of the file entry is the one determined by the extraction
+    worker when it opened the file entry to process the task.
+
+    Args:
+      task (Task): task.
+
+    Returns:
+      ProcessedEventSource: processed event source or None if the identity of
+          the file entry is not available, in which case a subsequent
+          extraction cannot determine if the file entry changed.
+    """
+    file_entry_identity = self._extraction_worker.file_entry_identity
+    if not file_entry_identity:
+      return None
+
+    processed_event_source = event_sources.ProcessedEventSource(
+        path_spec=task.path_spec,
+        status=event_sources.ProcessedEventSource.STATUS_COMPLETED)
+    processed_event_source.file_entry_identity = file_entry_identity
+    processed_event_source.file_entry_type = task.file_entry_type
+    processed_event_source.record_range = task.record_range
+
+    return processed_event_source
+
+  def _ProcessPathSpec(
+      self, extraction_worker, parser_mediator, path_spec, record_range=None):
     """Processes a path specification.
 
     Args:
       extraction_worker (worker.ExtractionWorker): extraction worker.
       parser_mediator (ParserMediator): parser mediator.
       path_spec (dfvfs.PathSpec): path specification.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification to process, where None represents all data
+          of the path specification.
+
+    Returns:
+      bool: True if the path specification was processed, False if processing
+          failed.
     """
     self._current_display_name = parser_mediator.GetDisplayNameForPathSpec(
         path_spec)
 
-    excluded_find_specs = None
+    excluded_path_filter = None
     if self._collection_filters_helper:
-      excluded_find_specs = (
-          self._collection_filters_helper.excluded_file_system_find_specs)
+      excluded_path_filter = (
+          self._collection_filters_helper.excluded_file_system_path_filter)
 
     try:
       extraction_worker.ProcessPathSpec(
-          parser_mediator, path_spec, excluded_find_specs=excluded_find_specs)
+          parser_mediator, path_spec, excluded_path_filter=excluded_path_filter,
+          record_range=record_range)
 
     except dfvfs_errors.CacheFullError:
       # TODO: signal engine of failure.
@@ -254,6 +375,7 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       logger.error((
           'ABORT: detected cache full error while processing path spec: '
           '{0:s}').format(self._current_display_name))
+      return False
 
     except Exception as exception:  # pylint: disable=broad-except
       parser_mediator.ProduceExtractionWarning((
@@ -266,6 +388,10 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
             '{0:s}.').format(self._current_display_name))
         logger.exception(exception)
 
+      return False
+
+    return True
+
   def _ProcessTask(self, task):
     """Processes a task.
 
@@ -277,6 +403,9 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     if self._tasks_profiler:
       self._tasks_profiler.Sample(task, 'processing_started')
 
+    if self._trace_profiler:
+      self._trace_profiler.SampleTaskStatus(task, 'processing_started')
+
     self._task = task
 
     task_storage_writer = self._storage_writer.CreateTaskStorage(
@@ -291,12 +420,34 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
     task_storage_writer.WriteTaskStart()
 
+    number_of_produced_event_sources = (
+        self._parser_mediator.number_of_produced_event_sources)
+
+    # Keep the file system of the task open for subsequent tasks of the same
+    # volume or snapshot.
+    if self._file_system_cache and task.path_spec:
+      self._file_system_cache.CacheFileSystem(task.path_spec)
+
     try:
       # TODO: add support for more task types.
-      self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
+      is_processed = self._ProcessPathSpec(
+          self._extraction_worker, self._parser_mediator, task.path_spec,
+          record_range=task.record_range)
       self._number_of_consumed_sources += 1
 
+      # The completion of a task that failed is not recorded, so that it is
+      # processed again by a subsequent extraction. The completion of a task
+      # that produced event sources, such as a directory or a file split into
+      # record ranges, is not recorded either since the task needs to be
+      # processed again to reproduce the event sources that were not
+      # completed.
+      if is_processed and task.path_spec and not self._abort and (
+          self._parser_mediator.number_of_produced_event_sources ==
+          number_of_produced_event_sources):
+        processed_event_source = self._CreateProcessedEventSource(task)
+        if processed_event_source:
+          task_storage_writer.AddProcessedEventSource(processed_event_source)
+
     finally:
       task_storage_writer.WriteTaskCompletion(aborted=self._abort)
 
@@ -314,8 +465,34 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     if self._tasks_profiler:
       self._tasks_profiler.Sample(task, 'processing_completed')
 
+    if self._trace_profiler:
+      self._trace_profiler.SampleTaskStatus(task, 'processing_completed')
+
     logger.debug('Completed processing task: {0:s}.'.format(task.identifier))
 
+  def _UpdatePrefetchedTaskIdentifiers(self, task_identifier):
+    """Updates the identifiers of the tasks prefetched from the task queue.
+
+    The identifiers are determined once, when the prefetched tasks are
+    received, instead of every time the status is retrieved. Since the task
+    queue items contain the task identifier, the prefetched tasks do not need
+    to be deserialized.
+
+    Args:
+      task_identifier (str): identifier of the task that was popped from
+          the task queue.
+    """
+    if (self._prefetched_task_identifiers and
+        self._prefetched_task_identifiers[0] == task_identifier):
+      # The list is replaced instead of modified, since the status can be
+      # retrieved from another thread.
+      self._prefetched_task_identifiers = self._prefetched_task_identifiers[1:]
+      return
+
+    self._prefetched_task_identifiers = [
+        item[0] for item in self._task_queue.GetPrefetchedItems()
+        if not isinstance(item, plaso_queue.QueueAbort)]
+
   def SignalAbort(self):
     """Signals the process to abort."""
     self._abort = True
@@ -15,6 +15,11 @@ class OutputModule(object):
   NAME = ''
   DESCRIPTION = ''
 
+  # True if the output of an event does not depend on the events written
+  # before it, such that the output of consecutive ranges of events can be
+  # written separately, for example in parallel, and concatenated.
+  SUPPORTS_CONCATENATION = False
+
   def __init__(self, output_mediator):
     """Initializes an output module.
 
@@ -170,3 +175,11 @@ class LinearOutputModule(OutputModule):
   def Close(self):
     """Closes the output."""
     self._output_writer = None
+
+  def WriteText(self, text):
+    """Writes text, such as previously formatted events, to the output.
+
+    Args:
+      text (str): text.
+    """
+    self._output_writer.Write(text)
@@ -18,6 +18,8 @@ class JSONLineOutputModule(interface.LinearOutputModule):
   NAME = 'json_line'
   DESCRIPTION = 'Saves the events into a JSON line format.'
 
+  SUPPORTS_CONCATENATION = True
+
   def __init__(self, output_mediator):
     """Initializes the output module object.
 
@@ -209,6 +209,8 @@ class L2TCSVOutputModule(interface.LinearOutputModule):
   NAME = 'l2tcsv'
   DESCRIPTION = 'CSV format used by legacy log2timeline, with 17 fixed fields.'
 
+  SUPPORTS_CONCATENATION = True
+
   _FIELD_NAMES = [
       'date', 'time', 'timezone', 'MACB', 'source', 'sourcetype', 'type',
       'user', 'host', 'short', 'desc', 'version', 'filename', 'inode', 'notes',
@@ -109,6 +109,8 @@ class NativePythonOutputModule(interface.LinearOutputModule):
   NAME = 'rawpy'
   DESCRIPTION = 'native (or "raw") Python output.'
 
+  SUPPORTS_CONCATENATION = True
+
   def __init__(self, output_mediator):
     """Initializes a native (or "raw") Python output module.
 
@@ -91,6 +91,8 @@ class DSVEventFormattingHelper(formatting_helper.EventFormattingHelper):
 class DSVOutputModule(interface.LinearOutputModule):
   """Shared functionality for delimiter separated values output modules."""
 
+  SUPPORTS_CONCATENATION = True
+
   def __init__(
       self, output_mediator, field_formatting_helper, names, delimiter=',',
       header=None):
@@ -63,6 +63,8 @@ class ASLParser(dtfabric_parser.DtFabricBaseParser):
 
   _DEFINITION_FILE = 'asl.yaml'
 
+  _READ_AHEAD_WINDOW_SIZE = 16 * 1024
+
   # Most significant bit of a 64-bit string offset.
   _STRING_OFFSET_MSB = 1 << 63
 
@@ -43,6 +43,8 @@ class BSMParser(dtfabric_parser.DtFabricBaseParser):
 
   _DEFINITION_FILE = 'bsm.yaml'
 
+  _READ_AHEAD_WINDOW_SIZE = 16 * 1024
+
   _TOKEN_TYPE_AUT_TRAILER = 0x13
   _TOKEN_TYPE_AUT_HEADER32 = 0x14
   _TOKEN_TYPE_AUT_HEADER32_EX = 0x15
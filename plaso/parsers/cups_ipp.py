@@ -81,6 +81,8 @@ class CupsIppParser(dtfabric_parser.DtFabricBaseParser):
 
   _DEFINITION_FILE = 'cups_ipp.yaml'
 
+  _READ_AHEAD_WINDOW_SIZE = 16 * 1024
+
   _SUPPORTED_FORMAT_VERSIONS = ('1.0', '1.1', '2.0')
 
   _DELIMITER_TAG_OPERATION_ATTRIBUTES = 0x01
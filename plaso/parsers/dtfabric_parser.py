@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import abc
 import os
+import struct
 
 from dtfabric import errors as dtfabric_errors
 from dtfabric.runtime import data_maps as dtfabric_data_maps
@@ -14,6 +15,264 @@ from plaso.lib import errors
 from plaso.parsers import interface
 
 
+class CompiledDataTypeMap(object):
+  """Data type map that maps fixed-size data with a precompiled struct.
+
+  A compiled data type map maps the same byte stream onto the same values as
+  the dtFabric data type map it was compiled from. The values of a structure
+  are stored in an instance of the structure values class of the dtFabric
+  data type map, so that attributes can be added to them as well. Methods
+  other than MapByteStream are passed to the dtFabric data type map.
+  """
+
+  _BYTE_ORDER_STRINGS = frozenset(['<', '>', '='])
+
+  def __init__(
+      self, data_type_map, format_string, member_ranges=None,
+      values_class=None):
+    """Initializes a compiled data type map.
+
+    Args:
+      data_type_map (dtfabric.DataTypeMap): dtFabric data type map.
+      format_string (str): Python struct format string.
+      member_ranges (Optional[list[int|tuple[int, int]]]): index or range of
+          indexes of the struct values per member of a structure, where None
+          represents every member has a single struct value.
+      values_class (Optional[type]): class of the structure values or None if
+          the data type map does not map a structure.
+    """
+    super(CompiledDataTypeMap, self).__init__()
+    self._data_type_map = data_type_map
+    self._member_ranges = member_ranges
+    self._struct = struct.Struct(format_string)
+    self._values_class = values_class
+
+    self.byte_size = self._struct.size
+
+  def __getattr__(self, attribute_name):
+    """Retrieves an attribute of the dtFabric data type map.
+
+    Args:
+      attribute_name (str): name of the attribute.
+
+    Returns:
+      object: attribute value.
+    """
+    return getattr(self._data_type_map, attribute_name)
+
+  @classmethod
+  def _GetMemberFormat(cls, data_type_map):
+    """Retrieves the struct format of a member of a structure.
+
+    Args:
+      data_type_map (dtfabric.DataTypeMap): data type map of the member.
+
+    Returns:
+      tuple[str, str, int]: byte order string, format string and number of
+          struct values of the member or None if the member is not supported.
+    """
+    if isinstance(data_type_map, (
+        dtfabric_data_maps.FloatingPointMap, dtfabric_data_maps.IntegerMap)):
+      return (
+          data_type_map.GetStructByteOrderString(),
+          data_type_map.GetStructFormatString(), 1)
+
+    # A string map is a stream map that also decodes the stream.
+    if isinstance(data_type_map, dtfabric_data_maps.StringMap) or (
+        not isinstance(data_type_map, (
+            dtfabric_data_maps.SequenceMap, dtfabric_data_maps.StreamMap))):
+      return None
+
+    data_type_definition = data_type_map._data_type_definition  # pylint: disable=protected-access
+    if (data_type_definition.elements_data_size_expression is not None or
+        data_type_definition.elements_terminator is not None or
+        data_type_definition.number_of_elements_expression is not None):
+      return None
+
+    byte_size = data_type_map.GetByteSize()
+    if not byte_size:
+      return None
+
+    if isinstance(data_type_map, dtfabric_data_maps.StreamMap):
+      return '', '{0:d}s'.format(byte_size), 1
+
+    element_data_type_map = (
+        data_type_map._element_data_type_map)  # pylint: disable=protected-access
+    if not isinstance(element_data_type_map, (
+        dtfabric_data_maps.FloatingPointMap, dtfabric_data_maps.IntegerMap)):
+      return None
+
+    number_of_elements = data_type_definition.number_of_elements
+    if not number_of_elements:
+      return None
+
+    return (
+        data_type_map.GetStructByteOrderString(),
+        data_type_map.GetStructFormatString(), number_of_elements)
+
+  @classmethod
+  def Compile(cls, data_type_map):
+    """Compiles a data type map.
+
+    Only integer, floating-point and structure data type maps that have
+    a fixed size can be compiled. The members of the structure must be
+    integer, floating-point, fixed-size stream or fixed-size sequence of
+    integer or floating-point data types, without supported values.
+
+    Args:
+      data_type_map (dtfabric.DataTypeMap): dtFabric data type map.
+
+    Returns:
+      CompiledDataTypeMap: compiled data type map or None if the data type
+          map cannot be compiled.
+    """
+    if isinstance(data_type_map, (
+        dtfabric_data_maps.FloatingPointMap, dtfabric_data_maps.IntegerMap)):
+      byte_order_string = data_type_map.GetStructByteOrderString()
+      format_string = data_type_map.GetStructFormatString()
+      if not byte_order_string or not format_string:
+        return None
+
+      return cls(data_type_map, ''.join([byte_order_string, format_string]))
+
+    if not isinstance(data_type_map, dtfabric_data_maps.StructureMap):
+      return None
+
+    data_type_definition = data_type_map._data_type_definition  # pylint: disable=protected-access
+    member_data_type_maps = data_type_map._data_type_maps  # pylint: disable=protected-access
+    if len(data_type_definition.members) != len(member_data_type_maps):
+      return None
+
+    byte_order_string = None
+    format_strings = []
+    member_ranges = []
+    number_of_values = 0
+
+    for member_definition, member_data_type_map in zip(
+        data_type_definition.members, member_data_type_maps):
+      if getattr(member_definition, 'values', None):
+        return None
+
+      member_format = cls._GetMemberFormat(member_data_type_map)
+      if not member_format:
+        return None
+
+      member_byte_order_string, member_format_string, member_values = (
+          member_format)
+      if member_byte_order_string not in cls._BYTE_ORDER_STRINGS:
+        member_byte_order_string = None
+
+      try:
+        element_size = struct.calcsize(
+            '<{0:s}'.format(member_format_string)) // member_values
+      except struct.error:
+        return None
+
+      # The byte order of single byte values is not relevant.
+      if element_size > 1 and member_format_string[-1] != 's':
+        if not member_byte_order_string:
+          return None
+
+        if byte_order_string is None:
+          byte_order_string = member_byte_order_string
+
+        elif byte_order_string != member_byte_order_string:
+          return None
+
+      format_strings.append(member_format_string)
+
+      if isinstance(
+          member_data_type_map, dtfabric_data_maps.SequenceMap):
+        member_ranges.append(
+            (number_of_values, number_of_values + member_values))
+      else:
+        member_ranges.append(number_of_values)
+
+      number_of_values += member_values
+
+    format_string = ''.join([byte_order_string or '<'] + format_strings)
+    try:
+      if struct.calcsize(format_string) != data_type_map.GetByteSize():
+        return None
+
+    except struct.error:
+      return None
+
+    values_class = data_type_map._structure_values_class  # pylint: disable=protected-access
+
+    if number_of_values == len(member_ranges):
+      member_ranges = None
+
+    return cls(
+        data_type_map, format_string, member_ranges=member_ranges,
+        values_class=values_class)
+
+  def GetByteSize(self):
+    """Retrieves the byte size of the data type map.
+
+    Returns:
+      int: data type size in bytes.
+    """
+    return self.byte_size
+
+  def GetSizeHint(self, **unused_kwargs):
+    """Retrieves a hint about the size.
+
+    Returns:
+      int: hint of the number of bytes needed from the byte stream.
+    """
+    return self.byte_size
+
+  def MapByteStream(
+      self, byte_stream, byte_offset=0, context=None, **unused_kwargs):
+    """Maps the data type on a byte stream.
+
+    Args:
+      byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset into the byte stream where to start.
+      context (Optional[dtfabric.DataTypeMapContext]): data type map context.
+
+    Returns:
+      object: mapped value.
+
+    Raises:
+      dtfabric.ByteStreamTooSmallError: if the byte stream is too small.
+      dtfabric.MappingError: if the data type definition cannot be mapped on
+          the byte stream.
+    """
+    try:
+      byte_stream_size = len(byte_stream)
+    except TypeError as exception:
+      raise dtfabric_errors.MappingError(exception)
+
+    if byte_stream_size - byte_offset < self.byte_size:
+      raise dtfabric_errors.ByteStreamTooSmallError(
+          'Byte stream too small requested: {0:d} available: {1:d}'.format(
+              self.byte_size, byte_stream_size))
+
+    try:
+      struct_values = self._struct.unpack_from(byte_stream, byte_offset)
+    except struct.error as exception:
+      raise dtfabric_errors.MappingError((
+          'Unable to read: {0:s} from byte stream at offset: {1:d} '
+          'with error: {2!s}').format(
+              self._data_type_map.name or '', byte_offset, exception))
+
+    if context:
+      context.byte_size = self.byte_size
+
+    if not self._values_class:
+      return struct_values[0]
+
+    if self._member_ranges:
+      struct_values = [
+          struct_values[index] if isinstance(index, int) else
+          struct_values[index[0]:index[1]]
+          for index in self._member_ranges]
+
+    return self._values_class(*struct_values)
+
+
 class DtFabricBaseParser(interface.FileObjectParser):
   """Shared functionality for dtFabric-based data format parsers.
 
@@ -65,6 +324,11 @@ class DtFabricBaseParser(interface.FileObjectParser):
 
   The _ReadStructure method of this class can be used to read structure data
   from a file-like object and create a Python object using a data type map.
+
+  A parser that reads many small structures that are stored near each other
+  can override _READ_AHEAD_WINDOW_SIZE to read the file-like object in
+  blocks of that size. Reads that fall within the last block read are served
+  from that block.
   """
 
   # The dtFabric definition file, which must be overwritten by a subclass.
@@ -74,11 +338,27 @@ class DtFabricBaseParser(interface.FileObjectParser):
   # at run-time.
   _DEFINITION_FILES_PATH = os.path.dirname(__file__)
 
+  # Determines if data type maps of fixed-size data types are compiled into
+  # Python struct-based data type maps, see CompiledDataTypeMap.
+  _COMPILE_DATA_TYPE_MAPS = True
+
+  # Size of the read-ahead window in bytes, where 0 represents read-ahead
+  # is disabled. Parsers that read many small structures that are stored
+  # near each other can override this value to serve these reads from
+  # a buffered block of data instead of the file-like object.
+  _READ_AHEAD_WINDOW_SIZE = 0
+
   def __init__(self):
     """Initializes a dtFabric-based data format parser."""
     super(DtFabricBaseParser, self).__init__()
     self._data_type_maps = {}
     self._fabric = self._ReadDefinitionFile(self._DEFINITION_FILE)
+    self._number_of_file_object_reads = 0
+    self._number_of_reads = 0
+    self._read_ahead_data = b''
+    self._read_ahead_file_object = None
+    self._read_ahead_offset = 0
+    self._read_ahead_window_size = self._READ_AHEAD_WINDOW_SIZE
 
   def _FormatPackedIPv4Address(self, packed_ip_address):
     """Formats a packed IPv4 address as a human readable string.
@@ -110,7 +390,9 @@ class DtFabricBaseParser(interface.FileObjectParser):
   def _GetDataTypeMap(self, name):
     """Retrieves a data type map defined by the definition file.
 
-    The data type maps are cached for reuse.
+    The data type maps are cached for reuse. Data type maps of fixed-size
+    data types are compiled into Python struct-based data type maps, if
+    supported.
 
     Args:
       name (str): name of the data type as defined by the definition file.
@@ -122,6 +404,12 @@ class DtFabricBaseParser(interface.FileObjectParser):
     data_type_map = self._data_type_maps.get(name, None)
     if not data_type_map:
       data_type_map = self._fabric.CreateDataTypeMap(name)
+
+      if self._COMPILE_DATA_TYPE_MAPS:
+        compiled_data_type_map = CompiledDataTypeMap.Compile(data_type_map)
+        if compiled_data_type_map:
+          data_type_map = compiled_data_type_map
+
       self._data_type_maps[name] = data_type_map
 
     return data_type_map
@@ -129,6 +417,11 @@ class DtFabricBaseParser(interface.FileObjectParser):
   def _ReadData(self, file_object, file_offset, data_size):
     """Reads data.
 
+    If read-ahead is enabled the data is read from the read-ahead window
+    when possible. Afterwards the current offset of the file-like object is
+    set to the end of the data, as if the data was read from the file-like
+    object directly.
+
     Args:
       file_object (dvfvs.FileIO): a file-like object to read.
       file_offset (int): offset of the data relative to the start of
@@ -147,25 +440,34 @@ class DtFabricBaseParser(interface.FileObjectParser):
     if not file_object:
       raise ValueError('Missing file-like object.')
 
-    file_object.seek(file_offset, os.SEEK_SET)
+    if not self._read_ahead_window_size:
+      return self._ReadFileObjectData(file_object, file_offset, data_size)
 
-    read_error = ''
+    self._number_of_reads += 1
 
-    try:
-      data = file_object.read(data_size)
+    if file_object is self._read_ahead_file_object:
+      data_offset = file_offset - self._read_ahead_offset
+      if 0 <= data_offset <= len(self._read_ahead_data) - data_size:
+        file_object.seek(file_offset + data_size, os.SEEK_SET)
+        return self._read_ahead_data[data_offset:data_offset + data_size]
 
-      if len(data) != data_size:
-        read_error = 'missing data'
+    self._read_ahead_data = b''
+    self._read_ahead_file_object = None
+    self._read_ahead_offset = 0
 
-    except IOError as exception:
-      read_error = '{0!s}'.format(exception)
+    if data_size >= self._read_ahead_window_size:
+      return self._ReadFileObjectData(file_object, file_offset, data_size)
 
-    if read_error:
-      raise errors.ParseError(
-          'Unable to read data at offset: 0x{0:08x} with error: {1:s}'.format(
-              file_offset, read_error))
+    window_data = self._ReadFileObjectData(
+        file_object, file_offset, self._read_ahead_window_size,
+        minimum_data_size=data_size)
 
-    return data
+    self._read_ahead_data = window_data
+    self._read_ahead_file_object = file_object
+    self._read_ahead_offset = file_offset
+
+    file_object.seek(file_offset + data_size, os.SEEK_SET)
+    return window_data[:data_size]
 
   def _ReadDefinitionFile(self, filename):
     """Reads a dtFabric definition file.
@@ -187,6 +489,49 @@ class DtFabricBaseParser(interface.FileObjectParser):
 
     return dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
 
+  def _ReadFileObjectData(
+      self, file_object, file_offset, data_size, minimum_data_size=None):
+    """Reads data from a file-like object.
+
+    Args:
+      file_object (dvfvs.FileIO): a file-like object to read.
+      file_offset (int): offset of the data relative to the start of
+          the file-like object.
+      data_size (int): size of the data.
+      minimum_data_size (Optional[int]): minimum size of the data, where
+          None represents the size of the data.
+
+    Returns:
+      bytes: byte stream containing the data.
+
+    Raises:
+      ParseError: if the data cannot be read.
+    """
+    if minimum_data_size is None:
+      minimum_data_size = data_size
+
+    self._number_of_file_object_reads += 1
+
+    file_object.seek(file_offset, os.SEEK_SET)
+
+    read_error = ''
+
+    try:
+      data = file_object.read(data_size)
+
+      if len(data) < minimum_data_size:
+        read_error = 'missing data'
+
+    except IOError as exception:
+      read_error = '{0!s}'.format(exception)
+
+    if read_error:
+      raise errors.ParseError(
+          'Unable to read data at offset: 0x{0:08x} with error: {1:s}'.format(
+              file_offset, read_error))
+
+    return data
+
   def _ReadStructureFromByteStream(
       self, byte_stream, file_offset, data_type_map, context=None):
     """Reads a structure from a byte stream.
@@ -282,6 +627,56 @@ class DtFabricBaseParser(interface.FileObjectParser):
         'Unable to read {0:s} at offset: 0x{1:08x}'.format(
             data_type_map.name, file_offset))
 
+  def _ResetReadAhead(self):
+    """Resets the read-ahead window and its statistics."""
+    self._number_of_file_object_reads = 0
+    self._number_of_reads = 0
+    self._read_ahead_data = b''
+    self._read_ahead_file_object = None
+    self._read_ahead_offset = 0
+
+  def Parse(self, parser_mediator, file_object):
+    """Parses a single file-like object.
+
+    If read-ahead is enabled the number of reads and the number of reads of
+    the file-like object are sampled for profiling.
+
+    Args:
+      parser_mediator (ParserMediator): a parser mediator.
+      file_object (dvfvs.FileIO): a file-like object to parse.
+
+    Raises:
+      UnableToParseFile: when the file cannot be parsed.
+    """
+    self._ResetReadAhead()
+
+    try:
+      super(DtFabricBaseParser, self).Parse(parser_mediator, file_object)
+
+    finally:
+      if self._number_of_reads:
+        parser_mediator.SampleReadAhead(
+            self.NAME, self._number_of_reads,
+            self._number_of_file_object_reads)
+
+      self._ResetReadAhead()
+
+  def SetReadAheadWindowSize(self, window_size):
+    """Sets the size of the read-ahead window.
+
+    Args:
+      window_size (int): size of the read-ahead window in bytes, where 0
+          disables read-ahead.
+
+    Raises:
+      ValueError: if the window size is negative.
+    """
+    if window_size < 0:
+      raise ValueError('Invalid read-ahead window size.')
+
+    self._read_ahead_window_size = window_size
+    self._ResetReadAhead()
+
   @abc.abstractmethod
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a file-like object.
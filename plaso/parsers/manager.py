@@ -3,14 +3,24 @@
 
 from __future__ import unicode_literals
 
+import importlib
+
 import pysigscan
 
 from plaso.filters import parser_filter
 from plaso.lib import specification
+from plaso.parsers import manifest
 
 
 class ParsersManager(object):
-  """The parsers and plugins manager."""
+  """The parsers and plugins manager.
+
+  The names, data formats, plugins and format specifications of the parsers
+  are read from the parsers manifest, see plaso/parsers/manifest.py, so that
+  the module of a parser is only imported when its parser class is needed.
+  Parser classes that are registered but not in the manifest, are supported
+  as well.
+  """
 
   _parser_classes = {}
 
@@ -69,7 +79,7 @@ class ParsersManager(object):
           and/or plugin names.
     """
     if not parser_filter_expression:
-      return set(cls._parser_classes.keys()), set()
+      return set(cls._GetParserNames()), set()
 
     known_parser_elements = set()
     unknown_parser_elements = set()
@@ -79,8 +89,8 @@ class ParsersManager(object):
         parser_expression = element[1:]
 
       parser_name, _, plugin_name = parser_expression.partition('/')
-      parser_class = cls._parser_classes.get(parser_name, None)
-      if not parser_class:
+      manifest_entry = cls._GetManifestEntry(parser_name)
+      if not manifest_entry:
         unknown_parser_elements.add(element)
         continue
 
@@ -88,15 +98,147 @@ class ParsersManager(object):
         known_parser_elements.add(element)
         continue
 
-      if parser_class.SupportsPlugins():
-        plugins = dict(parser_class.GetPlugins())
-        if plugin_name in plugins:
+      plugins = manifest_entry['plugins']
+      if plugins is not None:
+        if plugin_name in dict(plugins):
           known_parser_elements.add(element)
         else:
           unknown_parser_elements.add(element)
 
     return known_parser_elements, unknown_parser_elements
 
+  @classmethod
+  def _CreateManifestEntry(cls, parser_class):
+    """Creates a parsers manifest entry from a parser class.
+
+    Args:
+      parser_class (type): parser class (subclass of BaseParser).
+
+    Returns:
+      dict[str, object]: parsers manifest entry.
+    """
+    format_specification = parser_class.GetFormatSpecification()
+    if format_specification:
+      format_specification = {
+          'identifier': format_specification.identifier,
+          'signatures': [
+              (signature.pattern, signature.offset)
+              for signature in format_specification.signatures],
+          'text_format': format_specification.IsTextFormat()}
+
+    plugins = None
+    plugins_modules = []
+    if parser_class.SupportsPlugins():
+      plugins = []
+      for plugin_name, plugin_class in sorted(parser_class.GetPlugins()):
+        plugins.append((plugin_name, getattr(plugin_class, 'DATA_FORMAT', '')))
+
+        plugins_module, _, _ = plugin_class.__module__.rpartition('.')
+        if (plugin_class.__module__ != parser_class.__module__ and
+            plugins_module not in plugins_modules):
+          plugins_modules.append(plugins_module)
+
+    return {
+        'data_format': getattr(parser_class, 'DATA_FORMAT', ''),
+        'format_specification': format_specification,
+        'module': parser_class.__module__,
+        'plugins': plugins,
+        'plugins_modules': sorted(plugins_modules)}
+
+  @classmethod
+  def _CreateFormatSpecification(cls, format_specification_values):
+    """Creates a format specification from a parsers manifest entry.
+
+    Args:
+      format_specification_values (dict[str, object]): format specification
+          values of a parsers manifest entry.
+
+    Returns:
+      FormatSpecification: format specification.
+    """
+    format_specification = specification.FormatSpecification(
+        format_specification_values['identifier'],
+        text_format=format_specification_values['text_format'])
+
+    for pattern, offset in format_specification_values['signatures']:
+      format_specification.AddNewSignature(pattern, offset=offset)
+
+    return format_specification
+
+  @classmethod
+  def _GetManifestEntry(cls, parser_name):
+    """Retrieves the parsers manifest entry of a parser.
+
+    Args:
+      parser_name (str): name of the parser.
+
+    Returns:
+      dict[str, object]: parsers manifest entry or None if the parser is not
+          available.
+    """
+    manifest_entry = manifest.PARSERS.get(parser_name, None)
+    if not manifest_entry:
+      parser_class = cls._parser_classes.get(parser_name, None)
+      if parser_class:
+        manifest_entry = cls._CreateManifestEntry(parser_class)
+
+    return manifest_entry
+
+  @classmethod
+  def _GetParserClass(cls, parser_name):
+    """Retrieves a parser class, importing its modules when needed.
+
+    Args:
+      parser_name (str): name of the parser.
+
+    Returns:
+      type: parser class (subclass of BaseParser) or None if the parser is
+          not available.
+    """
+    manifest_entry = manifest.PARSERS.get(parser_name, None)
+    if manifest_entry:
+      for module_name in [manifest_entry['module']] + (
+          manifest_entry['plugins_modules']):
+        importlib.import_module(module_name)
+
+    return cls._parser_classes.get(parser_name, None)
+
+  @classmethod
+  def _GetParserNames(cls, parser_filter_expression=None):
+    """Retrieves the names of the available parsers.
+
+    Args:
+      parser_filter_expression (Optional[str]): parser filter expression,
+          where None represents all parsers and plugins.
+
+          A parser filter expression is a comma separated value string that
+          denotes which parsers and plugins should be used. See
+          filters/parser_filter.py for details of the expression syntax.
+
+          This function does not support presets, and requires a parser
+          filter expression where presets have been expanded.
+
+    Returns:
+      list[str]: names of the parsers, sorted by name.
+    """
+    parser_filter_helper = parser_filter.ParserFilterExpressionHelper()
+    excludes, includes = parser_filter_helper.SplitExpression(
+        parser_filter_expression)
+
+    parser_names = []
+    for parser_name in sorted(set(manifest.PARSERS).union(
+        cls._parser_classes)):
+      # If there are no includes all parsers are included by default.
+      if not includes and parser_name in excludes:
+        continue
+
+      if includes and parser_name not in includes:
+        continue
+
+      parser_names.append(parser_name)
+
+    return parser_names
+
   @classmethod
   def DeregisterParser(cls, parser_class):
     """Deregisters a parser class.
@@ -146,12 +288,14 @@ class ParsersManager(object):
     specification_store = specification.FormatSpecificationStore()
     remainder_list = []
 
-    for parser_name, parser_class in cls._GetParsers(
+    for parser_name in cls._GetParserNames(
         parser_filter_expression=parser_filter_expression):
-      format_specification = parser_class.GetFormatSpecification()
+      manifest_entry = cls._GetManifestEntry(parser_name)
+      format_specification = manifest_entry['format_specification']
 
-      if format_specification and format_specification.signatures:
-        specification_store.AddSpecification(format_specification)
+      if format_specification and format_specification['signatures']:
+        specification_store.AddSpecification(
+            cls._CreateFormatSpecification(format_specification))
         # The plist parser is a special case, where it both defines a signature
         # and also needs to be applied 'brute-force' to non-matching files,
         # as the signature matches binary plists, but not XML or JSON plists.
@@ -171,11 +315,12 @@ class ParsersManager(object):
     """
     parser_names = []
 
-    for parser_name, parser_class in cls._GetParsers():
-      if parser_class.SupportsPlugins():
+    for parser_name in cls._GetParserNames():
+      manifest_entry = cls._GetManifestEntry(parser_name)
+      if manifest_entry['plugins'] is not None:
         parser_names.append(parser_name)
 
-    return sorted(parser_names)
+    return parser_names
 
   @classmethod
   def GetParserAndPluginNames(cls, parser_filter_expression=None):
@@ -196,14 +341,14 @@ class ParsersManager(object):
       list[str]: parser and parser plugin names.
     """
     parser_and_plugin_names = []
-    for parser_name, parser_class in cls._GetParsers(
+    for parser_name in cls._GetParserNames(
         parser_filter_expression=parser_filter_expression):
       parser_and_plugin_names.append(parser_name)
 
-      if parser_class.SupportsPlugins():
-        for plugin_name, _ in parser_class.GetPlugins():
-          parser_and_plugin_names.append(
-              '{0:s}/{1:s}'.format(parser_name, plugin_name))
+      manifest_entry = cls._GetManifestEntry(parser_name)
+      for plugin_name, _ in manifest_entry['plugins'] or []:
+        parser_and_plugin_names.append(
+            '{0:s}/{1:s}'.format(parser_name, plugin_name))
 
     return parser_and_plugin_names
 
@@ -226,20 +371,18 @@ class ParsersManager(object):
       list[tuple[str, str]]: pairs of parser plugin names and descriptions.
     """
     parser_plugins_information = []
-    for _, parser_class in cls._GetParsers(
+    for parser_name in cls._GetParserNames(
         parser_filter_expression=parser_filter_expression):
-      if parser_class.SupportsPlugins():
-        for plugin_name, plugin_class in parser_class.GetPlugins():
-          description = ''
-
-          data_format = getattr(plugin_class, 'DATA_FORMAT', '')
-          if data_format:
-            if data_format.endswith(' file'):
-              description = 'Parser for {0:s}s.'.format(data_format)
-            else:
-              description = 'Parser for {0:s}.'.format(data_format)
+      manifest_entry = cls._GetManifestEntry(parser_name)
+      for plugin_name, data_format in manifest_entry['plugins'] or []:
+        description = ''
+        if data_format:
+          if data_format.endswith(' file'):
+            description = 'Parser for {0:s}s.'.format(data_format)
+          else:
+            description = 'Parser for {0:s}.'.format(data_format)
 
-          parser_plugins_information.append((plugin_name, description))
+        parser_plugins_information.append((plugin_name, description))
 
     return parser_plugins_information
 
@@ -254,7 +397,7 @@ class ParsersManager(object):
     Returns:
       BaseParser: parser object or None.
     """
-    parser_class = cls._parser_classes.get(parser_name, None)
+    parser_class = cls._GetParserClass(parser_name)
     if parser_class:
       return parser_class()
     return None
@@ -278,18 +421,12 @@ class ParsersManager(object):
       dict[str, BaseParser]: parsers per name.
     """
     parser_filter_helper = parser_filter.ParserFilterExpressionHelper()
-    excludes, includes = parser_filter_helper.SplitExpression(
+    _, includes = parser_filter_helper.SplitExpression(
         parser_filter_expression)
 
     parser_objects = {}
-    for parser_name, parser_class in cls._parser_classes.items():
-      # If there are no includes all parsers are included by default.
-      if not includes and parser_name in excludes:
-        continue
-
-      if includes and parser_name not in includes:
-        continue
-
+    for parser_name, parser_class in cls._GetParsers(
+        parser_filter_expression=parser_filter_expression):
       parser_object = parser_class()
       if parser_class.SupportsPlugins():
         plugin_includes = None
@@ -323,19 +460,11 @@ class ParsersManager(object):
       * str: name of the parser:
       * type: parser class (subclass of BaseParser).
     """
-    parser_filter_helper = parser_filter.ParserFilterExpressionHelper()
-    excludes, includes = parser_filter_helper.SplitExpression(
-        parser_filter_expression)
-
-    for parser_name, parser_class in cls._parser_classes.items():
-      # If there are no includes all parsers are included by default.
-      if not includes and parser_name in excludes:
-        continue
-
-      if includes and parser_name not in includes:
-        continue
-
-      yield parser_name, parser_class
+    for parser_name in cls._GetParserNames(
+        parser_filter_expression=parser_filter_expression):
+      parser_class = cls._GetParserClass(parser_name)
+      if parser_class:
+        yield parser_name, parser_class
 
   @classmethod
   def GetParsersInformation(cls):
@@ -345,17 +474,18 @@ class ParsersManager(object):
       list[tuple[str, str]]: parser names and descriptions.
     """
     parsers_information = []
-    for _, parser_class in cls._GetParsers():
-      description = ''
+    for parser_name in cls._GetParserNames():
+      manifest_entry = cls._GetManifestEntry(parser_name)
 
-      data_format = getattr(parser_class, 'DATA_FORMAT', '')
+      description = ''
+      data_format = manifest_entry['data_format']
       if data_format:
         if data_format.endswith(' file'):
           description = 'Parser for {0:s}s.'.format(data_format)
         else:
           description = 'Parser for {0:s}.'.format(data_format)
 
-      parsers_information.append((parser_class.NAME, description))
+      parsers_information.append((parser_name, description))
 
     return parsers_information
 
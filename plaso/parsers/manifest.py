@@ -0,0 +1,738 @@
+# -*- coding: utf-8 -*-
+"""Manifest of the parsers and their plugins.
+
+This file is generated by utils/update_parsers_manifest.py, do not edit.
+"""
+
+# pylint: disable=line-too-long
+
+from __future__ import unicode_literals
+
+PARSERS = {
+    'amcache': {
+        'data_format': 'AMCache Windows NT Registry (AMCache.hve) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.amcache',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'android_app_usage': {
+        'data_format': 'Android usage history (usage-history.xml) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.android_app_usage',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'apache_access': {
+        'data_format': 'Apache access log (access.log) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.apache_access',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'apt_history': {
+        'data_format': 'Advanced Packaging Tool (APT) History log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.apt_history',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'asl_log': {
+        'data_format': 'Apple System Log (ASL) file',
+        'format_specification': {
+            'identifier': 'asl_log',
+            'signatures': [(b'ASL DB\x00\x00\x00\x00\x00\x00', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.asl',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'bash_history': {
+        'data_format': 'Bash history file',
+        'format_specification': None,
+        'module': 'plaso.parsers.bash_history',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'bencode': {
+        'data_format': 'Bencoded file',
+        'format_specification': None,
+        'module': 'plaso.parsers.bencode_parser',
+        'plugins': [
+            ('bencode_transmission', 'Transmission BitTorrent activity file'),
+            ('bencode_utorrent', 'uTorrent active torrent file'),
+        ],
+        'plugins_modules': [
+            'plaso.parsers.bencode_plugins',
+        ],
+    },
+    'binary_cookies': {
+        'data_format': 'Safari Binary Cookie file',
+        'format_specification': {
+            'identifier': 'binary_cookies',
+            'signatures': [(b'cook\x00', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.safari_cookies',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'bsm_log': {
+        'data_format': 'Basic Security Module (BSM) event auditing file',
+        'format_specification': None,
+        'module': 'plaso.parsers.bsm',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'chrome_cache': {
+        'data_format': 'Google Chrome or Chromium Cache file',
+        'format_specification': None,
+        'module': 'plaso.parsers.chrome_cache',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'chrome_preferences': {
+        'data_format': 'Google Chrome Preferences file',
+        'format_specification': None,
+        'module': 'plaso.parsers.chrome_preferences',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'cups_ipp': {
+        'data_format': 'CUPS IPP file',
+        'format_specification': None,
+        'module': 'plaso.parsers.cups_ipp',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'custom_destinations': {
+        'data_format': 'Custom destinations jump list (.customDestinations-ms) file',
+        'format_specification': {
+            'identifier': 'custom_destinations',
+            'signatures': [(b'\xab\xfb\xbf\xba', -4)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.custom_destinations',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'czip': {
+        'data_format': 'Compound ZIP file',
+        'format_specification': None,
+        'module': 'plaso.parsers.czip',
+        'plugins': [
+            ('oxml', 'OpenXML (OXML) file'),
+        ],
+        'plugins_modules': [
+            'plaso.parsers.czip_plugins',
+        ],
+    },
+    'dockerjson': {
+        'data_format': 'Docker configuration and log JSON file',
+        'format_specification': None,
+        'module': 'plaso.parsers.docker',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'dpkg': {
+        'data_format': 'Debian package manager log (dpkg.log) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.dpkg',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'esedb': {
+        'data_format': 'Extensible Storage Engine (ESE) Database File (EDB) format',
+        'format_specification': {
+            'identifier': 'esedb',
+            'signatures': [(b'\xef\xcd\xab\x89', 4)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.esedb',
+        'plugins': [
+            ('file_history', 'Windows 8 File History ESE database file'),
+            ('msie_webcache', 'Internet Explorer WebCache ESE database (WebCacheV01.dat, WebCacheV24.dat) file'),
+            ('srum', 'System Resource Usage Monitor (SRUM) ESE database file'),
+        ],
+        'plugins_modules': [
+            'plaso.parsers.esedb_plugins',
+        ],
+    },
+    'filestat': {
+        'data_format': 'file system stat information',
+        'format_specification': None,
+        'module': 'plaso.parsers.filestat',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'firefox_cache': {
+        'data_format': 'Mozilla Firefox Cache version 1 file (version 31 or earlier)',
+        'format_specification': None,
+        'module': 'plaso.parsers.firefox_cache',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'firefox_cache2': {
+        'data_format': 'Mozilla Firefox Cache version 2 file (version 32 or later)',
+        'format_specification': None,
+        'module': 'plaso.parsers.firefox_cache',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'fseventsd': {
+        'data_format': 'MacOS File System Events Disk Log Stream (fseventsd) file',
+        'format_specification': {
+            'identifier': 'fseventsd',
+            'signatures': [(b'1SLD', 0), (b'2SLD', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.fseventsd',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'gdrive_synclog': {
+        'data_format': 'Google Drive Sync log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.gdrive_synclog',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'googlelog': {
+        'data_format': 'Google-formatted log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.google_logging',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'java_idx': {
+        'data_format': 'Java WebStart Cache IDX file',
+        'format_specification': None,
+        'module': 'plaso.parsers.java_idx',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'lnk': {
+        'data_format': 'Windows Shortcut (LNK) file',
+        'format_specification': {
+            'identifier': 'lnk',
+            'signatures': [(b'\x01\x14\x02\x00\x00\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x00F', 4)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.winlnk',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'mac_appfirewall_log': {
+        'data_format': 'MacOS Application firewall log (appfirewall.log) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.mac_appfirewall',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'mac_keychain': {
+        'data_format': 'MacOS keychain database file',
+        'format_specification': {
+            'identifier': 'mac_keychain',
+            'signatures': [(b'kych', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.mac_keychain',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'mac_securityd': {
+        'data_format': 'MacOS security daemon (securityd) log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.mac_securityd',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'mactime': {
+        'data_format': 'SleuthKit version 3 bodyfile',
+        'format_specification': {
+            'identifier': 'mactime',
+            'signatures': [],
+            'text_format': True,
+        },
+        'module': 'plaso.parsers.mactime',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'macwifi': {
+        'data_format': 'MacOS Wifi log (wifi.log) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.mac_wifi',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'mcafee_protection': {
+        'data_format': 'McAfee Anti-Virus access protection log file',
+        'format_specification': {
+            'identifier': 'mcafee_protection',
+            'signatures': [],
+            'text_format': True,
+        },
+        'module': 'plaso.parsers.mcafeeav',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'mft': {
+        'data_format': 'NTFS $MFT metadata file',
+        'format_specification': {
+            'identifier': 'mft',
+            'signatures': [(b'FILE', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.ntfs',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'msiecf': {
+        'data_format': 'Microsoft Internet Explorer (MSIE) 4 - 9 cache (index.dat) file',
+        'format_specification': {
+            'identifier': 'msiecf',
+            'signatures': [(b'Client UrlCache MMF Ver ', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.msiecf',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'networkminer_fileinfo': {
+        'data_format': 'NetworkMiner .fileinfos file',
+        'format_specification': {
+            'identifier': 'networkminer_fileinfo',
+            'signatures': [],
+            'text_format': True,
+        },
+        'module': 'plaso.parsers.networkminer',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'olecf': {
+        'data_format': '',
+        'format_specification': {
+            'identifier': 'olecf',
+            'signatures': [(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 0), (b'\x0e\x11\xfc\r\xd0\xcf\x11\x0e', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.olecf',
+        'plugins': [
+            ('olecf_automatic_destinations', 'Automatic destinations jump list OLE compound file (.automaticDestinations-ms)'),
+            ('olecf_default', 'Generic OLE compound item'),
+            ('olecf_document_summary', 'Document summary information (\\0x05DocumentSummaryInformation)'),
+            ('olecf_summary', 'Summary information (\\0x05SummaryInformation) (top-level only)'),
+        ],
+        'plugins_modules': [
+            'plaso.parsers.olecf_plugins',
+        ],
+    },
+    'opera_global': {
+        'data_format': 'Opera global history (global_history.dat) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.opera',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'opera_typed_history': {
+        'data_format': 'Opera typed history (typed_history.xml) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.opera',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'pe': {
+        'data_format': 'Portable Executable (PE) file',
+        'format_specification': {
+            'identifier': 'pe',
+            'signatures': [(b'MZ', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.pe',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'plist': {
+        'data_format': 'Property list (plist) file',
+        'format_specification': {
+            'identifier': 'plist',
+            'signatures': [(b'bplist', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.plist',
+        'plugins': [
+            ('airport', 'Airport plist file'),
+            ('apple_id', 'Apple account information plist file'),
+            ('ipod_device', 'iPod, iPad and iPhone plist file'),
+            ('launchd_plist', 'Launchd plist file'),
+            ('macos_software_update', 'MacOS software update plist file'),
+            ('macosx_bluetooth', 'Bluetooth plist file'),
+            ('macosx_install_history', 'MacOS installation history plist file'),
+            ('macuser', 'MacOS user plist file'),
+            ('plist_default', 'plist file'),
+            ('safari_history', 'Safari history plist file'),
+            ('spotlight', 'Spotlight plist file'),
+            ('spotlight_volume', 'Spotlight volume configuration plist file'),
+            ('time_machine', 'TimeMachine plist file'),
+        ],
+        'plugins_modules': [
+            'plaso.parsers.plist_plugins',
+        ],
+    },
+    'pls_recall': {
+        'data_format': '',
+        'format_specification': None,
+        'module': 'plaso.parsers.pls_recall',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'popularity_contest': {
+        'data_format': 'Popularity Contest log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.popcontest',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'prefetch': {
+        'data_format': 'Windows Prefetch File (PF)',
+        'format_specification': {
+            'identifier': 'prefetch',
+            'signatures': [(b'SCCA', 4), (b'MAM\x04', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.winprefetch',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'recycle_bin': {
+        'data_format': 'Windows $Recycle.Bin $I file',
+        'format_specification': None,
+        'module': 'plaso.parsers.recycler',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'recycle_bin_info2': {
+        'data_format': 'Windows Recycler INFO2 file',
+        'format_specification': None,
+        'module': 'plaso.parsers.recycler',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'rplog': {
+        'data_format': 'Windows Restore Point log (rp.log) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.winrestore',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'santa': {
+        'data_format': 'Santa log (santa.log) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.santa',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'sccm': {
+        'data_format': 'System Center Configuration Manager (SCCM) client log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.sccm',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'selinux': {
+        'data_format': 'SELinux audit log (audit.log) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.selinux',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'setupapi': {
+        'data_format': 'Windows SetupAPI log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.setupapi',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'skydrive_log': {
+        'data_format': 'OneDrive (or SkyDrive) log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.skydrivelog',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'skydrive_log_old': {
+        'data_format': 'OneDrive (or SkyDrive) old log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.skydrivelog',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'sophos_av': {
+        'data_format': 'Sophos Anti-Virus log file (SAV.txt) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.sophos_av',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'spotlight_storedb': {
+        'data_format': 'Apple Spotlight store database (store.db) file',
+        'format_specification': {
+            'identifier': 'spotlight_storedb',
+            'signatures': [(b'8tsd', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.spotlight_storedb',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'sqlite': {
+        'data_format': 'SQLite database file',
+        'format_specification': {
+            'identifier': 'sqlite',
+            'signatures': [(b'SQLite format 3', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.sqlite',
+        'plugins': [
+            ('android_calls', 'Android call history SQLite database (contacts2.db) file'),
+            ('android_sms', 'Android text messages (SMS) SQLite database (mmssms.dbs) file'),
+            ('android_webview', 'Android WebView SQLite database file'),
+            ('android_webviewcache', 'Android WebViewCache SQLite database file'),
+            ('appusage', 'MacOS application usage SQLite database (application_usage.sqlite) file'),
+            ('chrome_17_cookies', 'Google Chrome 17 - 65 cookies SQLite database file'),
+            ('chrome_27_history', 'Google Chrome 27 and later history SQLite database file'),
+            ('chrome_66_cookies', 'Google Chrome 66 and later cookies SQLite database file'),
+            ('chrome_8_history', 'Google Chrome 8 - 25 history SQLite database file'),
+            ('chrome_autofill', 'Google Chrome autofill SQLite database (Web Data) file'),
+            ('chrome_extension_activity', 'Google Chrome extension activity SQLite database file'),
+            ('firefox_cookies', 'Mozilla Firefox cookies SQLite database file'),
+            ('firefox_downloads', 'Mozilla Firefox downloads SQLite database (downloads.sqlite) file'),
+            ('firefox_history', 'Mozilla Firefox history SQLite database (places.sqlite) file'),
+            ('google_drive', 'Google Drive snapshot SQLite database (snapshot.db) file'),
+            ('hangouts_messages', 'Google Hangouts conversations SQLite database (babel.db) file'),
+            ('imessage', 'MacOS and iOS iMessage database (chat.db, sms.db) file'),
+            ('kik_messenger', 'iOS Kik messenger SQLite database (kik.sqlite) file'),
+            ('kodi', 'Kodi videos SQLite database (MyVideos.db) file'),
+            ('ls_quarantine', 'MacOS launch services quarantine events database SQLite database file'),
+            ('mac_document_versions', 'MacOS document revisions SQLite database file'),
+            ('mac_knowledgec', 'MacOS Duet / KnowledgeC SQLites database file'),
+            ('mac_notes', 'MacOS Notes SQLite database (NotesV7.storedata) file'),
+            ('mac_notificationcenter', 'MacOS Notification Center SQLite database file'),
+            ('mackeeper_cache', 'MacOS MacKeeper cache SQLite database file'),
+            ('macostcc', 'MacOS Transaprency, Consent, Control (TCC) SQLite database (TCC.db) file'),
+            ('safari_historydb', 'Safari history SQLite database (History.db) file'),
+            ('skype', 'Skype SQLite database (main.db) file'),
+            ('tango_android_profile', 'Tango on Android profile SQLite database file'),
+            ('tango_android_tc', 'Tango on Android TC SQLite database file'),
+            ('twitter_android', 'Twitter on Android SQLite database file'),
+            ('twitter_ios', 'Twitter on iOS 8 and later SQLite database (twitter.db) file'),
+            ('windows_timeline', 'Windows 10 Timeline SQLite database (ActivitiesCache.db) file'),
+            ('zeitgeist', 'Zeitgeist activity SQLite database file'),
+        ],
+        'plugins_modules': [
+            'plaso.parsers.sqlite_plugins',
+        ],
+    },
+    'symantec_scanlog': {
+        'data_format': 'AV Corporate Edition and Endpoint Protection log file',
+        'format_specification': {
+            'identifier': 'symantec_scanlog',
+            'signatures': [],
+            'text_format': True,
+        },
+        'module': 'plaso.parsers.symantec',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'syslog': {
+        'data_format': 'System log (syslog) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.syslog',
+        'plugins': [
+            ('cron', 'Cron syslog line'),
+            ('ssh', 'SSH syslog line'),
+        ],
+        'plugins_modules': [
+            'plaso.parsers.syslog_plugins',
+        ],
+    },
+    'systemd_journal': {
+        'data_format': 'Systemd journal file',
+        'format_specification': {
+            'identifier': 'systemd_journal',
+            'signatures': [(b'LPKSHHRH', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.systemd_journal',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'trendmicro_url': {
+        'data_format': 'Trend Micro Office Web Reputation log file',
+        'format_specification': {
+            'identifier': 'trendmicro_url',
+            'signatures': [],
+            'text_format': True,
+        },
+        'module': 'plaso.parsers.trendmicroav',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'trendmicro_vd': {
+        'data_format': 'Trend Micro Office Scan Virus Detection log file',
+        'format_specification': {
+            'identifier': 'trendmicro_vd',
+            'signatures': [],
+            'text_format': True,
+        },
+        'module': 'plaso.parsers.trendmicroav',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'usnjrnl': {
+        'data_format': 'NTFS USN change journal ($UsnJrnl:$J) file system metadata file',
+        'format_specification': None,
+        'module': 'plaso.parsers.ntfs',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'utmp': {
+        'data_format': 'Linux libc6 utmp file',
+        'format_specification': None,
+        'module': 'plaso.parsers.utmp',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'utmpx': {
+        'data_format': 'Mac OS X 10.5 utmpx file',
+        'format_specification': {
+            'identifier': 'utmpx',
+            'signatures': [(b'utmpx-1.00\x00', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.utmpx',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'vsftpd': {
+        'data_format': 'vsftpd log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.vsftpd',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'winevt': {
+        'data_format': 'Windows EventLog (EVT) file',
+        'format_specification': {
+            'identifier': 'winevt',
+            'signatures': [(b'LfLe', 4)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.winevt',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'winevtx': {
+        'data_format': 'Windows XML EventLog (EVTX) file',
+        'format_specification': {
+            'identifier': 'winevtx',
+            'signatures': [(b'ElfFile\x00', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.winevtx',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'winfirewall': {
+        'data_format': 'Windows Firewall log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.winfirewall',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'winiis': {
+        'data_format': 'Microsoft IIS log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.iis',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'winjob': {
+        'data_format': 'Windows Scheduled Task job (or at-job) file',
+        'format_specification': None,
+        'module': 'plaso.parsers.winjob',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'winreg': {
+        'data_format': 'Windows NT Registry (REGF) file',
+        'format_specification': {
+            'identifier': 'winreg',
+            'signatures': [(b'regf', 0)],
+            'text_format': False,
+        },
+        'module': 'plaso.parsers.winreg',
+        'plugins': [
+            ('appcompatcache', 'Application Compatibility Cache Registry data'),
+            ('bagmru', 'BagMRU (or ShellBags) Registry data'),
+            ('bam', 'Background Activity Moderator (BAM) Registry data'),
+            ('ccleaner', 'CCleaner Registry data'),
+            ('explorer_mountpoints2', 'Windows Explorer mount points Registry data'),
+            ('explorer_programscache', 'Windows Explorer Programs Cache Registry data'),
+            ('microsoft_office_mru', 'Microsoft Office MRU Registry data'),
+            ('microsoft_outlook_mru', 'Microsoft Outlook search MRU Registry data'),
+            ('mrulist_shell_item_list', 'Most Recently Used (MRU) Registry data'),
+            ('mrulist_string', 'Most Recently Used (MRU) Registry data'),
+            ('mrulistex_shell_item_list', 'Most Recently Used (MRU) Registry data'),
+            ('mrulistex_string', 'Most Recently Used (MRU) Registry data'),
+            ('mrulistex_string_and_shell_item', 'Most Recently Used (MRU) Registry data'),
+            ('mrulistex_string_and_shell_item_list', 'Most Recently Used (MRU) Registry data'),
+            ('msie_zone', 'Microsoft Internet Explorer zone settings Registry data'),
+            ('mstsc_rdp', 'Terminal Server Client Connection Registry data'),
+            ('mstsc_rdp_mru', 'Terminal Server Client Most Recently Used (MRU) Registry data'),
+            ('network_drives', 'Windows network drives Registry data'),
+            ('networks', 'Windows networks (NetworkList) Registry data'),
+            ('userassist', 'User Assist Registry data'),
+            ('windows_boot_execute', 'Boot Execution Registry data'),
+            ('windows_boot_verify', 'Windows boot verification Registry data'),
+            ('windows_run', 'Run and run once Registry data'),
+            ('windows_sam_users', 'Security Accounts Manager (SAM) users Registry data'),
+            ('windows_services', 'Windows drivers and services Registry data'),
+            ('windows_shutdown', 'Windows last shutdown Registry data'),
+            ('windows_task_cache', 'Windows Task Scheduler cache Registry data'),
+            ('windows_timezone', 'Windows time zone Registry data'),
+            ('windows_typed_urls', 'Windows Explorer typed URLs Registry data'),
+            ('windows_usb_devices', 'Windows USB device Registry data'),
+            ('windows_usbstor_devices', 'Windows USB Plug And Play Manager USBStor Registry data'),
+            ('windows_version', 'Windows version (product) Registry data'),
+            ('winlogon', 'Windows log-on Registry data'),
+            ('winrar_mru', 'WinRAR History Registry data'),
+            ('winreg_default', 'Windows Registry data'),
+        ],
+        'plugins_modules': [
+            'plaso.parsers.winreg_plugins',
+        ],
+    },
+    'xchatlog': {
+        'data_format': 'XChat log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.xchatlog',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'xchatscrollback': {
+        'data_format': 'XChat scrollback log file',
+        'format_specification': None,
+        'module': 'plaso.parsers.xchatscrollback',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+    'zsh_extended_history': {
+        'data_format': 'ZSH extended history file',
+        'format_specification': None,
+        'module': 'plaso.parsers.zsh_extended_history',
+        'plugins': None,
+        'plugins_modules': [],
+    },
+}
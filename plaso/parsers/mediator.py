@@ -5,12 +5,16 @@ from __future__ import unicode_literals
 
 import copy
 import datetime
+import gc
+import os
 import time
 
 from dfvfs.lib import definitions as dfvfs_definitions
 
+from plaso.containers import event_sources
 from plaso.containers import warnings
 from plaso.engine import path_helper
+from plaso.engine import process_info
 from plaso.engine import profilers
 from plaso.lib import errors
 from plaso.parsers import logger
@@ -33,8 +37,12 @@ class ParserMediator(object):
   _INT64_MIN = -1 << 63
   _INT64_MAX = (1 << 63) - 1
 
+  # Interval in seconds between checks of the memory usage.
+  _MEMORY_USAGE_CHECK_INTERVAL = 1.0
+
   def __init__(
       self, storage_writer, knowledge_base, collection_filters_helper=None,
+      maximum_number_of_records_per_task=None, memory_limit=None,
       preferred_year=None, resolver_context=None, temporary_directory=None):
     """Initializes a parser mediator.
 
@@ -44,6 +52,16 @@ class ParserMediator(object):
           data needed for parsing.
       collection_filters_helper (Optional[CollectionFiltersHelper]): collection
           filters helper.
+      maximum_number_of_records_per_task (Optional[int]): maximum number of
+          records a parser that supports record ranges should parse, where
+          the remaining records are produced as record range event sources.
+          None represents all records are parsed at once.
+      memory_limit (Optional[int]): soft limit of the amount of memory, in
+          bytes, the process is allowed to consume, where None represents no
+          limit. When the limit is exceeded the buffered attribute containers
+          are written and the memory is garbage collected. If the limit is
+          still exceeded parsers that support record ranges hand off the
+          records that remain to be parsed as record range event sources.
       preferred_year (Optional[int]): preferred year.
       resolver_context (Optional[dfvfs.Context]): resolver context.
       temporary_directory (Optional[str]): path of the directory for temporary
@@ -52,12 +70,18 @@ class ParserMediator(object):
     super(ParserMediator, self).__init__()
     self._abort = False
     self._cpu_time_profiler = None
+    self._event_data_stream = None
     self._event_data_stream_identifier = None
     self._extra_event_attributes = {}
     self._file_entry = None
     self._knowledge_base = knowledge_base
     self._last_event_data_hash = None
     self._last_event_data_identifier = None
+    self._last_memory_usage_check_time = 0.0
+    self._maximum_number_of_records_per_task = (
+        maximum_number_of_records_per_task)
+    self._memory_limit = memory_limit
+    self._memory_limit_exceeded = False
     self._memory_profiler = None
     self._number_of_event_sources = 0
     self._number_of_events = 0
@@ -65,6 +89,8 @@ class ParserMediator(object):
     self._parser_chain_components = []
     self._preferred_year = preferred_year
     self._process_information = None
+    self._read_ahead_profiler = None
+    self._record_range = None
     self._resolver_context = resolver_context
     self._storage_writer = storage_writer
     self._temporary_directory = temporary_directory
@@ -92,6 +118,11 @@ class ParserMediator(object):
     """KnowledgeBase: knowledge base."""
     return self._knowledge_base
 
+  @property
+  def memory_limit_exceeded(self):
+    """bool: True if the memory limit is exceeded after garbage collection."""
+    return self._memory_limit_exceeded
+
   @property
   def number_of_produced_event_sources(self):
     """int: number of produced event sources."""
@@ -132,6 +163,40 @@ class ParserMediator(object):
     """int: year."""
     return self._knowledge_base.year
 
+  def _CheckMemoryUsage(self):
+    """Checks if the memory usage exceeds the memory limit.
+
+    If the memory limit is exceeded the attribute containers buffered by
+    the storage writer are written and the memory is garbage collected,
+    before the memory usage is checked again.
+    """
+    self._last_memory_usage_check_time = time.time()
+
+    if not self._process_information:
+      self._process_information = process_info.ProcessInfo(os.getpid())
+
+    used_memory = self._process_information.GetUsedMemory() or 0
+    if used_memory <= self._memory_limit:
+      self._memory_limit_exceeded = False
+      return
+
+    if self._storage_writer:
+      self._storage_writer.Flush()
+
+    gc.collect()
+
+    used_memory = self._process_information.GetUsedMemory() or 0
+    self._memory_limit_exceeded = used_memory > self._memory_limit
+
+    if self._memory_limit_exceeded:
+      display_name = 'N/A'
+      if self._file_entry:
+        display_name = self.GetDisplayName()
+
+      logger.debug((
+          'Memory limit: {0:d} exceeded: {1:d} while parsing: {2:s}').format(
+              self._memory_limit, used_memory, display_name))
+
   def _GetEarliestYearFromFileEntry(self):
     """Retrieves the year from the file entry date and time values.
 
@@ -352,6 +417,44 @@ class ParserMediator(object):
     """
     return '/'.join(self._parser_chain_components)
 
+  def GetRecordRange(self, parser_name, number_of_records):
+    """Retrieves the indexes of the records a parser should parse.
+
+    If a record range is set, only the records in that range are parsed.
+    Otherwise, if the number of records exceeds the maximum number of records
+    per task, the records after the first range are produced as record range
+    event sources, so that they can be parsed by other workers in parallel.
+
+    Args:
+      parser_name (str): name of the parser that parses the records.
+      number_of_records (int): number of records in the data stream.
+
+    Returns:
+      range: indexes of the records to parse.
+    """
+    if self._record_range and self._record_range.parser_name == parser_name:
+      first_record_index = min(
+          self._record_range.first_record_index, number_of_records)
+      last_record_index = min(
+          first_record_index + self._record_range.number_of_records,
+          number_of_records)
+      return range(first_record_index, last_record_index)
+
+    maximum_number_of_records = self._maximum_number_of_records_per_task
+    if (self._record_range or not maximum_number_of_records or
+        number_of_records <= maximum_number_of_records):
+      return range(0, number_of_records)
+
+    for first_record_index in range(
+        maximum_number_of_records, number_of_records,
+        maximum_number_of_records):
+      self.ProduceRecordRangeEventSource(
+          parser_name, first_record_index, min(
+              maximum_number_of_records,
+              number_of_records - first_record_index))
+
+    return range(0, maximum_number_of_records)
+
   def GetRelativePath(self):
     """Retrieves the relative path of the current file entry.
 
@@ -436,6 +539,8 @@ class ParserMediator(object):
     if not self._storage_writer:
       raise RuntimeError('Storage writer not set.')
 
+    self._event_data_stream = event_data_stream
+
     if not event_data_stream:
       self._event_data_stream_identifier = None
     else:
@@ -519,6 +624,11 @@ class ParserMediator(object):
 
     self.last_activity_timestamp = time.time()
 
+    if self._memory_limit and (
+        self.last_activity_timestamp >= self._last_memory_usage_check_time +
+        self._MEMORY_USAGE_CHECK_INTERVAL):
+      self._CheckMemoryUsage()
+
   def ProduceExtractionWarning(self, message, path_spec=None):
     """Produces an extraction warning.
 
@@ -545,6 +655,38 @@ class ParserMediator(object):
 
     self.last_activity_timestamp = time.time()
 
+  def ProduceRecordRangeEventSource(
+      self, parser_name, first_record_index, number_of_records):
+    """Produces a record range event source of the active file entry.
+
+    Parsers that support record ranges use record range event sources to
+    split the records of a large data stream into ranges that are parsed by
+    other workers in parallel, or to hand off the records that remain to be
+    parsed when the memory limit is exceeded.
+
+    Args:
+      parser_name (str): name of the parser that parses the records.
+      first_record_index (int): index of the first record in the range.
+      number_of_records (int): number of records in the range.
+
+    Raises:
+      RuntimeError: when storage writer is not set.
+    """
+    data_stream_name = getattr(
+        getattr(self._event_data_stream, 'path_spec', None), 'data_stream',
+        None)
+
+    event_source = event_sources.RecordRangeEventSource(
+        path_spec=getattr(self._file_entry, 'path_spec', None))
+    event_source.data_stream_name = data_stream_name or ''
+    event_source.event_data_stream = self._event_data_stream
+    event_source.file_entry_type = getattr(
+        self._file_entry, 'entry_type', None)
+    event_source.first_record_index = first_record_index
+    event_source.number_of_records = number_of_records
+    event_source.parser_name = parser_name
+    self.ProduceEventSource(event_source)
+
   def RemoveEventAttribute(self, attribute_name):
     """Removes an attribute from being set on all events produced.
 
@@ -573,6 +715,20 @@ class ParserMediator(object):
       used_memory = self._process_information.GetUsedMemory() or 0
       self._memory_profiler.Sample(parser_name, used_memory)
 
+  def SampleReadAhead(
+      self, parser_name, number_of_reads, number_of_file_object_reads):
+    """Takes a sample of read-ahead window usage for profiling.
+
+    Args:
+      parser_name (str): name of the parser.
+      number_of_reads (int): number of reads.
+      number_of_file_object_reads (int): number of reads of the file-like
+          object.
+    """
+    if self._read_ahead_profiler:
+      self._read_ahead_profiler.Sample(
+          parser_name, number_of_reads, number_of_file_object_reads)
+
   def SampleStartTiming(self, parser_name):
     """Starts timing a CPU time sample for profiling.
 
@@ -598,8 +754,25 @@ class ParserMediator(object):
       file_entry (dfvfs.FileEntry): file entry.
     """
     self._file_entry = file_entry
+    self._event_data_stream = None
     self._event_data_stream_identifier = None
 
+    # If the memory limit was exceeded while parsing the previous file entry,
+    # the memory usage is checked again after the check interval, so that
+    # parsers make progress before they hand off the remaining records.
+    if self._memory_limit_exceeded:
+      self._last_memory_usage_check_time = time.time()
+      self._memory_limit_exceeded = False
+
+  def SetRecordRange(self, record_range):
+    """Sets the range of records to parse of the active file entry.
+
+    Args:
+      record_range (RecordRangeEventSource): range of records to parse or None
+          to parse all records.
+    """
+    self._record_range = record_range
+
   def SetStorageWriter(self, storage_writer):
     """Sets the storage writer.
 
@@ -640,6 +813,10 @@ class ParserMediator(object):
           identifier, configuration)
       self._memory_profiler.Start()
 
+      self._read_ahead_profiler = profilers.ReadAheadProfiler(
+          identifier, configuration)
+      self._read_ahead_profiler.Start()
+
     self._process_information = process_information
 
   def StopProfiling(self):
@@ -652,4 +829,8 @@ class ParserMediator(object):
       self._memory_profiler.Stop()
       self._memory_profiler = None
 
+    if self._read_ahead_profiler:
+      self._read_ahead_profiler.Stop()
+      self._read_ahead_profiler = None
+
     self._process_information = None
@@ -355,7 +355,20 @@ class NTFSMFTParser(interface.FileObjectParser):
           'unable to open $MFT file with error: {0!s}'.format(exception))
       return
 
-    for entry_index in range(0, mft_metadata_file.number_of_file_entries):
+    # Large $MFT metadata files are split into ranges of MFT entries that
+    # are parsed in parallel.
+    entry_indexes = parser_mediator.GetRecordRange(
+        self.NAME, mft_metadata_file.number_of_file_entries)
+
+    for entry_index in entry_indexes:
+      # The MFT entries that remain to be parsed are handed off to another
+      # task when the memory limit is exceeded.
+      if (parser_mediator.memory_limit_exceeded and
+          entry_index > entry_indexes.start):
+        parser_mediator.ProduceRecordRangeEventSource(
+            self.NAME, entry_index, entry_indexes.stop - entry_index)
+        break
+
       try:
         mft_entry = mft_metadata_file.get_file_entry(entry_index)
         if (not mft_entry.is_empty() and
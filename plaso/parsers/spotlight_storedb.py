@@ -281,8 +281,8 @@ class SpotlightStoreDatabaseParser(dtfabric_parser.DtFabricBaseParser):
     Args:
       page_header (spotlight_store_db_property_page_header): page header.
       page_data (bytes): page data.
-      property_table (dict[int, object]): property table in which to store the
-          property page values.
+      property_table (dict[int, list[str]]): property table in which to store
+          the names of the metadata values per index page value.
 
     Raises:
       ParseError: if the property page values cannot be read.
@@ -334,9 +334,7 @@ class SpotlightStoreDatabaseParser(dtfabric_parser.DtFabricBaseParser):
         value_string = getattr(metadata_value, 'value_name', '')
         values_list.append(value_string)
 
-      setattr(property_value, 'values_list', values_list)
-
-      property_table[property_value.table_index] = property_value
+      property_table[property_value.table_index] = values_list
 
       page_data_offset += page_value_size
       page_value_index += 1
@@ -615,9 +613,7 @@ class SpotlightStoreDatabaseParser(dtfabric_parser.DtFabricBaseParser):
     table_index, bytes_read = self._ReadVariableSizeInteger(data)
 
     if property_type & 0x03 == 0x03:
-      metadata_localized_strings = self._metadata_localized_strings.get(
-          table_index, None)
-      value_list = getattr(metadata_localized_strings, 'values_list', [])
+      value_list = self._metadata_localized_strings.get(table_index, [])
 
       value = '(null)'
       if value_list:
@@ -626,8 +622,7 @@ class SpotlightStoreDatabaseParser(dtfabric_parser.DtFabricBaseParser):
           value = value.split('\x16\x02')[0]
 
     elif property_type & 0x03 == 0x02:
-      metadata_list = self._metadata_lists.get(table_index, None)
-      value = getattr(metadata_list, 'values_list', [])
+      value = self._metadata_lists.get(table_index, [])
 
     else:
       metadata_value = self._metadata_values.get(table_index, None)
@@ -47,6 +47,8 @@ class SystemdJournalParser(dtfabric_parser.DtFabricBaseParser):
 
   _DEFINITION_FILE = 'systemd_journal.yaml'
 
+  _READ_AHEAD_WINDOW_SIZE = 16 * 1024
+
   _OBJECT_COMPRESSED_FLAG_XZ = 1
   _OBJECT_COMPRESSED_FLAG_LZ4 = 2
 
@@ -50,6 +50,8 @@ class UtmpParser(dtfabric_parser.DtFabricBaseParser):
 
   _DEFINITION_FILE = 'utmp.yaml'
 
+  _READ_AHEAD_WINDOW_SIZE = 16 * 1024
+
   _EMPTY_IP_ADDRESS = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
 
   _SUPPORTED_TYPES = frozenset(range(0, 10))
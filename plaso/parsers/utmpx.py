@@ -47,6 +47,8 @@ class UtmpxParser(dtfabric_parser.DtFabricBaseParser):
 
   _DEFINITION_FILE = 'utmp.yaml'
 
+  _READ_AHEAD_WINDOW_SIZE = 16 * 1024
+
   _SUPPORTED_TYPES = frozenset(range(0, 12))
 
   _FILE_HEADER_USERNAME = 'utmpx-1.00'
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import re
+
 from xml.parsers import expat
 
 import pyevtx
@@ -61,10 +63,23 @@ class WinEvtxParser(interface.FileObjectParser):
   NAME = 'winevtx'
   DATA_FORMAT = 'Windows XML EventLog (EVTX) file'
 
+  _SYSTEM_END_TAG = '</System>'
+
+  # Regular expression to extract the SystemTime attribute of the TimeCreated
+  # XML element, which is significantly faster than parsing the entire XML
+  # string. Note that markup characters in element values are escaped hence
+  # the expression can only match an actual TimeCreated XML element.
+  _TIME_CREATED_RE = re.compile(
+      r'<TimeCreated\s[^>]*?\bSystemTime=["\']([^"\']*)["\']')
+
   def _GetCreationTimeFromXMLString(
       self, parser_mediator, record_index, xml_string):
     """Retrieves the creationg time from the XML string.
 
+    The creation time is extracted from the System XML element with a regular
+    expression. The entire XML string is only parsed if the regular expression
+    does not match, for example when the XML string is malformed.
+
     Args:
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfvfs.
@@ -75,6 +90,13 @@ class WinEvtxParser(interface.FileObjectParser):
       str: creation date and time formatted as ISO 8601 or None if not
           available.
     """
+    system_end_offset = xml_string.find(self._SYSTEM_END_TAG)
+    if system_end_offset > 0:
+      regex_match = self._TIME_CREATED_RE.search(
+          xml_string, 0, system_end_offset)
+      if regex_match:
+        return regex_match.group(1)
+
     try:
       xml_root = ElementTree.fromstring(xml_string)
     except (LookupError, ElementTree.ParseError, expat.ExpatError) as exception:
@@ -229,32 +251,49 @@ class WinEvtxParser(interface.FileObjectParser):
     # The call to evt_file.get_record() and access to members of evt_record
     # should be called within a try-except.
 
-    for record_index in range(evtx_file.number_of_records):
-      if parser_mediator.abort:
-        break
+    number_of_records = evtx_file.number_of_records
 
-      try:
-        evtx_record = evtx_file.get_record(record_index)
-        self._ParseRecord(parser_mediator, record_index, evtx_record)
-
-      except (IOError, ElementTree.ParseError) as exception:
-        parser_mediator.ProduceExtractionWarning(
-            'unable to parse event record: {0:d} with error: {1!s}'.format(
-                record_index, exception))
+    # Large EVTX files are split into ranges of records that are parsed in
+    # parallel, where the indexes of the recovered records follow those of
+    # the records.
+    record_indexes = parser_mediator.GetRecordRange(
+        self.NAME, number_of_records + evtx_file.number_of_recovered_records)
 
-    for record_index in range(evtx_file.number_of_recovered_records):
+    for record_index in record_indexes:
       if parser_mediator.abort:
         break
 
-      try:
-        evtx_record = evtx_file.get_recovered_record(record_index)
-        self._ParseRecord(
-            parser_mediator, record_index, evtx_record, recovered=True)
-
-      except IOError as exception:
-        parser_mediator.ProduceExtractionWarning((
-            'unable to parse recovered event record: {0:d} with error: '
-            '{1!s}').format(record_index, exception))
+      # The records that remain to be parsed are handed off to another task
+      # when the memory limit is exceeded.
+      if (parser_mediator.memory_limit_exceeded and
+          record_index > record_indexes.start):
+        parser_mediator.ProduceRecordRangeEventSource(
+            self.NAME, record_index, record_indexes.stop - record_index)
+        break
+
+      if record_index < number_of_records:
+        try:
+          evtx_record = evtx_file.get_record(record_index)
+          self._ParseRecord(parser_mediator, record_index, evtx_record)
+
+        except (IOError, ElementTree.ParseError) as exception:
+          parser_mediator.ProduceExtractionWarning(
+              'unable to parse event record: {0:d} with error: {1!s}'.format(
+                  record_index, exception))
+
+      else:
+        recovered_record_index = record_index - number_of_records
+
+        try:
+          evtx_record = evtx_file.get_recovered_record(recovered_record_index)
+          self._ParseRecord(
+              parser_mediator, recovered_record_index, evtx_record,
+              recovered=True)
+
+        except IOError as exception:
+          parser_mediator.ProduceExtractionWarning((
+              'unable to parse recovered event record: {0:d} with error: '
+              '{1!s}').format(recovered_record_index, exception))
 
   @classmethod
   def GetFormatSpecification(cls):
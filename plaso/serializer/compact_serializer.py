@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""The compact serializer object implementation."""
+
+from __future__ import unicode_literals
+
+from dfvfs.path import path_spec as dfvfs_path_spec
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+from plaso.containers import event_sources
+from plaso.containers import interface as containers_interface
+from plaso.containers import manager as containers_manager
+from plaso.serializer import interface
+
+
+class CompactAttributeContainerSerializer(
+    interface.AttributeContainerSerializer):
+  """Compact attribute container serializer.
+
+  The serialized form of an attribute container is a tuple of built-in types,
+  which is considerably smaller and faster to pickle than the attribute
+  container itself, since it contains no class references, and which is
+  intended to pass attribute containers, such as tasks, between processes.
+
+  The serialized form consists of:
+  (container_type, ((attribute_name, value_type, attribute_value), ...))
+
+  Where value_type indicates how the attribute value is serialized:
+  * _VALUE_TYPE_ATTRIBUTE_CONTAINER: a nested attribute container in
+      serialized form;
+  * _VALUE_TYPE_PATH_SPEC: a path specification in serialized form, which
+      is a tuple of (type_indicator, ((property_name, property_value), ...))
+      per path specification, from the outermost to the innermost one;
+  * _VALUE_TYPE_VALUE: a built-in type that is stored as-is.
+  """
+
+  _VALUE_TYPE_ATTRIBUTE_CONTAINER = 1
+  _VALUE_TYPE_PATH_SPEC = 2
+  _VALUE_TYPE_VALUE = 0
+
+  # Event sources with attributes in addition to those of the event source
+  # attribute container per data type.
+  _EVENT_SOURCE_CLASSES = {
+      event_sources.RecordRangeEventSource.DATA_TYPE: (
+          event_sources.RecordRangeEventSource)}
+
+  @classmethod
+  def _ReadPathSpec(cls, serialized_path_spec):
+    """Reads a path specification from serialized form.
+
+    Args:
+      serialized_path_spec (tuple[tuple[str, tuple[tuple[str, object]]]]):
+          serialized path specification.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+    """
+    path_spec = None
+    for type_indicator, properties in reversed(serialized_path_spec):
+      kwargs = dict(properties)
+      if path_spec:
+        kwargs['parent'] = path_spec
+
+      path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+          type_indicator, **kwargs)
+
+    return path_spec
+
+  @classmethod
+  def _WritePathSpec(cls, path_spec):
+    """Writes a path specification to serialized form.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      tuple[tuple[str, tuple[tuple[str, object]]]]: serialized path
+          specification.
+    """
+    serialized_path_spec = []
+    while path_spec:
+      properties = []
+      for property_name in dfvfs_path_spec_factory.Factory.PROPERTY_NAMES:
+        property_value = getattr(path_spec, property_name, None)
+        if property_value is not None:
+          properties.append((property_name, property_value))
+
+      serialized_path_spec.append((path_spec.type_indicator, tuple(properties)))
+      path_spec = path_spec.parent
+
+    return tuple(serialized_path_spec)
+
+  @classmethod
+  def ReadSerialized(cls, serialized):
+    """Reads an attribute container from serialized form.
+
+    Args:
+      serialized (tuple[str, tuple[tuple[str, int, object]]]): serialized
+          attribute container.
+
+    Returns:
+      AttributeContainer: attribute container or None.
+
+    Raises:
+      ValueError: if the container type or the type of an attribute value
+          is not supported.
+    """
+    if not serialized:
+      return None
+
+    container_type, attributes = serialized
+
+    event_source_class = None
+    if container_type == event_sources.EventSource.CONTAINER_TYPE:
+      for attribute_name, _, attribute_value in attributes:
+        if attribute_name == 'data_type':
+          event_source_class = cls._EVENT_SOURCE_CLASSES.get(
+              attribute_value, None)
+          break
+
+    if event_source_class:
+      attribute_container = event_source_class()
+    else:
+      manager_class = containers_manager.AttributeContainersManager
+      attribute_container = manager_class.CreateAttributeContainer(
+          container_type)
+
+    for attribute_name, value_type, attribute_value in attributes:
+      if value_type == cls._VALUE_TYPE_PATH_SPEC:
+        attribute_value = cls._ReadPathSpec(attribute_value)
+
+      elif value_type == cls._VALUE_TYPE_ATTRIBUTE_CONTAINER:
+        attribute_value = cls.ReadSerialized(attribute_value)
+
+      elif value_type != cls._VALUE_TYPE_VALUE:
+        raise ValueError('Unsupported attribute value type: {0!s}'.format(
+            value_type))
+
+      setattr(attribute_container, attribute_name, attribute_value)
+
+    return attribute_container
+
+  @classmethod
+  def WriteSerialized(cls, attribute_container):
+    """Writes an attribute container to serialized form.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      tuple[str, tuple[tuple[str, int, object]]]: serialized attribute
+          container.
+
+    Raises:
+      TypeError: if not an instance of AttributeContainer.
+      ValueError: if the attribute container type is not supported.
+    """
+    if not isinstance(
+        attribute_container, containers_interface.AttributeContainer):
+      raise TypeError('{0!s} is not an attribute container type.'.format(
+          type(attribute_container)))
+
+    container_type = getattr(attribute_container, 'CONTAINER_TYPE', None)
+    if not container_type:
+      raise ValueError('Unsupported attribute container type: {0!s}.'.format(
+          type(attribute_container)))
+
+    attributes = []
+    for attribute_name, attribute_value in attribute_container.GetAttributes():
+      if isinstance(attribute_value, dfvfs_path_spec.PathSpec):
+        value_type = cls._VALUE_TYPE_PATH_SPEC
+        attribute_value = cls._WritePathSpec(attribute_value)
+
+      elif isinstance(
+          attribute_value, containers_interface.AttributeContainer):
+        value_type = cls._VALUE_TYPE_ATTRIBUTE_CONTAINER
+        attribute_value = cls.WriteSerialized(attribute_value)
+
+      else:
+        value_type = cls._VALUE_TYPE_VALUE
+
+      attributes.append((attribute_name, value_type, attribute_value))
+
+    return container_type, tuple(attributes)
@@ -18,6 +18,7 @@ from dfvfs.path import factory as dfvfs_path_spec_factory
 # the dfDateTime factory.
 from dfvfs.vfs import tsk_file_entry  # pylint: disable=unused-import
 
+from plaso.containers import event_sources
 from plaso.containers import interface as containers_interface
 from plaso.containers import manager as containers_manager
 from plaso.serializer import interface
@@ -39,6 +40,12 @@ class JSONAttributeContainerSerializer(interface.AttributeContainerSerializer):
       'preferred_encoding',
       'preferred_time_zone'])
 
+  # Event sources with attributes in addition to those of the event source
+  # attribute container per data type.
+  _EVENT_SOURCE_CLASSES = {
+      event_sources.RecordRangeEventSource.DATA_TYPE: (
+          event_sources.RecordRangeEventSource)}
+
   @classmethod
   def _ConvertAttributeContainerToDict(cls, attribute_container):
     """Converts an attribute container object into a JSON dictionary.
@@ -238,9 +245,17 @@ class JSONAttributeContainerSerializer(interface.AttributeContainerSerializer):
     else:
       raise ValueError('Unsupported class type: {0:s}'.format(class_type))
 
-    container_object = (
-        containers_manager.AttributeContainersManager.CreateAttributeContainer(
-            container_type))
+    event_source_class = None
+    if container_type == event_sources.EventSource.CONTAINER_TYPE:
+      event_source_class = cls._EVENT_SOURCE_CLASSES.get(
+          json_dict.get('data_type', None), None)
+
+    if event_source_class:
+      container_object = event_source_class()
+    else:
+      manager_class = containers_manager.AttributeContainersManager
+      container_object = manager_class.CreateAttributeContainer(
+          container_type)
 
     supported_attribute_names = container_object.GetAttributeNames()
     for attribute_name, attribute_value in json_dict.items():
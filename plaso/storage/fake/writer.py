@@ -43,6 +43,7 @@ class FakeStorageWriter(interface.StorageWriter):
     self._events = []
     self._warnings = []
     self._is_open = False
+    self._processed_event_sources = []
     self._task_storage_writers = {}
     self.analysis_reports = []
     self.session_completion = None
@@ -174,9 +175,10 @@ class FakeStorageWriter(interface.StorageWriter):
     """
     self._RaiseIfNotWritable()
 
-    event_source = self._PrepareAttributeContainer(event_source)
+    if self._store_event_sources:
+      event_source = self._PrepareAttributeContainer(event_source)
+      self._event_sources.append(event_source)
 
-    self._event_sources.append(event_source)
     self.number_of_event_sources += 1
 
   def AddEventTag(self, event_tag, serialized_data=None):
@@ -202,6 +204,26 @@ class FakeStorageWriter(interface.StorageWriter):
     self._event_tags.append(event_tag)
     self.number_of_event_tags += 1
 
+  def AddProcessedEventSource(
+      self, processed_event_source, serialized_data=None):
+    """Adds a processed event source.
+
+    Args:
+      processed_event_source (ProcessedEventSource): processed event source.
+      serialized_data (Optional[bytes]): serialized form of the processed
+          event source.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    processed_event_source = self._PrepareAttributeContainer(
+        processed_event_source)
+
+    self._processed_event_sources.append(processed_event_source)
+
   def AddWarning(self, warning, serialized_data=None):
     """Adds a warnings.
 
@@ -335,6 +357,14 @@ class FakeStorageWriter(interface.StorageWriter):
     """
     return iter(self._event_sources)
 
+  def GetProcessedEventSources(self):
+    """Retrieves the processed event sources.
+
+    Returns:
+      generator(ProcessedEventSource): processed event source generator.
+    """
+    return iter(self._processed_event_sources)
+
   def GetEventTags(self):
     """Retrieves the event tags.
 
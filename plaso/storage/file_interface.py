@@ -362,6 +362,20 @@ class StorageFileReader(interface.StorageReader):
     """
     return self._storage_file.GetEventTags()
 
+  def GetEventTimestampQuantiles(self, number_of_quantiles):
+    """Retrieves the timestamps that divide the events into quantiles.
+
+    Args:
+      number_of_quantiles (int): number of quantiles.
+
+    Returns:
+      list[int]: timestamps in increasing order, which are the timestamp of
+          the first event, the timestamps of the events at the boundaries of
+          the quantiles and the timestamp of the last event, or an empty list
+          if there are no events.
+    """
+    return self._storage_file.GetEventTimestampQuantiles(number_of_quantiles)
+
   def GetNumberOfAnalysisReports(self):
     """Retrieves the number analysis reports.
 
@@ -378,6 +392,14 @@ class StorageFileReader(interface.StorageReader):
     """
     return self._storage_file.GetNumberOfEventSources()
 
+  def GetProcessedEventSources(self):
+    """Retrieves the processed event sources.
+
+    Returns:
+      generator(ProcessedEventSource): processed event source generator.
+    """
+    return self._storage_file.GetProcessedEventSources()
+
   def GetSessions(self):
     """Retrieves the sessions.
 
@@ -667,8 +689,9 @@ class StorageFileWriter(interface.StorageWriter):
     """
     self._RaiseIfNotWritable()
 
-    self._storage_file.AddEventSource(
-        event_source, serialized_data=serialized_data)
+    if self._store_event_sources:
+      self._storage_file.AddEventSource(
+          event_source, serialized_data=serialized_data)
     self.number_of_event_sources += 1
 
   def AddEventTag(self, event_tag, serialized_data=None):
@@ -691,6 +714,24 @@ class StorageFileWriter(interface.StorageWriter):
       self._session.event_labels_counter[label] += 1
     self.number_of_event_tags += 1
 
+  def AddProcessedEventSource(
+      self, processed_event_source, serialized_data=None):
+    """Adds a processed event source.
+
+    Args:
+      processed_event_source (ProcessedEventSource): a processed event source.
+      serialized_data (Optional[bytes]): serialized form of the processed
+          event source.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    self._storage_file.AddProcessedEventSource(
+        processed_event_source, serialized_data=serialized_data)
+
   def Close(self):
     """Closes the storage writer.
 
@@ -876,6 +917,17 @@ class StorageFileWriter(interface.StorageWriter):
             'Unable to rename task storage file: {0:s} with error: '
             '{1!s}').format(storage_file_path, exception))
 
+  def Flush(self):
+    """Writes the buffered attribute containers to the storage file.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    self._RaiseIfNotWritable()
+
+    self._storage_file.Flush()
+
   def Open(self, **unused_kwargs):
     """Opens the storage writer.
 
@@ -34,6 +34,8 @@ class BaseStore(object):
   _CONTAINER_TYPE_EXTRACTION_ERROR = (
       warnings.ExtractionError.CONTAINER_TYPE)
   _CONTAINER_TYPE_EXTRACTION_WARNING = warnings.ExtractionWarning.CONTAINER_TYPE
+  _CONTAINER_TYPE_PROCESSED_EVENT_SOURCE = (
+      event_sources.ProcessedEventSource.CONTAINER_TYPE)
   _CONTAINER_TYPE_SESSION_COMPLETION = sessions.SessionCompletion.CONTAINER_TYPE
   _CONTAINER_TYPE_SESSION_CONFIGURATION = (
       sessions.SessionConfiguration.CONTAINER_TYPE)
@@ -52,6 +54,7 @@ class BaseStore(object):
       _CONTAINER_TYPE_EVENT_DATA_STREAM,
       _CONTAINER_TYPE_EVENT_SOURCE,
       _CONTAINER_TYPE_EVENT_TAG,
+      _CONTAINER_TYPE_PROCESSED_EVENT_SOURCE,
       _CONTAINER_TYPE_SESSION_COMPLETION,
       _CONTAINER_TYPE_SESSION_CONFIGURATION,
       _CONTAINER_TYPE_SESSION_START,
@@ -247,6 +250,21 @@ class BaseStore(object):
         self._CONTAINER_TYPE_EVENT_TAG, event_tag,
         serialized_data=serialized_data)
 
+  def AddProcessedEventSource(
+      self, processed_event_source, serialized_data=None):
+    """Adds a processed event source.
+
+    Args:
+      processed_event_source (ProcessedEventSource): processed event source.
+      serialized_data (Optional[bytes]): serialized form of the processed
+          event source.
+    """
+    self._RaiseIfNotWritable()
+
+    self._AddAttributeContainer(
+        self._CONTAINER_TYPE_PROCESSED_EVENT_SOURCE, processed_event_source,
+        serialized_data=serialized_data)
+
   def AddWarning(self, warning, serialized_data=None):
     """Adds a warning.
 
@@ -264,6 +282,14 @@ class BaseStore(object):
   def Close(self):
     """Closes the store."""
 
+  def Flush(self):
+    """Writes the buffered attribute containers to the store.
+
+    Stores that do not buffer attribute containers do not need to override
+    this method.
+    """
+    return
+
   def GetAnalysisReports(self):
     """Retrieves the analysis reports.
 
@@ -370,6 +396,21 @@ class BaseStore(object):
     return self._GetNumberOfAttributeContainers(
         self._CONTAINER_TYPE_EVENT_SOURCE)
 
+  def GetProcessedEventSources(self):
+    """Retrieves the processed event sources.
+
+    Returns:
+      generator(ProcessedEventSource): processed event source generator.
+    """
+    # Stores created before processed event sources were introduced do not
+    # contain them.
+    if not self._HasAttributeContainers(
+        self._CONTAINER_TYPE_PROCESSED_EVENT_SOURCE):
+      return iter([])
+
+    return self._GetAttributeContainers(
+        self._CONTAINER_TYPE_PROCESSED_EVENT_SOURCE)
+
   def GetSessions(self):
     """Retrieves the sessions.
 
@@ -870,6 +911,20 @@ class StorageReader(object):
       EventTag: event tag.
     """
 
+  @abc.abstractmethod
+  def GetEventTimestampQuantiles(self, number_of_quantiles):
+    """Retrieves the timestamps that divide the events into quantiles.
+
+    Args:
+      number_of_quantiles (int): number of quantiles.
+
+    Returns:
+      list[int]: timestamps in increasing order, which are the timestamp of
+          the first event, the timestamps of the events at the boundaries of
+          the quantiles and the timestamp of the last event, or an empty list
+          if there are no events or if not supported by the storage.
+    """
+
   @abc.abstractmethod
   def GetNumberOfAnalysisReports(self):
     """Retrieves the number analysis reports.
@@ -886,6 +941,14 @@ class StorageReader(object):
       int: number of event sources.
     """
 
+  @abc.abstractmethod
+  def GetProcessedEventSources(self):
+    """Retrieves the processed event sources.
+
+    Yields:
+      ProcessedEventSource: processed event source.
+    """
+
   @abc.abstractmethod
   def GetSessions(self):
     """Retrieves the sessions.
@@ -989,6 +1052,7 @@ class StorageWriter(object):
     self._session = session
     self._storage_profiler = None
     self._storage_type = storage_type
+    self._store_event_sources = True
     self._task = task
     self._written_event_source_index = 0
     self.number_of_analysis_reports = 0
@@ -1052,6 +1116,17 @@ class StorageWriter(object):
       serialized_data (Optional[bytes]): serialized form of the event tag.
     """
 
+  @abc.abstractmethod
+  def AddProcessedEventSource(
+      self, processed_event_source, serialized_data=None):
+    """Adds a processed event source.
+
+    Args:
+      processed_event_source (ProcessedEventSource): a processed event source.
+      serialized_data (Optional[bytes]): serialized form of the processed
+          event source.
+    """
+
   @abc.abstractmethod
   def AddWarning(self, warning, serialized_data=None):
     """Adds an warning.
@@ -1065,6 +1140,14 @@ class StorageWriter(object):
   def Close(self):
     """Closes the storage writer."""
 
+  def Flush(self):
+    """Writes the buffered attribute containers to the storage.
+
+    Storage writers that do not buffer attribute containers do not need to
+    override this method.
+    """
+    return
+
   @abc.abstractmethod
   def CheckTaskReadyForMerge(self, task):
     """Checks if a task is ready for merging into the store.
@@ -1212,6 +1295,18 @@ class StorageWriter(object):
       storage_profiler (StorageProfiler): storage profiler.
     """
 
+  def SetStoreEventSources(self, store_event_sources):
+    """Sets whether event sources should be stored.
+
+    Event sources that are not stored are still counted, but cannot be
+    retrieved from the storage, for example with GetFirstWrittenEventSource
+    and GetNextWrittenEventSource.
+
+    Args:
+      store_event_sources (bool): True if event sources should be stored.
+    """
+    self._store_event_sources = store_event_sources
+
   @abc.abstractmethod
   def WriteSessionCompletion(self, aborted=False):
     """Writes session completion information.
@@ -23,30 +23,39 @@ class RedisMergeReader(interface.StorageMergeReader):
   _CONTAINER_TYPE_ANALYSIS_REPORT = reports.AnalysisReport.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
   _CONTAINER_TYPE_EXTRACTION_ERROR = warnings.ExtractionError.CONTAINER_TYPE
+  _CONTAINER_TYPE_PROCESSED_EVENT_SOURCE = (
+      event_sources.ProcessedEventSource.CONTAINER_TYPE)
   _CONTAINER_TYPE_TASK_COMPLETION = tasks.TaskCompletion.CONTAINER_TYPE
   _CONTAINER_TYPE_TASK_START = tasks.TaskStart.CONTAINER_TYPE
 
   # Some container types reference other container types, such as event
   # referencing event_data. Container types in this tuple must be ordered after
-  # all the container types they reference.
+  # all the container types they reference. Processed event sources are
+  # merged last, so that they are only merged if all the other attribute
+  # containers of the task were merged.
   _CONTAINER_TYPES = (
       _CONTAINER_TYPE_EVENT_SOURCE,
+      _CONTAINER_TYPE_EVENT_DATA_STREAM,
       _CONTAINER_TYPE_EVENT_DATA,
       _CONTAINER_TYPE_EVENT,
       _CONTAINER_TYPE_EVENT_TAG,
       _CONTAINER_TYPE_EXTRACTION_ERROR,
-      _CONTAINER_TYPE_ANALYSIS_REPORT)
+      _CONTAINER_TYPE_ANALYSIS_REPORT,
+      _CONTAINER_TYPE_PROCESSED_EVENT_SOURCE)
 
   _ADD_CONTAINER_TYPE_METHODS = {
       _CONTAINER_TYPE_ANALYSIS_REPORT: '_AddAnalysisReport',
       _CONTAINER_TYPE_EVENT: '_AddEvent',
       _CONTAINER_TYPE_EVENT_DATA: '_AddEventData',
+      _CONTAINER_TYPE_EVENT_DATA_STREAM: '_AddEventDataStream',
       _CONTAINER_TYPE_EVENT_SOURCE: '_AddEventSource',
       _CONTAINER_TYPE_EVENT_TAG: '_AddEventTag',
       _CONTAINER_TYPE_EXTRACTION_ERROR: '_AddError',
+      _CONTAINER_TYPE_PROCESSED_EVENT_SOURCE: '_AddProcessedEventSource',
   }
 
   def __init__(self, storage_writer, task, redis_client=None):
@@ -72,6 +81,7 @@ class RedisMergeReader(interface.StorageMergeReader):
         task_identifier=task.identifier)
     self._store.Open(redis_client=redis_client)
     self._event_data_identifier_mappings = {}
+    self._event_data_stream_identifier_mappings = {}
     self._add_container_type_methods = {}
     self._active_extra_containers = []
 
@@ -112,6 +122,14 @@ class RedisMergeReader(interface.StorageMergeReader):
     """
     self._storage_writer.AddEventSource(event_source)
 
+  def _AddProcessedEventSource(self, processed_event_source):
+    """Adds a processed event source.
+
+    Args:
+      processed_event_source (ProcessedEventSource): processed event source.
+    """
+    self._storage_writer.AddProcessedEventSource(processed_event_source)
+
   def _AddEventTag(self, event_tag):
     """Adds an event tag.
 
@@ -126,14 +144,18 @@ class RedisMergeReader(interface.StorageMergeReader):
     Args:
       event (EventObject): event.
     """
-    if hasattr(event, 'event_data_row_identifier'):
-      event_data_identifier = identifiers.SQLTableIdentifier(
-          self._CONTAINER_TYPE_EVENT_DATA,
-          event.event_data_row_identifier)
-      lookup_key = event_data_identifier.CopyToString()
+    lookup_key = getattr(event, '_event_data_row_identifier', None)
+    if lookup_key is not None:
+      event_data_identifier = self._event_data_identifier_mappings.get(
+          lookup_key, None)
+      if not event_data_identifier:
+        logger.error((
+            'Unable to merge event attribute container since corresponding '
+            'event data: {0:s} was not merged.').format(lookup_key))
+        return
 
-      event_data_identifier = self._event_data_identifier_mappings[lookup_key]
       event.SetEventDataIdentifier(event_data_identifier)
+      delattr(event, '_event_data_row_identifier')
 
     # TODO: add event identifier mappings for event tags.
 
@@ -145,6 +167,15 @@ class RedisMergeReader(interface.StorageMergeReader):
     Args:
       event_data (EventData): event data.
     """
+    lookup_key = getattr(event_data, '_event_data_stream_row_identifier', None)
+    if lookup_key is not None:
+      event_data_stream_identifier = (
+          self._event_data_stream_identifier_mappings.get(lookup_key, None))
+      if event_data_stream_identifier:
+        event_data.SetEventDataStreamIdentifier(event_data_stream_identifier)
+
+      delattr(event_data, '_event_data_stream_row_identifier')
+
     identifier = event_data.GetIdentifier()
     lookup_key = identifier.CopyToString()
 
@@ -153,6 +184,21 @@ class RedisMergeReader(interface.StorageMergeReader):
     post_write_identifier = event_data.GetIdentifier()
     self._event_data_identifier_mappings[lookup_key] = post_write_identifier
 
+  def _AddEventDataStream(self, event_data_stream):
+    """Adds an event data stream.
+
+    Args:
+      event_data_stream (EventDataStream): event data stream.
+    """
+    identifier = event_data_stream.GetIdentifier()
+    lookup_key = identifier.CopyToString()
+
+    self._storage_writer.AddEventDataStream(event_data_stream)
+
+    post_write_identifier = event_data_stream.GetIdentifier()
+    self._event_data_stream_identifier_mappings[lookup_key] = (
+        post_write_identifier)
+
   def _PrepareForNextContainerType(self):
     """Prepares for the next container type.
 
@@ -228,9 +274,11 @@ class RedisMergeReader(interface.StorageMergeReader):
     self._active_cursor = cursor
     containers = self._active_extra_containers + containers
 
-    if maximum_number_of_items:
-      self._active_extra_containers = containers[maximum_number_of_items:]
+    if not maximum_number_of_items:
+      self._active_extra_containers = []
+      return containers
 
+    self._active_extra_containers = containers[maximum_number_of_items:]
     return containers[:maximum_number_of_items]
 
   def MergeAttributeContainers(
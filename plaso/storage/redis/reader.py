@@ -119,6 +119,18 @@ class RedisStorageReader(interface.StorageReader):
     """
     return self._store.GetEventTags()
 
+  def GetEventTimestampQuantiles(self, number_of_quantiles):
+    """Retrieves the timestamps that divide the events into quantiles.
+
+    Args:
+      number_of_quantiles (int): number of quantiles.
+
+    Returns:
+      list[int]: an empty list, since the Redis store does not support
+          retrieving events in a specific time range.
+    """
+    return []
+
   def GetNumberOfAnalysisReports(self):
     """Retrieves the number analysis reports.
 
@@ -135,6 +147,14 @@ class RedisStorageReader(interface.StorageReader):
     """
     return self._store.GetNumberOfEventSources()
 
+  def GetProcessedEventSources(self):
+    """Retrieves the processed event sources.
+
+    Returns:
+      generator(ProcessedEventSource): processed event source generator.
+    """
+    return self._store.GetProcessedEventSources()
+
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
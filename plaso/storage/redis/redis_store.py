@@ -6,6 +6,7 @@ Only supports task storage at the moment.
 from __future__ import unicode_literals
 
 import uuid
+import zlib
 
 import redis
 
@@ -21,6 +22,15 @@ class RedisStore(interface.BaseStore):
   Attribute containers are stored as Redis Hashes.
   All keys are prefixed with the session identifier to avoid collisions.
   Event identifiers are also stored in an index to enable sorting.
+
+  Writes are buffered in a Redis pipeline, that is sent to the Redis server
+  when it contains a maximum number of commands or amount of data, or before
+  the store is read from, finalized or closed.
+
+  Attributes:
+    compression_format (str): compression format of the serialized attribute
+        containers.
+    serialization_format (str): serialization format.
   """
 
   _FORMAT_VERSION = '20181013'
@@ -29,12 +39,22 @@ class RedisStore(interface.BaseStore):
   _FINALIZED_BYTES = b'finalized'
   _MERGING_KEY_NAME = 'merging'
   _MERGING_BYTES = b'merging'
+
+  # Maximum number of commands and amount of data in bytes buffered in
+  # the pipeline before it is sent to the Redis server.
+  _MAXIMUM_NUMBER_OF_BUFFERED_COMMANDS = 1000
+  _MAXIMUM_BUFFER_SIZE = 16 * 1024 * 1024
+
+  # Maximum number of attribute containers retrieved per Redis command.
+  _MAXIMUM_NUMBER_OF_ITEMS_PER_READ = 1000
+
   # DEFAULT_REDIS_URL is public so that it appears in generated documentation.
   DEFAULT_REDIS_URL = 'redis://127.0.0.1/0'
 
   def __init__(
       self, storage_type=definitions.STORAGE_TYPE_TASK,
-      session_identifier=None, task_identifier=None):
+      session_identifier=None, task_identifier=None,
+      compression_format=definitions.COMPRESSION_FORMAT_NONE):
     """Initializes a Redis store.
 
     Args:
@@ -44,13 +64,21 @@ class RedisStore(interface.BaseStore):
       task_identifier (Optional[str]): unique identifier of the task the store
           will store containers for. If not specified, an identifier will be
           generated.
+      compression_format (Optional[str]): compression format of the serialized
+          attribute containers. It is only used when the store is created,
+          an existing store uses the compression format in its metadata.
 
     Raises:
-      ValueError: if the storage type is not supported.
+      ValueError: if the storage type or compression format is not supported.
     """
     if storage_type != definitions.STORAGE_TYPE_TASK:
       raise ValueError('Unsupported storage type: {0:s}.'.format(
           storage_type))
+
+    if compression_format not in definitions.COMPRESSION_FORMATS:
+      raise ValueError('Unsupported compression format: {0:s}.'.format(
+          compression_format))
+
     super(RedisStore, self).__init__()
     if not session_identifier:
       session_identifier = str(uuid.uuid4())
@@ -58,7 +86,10 @@ class RedisStore(interface.BaseStore):
     if not task_identifier:
       task_identifier = str(uuid.uuid4())
     self._task_identifier = task_identifier
+    self._buffer_size = 0
+    self._pipeline = None
     self._redis_client = None
+    self.compression_format = compression_format
     self.serialization_format = definitions.SERIALIZER_FORMAT_JSON
 
   @classmethod
@@ -97,10 +128,54 @@ class RedisStore(interface.BaseStore):
 
     if not serialized_data:
       serialized_data = self._SerializeAttributeContainer(container)
+      serialized_data = serialized_data.encode('utf-8')
+
+    if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+      serialized_data = zlib.compress(serialized_data)
 
     container_key = self._GenerateRedisKey(container_type)
     string_identifier = identifier.CopyToString()
-    self._redis_client.hset(container_key, string_identifier, serialized_data)
+    self._pipeline.hset(container_key, string_identifier, serialized_data)
+
+    self._buffer_size += len(serialized_data)
+    self._FlushPipelineIfFull()
+
+  def _DecompressSerializedData(self, serialized_data):
+    """Decompresses serialized attribute container data.
+
+    Args:
+      serialized_data (bytes): serialized attribute container data, that is
+          compressed according to the compression format of the store.
+
+    Returns:
+      bytes: serialized attribute container data.
+
+    Raises:
+      IOError: if the serialized data cannot be decompressed.
+      OSError: if the serialized data cannot be decompressed.
+    """
+    if (serialized_data and
+        self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB):
+      try:
+        serialized_data = zlib.decompress(serialized_data)
+      except zlib.error as exception:
+        raise IOError('Unable to decompress serialized data: {0!s}'.format(
+            exception))
+
+    return serialized_data
+
+  def _FlushPipeline(self):
+    """Sends the commands buffered in the pipeline to the Redis server."""
+    if self._pipeline is not None and len(self._pipeline) > 0:
+      self._pipeline.execute()
+
+    self._buffer_size = 0
+
+  def _FlushPipelineIfFull(self):
+    """Sends the buffered commands to the Redis server if the buffer is full."""
+    if (len(self._pipeline) >= self._MAXIMUM_NUMBER_OF_BUFFERED_COMMANDS or
+        self._buffer_size >= self._MAXIMUM_BUFFER_SIZE):
+      self._FlushPipeline()
 
   def _GenerateRedisKey(self, key_suffix):
     """Generates a Redis key inside the appropriate namespace.
@@ -124,9 +199,12 @@ class RedisStore(interface.BaseStore):
     Yields:
       AttributeContainer: attribute container.
     """
+    self._FlushPipeline()
+
     container_key = self._GenerateRedisKey(container_type)
     for identifier, serialized_data in self._redis_client.hscan_iter(
-        container_key):
+        container_key, count=self._MAXIMUM_NUMBER_OF_ITEMS_PER_READ):
+      serialized_data = self._DecompressSerializedData(serialized_data)
       attribute_container = self._DeserializeAttributeContainer(
           container_type, serialized_data)
 
@@ -145,6 +223,8 @@ class RedisStore(interface.BaseStore):
     Returns:
       AttributeContainer: attribute container or None if not available.
     """
+    self._FlushPipeline()
+
     container_key = self._GenerateRedisKey(container_type)
     string_identifier = identifier.CopyToString()
 
@@ -154,6 +234,8 @@ class RedisStore(interface.BaseStore):
     if not serialized_data:
       return None
 
+    serialized_data = self._DecompressSerializedData(serialized_data)
+
     attribute_container = self._DeserializeAttributeContainer(
         container_type, serialized_data)
 
@@ -169,6 +251,8 @@ class RedisStore(interface.BaseStore):
     Returns:
       int: the number of containers in the store of the specified type.
     """
+    self._FlushPipeline()
+
     container_key = self._GenerateRedisKey(container_type)
     return self._redis_client.hlen(container_key)
 
@@ -191,6 +275,8 @@ class RedisStore(interface.BaseStore):
       bool: True if the store contains the specified type of attribute
           containers.
     """
+    self._FlushPipeline()
+
     container_key = self._GenerateRedisKey(container_type)
     number_of_containers = self._redis_client.hlen(container_key)
     return  number_of_containers > 0
@@ -215,16 +301,87 @@ class RedisStore(interface.BaseStore):
     if not self._redis_client:
       raise IOError('Unable to write, client not connected.')
 
+  def _ReadStorageMetadata(self):
+    """Reads the storage metadata.
+
+    Raises:
+      IOError: if the compression format is not supported.
+      OSError: if the compression format is not supported.
+    """
+    metadata_key = self._GenerateRedisKey('metadata')
+    compression_format = self._redis_client.hget(
+        metadata_key, 'compression_format')
+
+    # Stores without a compression format in their metadata were written
+    # before compression was supported.
+    if not compression_format:
+      compression_format = definitions.COMPRESSION_FORMAT_NONE
+    else:
+      compression_format = compression_format.decode('utf-8')
+
+    if compression_format not in definitions.COMPRESSION_FORMATS:
+      raise IOError('Unsupported compression format: {0:s}'.format(
+          compression_format))
+
+    self.compression_format = compression_format
+
+  def _UpdateEventDataIdentifierBeforeSerialize(self, event):
+    """Sets the event data identifier of an event before serialization.
+
+    Args:
+      event (EventObject): event.
+
+    Raises:
+      IOError: if the event data identifier type is not supported.
+      OSError: if the event data identifier type is not supported.
+    """
+    event_data_identifier = event.GetEventDataIdentifier()
+    if event_data_identifier is None:
+      return
+
+    if not isinstance(event_data_identifier, identifiers.RedisKeyIdentifier):
+      raise IOError('Unsupported event data identifier type: {0!s}'.format(
+          type(event_data_identifier)))
+
+    setattr(event, '_event_data_row_identifier',
+            event_data_identifier.CopyToString())
+
+  def _UpdateEventDataStreamIdentifierBeforeSerialize(self, event_data):
+    """Sets the event data stream identifier before serialization.
+
+    Args:
+      event_data (EventData): event data.
+
+    Raises:
+      IOError: if the event data stream identifier type is not supported.
+      OSError: if the event data stream identifier type is not supported.
+    """
+    event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+    if event_data_stream_identifier is None:
+      return
+
+    if not isinstance(
+        event_data_stream_identifier, identifiers.RedisKeyIdentifier):
+      raise IOError(
+          'Unsupported event data stream identifier type: {0!s}'.format(
+              type(event_data_stream_identifier)))
+
+    setattr(event_data, '_event_data_stream_row_identifier',
+            event_data_stream_identifier.CopyToString())
+
   def _WriteStorageMetadata(self):
     """Writes the storage metadata."""
     metadata = {
+        'compression_format': self.compression_format,
         'format_version': self._FORMAT_VERSION,
         'storage_type': definitions.STORAGE_TYPE_TASK,
         'serialization_format': self.serialization_format}
     metadata_key = self._GenerateRedisKey('metadata')
 
     for key, value in metadata.items():
-      self._redis_client.hset(metadata_key, key, value)
+      self._pipeline.hset(metadata_key, key, value)
+
+    self._FlushPipeline()
 
   def _WriteAttributeContainer(self, attribute_container):
     """Writes an attribute container to the store.
@@ -242,15 +399,36 @@ class RedisStore(interface.BaseStore):
       event (EventObject): event.
       serialized_data (Optional[bytes]): serialized form of the event.
     """
-    super(RedisStore, self).AddEvent(event, serialized_data=serialized_data)
+    # The serialized data is not used, as this method modifies the attribute
+    # container.
+    self._UpdateEventDataIdentifierBeforeSerialize(event)
+    super(RedisStore, self).AddEvent(event)
+
     event_index_name = self._GenerateRedisKey(self._EVENT_INDEX_NAME)
     identifier = event.GetIdentifier()
     string_identifier = identifier.CopyToString()
-    self._redis_client.zincrby(
+    self._pipeline.zincrby(
         event_index_name, event.timestamp, string_identifier)
 
+    self._FlushPipelineIfFull()
+
+  def AddEventData(self, event_data, serialized_data=None):
+    """Adds event data.
+
+    Args:
+      event_data (EventData): event data.
+      serialized_data (Optional[bytes]): serialized form of the event data.
+    """
+    # The serialized data is not used, as this method modifies the attribute
+    # container.
+    self._UpdateEventDataStreamIdentifierBeforeSerialize(event_data)
+    super(RedisStore, self).AddEventData(event_data)
+
   def Close(self):
     """Closes the store."""
+    self._FlushPipeline()
+
+    self._pipeline = None
     self._redis_client = None
 
   def RemoveAttributeContainer(self, container_type, identifier):
@@ -265,10 +443,12 @@ class RedisStore(interface.BaseStore):
     container_key = self._GenerateRedisKey(container_type)
     string_identifier = identifier.CopyToString()
 
-    self._redis_client.hdel(container_key, string_identifier)
+    self._pipeline.hdel(container_key, string_identifier)
     if container_type == self._CONTAINER_TYPE_EVENT:
       event_index_name = self._GenerateRedisKey(self._EVENT_INDEX_NAME)
-      self._redis_client.zrem(event_index_name, string_identifier)
+      self._pipeline.zrem(event_index_name, string_identifier)
+
+    self._FlushPipeline()
 
   def RemoveAttributeContainers(self, container_type, container_identifiers):
     """Removes multiple attribute containers from the store.
@@ -287,10 +467,12 @@ class RedisStore(interface.BaseStore):
     string_identifiers = [
         identifier.CopyToString() for identifier in container_identifiers]
 
-    self._redis_client.hdel(container_key, *string_identifiers)
+    self._pipeline.hdel(container_key, *string_identifiers)
     if container_type == self._CONTAINER_TYPE_EVENT:
       event_index_name = self._GenerateRedisKey(self._EVENT_INDEX_NAME)
-      self._redis_client.zrem(event_index_name, *string_identifiers)
+      self._pipeline.zrem(event_index_name, *string_identifiers)
+
+    self._FlushPipeline()
 
   def IsFinalized(self):
     """Checks if a store has been finalized.
@@ -313,10 +495,20 @@ class RedisStore(interface.BaseStore):
     """
     self._RaiseIfNotWritable()
 
+    # The buffered attribute containers must be written before the store
+    # is marked as finalized, since it can be merged from then on.
+    self._FlushPipeline()
+
     finalized_key = self._GetFinalizationKey()
     self._redis_client.hset(
         finalized_key, self._task_identifier, self._FINALIZED_BYTES)
 
+  def Flush(self):
+    """Sends the commands buffered in the pipeline to the Redis server."""
+    self._RaiseIfNotWritable()
+
+    self._FlushPipeline()
+
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
@@ -330,16 +522,41 @@ class RedisStore(interface.BaseStore):
     Raises:
       RuntimeError: if a time_range argument is specified.
     """
-    event_index_name = self._GenerateRedisKey(self._EVENT_INDEX_NAME)
     if time_range:
       raise RuntimeError('Not supported')
 
-    sorted_event_identifiers = self._redis_client.zscan_iter(event_index_name)
-    for event_identifier, _ in sorted_event_identifiers:
-      identifier_string = event_identifier.decode('utf-8')
-      event_identifier = identifiers.RedisKeyIdentifier(identifier_string)
-      yield self._GetAttributeContainerByIdentifier(
-          self._CONTAINER_TYPE_EVENT, event_identifier)
+    self._FlushPipeline()
+
+    container_key = self._GenerateRedisKey(self._CONTAINER_TYPE_EVENT)
+    event_index_name = self._GenerateRedisKey(self._EVENT_INDEX_NAME)
+
+    # The event identifiers are read in batches in order of the timestamps in
+    # the index, where the events of each batch are read with a single HMGET.
+    start_index = 0
+    while True:
+      end_index = start_index + self._MAXIMUM_NUMBER_OF_ITEMS_PER_READ - 1
+      string_identifiers = self._redis_client.zrange(
+          event_index_name, start_index, end_index)
+      if not string_identifiers:
+        break
+
+      serialized_events = self._redis_client.hmget(
+          container_key, string_identifiers)
+
+      for string_identifier, serialized_data in zip(
+          string_identifiers, serialized_events):
+        if not serialized_data:
+          continue
+
+        serialized_data = self._DecompressSerializedData(serialized_data)
+        event = self._DeserializeAttributeContainer(
+            self._CONTAINER_TYPE_EVENT, serialized_data)
+
+        identifier_string = string_identifier.decode('utf-8')
+        event.SetIdentifier(identifiers.RedisKeyIdentifier(identifier_string))
+        yield event
+
+      start_index = end_index + 1
 
   def GetSerializedAttributeContainers(
       self, container_type, cursor, maximum_number_of_items):
@@ -354,15 +571,24 @@ class RedisStore(interface.BaseStore):
     Returns:
       tuple: containing:
         int: Redis cursor.
-        list[bytes]: serialized attribute containers.
+        dict[bytes, bytes]: serialized attribute containers per identifier.
     """
+    self._FlushPipeline()
+
     name = self._GenerateRedisKey(container_type)
-    # Redis treats None as meaning "no limit", not 0.
+    # The count is only a hint of the number of items to scan. Without a count
+    # Redis scans about 10 items per command.
     if maximum_number_of_items == 0:
-      maximum_number_of_items = None
+      maximum_number_of_items = self._MAXIMUM_NUMBER_OF_ITEMS_PER_READ
 
     cursor, items = self._redis_client.hscan(
         name, cursor=cursor, count=maximum_number_of_items)
+
+    if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
+      items = {
+          identifier: self._DecompressSerializedData(serialized_data)
+          for identifier, serialized_data in items.items()}
+
     return cursor, items
 
   # pylint: disable=arguments-differ
@@ -391,15 +617,24 @@ class RedisStore(interface.BaseStore):
     else:
       self._redis_client = redis.from_url(url=url, socket_timeout=60)
 
+    # Commands are not executed atomically, the pipeline is only used to
+    # reduce the number of round trips to the Redis server.
+    self._pipeline = self._redis_client.pipeline(transaction=False)
+    self._buffer_size = 0
+
     client_name = self._GenerateRedisKey('')
     self._SetClientName(self._redis_client, client_name)
 
     metadata_key = self._GenerateRedisKey('metadata')
-    if not self._redis_client.exists(metadata_key):
+    if self._redis_client.exists(metadata_key):
+      self._ReadStorageMetadata()
+    else:
       self._WriteStorageMetadata()
 
   def Remove(self):
     """Removes the contents of the store from Redis."""
+    self._FlushPipeline()
+
     merging_key = '{0:s}-{1:s}'.format(
         self._session_identifier, self._MERGING_KEY_NAME)
     self._redis_client.hdel(merging_key, self._task_identifier)
@@ -93,6 +93,18 @@ class RedisStorageWriter(interface.StorageWriter):
     self._store.Finalize()
     self._store = None
 
+  def Flush(self):
+    """Writes the buffered attribute containers to the store.
+
+    Raises:
+      IOError: if the storage writer is closed.
+      OSError: if the storage writer is closed.
+    """
+    if not self._store:
+      raise IOError('Storage writer is not open.')
+
+    self._store.Flush()
+
   def PrepareMergeTaskStorage(self, task):
     """Prepares a task storage for merging.
 
@@ -136,7 +148,8 @@ class RedisStorageWriter(interface.StorageWriter):
       serialized_data (Optional[bytes]): serialized form of the event data
           stream.
     """
-    self._store.AddEventData(event_data_stream, serialized_data=serialized_data)
+    self._store.AddEventDataStream(
+        event_data_stream, serialized_data=serialized_data)
 
   def AddEventSource(self, event_source, serialized_data=None):
     """Adds an event source.
@@ -156,6 +169,18 @@ class RedisStorageWriter(interface.StorageWriter):
     """
     self._store.AddEventTag(event_tag, serialized_data=serialized_data)
 
+  def AddProcessedEventSource(
+      self, processed_event_source, serialized_data=None):
+    """Adds a processed event source.
+
+    Args:
+      processed_event_source (ProcessedEventSource): a processed event source.
+      serialized_data (Optional[bytes]): serialized form of the processed
+          event source.
+    """
+    self._store.AddProcessedEventSource(
+        processed_event_source, serialized_data=serialized_data)
+
   def AddWarning(self, warning, serialized_data=None):
     """Adds a warning.
 
@@ -32,12 +32,16 @@ class SQLiteStorageMergeReader(interface.StorageMergeReader):
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
   _CONTAINER_TYPE_EXTRACTION_WARNING = warnings.ExtractionWarning.CONTAINER_TYPE
+  _CONTAINER_TYPE_PROCESSED_EVENT_SOURCE = (
+      event_sources.ProcessedEventSource.CONTAINER_TYPE)
   _CONTAINER_TYPE_TASK_COMPLETION = tasks.TaskCompletion.CONTAINER_TYPE
   _CONTAINER_TYPE_TASK_START = tasks.TaskStart.CONTAINER_TYPE
 
   # Some container types reference other container types, such as event
   # referencing event_data. Container types in this tuple must be ordered after
-  # all the container types they reference.
+  # all the container types they reference. Processed event sources are
+  # merged last, so that they are only merged if all the other attribute
+  # containers of the task were merged.
   _CONTAINER_TYPES = (
       _CONTAINER_TYPE_EVENT_SOURCE,
       _CONTAINER_TYPE_EVENT_DATA_STREAM,
@@ -45,7 +49,8 @@ class SQLiteStorageMergeReader(interface.StorageMergeReader):
       _CONTAINER_TYPE_EVENT,
       _CONTAINER_TYPE_EVENT_TAG,
       _CONTAINER_TYPE_EXTRACTION_WARNING,
-      _CONTAINER_TYPE_ANALYSIS_REPORT)
+      _CONTAINER_TYPE_ANALYSIS_REPORT,
+      _CONTAINER_TYPE_PROCESSED_EVENT_SOURCE)
 
   _ADD_CONTAINER_TYPE_METHODS = {
       _CONTAINER_TYPE_ANALYSIS_REPORT: '_AddAnalysisReport',
@@ -55,6 +60,7 @@ class SQLiteStorageMergeReader(interface.StorageMergeReader):
       _CONTAINER_TYPE_EVENT_SOURCE: '_AddEventSource',
       _CONTAINER_TYPE_EVENT_TAG: '_AddEventTag',
       _CONTAINER_TYPE_EXTRACTION_WARNING: '_AddWarning',
+      _CONTAINER_TYPE_PROCESSED_EVENT_SOURCE: '_AddProcessedEventSource',
   }
 
   _TABLE_NAMES_QUERY = (
@@ -218,6 +224,18 @@ class SQLiteStorageMergeReader(interface.StorageMergeReader):
     self._storage_writer.AddEventSource(
         event_source, serialized_data=serialized_data)
 
+  def _AddProcessedEventSource(
+      self, processed_event_source, serialized_data=None):
+    """Adds a processed event source.
+
+    Args:
+      processed_event_source (ProcessedEventSource): processed event source.
+      serialized_data (Optional[bytes]): serialized form of the processed
+          event source.
+    """
+    self._storage_writer.AddProcessedEventSource(
+        processed_event_source, serialized_data=serialized_data)
+
   def _AddEventTag(self, event_tag, serialized_data=None):
     """Adds an event tag.
 
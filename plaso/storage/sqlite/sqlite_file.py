@@ -63,6 +63,9 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
   # a flush to disk (64 MiB).
   _MAXIMUM_BUFFER_SIZE = 64 * 1024 * 1024
 
+  # The maximum number of rows that are fetched from a query at once.
+  _MAXIMUM_NUMBER_OF_ROWS_PER_FETCH = 65536
+
   def __init__(
       self, maximum_buffer_size=0,
       storage_type=definitions.STORAGE_TYPE_SESSION):
@@ -708,6 +711,24 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
     else:
       container_list.Empty()
 
+  def _WriteSerializedAttributeContainerLists(self):
+    """Writes the serialized attribute container lists."""
+    self._WriteSerializedAttributeContainerList(
+        self._CONTAINER_TYPE_ANALYSIS_REPORT)
+    self._WriteSerializedAttributeContainerList(
+        self._CONTAINER_TYPE_EVENT_SOURCE)
+    self._WriteSerializedAttributeContainerList(
+        self._CONTAINER_TYPE_EVENT_DATA_STREAM)
+    self._WriteSerializedAttributeContainerList(
+        self._CONTAINER_TYPE_EVENT_DATA)
+    self._WriteSerializedAttributeContainerList(self._CONTAINER_TYPE_EVENT)
+    self._WriteSerializedAttributeContainerList(
+        self._CONTAINER_TYPE_EVENT_TAG)
+    self._WriteSerializedAttributeContainerList(
+        self._CONTAINER_TYPE_EXTRACTION_WARNING)
+    self._WriteSerializedAttributeContainerList(
+        self._CONTAINER_TYPE_PROCESSED_EVENT_SOURCE)
+
   def _WriteStorageMetadata(self):
     """Writes the storage metadata."""
     self._cursor.execute(self._CREATE_METADATA_TABLE_QUERY)
@@ -830,19 +851,7 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
       raise IOError('Storage file already closed.')
 
     if not self._read_only:
-      self._WriteSerializedAttributeContainerList(
-          self._CONTAINER_TYPE_ANALYSIS_REPORT)
-      self._WriteSerializedAttributeContainerList(
-          self._CONTAINER_TYPE_EVENT_SOURCE)
-      self._WriteSerializedAttributeContainerList(
-          self._CONTAINER_TYPE_EVENT_DATA_STREAM)
-      self._WriteSerializedAttributeContainerList(
-          self._CONTAINER_TYPE_EVENT_DATA)
-      self._WriteSerializedAttributeContainerList(self._CONTAINER_TYPE_EVENT)
-      self._WriteSerializedAttributeContainerList(
-          self._CONTAINER_TYPE_EVENT_TAG)
-      self._WriteSerializedAttributeContainerList(
-          self._CONTAINER_TYPE_EXTRACTION_WARNING)
+      self._WriteSerializedAttributeContainerLists()
 
     if self._connection:
       # We need to run commit or not all data is stored in the database.
@@ -854,6 +863,19 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
 
     self._is_open = False
 
+  def Flush(self):
+    """Writes the buffered attribute containers to the storage file.
+
+    Raises:
+      IOError: when the storage file is closed or read-only.
+      OSError: when the storage file is closed or read-only.
+    """
+    self._RaiseIfNotWritable()
+
+    self._WriteSerializedAttributeContainerLists()
+
+    self._connection.commit()
+
   def GetWarnings(self):
     """Retrieves the warnings.
 
@@ -989,6 +1011,63 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
         self._CONTAINER_TYPE_EVENT_SOURCE)
     return number_of_event_sources
 
+  def GetEventTimestampQuantiles(self, number_of_quantiles):
+    """Retrieves the timestamps that divide the events into quantiles.
+
+    Args:
+      number_of_quantiles (int): number of quantiles.
+
+    Returns:
+      list[int]: timestamps in increasing order, which are the timestamp of
+          the first event, the timestamps of the events at the boundaries of
+          the quantiles and the timestamp of the last event, or an empty list
+          if there are no events.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    number_of_events = self._GetNumberOfAttributeContainers(
+        self._CONTAINER_TYPE_EVENT)
+    if not number_of_events or number_of_quantiles < 1:
+      return []
+
+    event_indexes = {
+        (number_of_events * quantile) // number_of_quantiles
+        for quantile in range(number_of_quantiles)}
+
+    # Only the timestamps are sorted, which is considerably cheaper than
+    # reading the events.
+    query = 'SELECT _timestamp FROM {0:s} ORDER BY _timestamp'.format(
+        self._CONTAINER_TYPE_EVENT)
+
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query)
+    except sqlite3.OperationalError as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    event_index = 0
+    timestamp = None
+    timestamps = []
+
+    rows = cursor.fetchmany(self._MAXIMUM_NUMBER_OF_ROWS_PER_FETCH)
+    while rows:
+      for row in rows:
+        timestamp = row[0]
+        if event_index in event_indexes:
+          timestamps.append(timestamp)
+        event_index += 1
+
+      rows = cursor.fetchmany(self._MAXIMUM_NUMBER_OF_ROWS_PER_FETCH)
+
+    if timestamp is not None:
+      timestamps.append(timestamp)
+
+    return timestamps
+
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
@@ -1003,11 +1082,12 @@ class SQLiteStorageFile(file_interface.BaseStorageFile):
     if time_range:
       filter_expression = []
 
-      if time_range.start_timestamp:
+      # Note that a timestamp of 0 is a valid start or end of a time range.
+      if time_range.start_timestamp is not None:
         filter_expression.append(
             '_timestamp >= {0:d}'.format(time_range.start_timestamp))
 
-      if time_range.end_timestamp:
+      if time_range.end_timestamp is not None:
         filter_expression.append(
             '_timestamp <= {0:d}'.format(time_range.end_timestamp))
 
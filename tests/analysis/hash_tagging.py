@@ -4,6 +4,11 @@
 
 from __future__ import unicode_literals
 
+import http.server
+import json
+import os
+import queue
+import threading
 import unittest
 
 from dfvfs.path import fake_path_spec
@@ -11,12 +16,15 @@ from dfvfs.path import fake_path_spec
 from plaso.analysis import hash_tagging
 from plaso.lib import definitions
 
+from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
 class TestHashAnalyzer(hash_tagging.HashAnalyzer):
   """Hash analyzer for testing."""
 
+  EMPTY_QUEUE_WAIT_TIME = 0.01
+
   SUPPORTED_HASHES = ['md5', 'sha256']
 
   _TEST_HASH_SET = frozenset([
@@ -40,6 +48,95 @@ class TestHashAnalyzer(hash_tagging.HashAnalyzer):
     return hash_analyses
 
 
+class TestHTTPHashAnalyzer(hash_tagging.HTTPHashAnalyzer):
+  """HTTP hash analyzer for testing."""
+
+  SUPPORTED_HASHES = ['sha256']
+
+  def __init__(self, hash_queue, hash_analysis_queue, **kwargs):
+    """Initializes a HTTP hash analyzer for testing.
+
+    Args:
+      hash_queue (queue.Queue): contains hashes to be analyzed.
+      hash_analysis_queue (queue.Queue): queue that the analyzer will append
+          HashAnalysis objects to.
+    """
+    super(TestHTTPHashAnalyzer, self).__init__(
+        hash_queue, hash_analysis_queue, **kwargs)
+    self.url = None
+
+  def Analyze(self, hashes):
+    """Analyzes a list of hashes.
+
+    Args:
+      hashes (list[str]): list of hashes to look up.
+
+    Returns:
+      list[HashAnalysis]: list of results of analyzing the hashes.
+    """
+    json_response = self.MakeRequestAndDecodeJSON(
+        self.url, 'GET', params={'resource': ','.join(hashes)})
+    return [
+        hash_tagging.HashAnalysis(digest, json_response.get(digest, None))
+        for digest in hashes]
+
+
+class _FakeHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
+  """Request handler of a rate limited fake HTTP server for testing."""
+
+  protocol_version = 'HTTP/1.1'
+
+  # pylint: disable=invalid-name
+  def do_GET(self):
+    """Handles a GET request."""
+    self.server.number_of_requests += 1
+
+    if self.server.number_of_requests == 1:
+      self.send_response(429)
+      self.send_header('Retry-After', '0')
+      self.send_header('Content-Length', '0')
+      self.end_headers()
+      return
+
+    response_data = json.dumps({self.path.rpartition('=')[2]: True})
+    response_data = response_data.encode('utf-8')
+
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', '{0:d}'.format(len(response_data)))
+    self.end_headers()
+    self.wfile.write(response_data)
+
+  # pylint: disable=redefined-builtin
+  def log_message(self, format, *args):
+    """Disables logging of requests."""
+    return
+
+
+class _FakeHTTPServer(http.server.ThreadingHTTPServer):
+  """Rate limited fake HTTP server for testing.
+
+  Attributes:
+    number_of_connections (int): number of connections made to the server.
+    number_of_requests (int): number of requests made to the server.
+  """
+
+  daemon_threads = True
+
+  def __init__(self):
+    """Initializes a fake HTTP server on a free port of localhost."""
+    http.server.ThreadingHTTPServer.__init__(
+        self, ('127.0.0.1', 0), _FakeHTTPRequestHandler)
+    self.number_of_connections = 0
+    self.number_of_requests = 0
+
+  def process_request(self, request, client_address):
+    """Processes a connection made to the server."""
+    self.number_of_connections += 1
+    http.server.ThreadingHTTPServer.process_request(
+        self, request, client_address)
+
+
 class TestHashTaggingAnalysisPlugin(hash_tagging.HashTaggingAnalysisPlugin):
   """Hash tagging analysis plugin for testing."""
 
@@ -67,6 +164,118 @@ class TestHashTaggingAnalysisPlugin(hash_tagging.HashTaggingAnalysisPlugin):
     return []
 
 
+class HashAnalysisCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the hash analysis cache."""
+
+  def testGetAndSetHashInformation(self):
+    """Tests the GetHashInformation and SetHashInformation functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'cache.db')
+
+      cache = hash_tagging.HashAnalysisCache(path, 'test')
+      cache.SetHashInformation('md5', 'a' * 32, {'response_code': 1})
+      cache.Close()
+
+      cache = hash_tagging.HashAnalysisCache(path, 'test')
+      result = cache.GetHashInformation('md5', 'a' * 32)
+      self.assertEqual(result, (True, {'response_code': 1}))
+
+      result = cache.GetHashInformation('sha1', 'a' * 32)
+      self.assertEqual(result, (False, None))
+      cache.Close()
+
+      cache = hash_tagging.HashAnalysisCache(path, 'other')
+      result = cache.GetHashInformation('md5', 'a' * 32)
+      self.assertEqual(result, (False, None))
+      cache.Close()
+
+
+class HashAnalyzerTest(shared_test_lib.BaseTestCase):
+  """Tests for the hash analyzer interface."""
+
+  # pylint: disable=protected-access
+
+  def testGetHashes(self):
+    """Tests the _GetHashes function."""
+    hash_queue = queue.Queue()
+    analyzer = TestHashAnalyzer(hash_queue, queue.Queue())
+
+    for digest in ('a', 'b', 'c'):
+      hash_queue.put(digest)
+
+    hashes = analyzer._GetHashes(hash_queue, 2)
+    self.assertEqual(hashes, ['a', 'b'])
+
+    hashes = analyzer._GetHashes(hash_queue, 2)
+    self.assertEqual(hashes, ['c'])
+
+    hashes = analyzer._GetHashes(hash_queue, 2)
+    self.assertEqual(hashes, [])
+
+  def testRun(self):
+    """Tests the run function with concurrent batches."""
+    hash_queue = queue.Queue()
+    hash_analysis_queue = queue.Queue()
+    analyzer = TestHashAnalyzer(
+        hash_queue, hash_analysis_queue, hashes_per_batch=2,
+        number_of_concurrent_batches=2)
+
+    digests = ['{0:064x}'.format(value) for value in range(9)]
+    for digest in digests:
+      hash_queue.put(digest)
+
+    analyzer.start()
+    hash_queue.join()
+    analyzer.SignalAbort()
+    analyzer.join()
+
+    subject_hashes = []
+    while not hash_analysis_queue.empty():
+      hash_analysis = hash_analysis_queue.get()
+      subject_hashes.append(hash_analysis.subject_hash)
+
+    self.assertEqual(sorted(subject_hashes), digests)
+    self.assertEqual(analyzer.analyses_performed, 5)
+
+
+class HTTPHashAnalyzerTest(shared_test_lib.BaseTestCase):
+  """Tests for the HTTP hash analyzer interface."""
+
+  # pylint: disable=protected-access
+
+  def testMakeRequestAndDecodeJSON(self):
+    """Tests the MakeRequestAndDecodeJSON function."""
+    server = _FakeHTTPServer()
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.start()
+
+    try:
+      analyzer = TestHTTPHashAnalyzer(queue.Queue(), queue.Queue())
+      analyzer.url = 'http://{0:s}:{1:d}/report'.format(*server.server_address)
+
+      # The first request is rate limited and retried.
+      hash_analyses = analyzer.Analyze(['a'])
+      self.assertEqual(len(hash_analyses), 1)
+      self.assertTrue(hash_analyses[0].hash_information)
+
+      hash_analyses = analyzer.Analyze(['b'])
+      self.assertEqual(len(hash_analyses), 1)
+      self.assertTrue(hash_analyses[0].hash_information)
+
+      analyzer._CloseConnections()
+
+      self.assertEqual(server.number_of_requests, 3)
+      self.assertEqual(server.number_of_connections, 1)
+
+      with self.assertRaises(ValueError):
+        analyzer.MakeRequestAndDecodeJSON(analyzer.url, 'PUT')
+
+    finally:
+      server.shutdown()
+      server.server_close()
+      server_thread.join()
+
+
 class HashTaggingAnalysisPluginTest(test_lib.AnalysisPluginTestCase):
   """Tests for the hash tagging analysis plugin."""
 
@@ -136,6 +345,13 @@ class HashTaggingAnalysisPluginTest(test_lib.AnalysisPluginTestCase):
       labels.extend(event_tag.labels)
     self.assertEqual(len(labels), 0)
 
+  def testGetSupportedEventDataTypes(self):
+    """Tests the GetSupportedEventDataTypes function."""
+    plugin = TestHashTaggingAnalysisPlugin()
+
+    data_types = plugin.GetSupportedEventDataTypes()
+    self.assertEqual(data_types, frozenset(['fs:stat', 'fs:stat:ntfs']))
+
   def testSetLookupHash(self):
     """Tests the SetLookupHash function."""
     plugin = TestHashTaggingAnalysisPlugin()
@@ -4,55 +4,59 @@
 
 from __future__ import unicode_literals
 
+import os
+import socketserver
+import threading
 import unittest
 
-try:
-  import mock  # pylint: disable=import-error
-except ImportError:
-  from unittest import mock
-
 from dfvfs.path import fake_path_spec
 
 from plaso.analysis import nsrlsvr
 from plaso.lib import definitions
 
+from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
-class _MockNsrlsvrSocket(object):
-  """Mock socket object for testing."""
+class _FakeNsrlsvrRequestHandler(socketserver.StreamRequestHandler):
+  """Request handler of a fake nsrlsvr server for testing."""
 
-  _EXPECTED_DATA = (
-      b'QUERY 2d79fcc6b02a2e183a0cb30e0e25d103f42badda9fbf86bbee06f93aa3855aff'
-      b'\n')
+  _KNOWN_HASHES = frozenset([
+      b'2d79fcc6b02a2e183a0cb30e0e25d103f42badda9fbf86bbee06f93aa3855aff'])
 
-  def __init__(self):
-    """Initializes a mock socket."""
-    super(_MockNsrlsvrSocket, self).__init__()
-    self._data = None
+  def handle(self):
+    """Handles the queries of a connection."""
+    self.server.number_of_connections += 1
 
-  # Note: that the following functions do not follow the style guide
-  # because they are part of the socket interface.
-  # pylint: disable=invalid-name
+    for line in self.rfile:
+      command, _, digest = line.strip().partition(b' ')
+      if command != b'QUERY':
+        break
 
-  # pylint: disable=unused-argument
-  def recv(self, buffer_size):
-    """Mocks the socket.recv method."""
-    expected_data = self._data == self._EXPECTED_DATA
-    self._data = None
+      self.server.number_of_queries += 1
 
-    if expected_data:
-      return b'OK 1'
+      if digest in self._KNOWN_HASHES:
+        self.wfile.write(b'OK 1\r\n')
+      else:
+        self.wfile.write(b'OK 0\r\n')
 
-    return b'OK 0'
 
-  def sendall(self, data):
-    """Mocks the socket.sendall method"""
-    self._data = data
+class _FakeNsrlsvrServer(socketserver.ThreadingTCPServer):
+  """Fake nsrlsvr server for testing.
 
-  def close(self):
-    """Mocks the socket.close method"""
-    return
+  Attributes:
+    number_of_connections (int): number of connections made to the server.
+    number_of_queries (int): number of hashes queried.
+  """
+
+  daemon_threads = True
+
+  def __init__(self):
+    """Initializes a fake nsrlsvr server on a free port of localhost."""
+    socketserver.ThreadingTCPServer.__init__(
+        self, ('127.0.0.1', 0), _FakeNsrlsvrRequestHandler)
+    self.number_of_connections = 0
+    self.number_of_queries = 0
 
 
 class NsrlSvrTest(test_lib.AnalysisPluginTestCase):
@@ -78,36 +82,75 @@ class NsrlSvrTest(test_lib.AnalysisPluginTestCase):
        'timestamp': '2016-01-01 17:00:00',
        'timestamp_desc': definitions.TIME_DESCRIPTION_CREATION}]
 
-  # pylint: disable=unused-argument
-  def _MockCreateConnection(self, connection_information, timeout):
-    """Mocks the socket create_connection call
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    self._server = _FakeNsrlsvrServer()
+    self._server_thread = threading.Thread(target=self._server.serve_forever)
+    self._server_thread.start()
+
+  def tearDown(self):
+    """Cleans up after running an individual test."""
+    self._server.shutdown()
+    self._server.server_close()
+    self._server_thread.join()
 
-    Args:
-      connection_information (object): unused connection information.
-      timeout (int): unused timeout
+  def _CreatePlugin(self):
+    """Creates a nsrlsvr analysis plugin connected to the fake server.
 
     Returns:
-      _MockNsrlsvrSocket: a socket that mocks an open socket to an nsrlsvr
-          instance.
+      NsrlsvrAnalysisPlugin: nsrlsvr analysis plugin.
     """
-    return _MockNsrlsvrSocket()
+    host, port = self._server.server_address
 
-  def setUp(self):
-    """Makes preparations before running an individual test."""
-    self._socket_patcher = mock.patch(
-        'socket.create_connection', self._MockCreateConnection)
-    self._socket_patcher.start()
+    plugin = nsrlsvr.NsrlsvrAnalysisPlugin()
+    plugin.SetHost(host)
+    plugin.SetPort(port)
+    plugin.SetLabel('nsrl_present')
+    return plugin
 
-  def tearDown(self):
-    """Cleans up after running an individual test."""
-    self._socket_patcher.stop()
+  def testAnalyze(self):
+    """Tests the Analyze function."""
+    plugin = self._CreatePlugin()
+    analyzer = plugin._analyzer  # pylint: disable=protected-access
+
+    hash_analyses = analyzer.Analyze([self._EVENT_1_HASH, self._EVENT_2_HASH])
+    self.assertEqual(len(hash_analyses), 2)
+    self.assertEqual(hash_analyses[0].subject_hash, self._EVENT_1_HASH)
+    self.assertTrue(hash_analyses[0].hash_information)
+    self.assertEqual(hash_analyses[1].subject_hash, self._EVENT_2_HASH)
+    self.assertFalse(hash_analyses[1].hash_information)
+
+    # The connection is reused by subsequent batches of the same thread.
+    hash_analyses = analyzer.Analyze([self._EVENT_2_HASH])
+    self.assertEqual(len(hash_analyses), 1)
+
+    analyzer._CloseConnections()  # pylint: disable=protected-access
+
+    self.assertEqual(self._server.number_of_connections, 1)
+    self.assertEqual(self._server.number_of_queries, 3)
+
+  def testCacheFile(self):
+    """Tests the ExamineEvent and CompileReport functions with a cache."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      cache_file = os.path.join(temp_directory, 'cache.db')
+
+      plugin = self._CreatePlugin()
+      plugin.SetCacheFile(cache_file)
+
+      storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+      self.assertEqual(storage_writer.number_of_event_tags, 1)
+      self.assertEqual(self._server.number_of_queries, 2)
+
+      plugin = self._CreatePlugin()
+      plugin.SetCacheFile(cache_file)
+
+      storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
+      self.assertEqual(storage_writer.number_of_event_tags, 1)
+      self.assertEqual(self._server.number_of_queries, 2)
 
   def testExamineEventAndCompileReport(self):
     """Tests the ExamineEvent and CompileReport functions."""
-    plugin = nsrlsvr.NsrlsvrAnalysisPlugin()
-    plugin.SetHost('localhost')
-    plugin.SetPort(9120)
-    plugin.SetLabel('nsrl_present')
+    plugin = self._CreatePlugin()
 
     storage_writer = self._AnalyzeEvents(self._TEST_EVENTS, plugin)
 
@@ -130,6 +173,11 @@ class NsrlSvrTest(test_lib.AnalysisPluginTestCase):
     expected_labels = ['nsrl_present']
     self.assertEqual(labels, expected_labels)
 
+  def testTestConnection(self):
+    """Tests the TestConnection function."""
+    plugin = self._CreatePlugin()
+    self.assertTrue(plugin.TestConnection())
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -91,7 +91,7 @@ class ViperTest(test_lib.AnalysisPluginTestCase):
 
   def setUp(self):
     """Makes preparations before running an individual test."""
-    self.requests_patcher = mock.patch('requests.post', self._MockPost)
+    self.requests_patcher = mock.patch('requests.Session.post', self._MockPost)
     self.requests_patcher.start()
 
   def tearDown(self):
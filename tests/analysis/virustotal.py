@@ -78,7 +78,7 @@ class VirusTotalTest(test_lib.AnalysisPluginTestCase):
 
   def setUp(self):
     """Makes preparations before running an individual test."""
-    self.requests_patcher = mock.patch('requests.get', self._MockGet)
+    self.requests_patcher = mock.patch('requests.Session.get', self._MockGet)
     self.requests_patcher.start()
 
   def tearDown(self):
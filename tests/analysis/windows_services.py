@@ -131,6 +131,13 @@ class WindowsServicesTest(test_lib.AnalysisPluginTestCase):
     for string in test_strings:
       self.assertIn(string, analysis_report.text)
 
+  def testGetSupportedEventDataTypes(self):
+    """Tests the GetSupportedEventDataTypes function."""
+    plugin = windows_services.WindowsServicesAnalysisPlugin()
+
+    data_types = plugin.GetSupportedEventDataTypes()
+    self.assertEqual(data_types, frozenset(['windows:registry:service']))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -24,6 +24,19 @@ class EntropyHasherTest(test_lib.HasherTestCase):
     hasher = entropy.EntropyHasher()
     self._AssertTestPathStringDigestMatch(hasher, ['syslog.zip'], '7.264319')
 
+  def testFileHashMatchesKnownFileWithoutNumPy(self):
+    """Tests that hasher without NumPy matches the hash of a known file."""
+    hasher = entropy.EntropyHasher()
+    hasher._byte_frequency_counts = None  # pylint: disable=protected-access
+    self._AssertTestPathStringDigestMatch(hasher, ['syslog.zip'], '7.264319')
+
+  def testUpdate(self):
+    """Tests the Update function."""
+    hasher = entropy.EntropyHasher()
+    hasher.Update(b'\x00\x01')
+    hasher.Update(b'\x02\x03')
+    self.assertEqual(hasher.GetStringDigest(), '2.000000')
+
 
 if __name__ == '__main__':
   unittest.main()
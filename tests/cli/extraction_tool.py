@@ -43,12 +43,26 @@ class ExtractionToolTest(test_lib.CLIToolTestCase):
 usage: extraction_tool_test.py [--single_process]
                                [--temporary_directory DIRECTORY]
                                [--vfs_back_end TYPE]
+                               [--high_memory_worker_memory_limit SIZE]
+                               [--high_memory_workers WORKERS]
                                [--worker_memory_limit SIZE]
+                               [--worker_prefetched_tasks TASKS]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 optional arguments:
+  --high_memory_worker_memory_limit SIZE, --high-memory-worker-memory-limit SIZE
+                        Maximum amount of memory (data segment and shared
+                        memory) a high-memory worker process is allowed to
+                        consume in bytes. The default is no limit.
+  --high_memory_workers WORKERS, --high-memory-workers WORKERS
+                        Number of high-memory worker processes, which process
+                        the tasks that exceeded the memory limit of a worker
+                        process. Their memory limit is set with
+                        --high_memory_worker_memory_limit. The default is 0,
+                        where these tasks are retried by another worker
+                        process.
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
@@ -63,6 +77,17 @@ optional arguments:
                         bytes, where 0 represents no limit. The default limit
                         is 2147483648 (2 GiB). If a worker process exceeds
                         this limit it is killed by the main (foreman) process.
+                        Before that, when a worker process exceeds 80 percent
+                        of this limit, it writes buffered data, collects
+                        garbage and hands off the records that remain to be
+                        parsed of large files to other tasks.
+  --worker_prefetched_tasks TASKS, --worker-prefetched-tasks TASKS
+                        Maximum number of tasks a worker process requests from
+                        the task queue at once. The default is 1, where tasks
+                        are not prefetched. Prefetching tasks saves a request
+                        to the main (foreman) process per task, but a task
+                        that is prefetched by a busy worker process cannot be
+                        processed by an idle one.
   --worker_timeout MINUTES, --worker-timeout MINUTES
                         Number of minutes before a worker process that is not
                         providing status updates is considered inactive. The
@@ -79,12 +104,26 @@ usage: extraction_tool_test.py [--single_process]
                                [--process_memory_limit SIZE]
                                [--temporary_directory DIRECTORY]
                                [--vfs_back_end TYPE]
+                               [--high_memory_worker_memory_limit SIZE]
+                               [--high_memory_workers WORKERS]
                                [--worker_memory_limit SIZE]
+                               [--worker_prefetched_tasks TASKS]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 optional arguments:
+  --high_memory_worker_memory_limit SIZE, --high-memory-worker-memory-limit SIZE
+                        Maximum amount of memory (data segment and shared
+                        memory) a high-memory worker process is allowed to
+                        consume in bytes. The default is no limit.
+  --high_memory_workers WORKERS, --high-memory-workers WORKERS
+                        Number of high-memory worker processes, which process
+                        the tasks that exceeded the memory limit of a worker
+                        process. Their memory limit is set with
+                        --high_memory_worker_memory_limit. The default is 0,
+                        where these tasks are retried by another worker
+                        process.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -107,6 +146,17 @@ optional arguments:
                         bytes, where 0 represents no limit. The default limit
                         is 2147483648 (2 GiB). If a worker process exceeds
                         this limit it is killed by the main (foreman) process.
+                        Before that, when a worker process exceeds 80 percent
+                        of this limit, it writes buffered data, collects
+                        garbage and hands off the records that remain to be
+                        parsed of large files to other tasks.
+  --worker_prefetched_tasks TASKS, --worker-prefetched-tasks TASKS
+                        Maximum number of tasks a worker process requests from
+                        the task queue at once. The default is 1, where tasks
+                        are not prefetched. Prefetching tasks saves a request
+                        to the main (foreman) process per task, but a task
+                        that is prefetched by a busy worker process cannot be
+                        processed by an idle one.
   --worker_timeout MINUTES, --worker-timeout MINUTES
                         Number of minutes before a worker process that is not
                         providing status updates is considered inactive. The
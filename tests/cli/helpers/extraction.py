@@ -20,12 +20,27 @@ class ExtractionArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--preferred_year YEAR] [--process_archives]
+usage: cli_helper.py [--collect_from_mft] [--file_system_cache_size NUMBER]
+                     [--preferred_year YEAR] [--process_archives]
                      [--skip_compressed_streams]
+                     [--skip_unchanged_snapshot_files]
 
 Test argument parser.
 
 optional arguments:
+  --collect_from_mft, --collect-from-mft
+                        Collect the file entries of NTFS file systems by
+                        reading their $MFT sequentially instead of by
+                        traversing their directories. This can make the
+                        collection of large NTFS volumes significantly faster.
+                        It is ignored when a filter file or artifact filters
+                        are used.
+  --file_system_cache_size NUMBER, --file-system-cache-size NUMBER
+                        Maximum number of file systems, such as those of the
+                        volumes and snapshots of a storage media image, that a
+                        worker process keeps open between tasks, where 0
+                        represents that file systems are not kept open. The
+                        default is 8.
   --preferred_year YEAR, --preferred-year YEAR
                         When a format\'s timestamp does not include a year,
                         e.g. syslog, use this as the initial year instead of
@@ -37,6 +52,12 @@ optional arguments:
   --skip_compressed_streams, --skip-compressed-streams
                         Skip processing file content within compressed
                         streams, such as syslog.gz and syslog.bz2.
+  --skip_unchanged_snapshot_files, --skip-unchanged-snapshot-files
+                        Process a file entry that is stored in multiple volume
+                        snapshots, such as VSS, only once when its size,
+                        modification and change time are unchanged. Note that
+                        unchanged copies of the file entry in the other
+                        snapshots will not be represented in the output.
 """
 
   def testAddArguments(self):
@@ -58,9 +79,22 @@ optional arguments:
     test_tool = tools.CLITool()
     extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertFalse(test_tool._collect_from_mft)
+    self.assertIsNone(test_tool._file_system_cache_size)
     self.assertIsNone(test_tool._preferred_year)
     self.assertFalse(test_tool._process_archives)
     self.assertTrue(test_tool._process_compressed_streams)
+    self.assertFalse(test_tool._skip_unchanged_snapshot_files)
+
+    options.file_system_cache_size = 16
+    extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+    self.assertEqual(test_tool._file_system_cache_size, 16)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.file_system_cache_size = -1
+      extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.file_system_cache_size = None
 
     with self.assertRaises(errors.BadConfigObject):
       extraction.ExtractionArgumentsHelper.ParseOptions(options, None)
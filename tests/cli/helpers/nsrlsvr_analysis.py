@@ -22,12 +22,17 @@ class NsrlsvrAnalysisArgumentsHelperTest(
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--nsrlsvr-hash HASH] [--nsrlsvr-host HOST]
-                     [--nsrlsvr-label LABEL] [--nsrlsvr-port PORT]
+usage: cli_helper.py [--nsrlsvr-cache-file PATH] [--nsrlsvr-hash HASH]
+                     [--nsrlsvr-host HOST] [--nsrlsvr-label LABEL]
+                     [--nsrlsvr-port PORT]
 
 Test argument parser.
 
 optional arguments:
+  --nsrlsvr-cache-file PATH, --nsrlsvr_cache_file PATH
+                        Path of a file to cache the nsrlsvr look up results
+                        in. Hashes with results in the cache file are not
+                        looked up again.
   --nsrlsvr-hash HASH, --nsrlsvr_hash HASH
                         Type of hash to use to query nsrlsvr instance, the
                         default is: md5. Supported options: md5, sha1
@@ -21,11 +21,19 @@ class StatusViewArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--status_view TYPE]
+usage: cli_helper.py [--status_view TYPE] [--status_file PATH]
+                     [--status_metrics_port PORT]
 
 Test argument parser.
 
 optional arguments:
+  --status_file PATH, --status-file PATH
+                        Path of a JSON file to which the processing status is
+                        written periodically, for monitoring.
+  --status_metrics_port PORT, --status-metrics-port PORT
+                        Port of a local HTTP endpoint that publishes the
+                        processing status, in the Prometheus text format on
+                        /metrics and as JSON on /status.json, for monitoring.
   --status_view TYPE, --status-view TYPE
                         The processing status view mode: "linear", "none" or
                         "window".
@@ -52,6 +60,21 @@ optional arguments:
     status_view.StatusViewArgumentsHelper.ParseOptions(options, test_tool)
 
     self.assertEqual(test_tool._status_view_mode, options.status_view_mode)
+    self.assertIsNone(test_tool._status_file)
+    self.assertIsNone(test_tool._status_metrics_port)
+
+    options.status_file = 'status.json'
+    options.status_metrics_port = 9090
+
+    status_view.StatusViewArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._status_file, 'status.json')
+    self.assertEqual(test_tool._status_metrics_port, 9090)
+
+    options.status_metrics_port = 65536
+
+    with self.assertRaises(errors.BadConfigOption):
+      status_view.StatusViewArgumentsHelper.ParseOptions(options, test_tool)
 
     with self.assertRaises(errors.BadConfigObject):
       status_view.StatusViewArgumentsHelper.ParseOptions(options, None)
@@ -22,12 +22,17 @@ class ViperAnalysisArgumentsHelperTest(
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--viper-hash HASH] [--viper-host HOST]
-                     [--viper-port PORT] [--viper-protocol PROTOCOL]
+usage: cli_helper.py [--viper-cache-file PATH] [--viper-hash HASH]
+                     [--viper-host HOST] [--viper-port PORT]
+                     [--viper-protocol PROTOCOL]
 
 Test argument parser.
 
 optional arguments:
+  --viper-cache-file PATH, --viper_cache_file PATH
+                        Path of a file to cache the Viper look up results in.
+                        Hashes with results in the cache file are not looked
+                        up again.
   --viper-hash HASH, --viper_hash HASH
                         Type of hash to use to query the Viper server, the
                         default is: sha256. Supported options: md5, sha256
@@ -35,6 +35,7 @@ class VirusTotalAnalysisArgumentsHelperTest(
 
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--virustotal-api-key API_KEY]
+                     [--virustotal-cache-file PATH]
                      [--virustotal-free-rate-limit] [--virustotal-hash HASH]
 
 Test argument parser.
@@ -42,6 +43,10 @@ Test argument parser.
 optional arguments:
   --virustotal-api-key API_KEY, --virustotal_api_key API_KEY
                         Specify the API key for use with VirusTotal.
+  --virustotal-cache-file PATH, --virustotal_cache_file PATH
+                        Path of a file to cache the VirusTotal look up results
+                        in. Hashes with results in the cache file are not
+                        looked up again.
   --virustotal-free-rate-limit, --virustotal_free_rate_limit
                         Limit Virustotal requests to the default free API key
                         rate of 4 requests per minute. Set this to false if
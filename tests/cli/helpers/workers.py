@@ -20,18 +20,43 @@ class WorkersArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
-                     [--workers WORKERS]
+usage: cli_helper.py [--high_memory_worker_memory_limit SIZE]
+                     [--high_memory_workers WORKERS]
+                     [--worker_memory_limit SIZE]
+                     [--worker_prefetched_tasks TASKS]
+                     [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 optional arguments:
+  --high_memory_worker_memory_limit SIZE, --high-memory-worker-memory-limit SIZE
+                        Maximum amount of memory (data segment and shared
+                        memory) a high-memory worker process is allowed to
+                        consume in bytes. The default is no limit.
+  --high_memory_workers WORKERS, --high-memory-workers WORKERS
+                        Number of high-memory worker processes, which process
+                        the tasks that exceeded the memory limit of a worker
+                        process. Their memory limit is set with
+                        --high_memory_worker_memory_limit. The default is 0,
+                        where these tasks are retried by another worker
+                        process.
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
                         bytes, where 0 represents no limit. The default limit
                         is 2147483648 (2 GiB). If a worker process exceeds
                         this limit it is killed by the main (foreman) process.
+                        Before that, when a worker process exceeds 80 percent
+                        of this limit, it writes buffered data, collects
+                        garbage and hands off the records that remain to be
+                        parsed of large files to other tasks.
+  --worker_prefetched_tasks TASKS, --worker-prefetched-tasks TASKS
+                        Maximum number of tasks a worker process requests from
+                        the task queue at once. The default is 1, where tasks
+                        are not prefetched. Prefetching tasks saves a request
+                        to the main (foreman) process per task, but a task
+                        that is prefetched by a busy worker process cannot be
+                        processed by an idle one.
   --worker_timeout MINUTES, --worker-timeout MINUTES
                         Number of minutes before a worker process that is not
                         providing status updates is considered inactive. The
@@ -64,6 +89,38 @@ optional arguments:
     workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
     self.assertEqual(test_tool._number_of_extraction_workers, options.workers)
+    self.assertEqual(test_tool._number_of_high_memory_extraction_workers, 0)
+    self.assertIsNone(test_tool._high_memory_worker_memory_limit)
+    self.assertEqual(test_tool._maximum_number_of_prefetched_tasks, 1)
+
+    options.worker_prefetched_tasks = 4
+    workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._maximum_number_of_prefetched_tasks, 4)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.worker_prefetched_tasks = 0
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.worker_prefetched_tasks = 1
+
+    options.high_memory_worker_memory_limit = 8 * 1024 * 1024 * 1024
+    options.high_memory_workers = 1
+    workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._number_of_high_memory_extraction_workers, 1)
+    self.assertEqual(
+        test_tool._high_memory_worker_memory_limit, 8 * 1024 * 1024 * 1024)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.high_memory_workers = -1
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.high_memory_workers = 1
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.high_memory_worker_memory_limit = -1
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
     with self.assertRaises(errors.BadConfigObject):
       workers.WorkersArgumentsHelper.ParseOptions(options, None)
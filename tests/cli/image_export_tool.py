@@ -9,8 +9,14 @@ import json
 import os
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.cli import image_export_tool
@@ -62,74 +68,104 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
     return results
 
-  def testCalculateDigestHash(self):
-    """Tests the _CalculateDigestHash function."""
+  # TODO: add tests for _CreateSanitizedDestination.
+
+  def testExtractWithWorkers(self):
+    """Tests the _Extract function with export worker processes."""
     test_file_path = self._GetTestFilePath(['ímynd.dd'])
     self._SkipIfPathNotExists(test_file_path)
 
-    test_tool = image_export_tool.ImageExportTool()
-
     os_path_spec = path_spec_factory.Factory.NewPathSpec(
         dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
     tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
-        location='/a_directory/another_file', parent=os_path_spec)
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=os_path_spec)
 
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    digest_hash = test_tool._CalculateDigestHash(file_entry, '')
-    expected_digest_hash = (
-        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
-    self.assertEqual(digest_hash, expected_digest_hash)
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = image_export_tool.ImageExportTool()
+    test_tool._number_of_workers = 2
+    test_tool._quiet_mode = True
 
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=12,
-        location='/a_directory', parent=os_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_tool._Extract(
+          [tsk_path_spec], temp_directory, output_writer, None, None, None,
+          None)
 
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-    with self.assertRaises(IOError):
-      test_tool._CalculateDigestHash(file_entry, '')
+      extracted_files = self._RecursiveList(temp_directory)
 
-  # TODO: add tests for _CreateSanitizedDestination.
-  # TODO: add tests for _Extract.
+    self.assertEqual(sorted(extracted_files), [
+        os.path.join(temp_directory, 'a_directory'),
+        os.path.join(temp_directory, 'a_directory', 'a_file'),
+        os.path.join(temp_directory, 'a_directory', 'another_file'),
+        os.path.join(temp_directory, 'passwords.txt')])
 
-  def testExtractDataStream(self):
-    """Tests the _ExtractDataStream function."""
+    self.assertEqual(test_tool._number_of_exported_files, 3)
+
+  def testExtractWithWorkersInterrupted(self):
+    """Tests the _Extract function interrupted with export worker processes."""
     test_file_path = self._GetTestFilePath(['ímynd.dd'])
     self._SkipIfPathNotExists(test_file_path)
 
-    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
-    test_tool = image_export_tool.ImageExportTool()
-
     os_path_spec = path_spec_factory.Factory.NewPathSpec(
         dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
     tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
-        location='/a_directory/another_file', parent=os_path_spec)
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=os_path_spec)
+
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = image_export_tool.ImageExportTool()
+    test_tool._number_of_workers = 2
+    test_tool._quiet_mode = True
 
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
     with shared_test_lib.TempDirectory() as temp_directory:
-      test_tool._ExtractDataStream(
-          file_entry, '', temp_directory, output_writer)
+      with mock.patch.object(
+          test_tool, '_FinalizeDataStreamExport',
+          side_effect=KeyboardInterrupt):
+        with self.assertRaises(KeyboardInterrupt):
+          test_tool._Extract(
+              [tsk_path_spec], temp_directory, output_writer, None, None, None,
+              None)
 
-  def testExtractFileEntry(self):
-    """Tests the _ExtractFileEntry function."""
-    test_file_path = self._GetTestFilePath(['ímynd.dd'])
-    self._SkipIfPathNotExists(test_file_path)
+      extracted_files = self._RecursiveList(temp_directory)
 
-    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
-    test_tool = image_export_tool.ImageExportTool()
+    # The temporary files written by the export worker processes are removed.
+    self.assertEqual(extracted_files, [])
+    self.assertTrue(test_tool._abort)
 
-    os_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
-    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
-        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
-        location='/a_directory/another_file', parent=os_path_spec)
+  def testFinalizeDataStreamExport(self):
+    """Tests the _FinalizeDataStreamExport function."""
+    test_tool = image_export_tool.ImageExportTool()
 
     with shared_test_lib.TempDirectory() as temp_directory:
-      file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
-      test_tool._ExtractFileEntry(file_entry, temp_directory, output_writer)
+      target_directory = os.path.join(temp_directory, 'a_directory')
+
+      data_stream_exports = []
+      for filename in ('a_file', 'another_file'):
+        temporary_path = os.path.join(temp_directory, '.' + filename)
+        with open(temporary_path, 'wb') as file_object:
+          file_object.write(b'test')
+
+        data_stream_export = image_export_tool.DataStreamExport(
+            None, '', '/a_directory/' + filename, target_directory, filename,
+            temp_directory)
+        data_stream_export.digest = 'test_digest'
+        data_stream_export.size = 4
+        data_stream_export.temporary_path = temporary_path
+        data_stream_exports.append(data_stream_export)
+
+      for data_stream_export in data_stream_exports:
+        test_tool._FinalizeDataStreamExport(data_stream_export, temp_directory)
+
+      extracted_files = self._RecursiveList(temp_directory)
+
+    self.assertEqual(sorted(extracted_files), [
+        os.path.join(temp_directory, 'a_directory'),
+        os.path.join(temp_directory, 'a_directory', 'a_file')])
+    self.assertEqual(test_tool._number_of_exported_files, 1)
+    self.assertEqual(dict(test_tool._paths_by_hash), {
+        'test_digest': [
+            os.path.join('a_directory', 'a_file'),
+            os.path.join('a_directory', 'another_file')]})
 
   # TODO: add tests for _ExtractWithFilter.
   # TODO: add tests for _GetSourceFileSystem.
@@ -180,7 +216,52 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
     file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
     with shared_test_lib.TempDirectory() as temp_directory:
       destination_path = os.path.join(temp_directory, 'another_file')
-      test_tool._WriteFileEntry(file_entry, '', destination_path)
+      digest_hash, size = test_tool._WriteFileEntry(
+          file_entry, '', destination_path)
+
+      self.assertEqual(size, os.path.getsize(destination_path))
+
+    expected_digest_hash = (
+        'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16')
+    self.assertEqual(digest_hash, expected_digest_hash)
+    self.assertEqual(size, 22)
+
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=12,
+        location='/a_directory', parent=os_path_spec)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+    with shared_test_lib.TempDirectory() as temp_directory:
+      destination_path = os.path.join(temp_directory, 'a_directory')
+      with self.assertRaises(IOError):
+        test_tool._WriteFileEntry(file_entry, '', destination_path)
+
+  def testWriteDataStreamExport(self):
+    """Tests the _WriteDataStreamExport function."""
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=16,
+        location='/a_directory/another_file', parent=os_path_spec)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      data_stream_export = image_export_tool.DataStreamExport(
+          tsk_path_spec, '', '/a_directory/another_file',
+          os.path.join(temp_directory, 'a_directory'), 'another_file',
+          temp_directory)
+
+      data_stream_export = (
+          image_export_tool.ImageExportTool._WriteDataStreamExport(
+              data_stream_export, context.Context()))
+
+      self.assertIsNone(data_stream_export.error)
+      self.assertEqual(data_stream_export.digest, (
+          'c7fbc0e821c0871805a99584c6a384533909f68a6bbe9a2a687d28d9f3b10c16'))
+      self.assertIsNotNone(data_stream_export.temporary_path)
+      self.assertTrue(os.path.isfile(data_stream_export.temporary_path))
 
   # TODO: add tests for AddFilterOptions.
 
@@ -238,6 +319,9 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
     test_tool.ParseOptions(options)
 
+    # The files are exported in the main process by default.
+    self.assertEqual(test_tool._number_of_workers, 1)
+
     options = test_lib.TestOptions()
 
     with self.assertRaises(errors.BadConfigOption):
@@ -541,6 +625,48 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
 
       self.assertEqual(sorted(extracted_files), expected_extracted_files)
 
+  def testProcessSourcesWithWorkers(self):
+    """Tests the ProcessSources function with worker processes."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['image.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    extracted_files_per_workers = {}
+    json_data_per_workers = {}
+    for number_of_workers in (1, 2):
+      output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+      test_tool = image_export_tool.ImageExportTool(
+          output_writer=output_writer)
+
+      options = test_lib.TestOptions()
+      options.artifact_definitions_path = test_artifacts_path
+      options.image = test_file_path
+      options.workers = number_of_workers
+
+      with shared_test_lib.TempDirectory() as temp_directory:
+        options.path = temp_directory
+
+        test_tool.ParseOptions(options)
+
+        test_tool.ProcessSources()
+
+        extracted_files_per_workers[number_of_workers] = sorted([
+            os.path.relpath(path, temp_directory)
+            for path in self._RecursiveList(temp_directory)])
+
+        with open(os.path.join(temp_directory, 'hashes.json')) as json_file:
+          json_data_per_workers[number_of_workers] = json.load(json_file)
+
+      output = output_writer.ReadOutput()
+      self.assertIn('Exported: ', output)
+
+    self.assertIn('passwords.txt', extracted_files_per_workers[2])
+    self.assertEqual(
+        extracted_files_per_workers[1], extracted_files_per_workers[2])
+    self.assertEqual(json_data_per_workers[1], json_data_per_workers[2])
+
   def testOutputJsonFile(self):
     """Tests the content of the output JSON file."""
     test_artifacts_path = self._GetTestFilePath(['artifacts'])
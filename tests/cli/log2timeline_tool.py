@@ -197,6 +197,90 @@ class Log2TimelineToolTest(test_lib.CLIToolTestCase):
       output = output_writer.ReadOutput()
       self._CheckOutput(output, expected_output)
 
+  def testExtractEventsFromSourcesOnDirectoryIncremental(self):
+    """Tests the ExtractEventsFromSources function with incremental."""
+    test_file_path = self._GetTestFilePath(['testdir'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    options = self._CreateExtractionOptions(test_file_path)
+    options.incremental = True
+    options.single_process = False
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.storage_file = os.path.join(temp_directory, 'storage.plaso')
+      options.storage_format = definitions.STORAGE_FORMAT_SQLITE
+      options.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+      output_writer = test_lib.TestOutputWriter(
+          encoding=self._OUTPUT_ENCODING)
+      test_tool = log2timeline_tool.Log2TimelineTool(
+          output_writer=output_writer)
+      test_tool.ParseOptions(options)
+      test_tool.ExtractEventsFromSources()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=options.storage_file, read_only=True)
+      try:
+        number_of_events = len(list(storage_file.GetEvents()))
+        processed_event_sources = list(
+            storage_file.GetProcessedEventSources())
+      finally:
+        storage_file.Close()
+
+      self.assertGreater(number_of_events, 0)
+      self.assertGreater(len(processed_event_sources), 0)
+
+      # A second extraction only processes the event sources that produce
+      # other event sources, such as the directories.
+      output_writer = test_lib.TestOutputWriter(
+          encoding=self._OUTPUT_ENCODING)
+      test_tool = log2timeline_tool.Log2TimelineTool(
+          output_writer=output_writer)
+      test_tool.ParseOptions(options)
+      test_tool.ExtractEventsFromSources()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=options.storage_file, read_only=True)
+      try:
+        number_of_incremental_events = (
+            len(list(storage_file.GetEvents())) - number_of_events)
+      finally:
+        storage_file.Close()
+
+      self.assertLess(number_of_incremental_events, number_of_events)
+
+  def testExtractEventsFromSourcesOnDirectoryWithoutEventSources(self):
+    """Tests the ExtractEventsFromSources function without event sources."""
+    test_file_path = self._GetTestFilePath(['testdir'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    options = self._CreateExtractionOptions(test_file_path)
+    options.single_process = False
+    options.store_event_sources = False
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.storage_file = os.path.join(temp_directory, 'storage.plaso')
+      options.storage_format = definitions.STORAGE_FORMAT_SQLITE
+      options.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+      output_writer = test_lib.TestOutputWriter(
+          encoding=self._OUTPUT_ENCODING)
+      test_tool = log2timeline_tool.Log2TimelineTool(
+          output_writer=output_writer)
+      test_tool.ParseOptions(options)
+      test_tool.ExtractEventsFromSources()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=options.storage_file, read_only=True)
+      try:
+        number_of_events = len(list(storage_file.GetEvents()))
+        number_of_event_sources = storage_file.GetNumberOfEventSources()
+      finally:
+        storage_file.Close()
+
+      self.assertGreater(number_of_events, 0)
+      self.assertEqual(number_of_event_sources, 0)
+
   def testExtractEventsFromSourcesOnAPFSImage(self):
     """Tests the ExtractEventsFromSources function on APFS image."""
     test_file_path = self._GetTestFilePath(['apfs.dmg'])
@@ -114,11 +114,21 @@ optional arguments:
   if resource is None:
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY]
-                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--export_workers WORKERS] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES]
 
 Test argument parser.
 
 optional arguments:
+  --export_workers WORKERS, --export-workers WORKERS
+                        Maximum number of worker processes that export events
+                        in parallel, each exporting the events of a different
+                        time range. The default is 0, which represents that
+                        the events are exported by the main process. Only
+                        output formats that write events per line, such as
+                        dynamic, json_line and l2tcsv, can be exported in
+                        parallel and only if no time slice or filter limit is
+                        used.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -139,11 +149,21 @@ optional arguments:
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
-                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--export_workers WORKERS] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES]
 
 Test argument parser.
 
 optional arguments:
+  --export_workers WORKERS, --export-workers WORKERS
+                        Maximum number of worker processes that export events
+                        in parallel, each exporting the events of a different
+                        time range. The default is 0, which represents that
+                        the events are exported by the main process. Only
+                        output formats that write events per line, such as
+                        dynamic, json_line and l2tcsv, can be exported in
+                        parallel and only if no time slice or filter limit is
+                        used.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
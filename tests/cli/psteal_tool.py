@@ -13,6 +13,7 @@ from dfvfs.resolver import resolver as dfvfs_resolver
 
 from plaso.cli import psteal_tool
 from plaso.lib import errors
+from plaso.storage import factory as storage_factory
 
 from tests import test_lib as shared_test_lib
 from tests.cli import test_lib
@@ -258,6 +259,59 @@ optional arguments:
       output = output_writer.ReadOutput()
       self._CheckOutput(output, expected_output)
 
+  def testExtractEventsFromSourceDirectoryWithStreamOutput(self):
+    """Tests the ExtractEventsFromSources function with streamed output."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['testdir'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = psteal_tool.PstealTool(output_writer=output_writer)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.output_format = 'dynamic'
+    options.quiet = True
+    options.status_view_mode = 'none'
+    options.source = test_file_path
+    options.stream_output = True
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.log_file = os.path.join(temp_directory, 'output.log')
+      options.storage_file = os.path.join(temp_directory, 'storage.plaso')
+      options.write = os.path.join(temp_directory, 'output.txt')
+
+      test_tool.ParseOptions(options)
+
+      test_tool.ExtractEventsFromSources()
+
+      self.assertTrue(test_tool._output_streamed)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              options.storage_file))
+      try:
+        number_of_events = len(list(storage_reader.GetEvents()))
+      finally:
+        storage_reader.Close()
+
+      self.assertGreater(number_of_events, 0)
+      self.assertEqual(test_tool._number_of_streamed_events, number_of_events)
+
+      with io.open(options.write, 'rt', encoding='utf-8') as file_object:
+        lines = file_object.read().split('\n')
+
+      # The output contains a header and ends with an empty line.
+      self.assertEqual(len(lines), number_of_events + 2)
+
+      # The output was written during extraction and is not written again.
+      test_tool.AnalyzeEvents()
+
+      with io.open(options.write, 'rt', encoding='utf-8') as file_object:
+        self.assertEqual(file_object.read().split('\n'), lines)
+
   def testExtractEventsFromSourceBDEImage(self):
     """Tests the ExtractEventsFromSources function on an image with BDE."""
     test_artifacts_path = self._GetTestFilePath(['artifacts'])
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the status metrics publisher."""
+
+from __future__ import unicode_literals
+
+import json
+import os
+import unittest
+
+from urllib import request
+
+from plaso.cli import status_metrics
+from plaso.engine import processing_status
+
+from tests import test_lib as shared_test_lib
+
+
+class StatusMetricsPublisherTest(shared_test_lib.BaseTestCase):
+  """Tests for the status metrics publisher."""
+
+  # pylint: disable=protected-access
+
+  def _CreateProcessingStatus(self):
+    """Creates a processing status for testing.
+
+    Returns:
+      ProcessingStatus: processing status.
+    """
+    test_processing_status = processing_status.ProcessingStatus()
+    test_processing_status.UpdateForemanStatus(
+        'Main', 'Running', 12345, 2048, 'file.txt', 1, 2, 0, 100, 0, 0, 0, 0,
+        0, 3)
+    test_processing_status.UpdateWorkerStatus(
+        'Worker_00', 'Extracting', 12346, 4096, 'file.txt', 1, 0, 0, 80, 0, 0,
+        0, 0, 0, 1)
+
+    tasks_status = processing_status.TasksStatus()
+    tasks_status.number_of_queued_tasks = 4
+    tasks_status.number_of_tasks_pending_merge = 2
+    tasks_status.total_number_of_tasks = 10
+    test_processing_status.UpdateTasksStatus(tasks_status)
+
+    return test_processing_status
+
+  def testGetPrometheusMetrics(self):
+    """Tests the GetPrometheusMetrics function."""
+    test_publisher = status_metrics.StatusMetricsPublisher()
+    test_publisher.Update(self._CreateProcessingStatus())
+
+    metrics = test_publisher.GetPrometheusMetrics()
+
+    self.assertIn('# TYPE plaso_process_produced_events_total counter', metrics)
+    self.assertIn(
+        'plaso_process_produced_events_total{process="Main"} 100', metrics)
+    self.assertIn(
+        'plaso_process_produced_events_total{process="Worker_00"} 80',
+        metrics)
+    self.assertIn(
+        'plaso_process_used_memory_bytes{process="Worker_00"} 4096', metrics)
+    self.assertIn(
+        'plaso_process_info{pid="12346",process="Worker_00",'
+        'status="Extracting"} 1', metrics)
+    self.assertIn('plaso_tasks{status="queued"} 4', metrics)
+    self.assertIn('plaso_tasks{status="pending_merge"} 2', metrics)
+    self.assertIn('plaso_tasks_total 10', metrics)
+    self.assertNotIn('plaso_events_total', metrics)
+
+  def testGetStatusValues(self):
+    """Tests the GetStatusValues function."""
+    test_publisher = status_metrics.StatusMetricsPublisher()
+    self.assertEqual(test_publisher.GetStatusValues(), {})
+
+    test_processing_status = self._CreateProcessingStatus()
+    test_publisher.Update(test_processing_status)
+
+    status_values = test_publisher.GetStatusValues()
+    self.assertFalse(status_values['aborted'])
+    self.assertEqual(len(status_values['processes']), 2)
+    self.assertEqual(status_values['tasks']['queued'], 4)
+
+    process_values = status_values['processes'][1]
+    self.assertEqual(process_values['identifier'], 'Worker_00')
+    self.assertEqual(process_values['produced_events'], 80)
+    self.assertEqual(process_values['events_per_second'], 0.0)
+
+    # Determine the number of events per second from the previous update.
+    update_time = status_values['update_time']
+    test_publisher._last_number_of_events['Worker_00'] = (
+        update_time - 10.0, 0)
+
+    test_publisher.Update(test_processing_status)
+
+    status_values = test_publisher.GetStatusValues()
+    process_values = status_values['processes'][1]
+    self.assertGreater(process_values['events_per_second'], 0.0)
+    self.assertLessEqual(process_values['events_per_second'], 8.0)
+
+  def testStartStop(self):
+    """Tests the Start and Stop functions."""
+    test_publisher = status_metrics.StatusMetricsPublisher(http_port=0)
+    test_publisher.Start()
+
+    try:
+      test_publisher.Update(self._CreateProcessingStatus())
+
+      url = 'http://localhost:{0:d}'.format(
+          test_publisher._http_server.server_port)
+
+      with request.urlopen('{0:s}/metrics'.format(url)) as response:
+        content_type = response.headers['Content-Type']
+        metrics = response.read().decode('utf-8')
+
+      self.assertTrue(content_type.startswith('text/plain'))
+      self.assertIn('plaso_tasks_total 10', metrics)
+
+      with request.urlopen('{0:s}/status.json'.format(url)) as response:
+        status_values = json.loads(response.read().decode('utf-8'))
+
+      self.assertEqual(status_values['tasks']['total'], 10)
+
+    finally:
+      test_publisher.Stop()
+
+    self.assertIsNone(test_publisher._http_server)
+
+  def testUpdate(self):
+    """Tests the Update function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      status_file_path = os.path.join(temp_directory, 'status.json')
+      storage_file_path = os.path.join(temp_directory, 'storage.plaso')
+
+      with open(storage_file_path, 'wb') as file_object:
+        file_object.write(b'\x00' * 1024)
+
+      test_publisher = status_metrics.StatusMetricsPublisher(
+          status_file_path=status_file_path,
+          storage_file_path=storage_file_path)
+      test_publisher.Update(self._CreateProcessingStatus())
+
+      with open(status_file_path, 'r', encoding='utf-8') as file_object:
+        status_values = json.load(file_object)
+
+      self.assertFalse(os.path.exists('{0:s}.tmp'.format(status_file_path)))
+
+    self.assertEqual(status_values['storage_file_size'], 1024)
+    self.assertEqual(len(status_values['processes']), 2)
+    self.assertEqual(status_values['tasks']['pending_merge'], 2)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 try:
   import mock  # pylint: disable=import-error
@@ -18,6 +19,7 @@ import plaso
 from plaso.cli import status_view
 from plaso.engine import processing_status
 
+from tests import test_lib as shared_test_lib
 from tests.cli import test_lib
 
 
@@ -220,7 +222,46 @@ class StatusViewTest(test_lib.CLIToolTestCase):
 
   # TODO: add tests for _PrintTasksStatus
   # TODO: add tests for GetAnalysisStatusUpdateCallback
-  # TODO: add tests for GetExtractionStatusUpdateCallback
+
+  def testGetExtractionStatusUpdateCallback(self):
+    """Tests the GetExtractionStatusUpdateCallback function."""
+    output_writer = test_lib.TestOutputWriter()
+
+    test_view = status_view.StatusView(output_writer, 'test_tool')
+    test_view.SetMode('none')
+
+    status_update_callback = test_view.GetExtractionStatusUpdateCallback()
+    self.assertIsNone(status_update_callback)
+
+    test_view.SetMode(status_view.StatusView.MODE_LINEAR)
+
+    status_update_callback = test_view.GetExtractionStatusUpdateCallback()
+    self.assertEqual(
+        status_update_callback, test_view._PrintExtractionStatusUpdateLinear)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      status_file_path = os.path.join(temp_directory, 'status.json')
+      test_view.StartStatusMetrics(status_file_path=status_file_path)
+
+      process_status = processing_status.ProcessingStatus()
+      process_status.UpdateForemanStatus(
+          'f_identifier', 'f_status', 123, 0,
+          'f_test_file', 1, 29, 3, 456, 5, 6, 9, 10, 7, 8)
+
+      status_update_callback = test_view.GetExtractionStatusUpdateCallback()
+      status_update_callback(process_status)
+
+      test_view.StopStatusMetrics()
+
+      self.assertTrue(os.path.exists(status_file_path))
+
+    output = output_writer.ReadOutput()
+    self.assertIn('f_identifier', output)
+
+    status_update_callback = test_view.GetExtractionStatusUpdateCallback()
+    self.assertEqual(
+        status_update_callback, test_view._PrintExtractionStatusUpdateLinear)
+
   # TODO: add tests for PrintAnalysisReportsDetails
 
   def testPrintExtractionStatusHeader(self):
@@ -41,5 +41,22 @@ class FileEntryEventSourceTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class RecordRangeEventSourceTest(shared_test_lib.BaseTestCase):
+  """Tests for the record range event source attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = event_sources.RecordRangeEventSource()
+
+    expected_attribute_names = [
+        'data_stream_name', 'data_type', 'event_data_stream',
+        'file_entry_type', 'first_record_index', 'number_of_records',
+        'parser_name', 'path_spec']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -30,6 +30,7 @@ class TaskTest(shared_test_lib.BaseTestCase):
         'aborted': False,
         'has_retry': False,
         'identifier': task.identifier,
+        'requires_high_memory': False,
         'session_identifier': task.session_identifier,
         'start_time': task.start_time}
 
@@ -42,12 +43,16 @@ class TaskTest(shared_test_lib.BaseTestCase):
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
     task = tasks.Task(session_identifier=session_identifier)
     task.path_spec = 'test_path_spec'
+    task.record_range = 'test_record_range'
+    task.requires_high_memory = True
 
     retry_task = task.CreateRetryTask()
     self.assertNotEqual(retry_task.identifier, task.identifier)
     self.assertTrue(task.has_retry)
     self.assertFalse(retry_task.has_retry)
     self.assertEqual(retry_task.path_spec, task.path_spec)
+    self.assertEqual(retry_task.record_range, task.record_range)
+    self.assertTrue(retry_task.requires_high_memory)
 
   def testCreateTaskCompletion(self):
     """Tests the CreateTaskCompletion function."""
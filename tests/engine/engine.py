@@ -97,7 +97,7 @@ class BaseEngineTest(shared_test_lib.BaseTestCase):
       configuration.profiling.directory = temp_directory
       configuration.profiling.profilers = set([
           'memory', 'parsers', 'processing', 'serializers', 'storage',
-          'task_queue'])
+          'task_queue', 'trace'])
 
       test_engine = engine.BaseEngine()
 
@@ -106,6 +106,19 @@ class BaseEngineTest(shared_test_lib.BaseTestCase):
       test_engine._StartProfiling(configuration.profiling)
       test_engine._StopProfiling()
 
+      # The trace profiler records the processing phases when the processing
+      # profiler is not enabled.
+      configuration.profiling.profilers = set(['trace'])
+
+      test_engine._StartProfiling(configuration.profiling)
+      self.assertIsNotNone(test_engine._trace_profiler)
+      self.assertIs(
+          test_engine._processing_profiler, test_engine._trace_profiler)
+
+      test_engine._StopProfiling()
+      self.assertIsNone(test_engine._processing_profiler)
+      self.assertIsNone(test_engine._trace_profiler)
+
   def testCreateSession(self):
     """Tests the CreateSession function."""
     test_engine = engine.BaseEngine()
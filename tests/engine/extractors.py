@@ -244,6 +244,50 @@ class PathSpecExtractorTest(shared_test_lib.BaseTestCase):
     # image_offset: 0
     self.assertEqual(paths[1], '/passwords.txt')
 
+  def testExtractPathSpecsStorageMediaImageWithMFT(self):
+    """Tests the ExtractPathSpecs function on an image file using the $MFT."""
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+        parent=qcow_path_spec)
+
+    resolver_context = context.Context()
+    test_extractor = extractors.PathSpecExtractor()
+
+    path_specs = list(test_extractor.ExtractPathSpecs(
+        [source_path_spec], collect_from_mft=True,
+        recurse_file_system=False, resolver_context=resolver_context))
+
+    self.assertEqual(len(path_specs), 34)
+    self.assertEqual(path_specs[0], source_path_spec)
+
+    path_specs_by_location = {
+        path_spec.location: path_spec for path_spec in path_specs}
+
+    path_spec = path_specs_by_location['\\another_file']
+    self.assertEqual(path_spec.mft_attribute, 2)
+    self.assertEqual(path_spec.mft_entry, 39)
+
+    path_spec = path_specs_by_location[
+        '\\$Extend\\$RmMetadata\\$TxfLog\\$TxfLog.blf']
+    self.assertEqual(path_spec.mft_attribute, 1)
+    self.assertEqual(path_spec.mft_entry, 32)
+
+    # The $MFT should provide the same file entries as traversing
+    # the directories.
+    expected_path_specs = list(test_extractor.ExtractPathSpecs(
+        [source_path_spec], resolver_context=resolver_context))
+
+    self.assertEqual(
+        sorted(path_spec.comparable for path_spec in path_specs[1:]),
+        sorted(path_spec.comparable for path_spec in expected_path_specs))
+
   def testExtractPathSpecsStorageMediaImageWithPartitions(self):
     """Tests the ExtractPathSpecs function an image file with partitions.
 
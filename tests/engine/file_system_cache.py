@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the file system cache."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+
+from plaso.engine import file_system_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class FileSystemCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the file system cache."""
+
+  # pylint: disable=protected-access
+
+  def _GetPathSpec(self, location, store_index=None):
+    """Retrieves a path specification of a file entry in the VSS test image.
+
+    Args:
+      location (str): location of the file entry in the NTFS file system.
+      store_index (Optional[int]): index of the VSS store, where None
+          represents the current volume.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+    """
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=path_spec)
+    if store_index is not None:
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_VSHADOW, store_index=store_index,
+          parent=path_spec)
+    return path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location=location,
+        parent=path_spec)
+
+  def testGetFileSystemIdentifier(self):
+    """Tests the GetFileSystemIdentifier function."""
+    test_cache_class = file_system_cache.FileSystemCache
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/file')
+    self.assertEqual(test_cache_class.GetFileSystemIdentifier(path_spec), '')
+    self.assertEqual(test_cache_class.GetFileSystemIdentifier(None), '')
+
+    identifier = test_cache_class.GetFileSystemIdentifier(
+        self._GetPathSpec('/another_file'))
+    self.assertNotEqual(identifier, '')
+
+    other_identifier = test_cache_class.GetFileSystemIdentifier(
+        self._GetPathSpec('/syslog.gz'))
+    self.assertEqual(other_identifier, identifier)
+
+    snapshot_identifier = test_cache_class.GetFileSystemIdentifier(
+        self._GetPathSpec('/another_file', store_index=1))
+    self.assertNotEqual(snapshot_identifier, identifier)
+
+  def testCacheFileSystem(self):
+    """Tests the CacheFileSystem and Empty functions."""
+    resolver_context = context.Context()
+    test_cache = file_system_cache.FileSystemCache(
+        resolver_context, maximum_number_of_file_systems=2)
+    self.assertIsNone(test_cache.hit_rate)
+
+    path_spec = self._GetPathSpec('/another_file')
+    self.assertFalse(test_cache.CacheFileSystem(path_spec))
+    self.assertEqual(len(test_cache._file_systems), 1)
+    self.assertEqual(resolver_context.GetFileSystemReferenceCount(path_spec), 1)
+
+    # The file system remains cached in the resolver context.
+    self.assertTrue(test_cache.CacheFileSystem(
+        self._GetPathSpec('/syslog.gz')))
+    self.assertEqual(len(test_cache._file_systems), 1)
+
+    snapshot_path_spec = self._GetPathSpec('/another_file', store_index=0)
+    self.assertFalse(test_cache.CacheFileSystem(snapshot_path_spec))
+    self.assertEqual(len(test_cache._file_systems), 2)
+
+    # The least recently used file system is closed when the cache is full.
+    self.assertFalse(test_cache.CacheFileSystem(
+        self._GetPathSpec('/another_file', store_index=1)))
+    self.assertEqual(len(test_cache._file_systems), 2)
+    self.assertIsNone(resolver_context.GetFileSystem(path_spec))
+    self.assertIsNotNone(resolver_context.GetFileSystem(snapshot_path_spec))
+
+    self.assertEqual(test_cache.number_of_hits, 1)
+    self.assertEqual(test_cache.number_of_misses, 3)
+    self.assertEqual(test_cache.hit_rate, 25.0)
+
+    test_cache.Empty()
+    self.assertEqual(len(test_cache._file_systems), 0)
+    self.assertIsNone(resolver_context.GetFileSystem(snapshot_path_spec))
+
+  def testCacheFileSystemDisabled(self):
+    """Tests the CacheFileSystem function without caching."""
+    resolver_context = context.Context()
+    test_cache = file_system_cache.FileSystemCache(
+        resolver_context, maximum_number_of_file_systems=0)
+
+    path_spec = self._GetPathSpec('/another_file')
+    self.assertFalse(test_cache.CacheFileSystem(path_spec))
+    self.assertEqual(len(test_cache._file_systems), 0)
+    self.assertIsNone(resolver_context.GetFileSystem(path_spec))
+    self.assertIsNone(test_cache.hit_rate)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -115,6 +115,41 @@ class PathCollectionFiltersHelperTest(shared_test_lib.BaseTestCase):
     # total 6 path specifications.
     self.assertEqual(len(path_specs), 6)
 
+  def testBuildFindSpecsWithExcludePathFilter(self):
+    """Tests the BuildFindSpecs function with an exclude path filter."""
+    test_path_filter = path_filters.PathFilter(
+        path_filters.PathFilter.FILTER_TYPE_EXCLUDE, paths=[
+            '/Windows/System32/config',
+            '/\\$Recycle\\.Bin',
+            '/Users/.+/AppData/Local/Temp',
+            '{systemroot}/Temp',
+            '/bad re (no close on that parenthesis/file'])
+
+    environment_variable = artifacts.EnvironmentVariableArtifact(
+        case_sensitive=False, name='SystemRoot', value='C:\\Windows')
+
+    test_helper = path_filters.PathCollectionFiltersHelper()
+    test_helper.BuildFindSpecs(
+        [test_path_filter], environment_variables=[environment_variable])
+
+    self.assertEqual(len(test_helper.excluded_file_system_find_specs), 4)
+    self.assertEqual(len(test_helper.included_file_system_find_specs), 0)
+
+    excluded_path_filter = test_helper.excluded_file_system_path_filter
+    self.assertEqual(excluded_path_filter.number_of_paths, 4)
+
+    for path_segments, expected_result in (
+        (['Windows', 'System32', 'config', 'SAM'], True),
+        (['WINDOWS', 'system32', 'CONFIG'], True),
+        (['Windows', 'System32', 'cmd.exe'], False),
+        (['$RECYCLE.BIN', 'S-1-5-18'], True),
+        (['Users', 'user', 'AppData', 'Local', 'Temp', 'file.tmp'], True),
+        (['Users', 'user', 'AppData', 'Local'], False),
+        (['Windows', 'Temp', 'file.tmp'], True),
+        (['bad re (no close on that parenthesis', 'file'], False)):
+      result = excluded_path_filter.CheckPathSegments(path_segments)
+      self.assertEqual(result, expected_result)
+
   def testBuildFindSpecsWithYAMLFilterFile(self):
     """Tests the BuildFindSpecs function with YAML filter file."""
     test_file_path = self._GetTestFilePath(['System.evtx'])
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the event sources processed by previous extraction sessions."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import event_sources
+from plaso.containers import sessions
+from plaso.engine import processed_sources
+from plaso.storage.fake import writer as fake_writer
+
+from tests import test_lib as shared_test_lib
+
+
+class ProcessedEventSourcesTest(shared_test_lib.BaseTestCase):
+  """Tests for the event sources processed by previous extraction sessions."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestStorageWriter(self):
+    """Creates a storage writer with processed event sources for testing.
+
+    Returns:
+      FakeStorageWriter: storage writer.
+    """
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    for location, status in (
+        ('/file1', event_sources.ProcessedEventSource.STATUS_COMPLETED),
+        ('/file2', event_sources.ProcessedEventSource.STATUS_ABANDONED),
+        ('/file3', event_sources.ProcessedEventSource.STATUS_ABANDONED),
+        ('/file3', event_sources.ProcessedEventSource.STATUS_COMPLETED)):
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=location)
+      processed_event_source = event_sources.ProcessedEventSource(
+          path_spec=path_spec, status=status)
+      processed_event_source.file_entry_identity = 'inode: 1'
+      storage_writer.AddProcessedEventSource(processed_event_source)
+
+    return storage_writer
+
+  def testGetLookupKey(self):
+    """Tests the _GetLookupKey function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/file1')
+    record_range = event_sources.RecordRangeEventSource(path_spec=path_spec)
+    record_range.first_record_index = 10
+
+    lookup_key = processed_sources.ProcessedEventSources._GetLookupKey(
+        path_spec)
+    self.assertEqual(lookup_key, path_spec.comparable)
+
+    lookup_key = processed_sources.ProcessedEventSources._GetLookupKey(
+        path_spec, record_range=record_range)
+    self.assertEqual(lookup_key, '{0:s}record_range: 10\n'.format(
+        path_spec.comparable))
+
+  def testGetFileEntryIdentity(self):
+    """Tests the GetFileEntryIdentity function."""
+    file_entry = self._GetTestFileEntry(['syslog'])
+
+    file_entry_identity = (
+        processed_sources.ProcessedEventSources.GetFileEntryIdentity(
+            file_entry))
+    self.assertTrue(file_entry_identity.startswith('inode: '))
+    self.assertIn('size: {0:d}'.format(file_entry.size), file_entry_identity)
+
+    # The identity of the same file entry is stable.
+    file_entry = self._GetTestFileEntry(['syslog'])
+    self.assertEqual(
+        processed_sources.ProcessedEventSources.GetFileEntryIdentity(
+            file_entry), file_entry_identity)
+
+  def testReadFromStorage(self):
+    """Tests the ReadFromStorage function."""
+    storage_writer = self._CreateTestStorageWriter()
+
+    test_processed_event_sources = processed_sources.ProcessedEventSources()
+    test_processed_event_sources.ReadFromStorage(storage_writer)
+
+    storage_writer.Close()
+
+    abandoned_event_sources = (
+        test_processed_event_sources.GetAbandonedEventSources())
+    self.assertEqual(len(abandoned_event_sources), 1)
+    self.assertEqual(abandoned_event_sources[0].path_spec.location, '/file2')
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/file1')
+    self.assertTrue(test_processed_event_sources.IsCompleted(
+        path_spec, 'inode: 1'))
+    self.assertFalse(test_processed_event_sources.IsCompleted(
+        path_spec, 'inode: 2'))
+    self.assertFalse(test_processed_event_sources.IsAbandoned(path_spec))
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/file2')
+    self.assertFalse(test_processed_event_sources.IsCompleted(
+        path_spec, 'inode: 1'))
+    self.assertTrue(test_processed_event_sources.IsAbandoned(path_spec))
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/file3')
+    self.assertTrue(test_processed_event_sources.IsCompleted(
+        path_spec, 'inode: 1'))
+    self.assertFalse(test_processed_event_sources.IsAbandoned(path_spec))
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/file4')
+    self.assertFalse(test_processed_event_sources.IsCompleted(
+        path_spec, 'inode: 1'))
+    self.assertFalse(test_processed_event_sources.IsAbandoned(path_spec))
+
+
+if __name__ == '__main__':
+  unittest.main()
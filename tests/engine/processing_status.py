@@ -78,6 +78,23 @@ class ProcessingStatusTest(unittest.TestCase):
 
   # pylint: disable=protected-access
 
+  def testNumberOfSkippedFileEntries(self):
+    """Tests the number_of_skipped_file_entries property."""
+    status = processing_status.ProcessingStatus()
+    self.assertEqual(status.number_of_skipped_file_entries, 0)
+
+    status.UpdateWorkerStatus(
+        'worker1', 'Idle', 12345, 2000000, 'test process', 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, number_of_skipped_file_entries=3)
+    status.UpdateWorkerStatus(
+        'worker2', 'Idle', 12346, 2000000, 'test process', 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, number_of_skipped_file_entries=2)
+    status.UpdateWorkerStatus(
+        'worker2', 'Idle', 12346, 2000000, 'test process', 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    self.assertEqual(status.number_of_skipped_file_entries, 5)
+
   def testWorkersStatus(self):
     """Tests the workers_status property."""
     status = processing_status.ProcessingStatus()
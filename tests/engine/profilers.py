@@ -4,6 +4,9 @@
 
 from __future__ import unicode_literals
 
+import gzip
+import json
+import os
 import time
 import unittest
 
@@ -116,7 +119,7 @@ class AnalyzersProfilerTest(shared_test_lib.BaseTestCase):
       for _ in range(5):
         test_profiler.StartTiming('test_profile')
         time.sleep(0.01)
-        test_profiler.StopTiming('test_profile')
+        test_profiler.StopTiming('test_profile', data_size=4096)
 
       test_profiler.Stop()
 
@@ -144,6 +147,27 @@ class ProcessingProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class ReadAheadProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the read-ahead profiler."""
+
+  def testSample(self):
+    """Tests the Sample function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.ReadAheadProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      test_profiler.Sample('test_profile', 1024, 4)
+      test_profiler.Sample('test_profile', 0, 0)
+
+      test_profiler.Stop()
+
+
 class SerializersProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the serializers CPU time profiler."""
 
@@ -191,6 +215,28 @@ class StorageProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class TaskQueueLatencyProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the task queue latency profiler."""
+
+  def testSample(self):
+    """Tests the Sample function."""
+    latency_histogram = [(1, 5), (10, 2), (float('inf'), 0)]
+
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.TaskQueueLatencyProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      test_profiler.Sample('main_task_queue', latency_histogram)
+
+      test_profiler.Stop()
+
+
 class TaskQueueProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the task queue profiler."""
 
@@ -237,5 +283,68 @@ class TasksProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class TraceProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the trace profiler."""
+
+  def testStartStop(self):
+    """Tests the Start and Stop functions."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.TraceProfiler('test', profiling_configuration)
+
+      test_profiler.Start()
+
+      task = tasks.Task()
+      test_profiler.SampleTaskStatus(task, 'created')
+
+      test_profiler.StartTiming('test_profile')
+      time.sleep(0.05)
+      test_profiler.StopTiming('test_profile')
+
+      test_profiler.SampleCounter('memory', {'used': 1024})
+
+      tasks_status = processing_status.TasksStatus()
+      test_profiler.SampleTasksStatus(tasks_status)
+
+      test_profiler.Stop()
+
+      trace_path = os.path.join(temp_directory, 'trace-test.json.gz')
+      with gzip.open(trace_path, 'rt') as file_object:
+        trace_events = json.load(file_object)
+
+    trace_events_per_phase = {}
+    for trace_event in trace_events:
+      trace_events_per_phase.setdefault(trace_event['ph'], []).append(
+          trace_event)
+
+    self.assertEqual(len(trace_events_per_phase['M']), 3)
+    self.assertEqual(len(trace_events_per_phase['i']), 1)
+    self.assertEqual(len(trace_events_per_phase['C']), 2)
+
+    trace_event = trace_events_per_phase['i'][0]
+    self.assertEqual(trace_event['name'], 'created')
+    self.assertEqual(trace_event['args'], {'task': task.identifier})
+
+    processing_events = [
+        trace_event for trace_event in trace_events_per_phase['X']
+        if trace_event['cat'] == 'processing']
+    self.assertEqual(len(processing_events), 1)
+    self.assertEqual(processing_events[0]['name'], 'test_profile')
+    self.assertGreaterEqual(processing_events[0]['dur'], 50000)
+
+    sample_events = [
+        trace_event for trace_event in trace_events_per_phase['X']
+        if trace_event['cat'] == 'sample']
+    self.assertNotEqual(sample_events, [])
+
+    sample_event_names = [
+        trace_event['name'] for trace_event in sample_events]
+    self.assertTrue(any(
+        name.startswith('testStartStop ') for name in sample_event_names))
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the snapshot file entry cache."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.engine import snapshot_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class SnapshotFileEntryCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the snapshot file entry cache."""
+
+  # pylint: disable=protected-access
+
+  def _GetFileEntry(self, location, store_index=None):
+    """Retrieves a file entry from the VSS test image.
+
+    Args:
+      location (str): location of the file entry in the NTFS file system.
+      store_index (Optional[int]): index of the VSS store, where None
+          represents the current volume.
+
+    Returns:
+      dfvfs.FileEntry: file entry.
+    """
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=path_spec)
+    if store_index is not None:
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_VSHADOW, store_index=store_index,
+          parent=path_spec)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location=location,
+        parent=path_spec)
+
+    return path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+  def testGetIdentifier(self):
+    """Tests the _GetIdentifier function."""
+    test_cache = snapshot_cache.SnapshotFileEntryCache()
+
+    file_entry = self._GetFileEntry('/another_file')
+    identifier = test_cache._GetIdentifier(file_entry)
+    self.assertIsNotNone(identifier)
+    self.assertNotIn('VSHADOW', identifier)
+
+    file_entry = self._GetFileEntry('/another_file', store_index=1)
+    self.assertEqual(test_cache._GetIdentifier(file_entry), identifier)
+
+    file_entry = self._GetFileEntry('/')
+    self.assertIsNone(test_cache._GetIdentifier(file_entry))
+
+    test_file_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    self.assertIsNone(test_cache._GetIdentifier(file_entry))
+
+  def testRegisterFileEntry(self):
+    """Tests the RegisterFileEntry function."""
+    test_cache = snapshot_cache.SnapshotFileEntryCache()
+
+    try:
+      file_entry = self._GetFileEntry('/another_file')
+      self.assertTrue(test_cache.RegisterFileEntry(file_entry))
+
+      # The owner of a file entry can register it more than once.
+      self.assertTrue(test_cache.RegisterFileEntry(file_entry))
+
+      file_entry = self._GetFileEntry('/another_file', store_index=1)
+      self.assertFalse(test_cache.RegisterFileEntry(file_entry))
+
+      # The syslog file in the first store was changed afterwards.
+      file_entry = self._GetFileEntry('/syslog', store_index=0)
+      self.assertTrue(test_cache.RegisterFileEntry(file_entry))
+
+    finally:
+      test_cache.Close()
+
+  def testRegisterFileEntryShared(self):
+    """Tests the RegisterFileEntry function with a shared database file."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'snapshot_file_entries.db')
+
+      first_cache = snapshot_cache.SnapshotFileEntryCache(path=path)
+      second_cache = snapshot_cache.SnapshotFileEntryCache(path=path)
+
+      try:
+        file_entry = self._GetFileEntry('/another_file', store_index=1)
+        self.assertTrue(first_cache.RegisterFileEntry(file_entry))
+
+        file_entry = self._GetFileEntry('/another_file')
+        self.assertFalse(second_cache.RegisterFileEntry(file_entry))
+
+      finally:
+        first_cache.Close()
+        second_cache.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
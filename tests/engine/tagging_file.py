@@ -7,9 +7,109 @@ from __future__ import unicode_literals
 import unittest
 
 from plaso.engine import tagging_file
+from plaso.filters import expression_parser
+from plaso.filters import filters
 from plaso.lib import errors
 
 from tests import test_lib as shared_test_lib
+from tests.containers import test_lib as containers_test_lib
+
+
+class TaggingRulesIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the event tagging rules index."""
+
+  # pylint: disable=protected-access
+
+  def _CompileFilter(self, filter_expression):
+    """Compiles a filter expression.
+
+    Args:
+      filter_expression (str): filter expression.
+
+    Returns:
+      Filter: filter.
+    """
+    parser = expression_parser.EventFilterExpressionParser()
+    expression = parser.Parse(filter_expression)
+    return expression.Compile()
+
+  def testGetDataTypes(self):
+    """Tests the _GetDataTypes function."""
+    tagging_rules_index = tagging_file.TaggingRulesIndex()
+
+    filter_object = self._CompileFilter(
+        'data_type is \'fs:stat\' AND filename contains \'Tasks\'')
+    data_types = tagging_rules_index._GetDataTypes(filter_object)
+    self.assertEqual(data_types, frozenset(['fs:stat']))
+
+    filter_object = self._CompileFilter(
+        '(data_type is \'fs:stat\' OR data_type is \'fs:stat:ntfs\') AND '
+        'filename contains \'Tasks\'')
+    data_types = tagging_rules_index._GetDataTypes(filter_object)
+    self.assertEqual(data_types, frozenset(['fs:stat', 'fs:stat:ntfs']))
+
+    filter_object = self._CompileFilter(
+        'data_type is \'fs:stat\' OR filename contains \'Tasks\'')
+    data_types = tagging_rules_index._GetDataTypes(filter_object)
+    self.assertIsNone(data_types)
+
+    filter_object = self._CompileFilter('data_type is not \'fs:stat\'')
+    data_types = tagging_rules_index._GetDataTypes(filter_object)
+    self.assertIsNone(data_types)
+
+  def testMergeRegularExpressions(self):
+    """Tests the _MergeRegularExpressions function."""
+    tagging_rules_index = tagging_file.TaggingRulesIndex()
+
+    filter_object = self._CompileFilter(
+        'filename regexp \'a\\.exe\' OR filename regexp \'b\\.exe\' OR '
+        'body contains \'c\'')
+    filter_object = tagging_rules_index._MergeRegularExpressions(filter_object)
+
+    self.assertIsInstance(filter_object, filters.OrFilter)
+    self.assertEqual(len(filter_object.args), 2)
+    self.assertIsInstance(filter_object.args[1], filters.Regexp)
+    self.assertEqual(
+        filter_object.args[1].compiled_re.pattern,
+        '(?:a\\.exe)|(?:b\\.exe)')
+
+  def testGetMatchingLabels(self):
+    """Tests the GetMatchingLabels function."""
+    tagging_rules_index = tagging_file.TaggingRulesIndex()
+
+    filter_object = self._CompileFilter(
+        'data_type is \'fs:stat\' AND filename regexp \'Tasks\'')
+    tagging_rules_index.AddRule('task', filter_object)
+
+    filter_object = self._CompileFilter(
+        'data_type is \'fs:stat\' AND filename regexp \'Run\'')
+    tagging_rules_index.AddRule('task', filter_object)
+
+    filter_object = self._CompileFilter('filename contains \'Windows\'')
+    tagging_rules_index.AddRule('windows', filter_object)
+
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues({
+            'data_type': 'fs:stat',
+            'filename': '/Windows/Tasks/At1.job'}))
+
+    label_names = tagging_rules_index.GetMatchingLabels(
+        event, event_data, event_data_stream)
+    self.assertEqual(label_names, ['task', 'windows'])
+
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues({
+            'data_type': 'windows:lnk:link',
+            'filename': '/Windows/Tasks/At1.job'}))
+
+    label_names = tagging_rules_index.GetMatchingLabels(
+        event, event_data, event_data_stream)
+    self.assertEqual(label_names, ['windows'])
+
+    statistics = tagging_rules_index.GetStatistics()
+    self.assertEqual(len(statistics), 2)
+    self.assertEqual(statistics[0][:2], ('task', 1))
+    self.assertEqual(statistics[1][:2], ('windows', 2))
 
 
 class TaggingFileTestCase(shared_test_lib.BaseTestCase):
@@ -36,6 +136,25 @@ class TaggingFileTestCase(shared_test_lib.BaseTestCase):
     with self.assertRaises(errors.TaggingFileError):
       tag_file.GetEventTaggingRules()
 
+  def testGetEventTaggingRulesIndex(self):
+    """Tests the GetEventTaggingRulesIndex function."""
+    test_file_path = self._GetTestFilePath(['tagging_file', 'valid.txt'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    tag_file = tagging_file.TaggingFile(test_file_path)
+
+    tagging_rules_index = tag_file.GetEventTaggingRulesIndex()
+    self.assertEqual(len(tagging_rules_index.label_names), 5)
+
+    test_file_path = self._GetTestFilePath([
+        'tagging_file', 'invalid_syntax.txt'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    tag_file = tagging_file.TaggingFile(test_file_path)
+
+    with self.assertRaises(errors.TaggingFileError):
+      tag_file.GetEventTaggingRulesIndex()
+
 
 if __name__ == '__main__':
   unittest.main()
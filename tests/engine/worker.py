@@ -5,17 +5,28 @@
 from __future__ import unicode_literals
 
 import collections
+import os
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.analyzers import hashing_analyzer
+from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import sessions
 from plaso.engine import configurations
 from plaso.engine import knowledge_base
 from plaso.engine import worker
+from plaso.filters import path_filter
 from plaso.parsers import mediator as parsers_mediator
 from plaso.storage.fake import writer as fake_writer
 
@@ -78,7 +89,7 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
   def _TestProcessPathSpec(
       self, storage_writer, path_spec, expected_event_counters,
       extraction_worker=None, knowledge_base_values=None,
-      process_archives=False):
+      maximum_number_of_records_per_task=None, process_archives=False):
     """Tests processing a path specification.
 
     Args:
@@ -89,6 +100,8 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
       extraction_worker (Optional[EventExtractorWorker]): worker to process the
           path specification. If None, a new worker will be created.
       knowledge_base_values (Optional[dict]): knowledge base values.
+      maximum_number_of_records_per_task (Optional[int]): maximum number of
+          records a parser that supports record ranges should parse at once.
       process_archives (Optional[bool]): whether archive files should be
           processed.
     """
@@ -100,6 +113,7 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     resolver_context = context.Context()
     mediator = parsers_mediator.ParserMediator(
         storage_writer, knowledge_base_object,
+        maximum_number_of_records_per_task=maximum_number_of_records_per_task,
         resolver_context=resolver_context)
 
     if not extraction_worker:
@@ -117,7 +131,13 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
       extraction_worker.ProcessPathSpec(mediator, path_spec)
       event_source = storage_writer.GetFirstWrittenEventSource()
       while event_source:
-        extraction_worker.ProcessPathSpec(mediator, event_source.path_spec)
+        record_range = None
+        if event_source.data_type == (
+            event_sources.RecordRangeEventSource.DATA_TYPE):
+          record_range = event_source
+
+        extraction_worker.ProcessPathSpec(
+            mediator, event_source.path_spec, record_range=record_range)
         event_source = storage_writer.GetNextWrittenEventSource()
 
       storage_writer.WriteSessionCompletion()
@@ -202,6 +222,60 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     event_attribute = getattr(event_data_stream, 'test_result', None)
     self.assertEqual(event_attribute, 'is_vegetable')
 
+  def testAnalyzeFileObjectConcurrently(self):
+    """Tests the _AnalyzeFileObject function with concurrent analyzers."""
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker._MINIMUM_CONCURRENT_ANALYSIS_SIZE = 0
+
+    test_hashing_analyzer = hashing_analyzer.HashingAnalyzer()
+    test_hashing_analyzer.SetHasherNames('md5')
+
+    test_analyzer = analyzers_manager_test.TestAnalyzer()
+
+    extraction_worker._analyzers = [test_hashing_analyzer, test_analyzer]
+
+    file_entry = self._GetTestFileEntry(['ímynd.dd'])
+    file_object = file_entry.GetFileObject()
+    event_data_stream = events.EventDataStream()
+
+    try:
+      extraction_worker._AnalyzeFileObject(
+          file_object, 'ímynd.dd', event_data_stream)
+    finally:
+      file_object.close()
+
+    self.assertEqual(
+        event_data_stream.md5_hash, 'd73c51f10c7ee6a681b7b619ccc6f1c4')
+
+    event_attribute = getattr(event_data_stream, 'test_result', None)
+    self.assertEqual(event_attribute, 'is_vegetable')
+
+  def testIsExcludedFileEntry(self):
+    """Tests the _IsExcludedFileEntry function."""
+    path_spec = self._GetTestFilePathSpec(['syslog'])
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    path_segments = os.path.abspath(path_spec.location).split(os.path.sep)
+
+    extraction_worker = worker.EventExtractionWorker()
+
+    excluded_path_filter = path_filter.PathFilterTrie(case_sensitive=False)
+    result = extraction_worker._IsExcludedFileEntry(
+        file_entry, excluded_path_filter)
+    self.assertFalse(result)
+
+    excluded_path_filter.AddPathSegments(['does_not_exist'])
+    result = extraction_worker._IsExcludedFileEntry(
+        file_entry, excluded_path_filter)
+    self.assertFalse(result)
+
+    # The parent directory of the file entry is excluded.
+    excluded_path_filter.AddPathSegments([
+        path_segment.upper() for path_segment in path_segments[1:-1]])
+    result = extraction_worker._IsExcludedFileEntry(
+        file_entry, excluded_path_filter)
+    self.assertTrue(result)
+
   def testProcessPathSpecFile(self):
     """Tests the ProcessPathSpec function on a file."""
     knowledge_base_values = {'year': 2016}
@@ -333,6 +407,199 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
         storage_writer, path_spec, expected_event_counters,
         knowledge_base_values=knowledge_base_values, process_archives=True)
 
+  def testGetNumberOfArchiveMembersPerTask(self):
+    """Tests the _GetNumberOfArchiveMembersPerTask function."""
+    configuration = configurations.ExtractionConfiguration()
+    configuration.maximum_archive_size_per_task = 100
+    configuration.maximum_number_of_archive_members_per_task = 10
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    members_per_task = extraction_worker._GetNumberOfArchiveMembersPerTask(
+        5, 50)
+    self.assertEqual(members_per_task, 10)
+
+    members_per_task = extraction_worker._GetNumberOfArchiveMembersPerTask(
+        5, 250)
+    self.assertEqual(members_per_task, 2)
+
+    members_per_task = extraction_worker._GetNumberOfArchiveMembersPerTask(
+        1, 250)
+    self.assertEqual(members_per_task, 1)
+
+    configuration.maximum_archive_size_per_task = None
+    configuration.maximum_number_of_archive_members_per_task = None
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    members_per_task = extraction_worker._GetNumberOfArchiveMembersPerTask(
+        5000, 250)
+    self.assertEqual(members_per_task, 5000)
+
+  def testProcessArchiveMembers(self):
+    """Tests the _ProcessArchiveMembers function."""
+    session = sessions.Session()
+
+    path_spec = self._GetTestFilePathSpec(['syslog.zip'])
+    zip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_ZIP, location='/',
+        parent=path_spec)
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.process_archives = True
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base.KnowledgeBase(),
+        resolver_context=context.Context())
+
+    member_path_specs = extraction_worker._GetArchiveMemberPathSpecs(
+        mediator, zip_path_spec)
+    self.assertEqual(len(member_path_specs), 2)
+
+    # An error in the first member does not prevent the second member from
+    # being processed.
+    extraction_worker._pending_archive_member_path_specs.extend(
+        member_path_specs)
+
+    with mock.patch.object(
+        extraction_worker, '_ProcessFileEntry',
+        side_effect=[RuntimeError('test error'), None]) as process_file_entry:
+      extraction_worker._ProcessArchiveMembers(mediator)
+
+    self.assertEqual(process_file_entry.call_count, 2)
+    self.assertEqual(
+        len(extraction_worker._pending_archive_member_path_specs), 0)
+
+    warnings = list(storage_writer.GetWarnings())
+    self.assertEqual(len(warnings), 1)
+    self.assertEqual(
+        warnings[0].message,
+        'unable to process archive member with error: test error')
+    self.assertEqual(warnings[0].path_spec, member_path_specs[0])
+
+    # The pending members are cleared when processing a member range fails.
+    record_range = event_sources.RecordRangeEventSource(path_spec=zip_path_spec)
+    record_range.first_record_index = 0
+    record_range.number_of_records = 2
+
+    with mock.patch.object(
+        extraction_worker, '_ProcessFileEntry',
+        side_effect=dfvfs_errors.CacheFullError('test error')):
+      with self.assertRaises(dfvfs_errors.CacheFullError):
+        extraction_worker.ProcessPathSpec(
+            mediator, zip_path_spec, record_range=record_range)
+
+    self.assertEqual(
+        len(extraction_worker._pending_archive_member_path_specs), 0)
+
+    storage_writer.Close()
+
+  def testProcessPathSpecArchiveMemberRanges(self):
+    """Tests the ProcessPathSpec function on archive member ranges."""
+    knowledge_base_values = {'year': 2016}
+    session = sessions.Session()
+
+    path_spec = self._GetTestFilePathSpec(['syslog.zip'])
+
+    # Typically there are 3 filestat events, but there can be 4 on platforms
+    # that support os.stat_result st_birthtime. There are 2 additional filestat
+    # events from the members of the .zip file.
+    expected_event_counters = {
+        'fs:stat': [5, 6],
+        'linux:utmp:event': 4,
+        'syslog:cron:task_run': 3,
+        'syslog:line': 9}
+
+    # The members of the archive are processed in place.
+    storage_writer = fake_writer.FakeStorageWriter(session)
+
+    self._TestProcessPathSpec(
+        storage_writer, path_spec, expected_event_counters,
+        knowledge_base_values=knowledge_base_values, process_archives=True)
+
+    self.assertEqual(storage_writer.number_of_event_sources, 0)
+
+    # The second member of the archive is processed as a member range.
+    configuration = configurations.ExtractionConfiguration()
+    configuration.maximum_number_of_archive_members_per_task = 1
+    configuration.process_archives = True
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    storage_writer = fake_writer.FakeStorageWriter(session)
+
+    self._TestProcessPathSpec(
+        storage_writer, path_spec, expected_event_counters,
+        extraction_worker=extraction_worker,
+        knowledge_base_values=knowledge_base_values)
+
+    self.assertEqual(storage_writer.number_of_event_sources, 1)
+
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base.KnowledgeBase(),
+        resolver_context=context.Context())
+    extraction_worker.ProcessPathSpec(mediator, path_spec)
+
+    event_source = storage_writer.GetFirstWrittenEventSource()
+    storage_writer.Close()
+
+    self.assertEqual(
+        event_source.data_type, event_sources.RecordRangeEventSource.DATA_TYPE)
+    self.assertEqual(
+        event_source.path_spec.type_indicator,
+        dfvfs_definitions.TYPE_INDICATOR_ZIP)
+    self.assertEqual(event_source.first_record_index, 1)
+    self.assertEqual(event_source.number_of_records, 1)
+    self.assertIsNone(event_source.parser_name)
+
+  def testProcessPathSpecRecordRanges(self):
+    """Tests the ProcessPathSpec function on a file split in record ranges."""
+    session = sessions.Session()
+
+    path_spec = self._GetTestFilePathSpec(['System.evtx'])
+    storage_writer = fake_writer.FakeStorageWriter(session)
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.hasher_names_string = 'md5'
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    # Typically there are 3 filestat events, but there can be 4 on platforms
+    # that support os.stat_result st_birthtime.
+    expected_event_counters = {
+        'fs:stat': [3, 4],
+        'windows:evtx:record': 3202}
+
+    self._TestProcessPathSpec(
+        storage_writer, path_spec, expected_event_counters,
+        extraction_worker=extraction_worker,
+        maximum_number_of_records_per_task=500)
+
+    self.assertEqual(storage_writer.number_of_event_sources, 3)
+
+    # The events of the record ranges refer to the event data stream of
+    # the file, including its digest hash.
+    for event in storage_writer.GetEvents():
+      event_data = self._GetEventDataOfEvent(storage_writer, event)
+      if event_data.data_type != 'windows:evtx:record':
+        continue
+
+      event_data_stream = self._GetEventDataStreamOfEventData(
+          storage_writer, event_data)
+      self.assertEqual(
+          event_data_stream.md5_hash, '182de19fe6a25b928a34ad59af0bbf1e')
+
   def testProcessPathSpecCompressedArchive(self):
     """Tests the ProcessPathSpec function on a compressed archive file."""
     knowledge_base_values = {'year': 2016}
@@ -400,6 +667,122 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
         storage_writer, path_spec, expected_event_counters,
         knowledge_base_values=knowledge_base_values)
 
+  def testProcessPathSpecNTFSCollectFromMFT(self):
+    """Tests the ProcessPathSpec function on NTFS collected from the $MFT."""
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=path_spec)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_NTFS, location='\\',
+        parent=path_spec)
+
+    # The sub file entries of the root directory are only produced as event
+    # sources when they were not collected from the $MFT.
+    for collect_from_mft, expected_number_of_event_sources in (
+        (False, 15), (True, 0)):
+      configuration = configurations.ExtractionConfiguration()
+      configuration.collect_from_mft = collect_from_mft
+
+      extraction_worker = worker.EventExtractionWorker()
+      extraction_worker.SetExtractionConfiguration(configuration)
+
+      session = sessions.Session()
+      storage_writer = fake_writer.FakeStorageWriter(session)
+      mediator = parsers_mediator.ParserMediator(
+          storage_writer, knowledge_base.KnowledgeBase(),
+          resolver_context=context.Context())
+
+      storage_writer.Open()
+
+      try:
+        extraction_worker.ProcessPathSpec(mediator, path_spec)
+
+        self.assertEqual(
+            storage_writer.number_of_event_sources,
+            expected_number_of_event_sources)
+
+      finally:
+        storage_writer.Close()
+
+  def testProcessPathSpecVSS(self):
+    """Tests the ProcessPathSpec function on VSS with unchanged files."""
+    knowledge_base_values = {'year': 2016}
+
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=qcow_path_spec)
+    vss_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_VSHADOW, store_index=1,
+        parent=qcow_path_spec)
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.skip_unchanged_snapshot_files = True
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    # Without skipping unchanged files the VSS store produces 433 events.
+    test_values = [
+        (qcow_path_spec, 445, 0),
+        (vss_path_spec, 404, 4)]
+
+    for (parent_path_spec, expected_number_of_events,
+         expected_number_of_skipped_file_entries) in test_values:
+      session = sessions.Session()
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+          parent=parent_path_spec)
+      storage_writer = fake_writer.FakeStorageWriter(session)
+
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, None,
+          extraction_worker=extraction_worker,
+          knowledge_base_values=knowledge_base_values)
+
+      self.assertEqual(
+          storage_writer.number_of_events, expected_number_of_events)
+      self.assertEqual(
+          extraction_worker.number_of_skipped_file_entries,
+          expected_number_of_skipped_file_entries)
+
+    extraction_worker.Close()
+
+  def testClose(self):
+    """Tests the Close function."""
+    configuration = configurations.ExtractionConfiguration()
+    configuration.skip_unchanged_snapshot_files = True
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    snapshot_file_entry_cache = extraction_worker._snapshot_file_entry_cache
+    self.assertIsNotNone(snapshot_file_entry_cache)
+    snapshot_file_entry_cache._Open()
+
+    # Replacing the configuration closes the previous cache.
+    extraction_worker.SetExtractionConfiguration(configuration)
+    self.assertIsNone(snapshot_file_entry_cache._connection)
+    self.assertIsNot(
+        extraction_worker._snapshot_file_entry_cache, snapshot_file_entry_cache)
+
+    snapshot_file_entry_cache = extraction_worker._snapshot_file_entry_cache
+    snapshot_file_entry_cache._Open()
+
+    extraction_worker.Close()
+    self.assertIsNone(snapshot_file_entry_cache._connection)
+    self.assertIsNone(extraction_worker._snapshot_file_entry_cache)
+
+    # Closing an extraction worker without cache is supported.
+    extraction_worker.Close()
+
   def testExtractionWorkerHashing(self):
     """Test that the worker sets up and runs hashing code correctly."""
     extraction_worker = worker.EventExtractionWorker()
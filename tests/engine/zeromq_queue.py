@@ -4,8 +4,10 @@
 
 from __future__ import unicode_literals
 
+import time
 import unittest
 
+from plaso.engine import plaso_queue
 from plaso.engine import zeromq_queue
 from plaso.lib import errors
 
@@ -122,6 +124,59 @@ class ZeroMQQueuesTest(shared_test_lib.BaseTestCase):
     reply_queue.Close()
     request_queue.Close()
 
+  def testRequestAndBufferedReplyQueuesWithPrefetch(self):
+    """Tests REQ and buffered REP queue pairs that transfer items in batches."""
+    reply_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+        name='prefetch_replybind', delay_open=False, linger_seconds=1)
+    request_queue = zeromq_queue.ZeroMQRequestConnectQueue(
+        name='prefetch_requestconnect', delay_open=False,
+        maximum_number_of_prefetched_items=3, port=reply_queue.port,
+        linger_seconds=1)
+
+    for index in range(4):
+      reply_queue.PushItem('item{0:d}'.format(index))
+
+    # Wait for the responder thread to buffer the items.
+    time.sleep(0.1)
+
+    popped_item = request_queue.PopItem()
+    self.assertEqual(popped_item, 'item0')
+    self.assertEqual(request_queue.GetPrefetchedItems(), ['item1', 'item2'])
+
+    popped_item = request_queue.PopItem()
+    self.assertEqual(popped_item, 'item1')
+    popped_item = request_queue.PopItem()
+    self.assertEqual(popped_item, 'item2')
+    self.assertEqual(request_queue.GetPrefetchedItems(), [])
+
+    popped_item = request_queue.PopItem()
+    self.assertEqual(popped_item, 'item3')
+
+    # A batch is ended after a QueueAbort, so that each client receives one.
+    reply_queue.PushItem(plaso_queue.QueueAbort())
+    reply_queue.PushItem(plaso_queue.QueueAbort())
+
+    time.sleep(0.1)
+
+    popped_item = request_queue.PopItem()
+    self.assertIsInstance(popped_item, plaso_queue.QueueAbort)
+    self.assertEqual(request_queue.GetPrefetchedItems(), [])
+
+    popped_item = request_queue.PopItem()
+    self.assertIsInstance(popped_item, plaso_queue.QueueAbort)
+
+    # Wait for the responder thread to update the latency histogram, which
+    # it does after sending the items.
+    time.sleep(0.1)
+
+    latency_histogram = reply_queue.GetLatencyHistogram()
+    self.assertEqual(len(latency_histogram), 15)
+    self.assertEqual(latency_histogram[-1][0], float('inf'))
+    self.assertEqual(sum(count for _, count in latency_histogram), 6)
+
+    reply_queue.Close()
+    request_queue.Close()
+
   def testEmptyBufferedQueues(self):
     """Tests the Empty method for buffered queues."""
     queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
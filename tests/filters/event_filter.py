@@ -6,15 +6,51 @@ from __future__ import unicode_literals
 
 import unittest
 
+from plaso.containers import events
 from plaso.filters import event_filter
+from plaso.lib import definitions
 from plaso.lib import errors
 
+from tests.containers import test_lib as containers_test_lib
 from tests.filters import test_lib
 
 
 class EventObjectFilterTest(test_lib.FilterTestCase):
   """Tests for the event object filter."""
 
+  # pylint: disable=protected-access
+
+  _TEST_EVENTS = [
+      {'body': 'session opened for user root',
+       'data_type': 'syslog:line',
+       'filename': '/var/log/auth.log',
+       'md5_hash': 'e3df0d2abd2c27fbdadfb41a47442520',
+       'parser': 'syslog',
+       'timestamp': '2020-04-04 14:56:39',
+       'timestamp_desc': definitions.TIME_DESCRIPTION_WRITTEN},
+      {'data_type': 'fs:stat',
+       'filename': '/Windows/System32/config/SOFTWARE',
+       'parser': 'filestat',
+       'timestamp': 0,
+       'timestamp_desc': definitions.TIME_DESCRIPTION_CREATION},
+      {'data_type': 'test:event',
+       'parser': 'test_parser',
+       'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
+
+  _TEST_FILTER_EXPRESSIONS = [
+      'parser is \'syslog\' and body contains \'root\'',
+      'parser is not \'syslog\' or body contains \'ROOT\'',
+      'date > \'2020-01-01 00:00:00\' and date < \'2021-01-01 00:00:00\'',
+      'timestamp >= 0',
+      'timestamp != 0',
+      'body not contains \'root\'',
+      'filename regexp \'^/Windows/\' or tag contains \'login\'',
+      'filename iregexp \'auth\\.log$\' and md5_hash is '
+      '\'e3df0d2abd2c27fbdadfb41a47442520\'',
+      'timestamp_desc is \'Content Modification Time\' and (parser is '
+      '\'syslog\' or parser is \'filestat\') and filename contains '
+      '\'auth\'']
+
   def testCompilerFilter(self):
     """Tests the CompileFilter function."""
     test_filter = event_filter.EventObjectFilter()
@@ -38,6 +74,42 @@ class EventObjectFilterTest(test_lib.FilterTestCase):
       test_filter.CompileFilter(
           'some_stuff is "random" and other_stuff ')
 
+  def testMatch(self):
+    """Tests the Match function."""
+    test_filter = event_filter.EventObjectFilter()
+    self.assertTrue(test_filter.Match(None, None, None, None))
+
+    event_tag = events.EventTag()
+    event_tag.AddLabel('login')
+
+    for filter_expression in self._TEST_FILTER_EXPRESSIONS:
+      test_filter.CompileFilter(filter_expression)
+
+      for event_values in self._TEST_EVENTS:
+        event, event_data, event_data_stream = (
+            containers_test_lib.CreateEventFromValues(event_values))
+
+        for test_event_tag in (None, event_tag):
+          # The compiled match function and the filter it is compiled from
+          # should match the same events.
+          expected_result = test_filter._event_filter.Matches(
+              event, event_data, event_data_stream, test_event_tag)
+          result = test_filter.Match(
+              event, event_data, event_data_stream, test_event_tag)
+          self.assertEqual(result, expected_result, msg=filter_expression)
+
+    test_filter.CompileFilter(self._TEST_FILTER_EXPRESSIONS[0])
+
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0]))
+    result = test_filter.Match(event, event_data, event_data_stream, None)
+    self.assertTrue(result)
+
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[1]))
+    result = test_filter.Match(event, event_data, event_data_stream, None)
+    self.assertFalse(result)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -6,6 +6,8 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfdatetime import posix_time as dfdatetime_posix_time
+
 from plaso.containers import events
 from plaso.filters import filters
 from plaso.lib import definitions
@@ -83,6 +85,8 @@ class FilterTest(shared_test_lib.BaseTestCase):
 class AndFilterTest(shared_test_lib.BaseTestCase):
   """Tests the boolean AND filter."""
 
+  # pylint: disable=protected-access
+
   _TEST_EVENTS = [
       {'data_type': 'test:event',
        'test_value': 1,
@@ -109,6 +113,93 @@ class AndFilterTest(shared_test_lib.BaseTestCase):
     result = filter_object.Matches(event, event_data, None, None)
     self.assertFalse(result)
 
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    false_filter_object = FalseFilter()
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.AndFilter()
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object = filters.AndFilter(arguments=[
+        true_filter_object, filters.AndFilter(arguments=[
+            true_filter_object, true_filter_object])])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object = filters.AndFilter(arguments=[
+        true_filter_object, filters.AndFilter(arguments=[
+            true_filter_object, false_filter_object])])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    # The comparison of an integer with a string, which raises TypeError, is
+    # not reached since it is evaluated in the order of the expression.
+    filter_object = filters.AndFilter(arguments=[
+        filters.Regexp(arguments=['data_type', '^other']),
+        filters.GreaterThanOperator(arguments=['test_value', 'a'])])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+  def testGetSubFilters(self):
+    """Tests the _GetSubFilters function."""
+    false_filter_object = FalseFilter()
+    true_filter_object = TrueFilter()
+    or_filter_object = filters.OrFilter(arguments=[
+        false_filter_object, true_filter_object])
+
+    filter_object = filters.AndFilter(arguments=[
+        true_filter_object, filters.AndFilter(arguments=[
+            false_filter_object, or_filter_object])])
+
+    sub_filters = filter_object._GetSubFilters()
+    self.assertEqual(sub_filters, [
+        true_filter_object, false_filter_object, or_filter_object])
+
+  def testGetSortedMatchFunctions(self):
+    """Tests the _GetSortedMatchFunctions function."""
+    regexp_filter_object = filters.Regexp(arguments=['filename', 'Windows'])
+    equals_filter_object = filters.EqualsOperator(
+        arguments=['timestamp_desc', 'Creation Time'])
+    identity_filter_object = filters.IdentityFilter()
+
+    filter_object = filters.AndFilter(arguments=[
+        regexp_filter_object, equals_filter_object, identity_filter_object])
+    self.assertEqual(filter_object.EstimateCost(), 6)
+
+    match_functions = filter_object._GetSortedMatchFunctions()
+    self.assertEqual(len(match_functions), 3)
+    self.assertEqual(match_functions[0], identity_filter_object.Matches)
+
+    # Filters that are not reorderable remain in the order of the expression.
+    false_filter_object = FalseFilter()
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.AndFilter(arguments=[
+        regexp_filter_object, true_filter_object, identity_filter_object,
+        false_filter_object])
+
+    match_functions = filter_object._GetSortedMatchFunctions()
+    self.assertEqual(len(match_functions), 4)
+    self.assertEqual(match_functions[1], true_filter_object.Matches)
+    self.assertEqual(match_functions[2], identity_filter_object.Matches)
+    self.assertEqual(match_functions[3], false_filter_object.Matches)
+
+  def testIsReorderable(self):
+    """Tests the IsReorderable function."""
+    filter_object = filters.AndFilter(arguments=[
+        filters.IdentityFilter(),
+        filters.Regexp(arguments=['filename', 'Windows'])])
+    self.assertTrue(filter_object.IsReorderable())
+
+    filter_object = filters.AndFilter(arguments=[
+        filters.IdentityFilter(), TrueFilter()])
+    self.assertFalse(filter_object.IsReorderable())
+
 
 class OrFilterTest(shared_test_lib.BaseTestCase):
   """Tests the boolean OR filter."""
@@ -139,6 +230,38 @@ class OrFilterTest(shared_test_lib.BaseTestCase):
     result = filter_object.Matches(event, event_data, None, None)
     self.assertFalse(result)
 
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    false_filter_object = FalseFilter()
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.OrFilter()
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object = filters.OrFilter(arguments=[
+        false_filter_object, filters.OrFilter(arguments=[
+            false_filter_object, true_filter_object])])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object = filters.OrFilter(arguments=[
+        false_filter_object, filters.AndFilter(arguments=[
+            true_filter_object, false_filter_object])])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    # The comparison of an integer with a string, which raises TypeError, is
+    # not reached since it is evaluated in the order of the expression.
+    filter_object = filters.OrFilter(arguments=[
+        filters.Regexp(arguments=['data_type', '^test']),
+        filters.GreaterThanOperator(arguments=['test_value', 'a'])])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
 
 class IdentityFilterTest(shared_test_lib.BaseTestCase):
   """Tests the filter which always evaluates to True."""
@@ -208,6 +331,137 @@ class GenericBinaryOperatorTest(shared_test_lib.BaseTestCase):
         'tag', event, event_data, None, event_tag)
     self.assertEqual(test_value, ['browser_search'])
 
+  def testCompileGetValueFunction(self):
+    """Tests the _CompileGetValueFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.md5_hash = 'e3df0d2abd2c27fbdadfb41a47442520'
+
+    event_tag = events.EventTag()
+    event_tag.AddLabel('browser_search')
+
+    filter_object = filters.GenericBinaryOperator(arguments=['test_value', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertEqual(test_value, 1)
+
+    filter_object = filters.GenericBinaryOperator(arguments=['timestamp', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertIsNotNone(test_value)
+    self.assertEqual(test_value.timestamp, 5134324321)
+
+    filter_object = filters.GenericBinaryOperator(arguments=['md5_hash', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertEqual(test_value, 'e3df0d2abd2c27fbdadfb41a47442520')
+
+    # Attributes of the event data stream fall back to the event data.
+    event_data.md5_hash = '0123456789abcdef0123456789abcdef'
+    test_value = get_value_function(event, event_data, None, event_tag)
+    self.assertEqual(test_value, '0123456789abcdef0123456789abcdef')
+
+    # Attributes that are not known in advance are also retrieved from
+    # the event data stream.
+    event_data_stream.test_hash = 'test'
+
+    filter_object = filters.GenericBinaryOperator(arguments=['test_hash', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertEqual(test_value, 'test')
+
+    test_value = get_value_function(event, event_data, None, event_tag)
+    self.assertIsNone(test_value)
+
+    filter_object = filters.GenericBinaryOperator(arguments=['tag', 1])
+    get_value_function = filter_object._CompileGetValueFunction()
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertEqual(test_value, ['browser_search'])
+
+  def testCompileTimestampMatchFunction(self):
+    """Tests the _CompileTimestampMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+        timestamp=5134324321)
+
+    filter_object = filters.GreaterEqualOperator(
+        arguments=['timestamp', date_time])
+    match_function = filter_object._CompileTimestampMatchFunction()
+    self.assertIsNotNone(match_function)
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object.FlipBool()
+    match_function = filter_object._CompileTimestampMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    # An event without a timestamp is compared as a date and time object.
+    event.timestamp = None
+    self.assertEqual(
+        match_function(event, event_data, None, None),
+        filter_object.Matches(event, event_data, None, None))
+
+    filter_object = filters.GreaterEqualOperator(
+        arguments=['test_value', date_time])
+    match_function = filter_object._CompileTimestampMatchFunction()
+    self.assertIsNone(match_function)
+
+    filter_object = filters.Contains(arguments=['timestamp', date_time])
+    match_function = filter_object._CompileTimestampMatchFunction()
+    self.assertIsNone(match_function)
+
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    filter_object = filters.EqualsOperator(arguments=['test_value', 1])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object.FlipBool()
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    filter_object = filters.EqualsOperator(arguments=['missing_value', 1])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    filter_object.FlipBool()
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+  def testEstimateCost(self):
+    """Tests the EstimateCost function."""
+    filter_object = filters.EqualsOperator(arguments=['timestamp_desc', 1])
+    self.assertEqual(filter_object.EstimateCost(), 1)
+
+    filter_object = filters.EqualsOperator(arguments=['test_value', 1])
+    self.assertEqual(filter_object.EstimateCost(), 2)
+
+  def testIsReorderable(self):
+    """Tests the IsReorderable function."""
+    filter_object = filters.EqualsOperator(arguments=['test_value', 1])
+    self.assertTrue(filter_object.IsReorderable())
+
+    filter_object = filters.GreaterEqualOperator(arguments=['test_value', 1])
+    self.assertFalse(filter_object.IsReorderable())
+
+    date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+        timestamp=5134324321)
+
+    filter_object = filters.GreaterEqualOperator(
+        arguments=['timestamp', date_time])
+    self.assertTrue(filter_object.IsReorderable())
+
   # TODO: add tests for FlipBool function
 
 
@@ -319,10 +573,82 @@ class GreaterEqualOperatorTest(shared_test_lib.BaseTestCase):
     self.assertTrue(result)
 
 
-# TODO: add tests for Contains
+class ContainsTest(shared_test_lib.BaseTestCase):
+  """Tests the contains operator."""
+
+  # pylint: disable=protected-access
+
+  def testCompareValue(self):
+    """Tests the _CompareValue function."""
+    filter_object = filters.Contains(arguments=['first', 'second'])
+
+    result = filter_object._CompareValue('Some Value', 'value')
+    self.assertTrue(result)
+
+    result = filter_object._CompareValue('Some Value', 1)
+    self.assertFalse(result)
+
+  def testCompileCompareValueFunction(self):
+    """Tests the _CompileCompareValueFunction function."""
+    filter_object = filters.Contains(arguments=['first', 'Value'])
+    compare_value_function = filter_object._CompileCompareValueFunction()
+
+    self.assertTrue(compare_value_function('some value'))
+    self.assertFalse(compare_value_function('some other'))
+    self.assertTrue(compare_value_function(['Value']))
+    self.assertFalse(compare_value_function(1))
+
+    filter_object = filters.Contains(arguments=['first', 1])
+    compare_value_function = filter_object._CompileCompareValueFunction()
+
+    self.assertFalse(compare_value_function('1'))
+    self.assertTrue(compare_value_function([1, 2]))
+
+
 # TODO: add tests for InSet
-# TODO: add tests for Regexp
-# TODO: add tests for RegexpInsensitive
+
+
+class RegexpTest(shared_test_lib.BaseTestCase):
+  """Tests the regular expression operator."""
+
+  # pylint: disable=protected-access
+
+  def testCompareValue(self):
+    """Tests the _CompareValue function."""
+    filter_object = filters.Regexp(arguments=['first', '^Some'])
+
+    result = filter_object._CompareValue('Some value', None)
+    self.assertTrue(result)
+
+    result = filter_object._CompareValue('some value', None)
+    self.assertFalse(result)
+
+  def testCompileCompareValueFunction(self):
+    """Tests the _CompileCompareValueFunction function."""
+    filter_object = filters.Regexp(arguments=['first', '^1[0-9]'])
+    compare_value_function = filter_object._CompileCompareValueFunction()
+
+    self.assertTrue(compare_value_function('12 value'))
+    self.assertFalse(compare_value_function('value'))
+    self.assertTrue(compare_value_function(12))
+    self.assertTrue(compare_value_function(b'12'))
+    self.assertTrue(compare_value_function(['1', '2']))
+    self.assertFalse(compare_value_function(1.2))
+
+
+class RegexpInsensitiveTest(shared_test_lib.BaseTestCase):
+  """Tests the case insensitive regular expression operator."""
+
+  # pylint: disable=protected-access
+
+  def testCompileCompareValueFunction(self):
+    """Tests the _CompileCompareValueFunction function."""
+    filter_object = filters.RegexpInsensitive(arguments=['first', '^Some'])
+    compare_value_function = filter_object._CompileCompareValueFunction()
+
+    self.assertTrue(compare_value_function('Some value'))
+    self.assertTrue(compare_value_function('some value'))
+    self.assertFalse(compare_value_function('value'))
 
 
 if __name__ == "__main__":
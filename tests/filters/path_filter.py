@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Tests for the scan tree-based path filter."""
+"""Tests for the scan tree and trie-based path filters."""
 
 from __future__ import unicode_literals
 
@@ -115,5 +115,72 @@ class PathFilterScanTreeTest(test_lib.FilterTestCase):
     self.assertTrue(scan_tree.CheckPath(path, path_segment_separator='/'))
 
 
+class PathFilterTrieTest(test_lib.FilterTestCase):
+  """Tests for the path filter trie."""
+
+  # pylint: disable=protected-access
+
+  def testAddPathSegments(self):
+    """Tests the AddPathSegments function."""
+    trie = path_filter.PathFilterTrie(case_sensitive=False)
+    self.assertEqual(trie.number_of_paths, 0)
+
+    trie.AddPathSegments(['Windows', 'System32', 'config'])
+    trie.AddPathSegments(['Windows', 'Temp'])
+    trie.AddPathSegments(['\\$Recycle\\.Bin'])
+    trie.AddPathSegments(['Users', '.+', 'NTUSER\\.DAT'])
+    trie.AddPathSegments(['Users', '.+', 'AppData'])
+    self.assertEqual(trie.number_of_paths, 5)
+
+    # Path segments without special characters are stored as literals.
+    self.assertEqual(
+        sorted(trie._root_node._literal_sub_nodes.keys()),
+        ['$recycle.bin', 'users', 'windows'])
+    self.assertEqual(len(trie._root_node._regular_expression_sub_nodes), 0)
+
+    sub_node = trie._root_node._literal_sub_nodes['users']
+    self.assertEqual(len(sub_node._literal_sub_nodes), 0)
+    self.assertEqual(len(sub_node._regular_expression_sub_nodes), 1)
+
+    with self.assertRaises(ValueError):
+      trie.AddPathSegments([])
+
+    with self.assertRaises(ValueError):
+      trie.AddPathSegments(['bad re (no close on that parenthesis'])
+
+  def testCheckPathSegments(self):
+    """Tests the CheckPathSegments function."""
+    trie = path_filter.PathFilterTrie(case_sensitive=False)
+    self.assertFalse(trie.CheckPathSegments(['Windows']))
+
+    trie.AddPathSegments(['Windows', 'System32', 'config'])
+    trie.AddPathSegments(['\\$Recycle\\.Bin'])
+    trie.AddPathSegments(['Users', '.+', 'AppData'])
+    trie.AddPathSegments(['Users', 'Public'])
+
+    self.assertTrue(trie.CheckPathSegments(['Windows', 'System32', 'config']))
+    self.assertTrue(trie.CheckPathSegments(
+        ['WINDOWS', 'system32', 'CONFIG', 'SAM']))
+    self.assertFalse(trie.CheckPathSegments(['Windows', 'System32']))
+    self.assertFalse(trie.CheckPathSegments(['Windows', 'System32', 'cmd.exe']))
+
+    self.assertTrue(trie.CheckPathSegments(['$RECYCLE.BIN']))
+    self.assertFalse(trie.CheckPathSegments(['$RecycleXBin']))
+
+    self.assertTrue(trie.CheckPathSegments(['Users', 'user', 'AppData']))
+    self.assertTrue(trie.CheckPathSegments(['Users', 'Public', 'Desktop']))
+    self.assertFalse(trie.CheckPathSegments(['Users', 'user', 'Desktop']))
+    self.assertFalse(trie.CheckPathSegments([]))
+
+    trie = path_filter.PathFilterTrie(case_sensitive=True)
+    trie.AddPathSegments(['Windows', 'System32', 'config'])
+    trie.AddPathSegments(['Users', '[a-z]+'])
+
+    self.assertTrue(trie.CheckPathSegments(['Windows', 'System32', 'config']))
+    self.assertFalse(trie.CheckPathSegments(['WINDOWS', 'System32', 'config']))
+    self.assertTrue(trie.CheckPathSegments(['Users', 'user']))
+    self.assertFalse(trie.CheckPathSegments(['Users', 'USER']))
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests the event source queue."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import event_sources
+from plaso.multi_processing import event_source_queue
+
+from tests import test_lib as shared_test_lib
+
+
+class EventSourceQueueTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source queue."""
+
+  def _CreateEventSources(self, number_of_event_sources):
+    """Creates event sources for testing.
+
+    Args:
+      number_of_event_sources (int): number of event sources to create.
+
+    Returns:
+      list[EventSource]: event sources.
+    """
+    test_event_sources = []
+    for index in range(number_of_event_sources):
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS,
+          location='/file{0:d}'.format(index))
+      test_event_sources.append(
+          event_sources.FileEntryEventSource(path_spec=path_spec))
+
+    return test_event_sources
+
+  def testPushAndPopEventSource(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    test_queue = event_source_queue.EventSourceQueue()
+
+    self.assertEqual(len(test_queue), 0)
+    self.assertIsNone(test_queue.PopEventSource())
+
+    for event_source in self._CreateEventSources(5):
+      test_queue.PushEventSource(event_source)
+
+    self.assertEqual(len(test_queue), 5)
+    self.assertEqual(test_queue.number_of_spilled_event_sources, 0)
+
+    event_source = test_queue.PopEventSource()
+    self.assertEqual(event_source.path_spec.location, '/file0')
+    self.assertEqual(len(test_queue), 4)
+
+    test_queue.Close()
+    self.assertEqual(len(test_queue), 0)
+
+  def testPushAndPopEventSourceWithSpill(self):
+    """Tests the PushEventSource and PopEventSource functions with spilling."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_queue = event_source_queue.EventSourceQueue(
+          maximum_number_of_items=3, temporary_directory=temp_directory)
+
+      for event_source in self._CreateEventSources(8):
+        test_queue.PushEventSource(event_source)
+
+      self.assertEqual(len(test_queue), 8)
+      self.assertEqual(test_queue.number_of_spilled_event_sources, 5)
+
+      locations = []
+      for _ in range(4):
+        event_source = test_queue.PopEventSource()
+        locations.append(event_source.path_spec.location)
+
+      # Event sources pushed after spilling started must stay in order.
+      for event_source in self._CreateEventSources(10)[8:]:
+        test_queue.PushEventSource(event_source)
+
+      event_source = test_queue.PopEventSource()
+      while event_source:
+        locations.append(event_source.path_spec.location)
+        event_source = test_queue.PopEventSource()
+
+      expected_locations = ['/file{0:d}'.format(index) for index in range(10)]
+      self.assertEqual(locations, expected_locations)
+
+      self.assertEqual(len(test_queue), 0)
+      self.assertEqual(test_queue.number_of_spilled_event_sources, 0)
+
+      test_queue.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -5,12 +5,14 @@
 from __future__ import unicode_literals
 
 import codecs
+import multiprocessing
 import os
 import shutil
 import unittest
 
 from plaso.analysis import interface as analysis_interface
 from plaso.analysis import tagging
+from plaso.containers import reports
 from plaso.containers import sessions
 from plaso.engine import configurations
 from plaso.engine import knowledge_base
@@ -65,6 +67,79 @@ class TestAnalysisPlugin(analysis_interface.AnalysisPlugin):
     return
 
 
+class TestEventCountingAnalysisPlugin(analysis_interface.AnalysisPlugin):
+  """Analysis plugin for testing that counts the events it examines."""
+
+  NAME = 'test_event_counting'
+
+  _SUPPORTED_EVENT_DATA_TYPES = frozenset(['test:event'])
+
+  def __init__(self):
+    """Initializes an analysis plugin."""
+    super(TestEventCountingAnalysisPlugin, self).__init__()
+    self._number_of_events = 0
+
+  def CompileReport(self, mediator):
+    """Compiles a report of the analysis.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+
+    Returns:
+      AnalysisReport: report, which contains the number of examined events.
+    """
+    return reports.AnalysisReport(
+        plugin_name=self.NAME, text='{0:d}'.format(self._number_of_events))
+
+  def ExamineEvent(self, mediator, event, event_data, event_data_stream):
+    """Analyzes an event object.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+    """
+    self._number_of_events += 1
+
+
+class TestExportProcess(object):
+  """Export process for testing.
+
+  Attributes:
+    number_of_exported_events (multiprocessing.Value): number of exported
+        events.
+  """
+
+  def __init__(self, is_alive):
+    """Initializes an export process.
+
+    Args:
+      is_alive (bool): value to return from is_alive.
+    """
+    super(TestExportProcess, self).__init__()
+    self._is_alive = is_alive
+    self.number_of_exported_events = multiprocessing.Value('Q', 0)
+
+  def is_alive(self):
+    """Determines if the process is alive.
+
+    Returns:
+      bool: True if the process is alive, False otherwise.
+    """
+    return self._is_alive
+
+  def join(self, timeout=None):  # pylint: disable=unused-argument
+    """Waits for the process to stop.
+
+    Args:
+      timeout (Optional[float]): number of seconds to wait.
+    """
+    return
+
+
 class TestOutputModule(output_interface.OutputModule):
   """Output module for testing.
 
@@ -276,11 +351,13 @@ class PsortMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
        'timestamp': 5134024321,
        'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
 
-  def _CreateTestStorageFile(self, path):
+  def _CreateTestStorageFile(self, path, test_events=None):
     """Creates a storage file for testing.
 
     Args:
       path (str): path.
+      test_events (Optional[list[dict[str, object]]]): values of the events
+          to store, where None represents the default test events.
     """
     storage_file = storage_factory.StorageFactory.CreateStorageFile(
         definitions.DEFAULT_STORAGE_FORMAT)
@@ -289,7 +366,8 @@ class PsortMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
     # TODO: add preprocessing information.
 
     for event, event_data, event_data_stream in (
-        containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+        containers_test_lib.CreateEventsFromValues(
+            test_events or self._TEST_EVENTS)):
       storage_file.AddEventDataStream(event_data_stream)
 
       event_data.SetEventDataStreamIdentifier(event_data_stream.GetIdentifier())
@@ -449,6 +527,43 @@ class PsortMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
     self.assertEqual(len(output_module.events), 15)
     self.assertEqual(len(output_module.macb_groups), 3)
 
+  def testInternalGetExportTimeRanges(self):
+    """Tests the _GetExportTimeRanges function."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        test_file_path)
+
+    test_engine = psort.PsortMultiProcessEngine()
+
+    time_ranges = test_engine._GetExportTimeRanges(storage_reader, 1)
+    self.assertEqual(len(time_ranges), 1)
+    self.assertEqual(time_ranges[0].start_timestamp, 1327218753000000)
+    self.assertEqual(time_ranges[0].end_timestamp, 1585982381000000)
+
+    time_ranges = test_engine._GetExportTimeRanges(storage_reader, 4)
+    self.assertEqual(len(time_ranges), 4)
+    self.assertEqual(time_ranges[0].start_timestamp, 1327218753000000)
+    self.assertEqual(time_ranges[0].end_timestamp, 1327218840999999)
+    self.assertEqual(time_ranges[1].start_timestamp, 1327218841000000)
+    self.assertEqual(time_ranges[3].end_timestamp, 1585982381000000)
+
+    storage_reader.Close()
+
+  def testJoinExportProcess(self):
+    """Tests the _JoinExportProcess function."""
+    test_engine = psort.PsortMultiProcessEngine(worker_timeout=0.1)
+    test_engine._PROCESS_JOIN_TIMEOUT = 0.01
+
+    process = TestExportProcess(False)
+    self.assertTrue(test_engine._JoinExportProcess(process))
+
+    # An export process that does not export events is not waited for
+    # after the worker timeout.
+    process = TestExportProcess(True)
+    self.assertFalse(test_engine._JoinExportProcess(process))
+
   # TODO: add test for _FlushExportBuffer.
   # TODO: add test for _StartAnalysisProcesses.
   # TODO: add test for _StatusUpdateThreadMain.
@@ -513,6 +628,50 @@ class PsortMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
 
     # TODO: add bogus data location test.
 
+  def testAnalyzeEventsInBatches(self):
+    """Tests the AnalyzeEvents function with multiple event batches."""
+    session = sessions.Session()
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+
+    # More than 2 batches of supported events, where the last batch is only
+    # partially filled, and events the plugin does not support.
+    test_events = []
+    for index in range(300):
+      test_events.append({
+          'data_type': 'test:other' if index % 10 == 9 else 'test:event',
+          'timestamp': 5134324321 + index,
+          'timestamp_desc': definitions.TIME_DESCRIPTION_WRITTEN})
+
+    analysis_plugin = TestEventCountingAnalysisPlugin()
+    analysis_plugins = {analysis_plugin.NAME: analysis_plugin}
+
+    configuration = configurations.ProcessingConfiguration()
+
+    test_engine = psort.PsortMultiProcessEngine()
+    self.assertGreater(270, 2 * test_engine._EVENT_QUEUE_BATCH_SIZE)
+    self.assertNotEqual(270 % test_engine._EVENT_QUEUE_BATCH_SIZE, 0)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file, test_events=test_events)
+
+      storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+          definitions.DEFAULT_STORAGE_FORMAT, session, temp_file)
+
+      test_engine.AnalyzeEvents(
+          knowledge_base_object, storage_writer, None, analysis_plugins,
+          configuration)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              temp_file))
+      analysis_reports = list(storage_reader.GetAnalysisReports())
+      storage_reader.Close()
+
+    self.assertEqual(len(analysis_reports), 1)
+    self.assertEqual(analysis_reports[0].plugin_name, analysis_plugin.NAME)
+    self.assertEqual(analysis_reports[0].text, '270')
+
   def testExportEvents(self):
     """Tests the ExportEvents function."""
     test_file_path = self._GetTestFilePath(['psort_test.plaso'])
@@ -566,6 +725,57 @@ class PsortMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
         'repeated')
     self.assertEqual(lines[14], expected_line)
 
+  def testExportEventsInParallel(self):
+    """Tests the ExportEvents function with multiple export processes."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    formatters_manager.FormattersManager.Reset()
+    formatters_directory_path = self._GetDataFilePath(['formatters'])
+    formatters_manager.FormattersManager.ReadFormattersFromDirectory(
+        formatters_directory_path)
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.storage_file_path = test_file_path
+
+    outputs = []
+    for number_of_export_processes in (0, 4):
+      configuration.number_of_export_processes = number_of_export_processes
+
+      knowledge_base_object = knowledge_base.KnowledgeBase()
+      output_writer = cli_test_lib.TestBinaryOutputWriter()
+
+      formatter_mediator = formatters_mediator.FormatterMediator()
+      formatter_mediator.SetPreferredLanguageIdentifier('en-US')
+
+      output_mediator_object = output_mediator.OutputMediator(
+          knowledge_base_object, formatter_mediator,
+          data_location=shared_test_lib.TEST_DATA_PATH)
+
+      output_module = dynamic.DynamicOutputModule(output_mediator_object)
+      output_module.SetOutputWriter(output_writer)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              test_file_path))
+
+      test_engine = psort.PsortMultiProcessEngine()
+      test_engine._MINIMUM_NUMBER_OF_EVENTS_PER_EXPORT_PROCESS = 1
+
+      test_engine.ExportEvents(
+          knowledge_base_object, storage_reader, output_module, configuration)
+
+      storage_reader.Close()
+
+      events_status = test_engine._processing_status.events_status
+      self.assertEqual(events_status.number_of_duplicate_events, 18)
+
+      outputs.append(output_writer.ReadOutput())
+
+    # The output of the export processes is the same as the output of
+    # the engine process.
+    self.assertEqual(outputs[1], outputs[0])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -7,23 +7,303 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+try:
+  import mock  # pylint: disable=import-error
+except ImportError:
+  from unittest import mock
+
 from artifacts import reader as artifacts_reader
 from artifacts import registry as artifacts_registry
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import event_sources
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.lib import definitions
 from plaso.engine import configurations
+from plaso.multi_processing import event_source_queue
 from plaso.multi_processing import task_engine
+from plaso.storage import identifiers
+from plaso.storage.fake import writer as fake_writer
 from plaso.storage.sqlite import writer as sqlite_writer
 
 from tests import test_lib as shared_test_lib
 
 
+class _TestProcess(object):
+  """Process for testing.
+
+  Attributes:
+    name (str): name of the process.
+  """
+
+  def __init__(self, name):
+    """Initializes a process for testing.
+
+    Args:
+      name (str): name of the process.
+    """
+    super(_TestProcess, self).__init__()
+    self.name = name
+
+
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source heap."""
+
+  # pylint: disable=protected-access
+
+  def _CreateEventSource(self, store_index, location):
+    """Creates an event source of a file entry in a VSS test image.
+
+    Args:
+      store_index (int): index of the VSS store.
+      location (str): location of the file entry.
+
+    Returns:
+      FileEntryEventSource: event source.
+    """
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/vsstest.qcow2')
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=path_spec)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_VSHADOW, store_index=store_index,
+        parent=path_spec)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location=location,
+        parent=path_spec)
+
+    event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+    event_source.file_entry_type = dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+    return event_source
+
+  def testPushAndPopEventSource(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    event_source_heap = task_engine._EventSourceHeap()
+
+    self.assertIsNone(event_source_heap.PopEventSource())
+
+    for location in ('/file1', '/file2'):
+      for store_index in (1, 0):
+        event_source_heap.PushEventSource(
+            self._CreateEventSource(store_index, location))
+
+    # Event sources of the same file system are popped consecutively.
+    store_indexes = []
+    for _ in range(4):
+      event_source = event_source_heap.PopEventSource()
+      store_indexes.append(event_source.path_spec.parent.store_index)
+
+    self.assertEqual(store_indexes, [0, 0, 1, 1])
+    self.assertIsNone(event_source_heap.PopEventSource())
+
+
+class MergedEventsCollectorTest(shared_test_lib.BaseTestCase):
+  """Tests for the merged events collector."""
+
+  # pylint: disable=protected-access
+
+  def testPopEvents(self):
+    """Tests the CollectAttributeContainer and PopEvents functions."""
+    collector = task_engine._MergedEventsCollector()
+
+    event_data_stream = events.EventDataStream()
+    event_data = events.EventData()
+    event = events.EventObject()
+    event_without_event_data = events.EventObject()
+
+    for container in (
+        event_data_stream, event_data, event, event_without_event_data):
+      collector.CollectAttributeContainer(None, container)
+
+    # Set the identifiers as if the containers were added to the session
+    # storage.
+    event_data_stream_identifier = identifiers.SQLTableIdentifier(
+        'event_data_stream', 1)
+    event_data_stream.SetIdentifier(event_data_stream_identifier)
+
+    event_data_identifier = identifiers.SQLTableIdentifier('event_data', 1)
+    event_data.SetIdentifier(event_data_identifier)
+    event_data.SetEventDataStreamIdentifier(event_data_stream_identifier)
+
+    event.SetIdentifier(identifiers.SQLTableIdentifier('event', 1))
+    event.SetEventDataIdentifier(event_data_identifier)
+
+    event_without_event_data.SetIdentifier(
+        identifiers.SQLTableIdentifier('event', 2))
+
+    merged_events = list(collector.PopEvents())
+    self.assertEqual(merged_events, [(event, event_data, event_data_stream)])
+
+    merged_events = list(collector.PopEvents())
+    self.assertEqual(merged_events, [])
+
+
 class TaskMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task multi-process engine."""
 
+  # pylint: disable=protected-access
+
+  def testAbandonPrefetchedTasks(self):
+    """Tests the _AbandonPrefetchedTasks function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    task = test_engine._task_manager.CreateTask('test_session')
+    test_engine._prefetched_task_identifiers_per_pid[1] = [
+        task.identifier, 'bogus']
+
+    test_engine._AbandonPrefetchedTasks(1)
+
+    self.assertNotIn(1, test_engine._prefetched_task_identifiers_per_pid)
+
+    abandoned_tasks = test_engine._task_manager.GetFailedTasks()
+    self.assertEqual(abandoned_tasks, [task])
+
+  def testLogFileSystemCacheStatistics(self):
+    """Tests the _LogFileSystemCacheStatistics function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    test_engine._file_system_cache_statistics_per_process = {
+        'Worker_00': (9, 1), 'Worker_01': (5, 5)}
+
+    with mock.patch.object(task_engine.logger, 'info') as mock_info:
+      test_engine._LogFileSystemCacheStatistics()
+
+    mock_info.assert_called_once_with(
+        'File system cache hits: 14, misses: 6, hit rate: 70.0%.')
+
+  def testCollectEventSources(self):
+    """Tests the _CollectEventSources function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+    test_engine._event_source_queue = event_source_queue.EventSourceQueue()
+
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.Open()
+
+    path_specs = [
+        path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS,
+            location='/file{0:d}'.format(index))
+        for index in range(150)]
+    path_spec_generator = iter(path_specs)
+
+    result = test_engine._CollectEventSources(
+        storage_writer, path_spec_generator)
+    self.assertTrue(result)
+    self.assertEqual(storage_writer.number_of_event_sources, 100)
+    self.assertEqual(test_engine._number_of_produced_sources, 100)
+
+    result = test_engine._CollectEventSources(
+        storage_writer, path_spec_generator)
+    self.assertFalse(result)
+    self.assertEqual(storage_writer.number_of_event_sources, 150)
+
+    event_source = storage_writer.GetFirstWrittenEventSource()
+    self.assertEqual(event_source.path_spec.location, '/file0')
+
+    self.assertEqual(len(test_engine._event_source_queue), 150)
+
+    event_source = test_engine._event_source_queue.PopEventSource()
+    self.assertEqual(event_source.path_spec.location, '/file0')
+
+    storage_writer.Close()
+
+    test_engine._event_source_queue.Close()
+
+  def testCollectEventSourcesWithoutStorage(self):
+    """Tests the _CollectEventSources function without storing sources."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+    test_engine._event_source_queue = event_source_queue.EventSourceQueue()
+
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.SetStoreEventSources(False)
+    storage_writer.Open()
+
+    path_specs = [
+        path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS,
+            location='/file{0:d}'.format(index))
+        for index in range(10)]
+
+    result = test_engine._CollectEventSources(storage_writer, iter(path_specs))
+    self.assertFalse(result)
+    self.assertEqual(storage_writer.number_of_event_sources, 10)
+    self.assertIsNone(storage_writer.GetFirstWrittenEventSource())
+    self.assertEqual(len(test_engine._event_source_queue), 10)
+
+    storage_writer.Close()
+
+    test_engine._event_source_queue.Close()
+
+  def testCollectMergedAttributeContainer(self):
+    """Tests the _CollectMergedAttributeContainer function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+    test_engine._event_source_queue = event_source_queue.EventSourceQueue()
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/file')
+    event_source = event_sources.FileEntryEventSource(path_spec=path_spec)
+
+    test_engine._CollectMergedAttributeContainer(None, events.EventData())
+    test_engine._CollectMergedAttributeContainer(None, event_source)
+
+    self.assertEqual(len(test_engine._event_source_queue), 1)
+    self.assertEqual(
+        test_engine._event_source_queue.PopEventSource(), event_source)
+
+    test_engine._event_source_queue.Close()
+
+  def testGetParserName(self):
+    """Tests the _GetParserName function."""
+    test_engine = task_engine.TaskMultiProcessEngine()
+
+    parser_name = test_engine._GetParserName('sqlite/chrome_27_history')
+    self.assertEqual(parser_name, 'sqlite')
+
+    parser_name = test_engine._GetParserName('winevtx')
+    self.assertEqual(parser_name, 'winevtx')
+
+    parser_name = test_engine._GetParserName('')
+    self.assertIsNone(parser_name)
+
+  def testGetWorkerMemoryLimit(self):
+    """Tests the _GetWorkerMemoryLimit function."""
+    test_engine = task_engine.TaskMultiProcessEngine(
+        high_memory_worker_memory_limit=4096, worker_memory_limit=1024)
+
+    test_engine._processes_per_pid[1] = _TestProcess('Worker_00')
+    test_engine._processes_per_pid[2] = _TestProcess('HighMemoryWorker_00')
+    test_engine._high_memory_worker_process_names.add('HighMemoryWorker_00')
+
+    self.assertEqual(test_engine._GetWorkerMemoryLimit(1), 1024)
+    self.assertEqual(test_engine._GetWorkerMemoryLimit(2), 4096)
+
+  def testHandleWorkerMemoryLimitExceeded(self):
+    """Tests the _HandleWorkerMemoryLimitExceeded function."""
+    test_engine = task_engine.TaskMultiProcessEngine(
+        number_of_high_memory_worker_processes=1)
+
+    task = test_engine._task_manager.CreateTask('test_session')
+    test_engine._task_manager.UpdateTaskAsProcessingByIdentifier(
+        task.identifier)
+
+    process_status = {
+        'parser_chain': 'winevtx',
+        'task_identifier': task.identifier}
+
+    with mock.patch.object(test_engine, '_KillProcess') as kill_process:
+      test_engine._HandleWorkerMemoryLimitExceeded(1, process_status)
+      kill_process.assert_called_once_with(1)
+
+    self.assertIn('winevtx', test_engine._memory_intensive_parsers)
+    self.assertTrue(task.requires_high_memory)
+
+    abandoned_tasks = test_engine._task_manager.GetFailedTasks()
+    self.assertEqual(abandoned_tasks, [task])
+
   def testProcessSources(self):
     """Tests the PreprocessSources and ProcessSources function."""
     artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
@@ -693,10 +693,54 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(len(manager._tasks_pending_merge), 0)
     self.assertEqual(len(manager._tasks_abandoned), 0)
 
+  def testRestoreAbandonedTask(self):
+    """Tests the RestoreAbandonedTask function."""
+    manager = task_manager.TaskManager()
+
+    task = tasks.Task(session_identifier=self._TEST_SESSION_IDENTIFIER)
+    manager.RestoreAbandonedTask(task)
+
+    self.assertEqual(len(manager._tasks_queued), 0)
+    self.assertEqual(len(manager._tasks_abandoned), 1)
+
+    self.assertEqual(manager._total_number_of_tasks, 1)
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+    self.assertTrue(task.has_retry)
+
+    self.assertEqual(len(manager._tasks_queued), 1)
+    self.assertEqual(manager._total_number_of_tasks, 2)
+
   # TODO: add tests for SampleTaskStatus
   # TODO: add tests for StartProfiling
   # TODO: add tests for StopProfiling
 
+  def testUpdateTaskAsAbandonedByIdentifier(self):
+    """Tests the UpdateTaskAsAbandonedByIdentifier function."""
+    manager = task_manager.TaskManager()
+
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    manager.UpdateTaskAsProcessingByIdentifier(task.identifier)
+
+    self.assertEqual(len(manager._tasks_processing), 1)
+    self.assertEqual(len(manager._tasks_abandoned), 0)
+
+    abandoned_task = manager.UpdateTaskAsAbandonedByIdentifier(
+        task.identifier)
+    self.assertEqual(abandoned_task, task)
+
+    self.assertEqual(len(manager._tasks_queued), 0)
+    self.assertEqual(len(manager._tasks_processing), 0)
+    self.assertEqual(len(manager._tasks_abandoned), 1)
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+    self.assertEqual(retry_task.path_spec, task.path_spec)
+
+    with self.assertRaises(KeyError):
+      manager.UpdateTaskAsAbandonedByIdentifier(task.identifier)
+
   def testUpdateTaskAsPendingMerge(self):
     """Tests the UpdateTaskAsPendingMerge function."""
     manager = task_manager.TaskManager()
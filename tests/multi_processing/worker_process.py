@@ -9,6 +9,7 @@ import unittest
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.path import fake_path_spec
 
+from plaso.containers import event_sources
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.engine import configurations
@@ -25,32 +26,91 @@ class TestEventExtractionWorker(worker.EventExtractionWorker):
   """Event extraction worker for testing."""
 
   # pylint: disable=unused-argument
-  def ProcessPathSpec(self, mediator, path_spec, excluded_find_specs=None):
+  def ProcessPathSpec(
+      self, mediator, path_spec, excluded_path_filter=None, record_range=None):
     """Processes a path specification.
 
     Args:
       mediator (ParserMediator): mediates the interactions between
           parsers and other components, such as storage and abort signals.
       path_spec (dfvfs.PathSpec): path specification.
-      excluded_find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
-         that are excluded from processing.
+      excluded_path_filter (Optional[PathFilterTrie]): paths that are excluded
+          from processing.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification to process.
     """
-    return
+    self.file_entry_identity = (
+        'inode: 1, size: 0, mtime: 2020-01-01 00:00:00, '
+        'ctime: 2020-01-01 00:00:00')
+
+
+class TestEventSourceEventExtractionWorker(TestEventExtractionWorker):
+  """Event extraction worker for testing that produces an event source."""
+
+  def ProcessPathSpec(
+      self, mediator, path_spec, excluded_path_filter=None, record_range=None):
+    """Processes a path specification.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      path_spec (dfvfs.PathSpec): path specification.
+      excluded_path_filter (Optional[PathFilterTrie]): paths that are excluded
+          from processing.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification to process.
+    """
+    super(TestEventSourceEventExtractionWorker, self).ProcessPathSpec(
+        mediator, path_spec, excluded_path_filter=excluded_path_filter,
+        record_range=record_range)
+
+    sub_path_spec = fake_path_spec.FakePathSpec(location='/test/file/sub')
+    mediator.ProduceEventSource(event_sources.EventSource(
+        path_spec=sub_path_spec))
+
+
+class TestExceptionEventExtractionWorker(TestEventExtractionWorker):
+  """Event extraction worker for testing an unhandled exception."""
+
+  def ProcessPathSpec(
+      self, mediator, path_spec, excluded_path_filter=None, record_range=None):
+    """Processes a path specification.
+
+    Args:
+      mediator (ParserMediator): mediates the interactions between
+          parsers and other components, such as storage and abort signals.
+      path_spec (dfvfs.PathSpec): path specification.
+      excluded_path_filter (Optional[PathFilterTrie]): paths that are excluded
+          from processing.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification to process.
+
+    Raises:
+      RuntimeError: unhandled exception.
+    """
+    super(TestExceptionEventExtractionWorker, self).ProcessPathSpec(
+        mediator, path_spec, excluded_path_filter=excluded_path_filter,
+        record_range=record_range)
+
+    raise RuntimeError('Unhandled exception.')
 
 
 class TestFailureEventExtractionWorker(worker.EventExtractionWorker):
   """Event extraction worker for testing failure."""
 
   # pylint: disable=unused-argument
-  def ProcessPathSpec(self, mediator, path_spec, excluded_find_specs=None):
+  def ProcessPathSpec(
+      self, mediator, path_spec, excluded_path_filter=None, record_range=None):
     """Processes a path specification.
 
     Args:
       mediator (ParserMediator): mediates the interactions between
           parsers and other components, such as storage and abort signals.
       path_spec (dfvfs.PathSpec): path specification.
-      excluded_find_specs (Optional[list[dfvfs.FindSpec]]): find specifications
-         that are excluded from processing.
+      excluded_path_filter (Optional[PathFilterTrie]): paths that are excluded
+          from processing.
+      record_range (Optional[RecordRangeEventSource]): range of records of
+          the path specification to process.
 
     Raises:
       dfvfs_errors.CacheFullError: cache full error.
@@ -80,6 +140,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
     self.assertIsNotNone(status_attributes)
     self.assertEqual(status_attributes['identifier'], 'TestWorker')
     self.assertEqual(status_attributes['last_activity_timestamp'], 0.0)
+    self.assertIsNone(status_attributes['number_of_file_system_cache_hits'])
     self.assertIsNone(status_attributes['number_of_produced_warnings'])
 
     session = sessions.Session()
@@ -93,6 +154,8 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
     self.assertEqual(status_attributes['identifier'], 'TestWorker')
     self.assertEqual(status_attributes['last_activity_timestamp'], 0.0)
     self.assertEqual(status_attributes['number_of_produced_warnings'], 0)
+    self.assertEqual(status_attributes['parser_chain'], '')
+    self.assertEqual(status_attributes['prefetched_task_identifiers'], [])
 
   def testMain(self):
     """Tests the _Main function."""
@@ -131,15 +194,20 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
     path_spec = fake_path_spec.FakePathSpec(location='/test/file')
 
     extraction_worker = TestEventExtractionWorker()
-    test_process._ProcessPathSpec(extraction_worker, parser_mediator, path_spec)
+    result = test_process._ProcessPathSpec(
+        extraction_worker, parser_mediator, path_spec)
+    self.assertTrue(result)
     self.assertEqual(parser_mediator._number_of_warnings, 0)
 
     extraction_worker = TestFailureEventExtractionWorker()
-    test_process._ProcessPathSpec(extraction_worker, parser_mediator, path_spec)
+    result = test_process._ProcessPathSpec(
+        extraction_worker, parser_mediator, path_spec)
+    self.assertFalse(result)
     self.assertEqual(parser_mediator._number_of_warnings, 0)
     self.assertTrue(test_process._abort)
 
-    test_process._ProcessPathSpec(None, parser_mediator, path_spec)
+    result = test_process._ProcessPathSpec(None, parser_mediator, path_spec)
+    self.assertFalse(result)
     self.assertEqual(parser_mediator._number_of_warnings, 1)
 
   def testProcessTask(self):
@@ -159,6 +227,49 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
     task = tasks.Task(session_identifier=session.identifier)
     test_process._ProcessTask(task)
 
+  def testProcessTaskProcessedEventSources(self):
+    """Tests the _ProcessTask function records processed event sources."""
+    session = sessions.Session()
+    storage_writer = self._CreateStorageWriter(session)
+    knowledge_base = self._CreateKnowledgeBase()
+    configuration = configurations.ProcessingConfiguration()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/test/file')
+
+    # The completion of a task is only recorded if it was processed without
+    # an error and did not produce event sources, such as a directory.
+    test_values = [
+        (TestEventExtractionWorker, 1),
+        (TestEventSourceEventExtractionWorker, 0),
+        (TestExceptionEventExtractionWorker, 0)]
+
+    for extraction_worker_class, expected_number_of_sources in test_values:
+      test_process = worker_process.WorkerProcess(
+          None, storage_writer, None, knowledge_base, session.identifier,
+          configuration, name='TestWorker')
+      test_process._extraction_worker = extraction_worker_class()
+      test_process._parser_mediator = self._CreateParserMediator(
+          storage_writer, knowledge_base)
+
+      task = tasks.Task(session_identifier=session.identifier)
+      task.path_spec = path_spec
+      test_process._ProcessTask(task)
+
+      task_storage_writer = storage_writer._task_storage_writers[
+          task.identifier]
+      processed_event_sources = list(
+          task_storage_writer.GetProcessedEventSources())
+      self.assertEqual(
+          len(processed_event_sources), expected_number_of_sources)
+
+      for processed_event_source in processed_event_sources:
+        self.assertEqual(
+            processed_event_source.status,
+            event_sources.ProcessedEventSource.STATUS_COMPLETED)
+        self.assertEqual(
+            processed_event_source.file_entry_identity,
+            test_process._extraction_worker.file_entry_identity)
+
   def testStartAndStopProfiling(self):
     """Tests the _StartProfiling and _StopProfiling functions."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -166,7 +277,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       configuration.profiling.directory = temp_directory
       configuration.profiling.profilers = set([
           'memory', 'parsers', 'processing', 'serializers', 'storage',
-          'task_queue'])
+          'task_queue', 'trace'])
 
       test_process = worker_process.WorkerProcess(
           None, None, None, None, None, configuration, name='TestWorker')
@@ -177,6 +288,38 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       test_process._StartProfiling(configuration.profiling)
       test_process._StopProfiling()
 
+  def testUpdatePrefetchedTaskIdentifiers(self):
+    """Tests the _UpdatePrefetchedTaskIdentifiers function."""
+    task_queue = zeromq_queue.ZeroMQRequestConnectQueue(
+        delay_open=True, linger_seconds=0,
+        maximum_number_of_prefetched_items=3, name='test input task queue',
+        port=1234, timeout_seconds=self._QUEUE_TIMEOUT)
+
+    test_process = worker_process.WorkerProcess(
+        task_queue, None, None, None, None, None, name='TestWorker')
+    self.assertEqual(test_process._prefetched_task_identifiers, [])
+
+    first_task = tasks.Task()
+    second_task = tasks.Task()
+    third_task = tasks.Task()
+
+    # The first task was received together with the tasks that are prefetched.
+    task_queue._prefetched_items.extend([
+        (second_task.identifier, 'serialized second task'),
+        (third_task.identifier, 'serialized third task'),
+        plaso_queue.QueueAbort()])
+
+    test_process._UpdatePrefetchedTaskIdentifiers(first_task.identifier)
+    self.assertEqual(
+        test_process._prefetched_task_identifiers,
+        [second_task.identifier, third_task.identifier])
+
+    task_queue._prefetched_items.popleft()
+
+    test_process._UpdatePrefetchedTaskIdentifiers(second_task.identifier)
+    self.assertEqual(
+        test_process._prefetched_task_identifiers, [third_task.identifier])
+
   def testSignalAbort(self):
     """Tests the SignalAbort function."""
     test_process = worker_process.WorkerProcess(
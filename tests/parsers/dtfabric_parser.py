@@ -64,6 +64,141 @@ class ErrorDataTypeMap(dtfabric_data_maps.DataTypeMap):
         'Unable to map byte stream for testing purposes.')
 
 
+class CompiledDataTypeMapTest(test_lib.BaseTestCase):
+  """Tests for the compiled data type map."""
+
+  _DATA_TYPE_FABRIC_DEFINITION = b"""\
+name: byte
+type: integer
+attributes:
+  format: unsigned
+  size: 1
+  units: bytes
+---
+name: uint16be
+type: integer
+attributes:
+  byte_order: big-endian
+  format: unsigned
+  size: 2
+  units: bytes
+---
+name: uint32
+type: integer
+attributes:
+  format: unsigned
+  size: 4
+  units: bytes
+---
+name: record
+type: structure
+attributes:
+  byte_order: little-endian
+members:
+- name: identifier
+  data_type: uint32
+- name: name
+  type: stream
+  element_data_type: byte
+  number_of_elements: 4
+- name: address
+  type: sequence
+  element_data_type: byte
+  number_of_elements: 4
+---
+name: mixed_byte_order
+type: structure
+attributes:
+  byte_order: little-endian
+members:
+- name: first
+  data_type: uint32
+- name: second
+  data_type: uint16be
+---
+name: string_record
+type: structure
+attributes:
+  byte_order: little-endian
+members:
+- name: string_size
+  data_type: uint32
+- name: string
+  type: stream
+  element_data_type: byte
+  elements_data_size: string_record.string_size
+"""
+
+  _DATA_TYPE_FABRIC = dtfabric_fabric.DataTypeFabric(
+      yaml_definition=_DATA_TYPE_FABRIC_DEFINITION)
+
+  _RECORD_DATA = (
+      b'\x01\x02\x00\x00test\xc0\xa8\x01\x02')
+
+  def testCompile(self):
+    """Tests the Compile function."""
+    for name in ('uint16be', 'uint32', 'record'):
+      data_type_map = self._DATA_TYPE_FABRIC.CreateDataTypeMap(name)
+      compiled_data_type_map = dtfabric_parser.CompiledDataTypeMap.Compile(
+          data_type_map)
+      self.assertIsNotNone(compiled_data_type_map)
+      self.assertEqual(
+          compiled_data_type_map.GetByteSize(), data_type_map.GetByteSize())
+
+    for name in ('mixed_byte_order', 'string_record'):
+      data_type_map = self._DATA_TYPE_FABRIC.CreateDataTypeMap(name)
+      compiled_data_type_map = dtfabric_parser.CompiledDataTypeMap.Compile(
+          data_type_map)
+      self.assertIsNone(compiled_data_type_map)
+
+  def testMapByteStream(self):
+    """Tests the MapByteStream function."""
+    data_type_map = self._DATA_TYPE_FABRIC.CreateDataTypeMap('record')
+    compiled_data_type_map = dtfabric_parser.CompiledDataTypeMap.Compile(
+        data_type_map)
+
+    context = dtfabric_data_maps.DataTypeMapContext()
+    record = compiled_data_type_map.MapByteStream(
+        self._RECORD_DATA, context=context)
+    self.assertEqual(context.byte_size, 12)
+
+    expected_record = data_type_map.MapByteStream(self._RECORD_DATA)
+    self.assertEqual(record.identifier, expected_record.identifier)
+    self.assertEqual(record.name, expected_record.name)
+    self.assertEqual(record.address, expected_record.address)
+
+    self.assertEqual(record.identifier, 0x201)
+    self.assertEqual(record.name, b'test')
+    self.assertEqual(record.address, (192, 168, 1, 2))
+
+    # The values of a structure can be annotated as with dtFabric.
+    self.assertIsInstance(record, type(expected_record))
+
+    record.identifier = 0x102
+    record.annotation = 'test'
+    self.assertEqual(record.identifier, 0x102)
+    self.assertEqual(record.annotation, 'test')
+
+    record = compiled_data_type_map.MapByteStream(
+        b'\xff' + self._RECORD_DATA, byte_offset=1)
+    self.assertEqual(record.identifier, 0x201)
+
+    data_type_map = self._DATA_TYPE_FABRIC.CreateDataTypeMap('uint16be')
+    compiled_data_type_map = dtfabric_parser.CompiledDataTypeMap.Compile(
+        data_type_map)
+
+    value = compiled_data_type_map.MapByteStream(b'\x01\x02')
+    self.assertEqual(value, 0x102)
+
+    # Test with byte stream that is too small.
+    with self.assertRaises(dtfabric_errors.ByteStreamTooSmallError):
+      compiled_data_type_map.MapByteStream(b'\x01')
+
+    # Test with missing byte stream.
+    with self.assertRaises(dtfabric_errors.MappingError):
+      compiled_data_type_map.MapByteStream(None)
+
+
 class DtFabricBaseParserTest(test_lib.BaseTestCase):
   """Shared functionality for dtFabric-based data format parsers tests."""
 
@@ -127,7 +262,17 @@ members:
         0x00, 0x42, 0x83, 0x29])
     self.assertEqual(ip_address, '2001:0db8:0000:0000:0000:ff00:0042:8329')
 
-  # TODO: add tests for _GetDataTypeMap
+  def testGetDataTypeMap(self):
+    """Tests the _GetDataTypeMap function."""
+    parser = dtfabric_parser.DtFabricBaseParser()
+    parser._fabric = self._DATA_TYPE_FABRIC
+
+    data_type_map = parser._GetDataTypeMap('point3d')
+    self.assertIsInstance(data_type_map, dtfabric_parser.CompiledDataTypeMap)
+    self.assertIs(parser._GetDataTypeMap('point3d'), data_type_map)
+
+    data_type_map = parser._GetDataTypeMap('shape3d')
+    self.assertIsInstance(data_type_map, dtfabric_data_maps.StructureMap)
 
   def testReadData(self):
     """Tests the _ReadData function."""
@@ -156,6 +301,40 @@ members:
     with self.assertRaises(errors.ParseError):
       parser._ReadData(file_object, 0, self._POINT3D_SIZE)
 
+  def testReadDataWithReadAhead(self):
+    """Tests the _ReadData function with read-ahead."""
+    parser = dtfabric_parser.DtFabricBaseParser()
+    parser.SetReadAheadWindowSize(8)
+
+    file_object = io.BytesIO(
+        b'\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00')
+
+    data = parser._ReadData(file_object, 0, 4)
+    self.assertEqual(data, b'\x01\x00\x00\x00')
+    self.assertEqual(file_object.tell(), 4)
+
+    data = parser._ReadData(file_object, 4, 4)
+    self.assertEqual(data, b'\x02\x00\x00\x00')
+    self.assertEqual(file_object.tell(), 8)
+
+    data = parser._ReadData(file_object, 6, 4)
+    self.assertEqual(data, b'\x00\x00\x03\x00')
+    self.assertEqual(file_object.tell(), 10)
+
+    # Test with data that is larger than the read-ahead window.
+    data = parser._ReadData(file_object, 0, self._POINT3D_SIZE)
+    self.assertEqual(len(data), self._POINT3D_SIZE)
+
+    self.assertEqual(parser._number_of_reads, 4)
+    self.assertEqual(parser._number_of_file_object_reads, 3)
+
+    # Test with file-like object with insufficient data.
+    with self.assertRaises(errors.ParseError):
+      parser._ReadData(file_object, 10, 4)
+
+    with self.assertRaises(ValueError):
+      parser.SetReadAheadWindowSize(-1)
+
   # TODO: add tests for _ReadDefinitionFile
 
   def testReadStructureFromByteStream(self):
@@ -8,6 +8,8 @@ import glob
 import os
 import unittest
 
+from plaso.parsers import manifest
+
 from tests import test_lib
 
 
@@ -18,10 +20,27 @@ class ParserImportTest(test_lib.ImportCheckTestCase):
       'dtfabric_parser.py', 'dtfabric_plugin.py', 'logger.py', 'manager.py',
       'presets.py', 'mediator.py', 'interface.py', 'plugins.py'])
 
-  def testParsersImported(self):
-    """Tests that all parsers are imported."""
-    self._AssertFilesImportedInInit(
-        test_lib.PARSERS_PATH, self._IGNORABLE_FILES)
+  # Files of the parsers package that do not define a parser.
+  _BASE_PARSER_FILES = frozenset([
+      'dsv_parser.py', 'manifest.py', 'text_parser.py'])
+
+  def testParsersInManifest(self):
+    """Tests that all parsers are in the parsers manifest."""
+    manifest_modules = {
+        manifest_entry['module']
+        for manifest_entry in manifest.PARSERS.values()}
+
+    for filename in os.listdir(test_lib.PARSERS_PATH):
+      if (filename in self._IGNORABLE_FILES or
+          filename in self._BASE_PARSER_FILES or
+          not self._FILENAME_REGEXP.search(filename)):
+        continue
+
+      module_name, _, _ = filename.partition('.')
+      module_name = 'plaso.parsers.{0:s}'.format(module_name)
+      self.assertIn(
+          module_name, manifest_modules,
+          '{0:s} not in parsers manifest'.format(module_name))
 
   def testPluginsImported(self):
     """Tests that all plugins are imported."""
@@ -93,7 +93,53 @@ class ParsersManagerTest(shared_test_lib.BaseTestCase):
         len(manager.ParsersManager._parser_classes),
         number_of_parsers)
 
-  # TODO: add tests for GetFormatsWithSignatures.
+  def testGetFormatsWithSignatures(self):
+    """Tests the GetFormatsWithSignatures function."""
+    specification_store, remainder_list = (
+        manager.ParsersManager.GetFormatsWithSignatures(
+            parser_filter_expression='asl_log,bash_history,sqlite'))
+
+    format_specifications = {
+        format_specification.identifier: format_specification
+        for format_specification in specification_store.specifications}
+    self.assertEqual(sorted(format_specifications), ['asl_log', 'sqlite'])
+
+    format_specification = format_specifications['asl_log']
+    self.assertEqual(len(format_specification.signatures), 1)
+    self.assertEqual(
+        format_specification.signatures[0].pattern,
+        b'ASL DB\x00\x00\x00\x00\x00\x00')
+    self.assertEqual(format_specification.signatures[0].offset, 0)
+
+    self.assertEqual(remainder_list, ['bash_history'])
+
+  def testGetManifestEntry(self):
+    """Tests the _GetManifestEntry function."""
+    manifest_entry = manager.ParsersManager._GetManifestEntry('winreg')
+    self.assertIsNotNone(manifest_entry)
+    self.assertEqual(manifest_entry['module'], 'plaso.parsers.winreg')
+    self.assertEqual(
+        manifest_entry['plugins_modules'], ['plaso.parsers.winreg_plugins'])
+    self.assertIn('windows_services', dict(manifest_entry['plugins']))
+
+    TestParserWithPlugins.RegisterPlugin(TestPlugin)
+    manager.ParsersManager.RegisterParser(TestParserWithPlugins)
+
+    try:
+      manifest_entry = manager.ParsersManager._GetManifestEntry(
+          'test_parser_with_plugins')
+      self.assertIsNotNone(manifest_entry)
+      self.assertEqual(
+          manifest_entry['data_format'], 'Test parser with plugins')
+      self.assertEqual(
+          manifest_entry['plugins'], [('test_plugin', 'Test plugin')])
+
+    finally:
+      manager.ParsersManager.DeregisterParser(TestParserWithPlugins)
+      TestParserWithPlugins.DeregisterPlugin(TestPlugin)
+
+    manifest_entry = manager.ParsersManager._GetManifestEntry('bogus')
+    self.assertIsNone(manifest_entry)
 
   def testCheckParserNames(self):
     """Tests the CheckFilterExpression function."""
@@ -132,7 +178,7 @@ class ParsersManagerTest(shared_test_lib.BaseTestCase):
       self.assertEqual(expected_invalid_elements, invalid_elements)
 
       none_expression = None
-      all_parser_names = manager.ParsersManager._parser_classes.keys()
+      all_parser_names = manager.ParsersManager._GetParserNames()
       expected_valid_elements = set(all_parser_names)
       expected_invalid_elements = set()
       valid_elements, invalid_elements = (
@@ -287,6 +333,18 @@ class ParsersManagerTest(shared_test_lib.BaseTestCase):
     manager.ParsersManager.DeregisterParser(TestParserWithPlugins)
     manager.ParsersManager.DeregisterParser(TestParser)
 
+  def testGetParserClass(self):
+    """Tests the _GetParserClass function."""
+    parser_class = manager.ParsersManager._GetParserClass('sqlite')
+    self.assertIsNotNone(parser_class)
+    self.assertEqual(parser_class.NAME, 'sqlite')
+
+    plugin_names = [plugin_name for plugin_name, _ in parser_class.GetPlugins()]
+    self.assertIn('chrome_27_history', plugin_names)
+
+    parser_class = manager.ParsersManager._GetParserClass('bogus')
+    self.assertIsNone(parser_class)
+
   def testGetParsersInformation(self):
     """Tests the GetParsersInformation function."""
     manager.ParsersManager.RegisterParser(TestParser)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the parsers manifest."""
+
+from __future__ import unicode_literals
+
+import importlib
+import os
+import pkgutil
+import unittest
+
+import plaso
+
+from plaso.parsers import manager
+from plaso.parsers import manifest
+
+from tests import test_lib as shared_test_lib
+
+
+class ParsersManifestTest(shared_test_lib.BaseTestCase):
+  """Tests for the parsers manifest."""
+
+  # pylint: disable=protected-access
+
+  def testManifest(self):
+    """Tests if the manifest matches the parser and plugin classes."""
+    parsers_path = os.path.join(os.path.dirname(plaso.__file__), 'parsers')
+
+    for module_information in pkgutil.walk_packages(
+        [parsers_path], prefix='plaso.parsers.'):
+      importlib.import_module(module_information.name)
+
+    parser_classes = {
+        parser_name: parser_class
+        for parser_name, parser_class in (
+            manager.ParsersManager._parser_classes.items())
+        if parser_class.__module__.startswith('plaso.parsers.')}
+
+    error_message = (
+        'Parsers manifest is out of date, run '
+        'utils/update_parsers_manifest.py')
+
+    self.assertEqual(
+        sorted(parser_classes.keys()), sorted(manifest.PARSERS.keys()),
+        error_message)
+
+    for parser_name, parser_class in parser_classes.items():
+      manifest_entry = manager.ParsersManager._CreateManifestEntry(
+          parser_class)
+      self.assertEqual(
+          manifest_entry, manifest.PARSERS[parser_name], error_message)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -29,6 +29,23 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
 
   # pylint: disable=protected-access
 
+  def testCheckMemoryUsage(self):
+    """Tests the _CheckMemoryUsage function."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    parser_mediator = mediator.ParserMediator(
+        storage_writer, knowledge_base_object, memory_limit=1)
+
+    storage_writer.Open()
+
+    parser_mediator._CheckMemoryUsage()
+    self.assertTrue(parser_mediator.memory_limit_exceeded)
+
+    parser_mediator._memory_limit = 1024 * 1024 * 1024 * 1024
+    parser_mediator._CheckMemoryUsage()
+    self.assertFalse(parser_mediator.memory_limit_exceeded)
+
   def testGetEarliestYearFromFileEntry(self):
     """Tests the _GetEarliestYearFromFileEntry function."""
     session = sessions.Session()
@@ -187,6 +204,38 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
     latest_year = parser_mediator.GetLatestYear()
     self.assertEqual(latest_year, expected_latest_year)
 
+  def testGetRecordRange(self):
+    """Tests the GetRecordRange function."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    parser_mediator = mediator.ParserMediator(
+        storage_writer, knowledge_base_object,
+        maximum_number_of_records_per_task=10)
+
+    storage_writer.Open()
+
+    record_indexes = parser_mediator.GetRecordRange('test_parser', 5)
+    self.assertEqual(record_indexes, range(0, 5))
+    self.assertEqual(storage_writer.number_of_event_sources, 0)
+
+    record_indexes = parser_mediator.GetRecordRange('test_parser', 25)
+    self.assertEqual(record_indexes, range(0, 10))
+    self.assertEqual(storage_writer.number_of_event_sources, 2)
+
+    event_sources = list(storage_writer.GetEventSources())
+    self.assertEqual(event_sources[0].first_record_index, 10)
+    self.assertEqual(event_sources[0].number_of_records, 10)
+    self.assertEqual(event_sources[1].first_record_index, 20)
+    self.assertEqual(event_sources[1].number_of_records, 5)
+    self.assertEqual(event_sources[1].parser_name, 'test_parser')
+
+    parser_mediator.SetRecordRange(event_sources[1])
+
+    record_indexes = parser_mediator.GetRecordRange('test_parser', 25)
+    self.assertEqual(record_indexes, range(20, 25))
+    self.assertEqual(storage_writer.number_of_event_sources, 2)
+
   # TODO: add tests for GetParserChain.
   # TODO: add tests for GetRelativePathForPathSpec.
   # TODO: add tests for PopFromParserChain.
@@ -223,7 +272,57 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
       parser_mediator.ProduceEventWithEventData(
           event_without_timestamp, event_data)
 
+  def testProduceEventWithEventDataAndMemoryLimit(self):
+    """Tests the ProduceEventWithEventData method with a memory limit."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    parser_mediator = mediator.ParserMediator(
+        storage_writer, knowledge_base_object, memory_limit=1)
+
+    storage_writer.Open()
+
+    date_time = fake_time.FakeTime()
+    event = time_events.DateTimeValuesEvent(
+        date_time, definitions.TIME_DESCRIPTION_WRITTEN)
+    event_data = events.EventData()
+    event_data.parser = 'test_parser'
+
+    self.assertFalse(parser_mediator.memory_limit_exceeded)
+
+    parser_mediator.ProduceEventWithEventData(event, event_data)
+    self.assertTrue(parser_mediator.memory_limit_exceeded)
+
+    test_file_path = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+
+    parser_mediator.SetFileEntry(file_entry)
+    self.assertFalse(parser_mediator.memory_limit_exceeded)
+
   # TODO: add tests for ProduceExtractionWarning.
+
+  def testProduceRecordRangeEventSource(self):
+    """Tests the ProduceRecordRangeEventSource method."""
+    session = sessions.Session()
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    parser_mediator = mediator.ParserMediator(
+        storage_writer, knowledge_base_object)
+
+    storage_writer.Open()
+
+    parser_mediator.ProduceRecordRangeEventSource('test_parser', 20, 5)
+    self.assertEqual(storage_writer.number_of_event_sources, 1)
+
+    event_source = storage_writer.GetFirstWrittenEventSource()
+    self.assertEqual(event_source.first_record_index, 20)
+    self.assertEqual(event_source.number_of_records, 5)
+    self.assertEqual(event_source.parser_name, 'test_parser')
+
   # TODO: add tests for RemoveEventAttribute.
 
   def testResetFileEntry(self):
@@ -84,6 +84,43 @@ class NTFSMFTParserTest(test_lib.ParserTestCase):
     expected_path_hints = ['$Orphan\\session\\menu.text.css']
     self.assertEqual(event_data.path_hints, expected_path_hints)
 
+  def testParseImageInRecordRanges(self):
+    """Tests the Parse function on a $MFT file split into record ranges."""
+    parser = ntfs.NTFSMFTParser()
+
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=0, location='/$MFT',
+        parent=qcow_path_spec)
+
+    storage_writer = self._ParseFileByPathSpecInRecordRanges(
+        tsk_path_spec, parser, 100)
+
+    # The $MFT metadata file contains 256 MFT entries.
+    event_sources = list(storage_writer.GetEventSources())
+    self.assertEqual(len(event_sources), 2)
+
+    self.assertEqual(event_sources[1].first_record_index, 200)
+    self.assertEqual(event_sources[1].number_of_records, 56)
+    self.assertEqual(event_sources[1].parser_name, 'mft')
+
+    self.assertEqual(storage_writer.number_of_warnings, 0)
+    self.assertEqual(storage_writer.number_of_events, 284)
+
+    serial_storage_writer = self._ParseFileByPathSpec(tsk_path_spec, parser)
+
+    timestamps = sorted(
+        event.timestamp for event in storage_writer.GetEvents())
+    serial_timestamps = sorted(
+        event.timestamp for event in serial_storage_writer.GetEvents())
+    self.assertEqual(timestamps, serial_timestamps)
+
   def testParseImage(self):
     """Tests the Parse function on a storage media image."""
     parser = ntfs.NTFSMFTParser()
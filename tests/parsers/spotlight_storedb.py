@@ -15,6 +15,36 @@ from tests.parsers import test_lib
 class SpotlightStoreDatabaseParserTest(test_lib.ParserTestCase):
   """Tests for the Apple Spotlight store database parser."""
 
+  # pylint: disable=protected-access
+
+  def testReadIndexPageValues(self):
+    """Tests the _ReadIndexPageValues function."""
+    parser = spotlight_storedb.SpotlightStoreDatabaseParser()
+
+    data_type_map = parser._GetDataTypeMap(
+        'spotlight_store_db_property_value21')
+    for table_index, value_name in ((1, b'first'), (2, b'second')):
+      parser._metadata_values[table_index] = data_type_map.MapByteStream(
+          b''.join([
+              bytes(bytearray([table_index, 0, 0, 0])), value_name, b'\x00']))
+
+    data_type_map = parser._GetDataTypeMap(
+        'spotlight_store_db_property_page_header')
+    page_header = data_type_map.MapByteStream(b''.join([
+        b'2pbd', b'\x00\x10\x00\x00', b'\x2d\x00\x00\x00',
+        b'\x81\x00\x00\x00', b'\x00\x00\x00\x00']))
+
+    # The index page value consists of the table index, the size of the index
+    # values as a variable size integer and 2 index values.
+    page_data = b''.join([
+        b'\x00' * 12, b'\x07\x00\x00\x00', b'\x08',
+        b'\x01\x00\x00\x00\x02\x00\x00\x00'])
+
+    property_table = {}
+    parser._ReadIndexPageValues(page_header, page_data, property_table)
+
+    self.assertEqual(property_table, {7: ['first', 'second']})
+
   def testParse(self):
     """Tests the Parse function."""
     parser = spotlight_storedb.SpotlightStoreDatabaseParser()
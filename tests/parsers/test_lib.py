@@ -47,7 +47,8 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
 
   def _CreateParserMediator(
       self, storage_writer, collection_filters_helper=None, file_entry=None,
-      knowledge_base_values=None, parser_chain=None, timezone='UTC'):
+      knowledge_base_values=None, maximum_number_of_records_per_task=None,
+      parser_chain=None, timezone='UTC'):
     """Creates a parser mediator.
 
     Args:
@@ -56,6 +57,8 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
           filters helper.
       file_entry (Optional[dfvfs.FileEntry]): file entry object being parsed.
       knowledge_base_values (Optional[dict]): knowledge base values.
+      maximum_number_of_records_per_task (Optional[int]): maximum number of
+          records a parser that supports record ranges should parse at once.
       parser_chain (Optional[str]): parsing chain up to this point.
       timezone (Optional[str]): timezone.
 
@@ -74,7 +77,8 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
 
     parser_mediator = mediator.ParserMediator(
         storage_writer, knowledge_base_object,
-        collection_filters_helper=collection_filters_helper)
+        collection_filters_helper=collection_filters_helper,
+        maximum_number_of_records_per_task=maximum_number_of_records_per_task)
 
     if file_entry:
       parser_mediator.SetFileEntry(file_entry)
@@ -190,6 +194,43 @@ class ParserTestCase(shared_test_lib.BaseTestCase):
 
     return storage_writer
 
+  def _ParseFileByPathSpecInRecordRanges(
+      self, path_spec, parser, maximum_number_of_records_per_task):
+    """Parses a file with a parser in ranges of records.
+
+    The file is parsed the same way worker processes parse a large file.
+    The first range of records is parsed together with the production of
+    record range event sources for the remaining records, which are parsed
+    one range at a time afterwards.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+      parser (FileObjectParser): parser that supports record ranges.
+      maximum_number_of_records_per_task (int): maximum number of records
+          to parse at once.
+
+    Returns:
+      FakeStorageWriter: storage writer.
+    """
+    storage_writer = self._CreateStorageWriter()
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    parser_mediator = self._CreateParserMediator(
+        storage_writer, file_entry=file_entry,
+        maximum_number_of_records_per_task=maximum_number_of_records_per_task)
+
+    file_object = file_entry.GetFileObject()
+    try:
+      parser.Parse(parser_mediator, file_object)
+
+      for event_source in list(storage_writer.GetEventSources()):
+        parser_mediator.SetRecordRange(event_source)
+        parser.Parse(parser_mediator, file_object)
+
+    finally:
+      file_object.close()
+
+    return storage_writer
+
   def _TestGetMessageStrings(
       self, event_data, expected_message, expected_short_message):
     """Tests the formatting of the message strings.
@@ -6,6 +6,10 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
 from plaso.formatters import winevtx as _  # pylint: disable=unused-import
 from plaso.lib import definitions
 from plaso.parsers import winevtx
@@ -16,6 +20,45 @@ from tests.parsers import test_lib
 class WinEvtxParserTest(test_lib.ParserTestCase):
   """Tests for the Windows XML EventLog (EVTX) parser."""
 
+  # pylint: disable=protected-access
+
+  _XML_STRING = (
+      '<Event xmlns="http://schemas.microsoft.com/win/2004/08/events/event">\n'
+      '  <System>\n'
+      '    <Provider Name="Service Control Manager"/>\n'
+      '    <EventID Qualifiers="16384">7036</EventID>\n'
+      '    <TimeCreated SystemTime="2012-03-14T04:17:38.276340700Z"/>\n'
+      '  </System>\n'
+      '  <EventData>\n'
+      '    <Data Name="param1">&lt;TimeCreated SystemTime="bogus"/&gt;</Data>\n'
+      '  </EventData>\n'
+      '</Event>\n')
+
+  def testGetCreationTimeFromXMLString(self):
+    """Tests the _GetCreationTimeFromXMLString function."""
+    parser = winevtx.WinEvtxParser()
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    creation_time_string = parser._GetCreationTimeFromXMLString(
+        parser_mediator, 0, self._XML_STRING)
+    self.assertEqual(creation_time_string, '2012-03-14T04:17:38.276340700Z')
+    self.assertEqual(storage_writer.number_of_warnings, 0)
+
+    # Test with an XML string without a TimeCreated XML element.
+    xml_string = self._XML_STRING.replace('TimeCreated', 'TimeWritten')
+    creation_time_string = parser._GetCreationTimeFromXMLString(
+        parser_mediator, 1, xml_string)
+    self.assertIsNone(creation_time_string)
+    self.assertEqual(storage_writer.number_of_warnings, 1)
+
+    # Test with a malformed XML string.
+    xml_string = self._XML_STRING.replace('</System>', '<System>')
+    creation_time_string = parser._GetCreationTimeFromXMLString(
+        parser_mediator, 2, xml_string)
+    self.assertIsNone(creation_time_string)
+    self.assertEqual(storage_writer.number_of_warnings, 2)
+
   def testParse(self):
     """Tests the Parse function."""
     parser = winevtx.WinEvtxParser()
@@ -123,6 +166,70 @@ class WinEvtxParserTest(test_lib.ParserTestCase):
     self._TestGetMessageStrings(
         event_data, expected_message, expected_short_message)
 
+  def testParseInRecordRanges(self):
+    """Tests the Parse function on a file split into record ranges."""
+    parser = winevtx.WinEvtxParser()
+
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+
+    storage_writer = self._ParseFileByPathSpecInRecordRanges(
+        path_spec, parser, 500)
+
+    event_sources = list(storage_writer.GetEventSources())
+    self.assertEqual(len(event_sources), 3)
+
+    self.assertEqual(event_sources[2].first_record_index, 1500)
+    self.assertEqual(event_sources[2].number_of_records, 101)
+    self.assertEqual(event_sources[2].parser_name, 'winevtx')
+
+    self.assertEqual(storage_writer.number_of_warnings, 0)
+    self.assertEqual(storage_writer.number_of_events, 3202)
+
+    serial_storage_writer = self._ParseFileByPathSpec(path_spec, parser)
+
+    timestamps = sorted(
+        event.timestamp for event in storage_writer.GetEvents())
+    serial_timestamps = sorted(
+        event.timestamp for event in serial_storage_writer.GetEvents())
+    self.assertEqual(timestamps, serial_timestamps)
+
+  def testParseWithMemoryLimitExceeded(self):
+    """Tests the Parse function with the memory limit exceeded."""
+    parser = winevtx.WinEvtxParser()
+
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+
+    storage_writer = self._CreateStorageWriter()
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    parser_mediator = self._CreateParserMediator(
+        storage_writer, file_entry=file_entry)
+
+    # pylint: disable=protected-access
+    parser_mediator._memory_limit_exceeded = True
+
+    file_object = file_entry.GetFileObject()
+    try:
+      parser.Parse(parser_mediator, file_object)
+    finally:
+      file_object.close()
+
+    event_sources = list(storage_writer.GetEventSources())
+    self.assertEqual(len(event_sources), 1)
+
+    self.assertEqual(event_sources[0].first_record_index, 1)
+    self.assertEqual(event_sources[0].number_of_records, 1600)
+    self.assertEqual(event_sources[0].parser_name, 'winevtx')
+
+    self.assertLess(storage_writer.number_of_events, 3202)
+
   def testParseTruncated(self):
     """Tests the Parse function on a truncated file."""
     parser = winevtx.WinEvtxParser()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the compact serializer object implementation."""
+
+from __future__ import unicode_literals
+
+import pickle
+import unittest
+import uuid
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import fake_path_spec
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import event_sources
+from plaso.containers import events
+from plaso.containers import tasks
+from plaso.serializer import compact_serializer
+
+from tests import test_lib as shared_test_lib
+
+
+class CompactAttributeContainerSerializerTest(shared_test_lib.BaseTestCase):
+  """Tests for the compact attribute container serializer object."""
+
+  _SERIALIZER = compact_serializer.CompactAttributeContainerSerializer
+
+  def testReadAndWriteSerializedRecordRangeEventSource(self):
+    """Test ReadSerialized and WriteSerialized of RecordRangeEventSource."""
+    test_path_spec = fake_path_spec.FakePathSpec(location='/opt/plaso.txt')
+
+    expected_event_source = event_sources.RecordRangeEventSource(
+        path_spec=test_path_spec)
+    expected_event_source.data_stream_name = ''
+    expected_event_source.event_data_stream = events.EventDataStream()
+    expected_event_source.event_data_stream.md5_hash = (
+        'e3df0d2abd2c27fbdadfb41a47442520')
+    expected_event_source.first_record_index = 1000
+    expected_event_source.number_of_records = 500
+    expected_event_source.parser_name = 'winevtx'
+
+    serialized = self._SERIALIZER.WriteSerialized(expected_event_source)
+    self.assertIsNotNone(serialized)
+
+    event_source = self._SERIALIZER.ReadSerialized(serialized)
+
+    self.assertIsNotNone(event_source)
+    self.assertIsInstance(event_source, event_sources.RecordRangeEventSource)
+
+    self.assertEqual(event_source.data_type, 'record_range')
+    self.assertEqual(event_source.first_record_index, 1000)
+    self.assertEqual(event_source.number_of_records, 500)
+    self.assertEqual(event_source.parser_name, 'winevtx')
+    self.assertEqual(
+        event_source.path_spec.comparable, test_path_spec.comparable)
+
+    self.assertIsInstance(
+        event_source.event_data_stream, events.EventDataStream)
+    self.assertEqual(
+        event_source.event_data_stream.md5_hash,
+        'e3df0d2abd2c27fbdadfb41a47442520')
+
+  def testReadAndWriteSerializedTask(self):
+    """Test ReadSerialized and WriteSerialized of Task."""
+    session_identifier = '{0:s}'.format(uuid.uuid4().hex)
+
+    test_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/image.raw')
+    test_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK_PARTITION, location='/p1',
+        parent=test_path_spec)
+    test_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=15,
+        location='/Windows/System32/config/SOFTWARE', parent=test_path_spec)
+
+    expected_task = tasks.Task(session_identifier=session_identifier)
+    expected_task.path_spec = test_path_spec
+    expected_task.storage_format = 'sqlite'
+
+    serialized = self._SERIALIZER.WriteSerialized(expected_task)
+    self.assertIsNotNone(serialized)
+
+    # The serialized form contains no class references and is smaller than
+    # the pickled task.
+    serialized_task = pickle.dumps(serialized, protocol=pickle.HIGHEST_PROTOCOL)
+    pickled_task = pickle.dumps(expected_task, protocol=pickle.HIGHEST_PROTOCOL)
+    self.assertLess(len(serialized_task), len(pickled_task))
+
+    task = self._SERIALIZER.ReadSerialized(pickle.loads(serialized_task))
+
+    self.assertIsNotNone(task)
+    self.assertIsInstance(task, tasks.Task)
+    self.assertEqual(task.identifier, expected_task.identifier)
+    self.assertEqual(task.session_identifier, session_identifier)
+    self.assertEqual(task.start_time, expected_task.start_time)
+    self.assertEqual(task.storage_format, 'sqlite')
+    self.assertEqual(task.path_spec.comparable, test_path_spec.comparable)
+
+  def testReadSerialized(self):
+    """Test ReadSerialized with unsupported values."""
+    self.assertIsNone(self._SERIALIZER.ReadSerialized(None))
+
+    with self.assertRaises(ValueError):
+      self._SERIALIZER.ReadSerialized(('task', (('aborted', 99, False),)))
+
+  def testWriteSerialized(self):
+    """Test WriteSerialized with unsupported values."""
+    with self.assertRaises(TypeError):
+      self._SERIALIZER.WriteSerialized('task')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -273,6 +273,46 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
         sorted(event_source_dict.items()),
         sorted(expected_event_source_dict.items()))
 
+  def testReadAndWriteSerializedRecordRangeEventSource(self):
+    """Test ReadSerialized and WriteSerialized of RecordRangeEventSource."""
+    test_path_spec = fake_path_spec.FakePathSpec(location='/opt/plaso.txt')
+
+    expected_event_source = event_sources.RecordRangeEventSource(
+        path_spec=test_path_spec)
+    expected_event_source.data_stream_name = ''
+    expected_event_source.event_data_stream = events.EventDataStream()
+    expected_event_source.event_data_stream.md5_hash = (
+        'e3df0d2abd2c27fbdadfb41a47442520')
+    expected_event_source.first_record_index = 1000
+    expected_event_source.number_of_records = 500
+    expected_event_source.parser_name = 'winevtx'
+
+    json_string = (
+        json_serializer.JSONAttributeContainerSerializer.WriteSerialized(
+            expected_event_source))
+
+    self.assertIsNotNone(json_string)
+
+    event_source = (
+        json_serializer.JSONAttributeContainerSerializer.ReadSerialized(
+            json_string))
+
+    self.assertIsNotNone(event_source)
+    self.assertIsInstance(event_source, event_sources.RecordRangeEventSource)
+
+    self.assertEqual(event_source.data_type, 'record_range')
+    self.assertEqual(event_source.first_record_index, 1000)
+    self.assertEqual(event_source.number_of_records, 500)
+    self.assertEqual(event_source.parser_name, 'winevtx')
+    self.assertEqual(
+        event_source.path_spec.comparable, test_path_spec.comparable)
+
+    self.assertIsInstance(
+        event_source.event_data_stream, events.EventDataStream)
+    self.assertEqual(
+        event_source.event_data_stream.md5_hash,
+        'e3df0d2abd2c27fbdadfb41a47442520')
+
   def testReadAndWriteSerializedEventTag(self):
     """Test ReadSerialized and WriteSerialized of EventTag."""
     expected_event_tag = events.EventTag()
@@ -439,6 +479,7 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
         'aborted': False,
         'has_retry': False,
         'identifier': task.identifier,
+        'requires_high_memory': False,
         'session_identifier': session_identifier,
         'start_time': task.start_time
     }
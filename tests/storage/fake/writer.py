@@ -199,6 +199,22 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
 
     # TODO: add test with time range.
 
+  def testSetStoreEventSources(self):
+    """Tests the SetStoreEventSources function."""
+    session = sessions.Session()
+    event_source = event_sources.EventSource()
+
+    storage_writer = fake_writer.FakeStorageWriter(session)
+    storage_writer.SetStoreEventSources(False)
+    storage_writer.Open()
+
+    storage_writer.AddEventSource(event_source)
+
+    self.assertEqual(storage_writer.number_of_event_sources, 1)
+    self.assertIsNone(storage_writer.GetFirstWrittenEventSource())
+
+    storage_writer.Close()
+
   def testWriteSessionStartAndCompletion(self):
     """Tests the WriteSessionStart and WriteSessionCompletion functions."""
     session = sessions.Session()
@@ -101,6 +101,48 @@ class RedisMergeReaderTest(test_lib.StorageTestCase):
       result = test_reader.MergeAttributeContainers()
       self.assertTrue(result)
 
+      self.assertEqual(storage_writer.number_of_events, 4)
+
+      for event in storage_writer.GetSortedEvents():
+        event_data_identifier = event.GetEventDataIdentifier()
+        event_data = storage_writer.GetEventDataByIdentifier(
+            event_data_identifier)
+        self.assertIsNotNone(event_data)
+
+        event_data_stream_identifier = (
+            event_data.GetEventDataStreamIdentifier())
+        self.assertIsNotNone(event_data_stream_identifier)
+
+      storage_writer.Close()
+
+  def testMergeAttributeContainersWithMaximumNumberOfContainers(self):
+    """Tests the MergeAttributeContainers function with a maximum."""
+    session = sessions.Session()
+    client = self._GetRedisClient()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      task = self._CreateTaskStore(session, redis_client=client)
+
+      session_storage_path = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_writer = writer.SQLiteStorageFileWriter(
+          session, session_storage_path)
+
+      test_reader = merge_reader.RedisMergeReader(
+          storage_writer, task, redis_client=client)
+
+      storage_writer.Open()
+
+      result = test_reader.MergeAttributeContainers(
+          maximum_number_of_containers=3)
+      self.assertFalse(result)
+
+      result = False
+      while not result:
+        result = test_reader.MergeAttributeContainers(
+            maximum_number_of_containers=3)
+
+      self.assertEqual(storage_writer.number_of_events, 4)
+
       storage_writer.Close()
 
 
@@ -12,6 +12,7 @@ import redis
 from plaso.containers import events
 from plaso.containers import sessions
 from plaso.containers import tasks
+from plaso.lib import definitions
 from plaso.storage.redis import redis_store
 from plaso.storage.redis import writer
 
@@ -119,8 +120,131 @@ class RedisStoreTest(test_lib.StorageTestCase):
     retrieved_events = list(store.GetSortedEvents())
     self.assertEqual(len(retrieved_events), 4)
 
+    timestamps = [event.timestamp for event in retrieved_events]
+    self.assertEqual(timestamps, sorted(timestamps))
+
     store.Close()
 
+  def testGetSortedEventsInBatches(self):
+    """Tests the GetSortedEvents method with multiple batches."""
+    store = redis_store.RedisStore()
+    store._MAXIMUM_NUMBER_OF_ITEMS_PER_READ = 3
+    redis_client = self._GetRedisClient()
+    store.Open(redis_client=redis_client)
+
+    for event, _, _ in containers_test_lib.CreateEventsFromValues(
+        self._TEST_EVENTS + self._TEST_EVENTS):
+      store.AddEvent(event)
+
+    retrieved_events = list(store.GetSortedEvents())
+    self.assertEqual(len(retrieved_events), 8)
+
+    timestamps = [event.timestamp for event in retrieved_events]
+    self.assertEqual(timestamps, sorted(timestamps))
+
+    store.Close()
+
+  def testBufferedWrites(self):
+    """Tests that writes are buffered until the pipeline is flushed."""
+    store = redis_store.RedisStore()
+    redis_client = self._GetRedisClient()
+    store.Open(redis_client=redis_client)
+
+    event_data = events.EventData()
+    store.AddEventData(event_data)
+
+    container_key = store._GenerateRedisKey(store._CONTAINER_TYPE_EVENT_DATA)
+    self.assertEqual(redis_client.hlen(container_key), 0)
+    self.assertEqual(len(store._pipeline), 1)
+
+    # Reading from the store flushes the pipeline.
+    self.assertEqual(
+        store._GetNumberOfAttributeContainers(event_data.CONTAINER_TYPE), 1)
+    self.assertEqual(redis_client.hlen(container_key), 1)
+    self.assertEqual(len(store._pipeline), 0)
+
+    store.Close()
+
+  def testBufferedWritesMaximumNumberOfCommands(self):
+    """Tests that the pipeline is flushed when it is full."""
+    store = redis_store.RedisStore()
+    store._MAXIMUM_NUMBER_OF_BUFFERED_COMMANDS = 2
+    redis_client = self._GetRedisClient()
+    store.Open(redis_client=redis_client)
+
+    container_key = store._GenerateRedisKey(store._CONTAINER_TYPE_EVENT_DATA)
+
+    store.AddEventData(events.EventData())
+    self.assertEqual(redis_client.hlen(container_key), 0)
+
+    store.AddEventData(events.EventData())
+    self.assertEqual(redis_client.hlen(container_key), 2)
+
+    store.Close()
+
+  def testFlush(self):
+    """Tests the Flush function."""
+    store = redis_store.RedisStore()
+    redis_client = self._GetRedisClient()
+    store.Open(redis_client=redis_client)
+
+    store.AddEventData(events.EventData())
+
+    container_key = store._GenerateRedisKey(store._CONTAINER_TYPE_EVENT_DATA)
+    self.assertEqual(redis_client.hlen(container_key), 0)
+
+    store.Flush()
+    self.assertEqual(redis_client.hlen(container_key), 1)
+    self.assertEqual(len(store._pipeline), 0)
+
+    store.Close()
+
+  def testCompression(self):
+    """Tests reading and writing compressed attribute containers."""
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    store = redis_store.RedisStore(
+        session_identifier=session.identifier, task_identifier=task.identifier,
+        compression_format=definitions.COMPRESSION_FORMAT_ZLIB)
+    redis_client = self._GetRedisClient()
+    store.Open(redis_client=redis_client)
+
+    for event, event_data, _ in containers_test_lib.CreateEventsFromValues(
+        self._TEST_EVENTS):
+      store.AddEventData(event_data)
+      event.SetEventDataIdentifier(event_data.GetIdentifier())
+      store.AddEvent(event)
+
+    store.Close()
+
+    # The compression format is read from the metadata of an existing store.
+    store = redis_store.RedisStore(
+        session_identifier=session.identifier, task_identifier=task.identifier)
+    store.Open(redis_client=redis_client)
+
+    self.assertEqual(
+        store.compression_format, definitions.COMPRESSION_FORMAT_ZLIB)
+
+    retrieved_events = list(store.GetSortedEvents())
+    self.assertEqual(len(retrieved_events), 4)
+
+    retrieved_event_data = list(
+        store._GetAttributeContainers(store._CONTAINER_TYPE_EVENT_DATA))
+    self.assertEqual(len(retrieved_event_data), 4)
+
+    _, serialized_containers = store.GetSerializedAttributeContainers(
+        store._CONTAINER_TYPE_EVENT_DATA, 0, 0)
+    for serialized_container in serialized_containers.values():
+      self.assertTrue(serialized_container.startswith(b'{'))
+
+    store.Close()
+
+  def testUnsupportedCompressionFormat(self):
+    """Tests initializing a store with an unsupported compression format."""
+    with self.assertRaises(ValueError):
+      redis_store.RedisStore(compression_format='bogus')
+
   def testGetAttributeContainers(self):
     """Tests the _GetAttributeContainers method."""
     store = redis_store.RedisStore()
@@ -194,8 +318,17 @@ class RedisStoreTest(test_lib.StorageTestCase):
 
     store.Open(redis_client=redis_client)
     self.assertFalse(store.IsFinalized())
+
+    event_data = events.EventData()
+    store.AddEventData(event_data)
+
     store.Finalize()
     self.assertTrue(store.IsFinalized())
+
+    # Buffered attribute containers are written when the store is finalized.
+    container_key = store._GenerateRedisKey(store._CONTAINER_TYPE_EVENT_DATA)
+    self.assertEqual(redis_client.hlen(container_key), 1)
+
     store.Close()
 
   def testScanForProcessedTasks(self):
@@ -14,6 +14,7 @@ from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.containers import warnings
 from plaso.lib import definitions
+from plaso.storage import time_range
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -105,6 +106,32 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testFlush(self):
+    """Tests the Flush function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      storage_file.AddEventData(events.EventData())
+
+      self.assertEqual(
+          storage_file._GetNumberOfSerializedAttributeContainers(
+              storage_file._CONTAINER_TYPE_EVENT_DATA), 1)
+
+      storage_file.Flush()
+
+      self.assertEqual(
+          storage_file._GetNumberOfSerializedAttributeContainers(
+              storage_file._CONTAINER_TYPE_EVENT_DATA), 0)
+      self.assertEqual(storage_file._GetNumberOfAttributeContainers(
+          storage_file._CONTAINER_TYPE_EVENT_DATA), 1)
+
+      storage_file.Close()
+
+      with self.assertRaises(IOError):
+        storage_file.Flush()
+
   def testGetAttributeContainerByIndex(self):
     """Tests the _GetAttributeContainerByIndex function."""
     event_data = events.EventData()
@@ -510,6 +537,46 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
       storage_file.Close()
 
+  def testGetEventTimestampQuantiles(self):
+    """Tests the GetEventTimestampQuantiles function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'plaso.sqlite')
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file, read_only=False)
+
+      timestamps = storage_file.GetEventTimestampQuantiles(2)
+      self.assertEqual(timestamps, [])
+
+      for event, event_data, event_data_stream in (
+          containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+        storage_file.AddEventDataStream(event_data_stream)
+
+        event_data.SetEventDataStreamIdentifier(
+            event_data_stream.GetIdentifier())
+        storage_file.AddEventData(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        storage_file.AddEvent(event)
+
+      storage_file.Close()
+
+      storage_file = sqlite_file.SQLiteStorageFile()
+      storage_file.Open(path=temp_file)
+
+      timestamps = storage_file.GetEventTimestampQuantiles(1)
+      self.assertEqual(timestamps, [1238934459000000, 1334966206929596])
+
+      timestamps = storage_file.GetEventTimestampQuantiles(2)
+      self.assertEqual(timestamps, [
+          1238934459000000, 1334961526929596, 1334966206929596])
+
+      timestamps = storage_file.GetEventTimestampQuantiles(8)
+      self.assertEqual(timestamps, [
+          1238934459000000, 1334940286000000, 1334961526929596,
+          1334966206929596, 1334966206929596])
+
+      storage_file.Close()
+
   # TODO: add tests for GetNumberOfAnalysisReports
   # TODO: add tests for GetNumberOfEventSources
 
@@ -541,9 +608,18 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       test_events = list(storage_file.GetSortedEvents())
       self.assertEqual(len(test_events), 4)
 
-      storage_file.Close()
+      test_time_range = time_range.TimeRange(0, 1334961526929596)
+      test_events = list(storage_file.GetSortedEvents(
+          time_range=test_time_range))
+      self.assertEqual(len(test_events), 3)
 
-    # TODO: add test with time range.
+      test_time_range = time_range.TimeRange(
+          1334961526929596, 1334961526929596)
+      test_events = list(storage_file.GetSortedEvents(
+          time_range=test_time_range))
+      self.assertEqual(len(test_events), 1)
+
+      storage_file.Close()
 
   # TODO: add tests for HasAnalysisReports
   # TODO: add tests for HasWarnings
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the compiled data type maps of dtFabric-based parsers.
+
+For every fixed-size data type of the parsers that can be compiled, the time
+it takes to map a byte stream is measured with both the dtFabric data type map
+and the compiled data type map.
+
+For example, to benchmark the data type maps of the utmp parser:
+
+  PYTHONPATH=. python3 utils/benchmark_data_type_maps.py --parser utmp
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import sys
+import timeit
+
+from plaso.parsers import dtfabric_parser
+from plaso.parsers import manager as parsers_manager
+
+
+def BenchmarkDataTypeMap(data_type_map, number_of_iterations):
+  """Benchmarks mapping a byte stream with a data type map.
+
+  Args:
+    data_type_map (dtfabric.DataTypeMap): data type map.
+    number_of_iterations (int): number of times to map the byte stream.
+
+  Returns:
+    float: number of microseconds it took to map the byte stream once.
+  """
+  byte_stream = b'\x00' * data_type_map.GetByteSize()
+
+  total_time = timeit.timeit(
+      lambda: data_type_map.MapByteStream(byte_stream),
+      number=number_of_iterations)
+
+  return total_time * 1000000.0 / number_of_iterations
+
+
+def BenchmarkParser(parser, number_of_iterations):
+  """Benchmarks the compiled data type maps of a parser.
+
+  Args:
+    parser (DtFabricBaseParser): dtFabric-based parser.
+    number_of_iterations (int): number of times to map a byte stream.
+
+  Returns:
+    list[tuple[str, float, float]]: name of the data type and number of
+        microseconds it took to map a byte stream with the dtFabric and
+        the compiled data type map.
+  """
+  # pylint: disable=protected-access
+  if not parser._fabric:
+    return []
+
+  results = []
+  for data_type_definition in (
+      parser._fabric._definitions_registry.GetDefinitions()):
+    try:
+      data_type_map = parser._fabric.CreateDataTypeMap(
+          data_type_definition.name)
+    except Exception:  # pylint: disable=broad-except
+      continue
+
+    compiled_data_type_map = dtfabric_parser.CompiledDataTypeMap.Compile(
+        data_type_map)
+    if not compiled_data_type_map:
+      continue
+
+    results.append((
+        data_type_definition.name,
+        BenchmarkDataTypeMap(data_type_map, number_of_iterations),
+        BenchmarkDataTypeMap(compiled_data_type_map, number_of_iterations)))
+
+  return results
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the compiled data type maps of dtFabric-based parsers.'))
+
+  argument_parser.add_argument(
+      '--iterations', dest='iterations', type=int, default=10000, help=(
+          'number of times to map a byte stream, the default is: 10000.'))
+
+  argument_parser.add_argument(
+      '--parser', dest='parser_name', type=str, default=None, help=(
+          'name of the parser to benchmark, the default is to benchmark all '
+          'dtFabric-based parsers.'))
+
+  options = argument_parser.parse_args()
+
+  parser_objects = parsers_manager.ParsersManager.GetParserObjects(
+      parser_filter_expression=options.parser_name)
+
+  parser_objects = {
+      parser_name: parser_object
+      for parser_name, parser_object in parser_objects.items()
+      if isinstance(parser_object, dtfabric_parser.DtFabricBaseParser)}
+
+  if not parser_objects:
+    print('No dtFabric-based parsers to benchmark.')
+    return False
+
+  print('{0:<20s} {1:<40s} {2:>12s} {3:>12s} {4:>8s}'.format(
+      'Parser', 'Data type', 'dtFabric', 'Compiled', 'Speedup'))
+
+  for parser_name, parser_object in sorted(parser_objects.items()):
+    for name, generic_time, compiled_time in BenchmarkParser(
+        parser_object, options.iterations):
+      print('{0:<20s} {1:<40s} {2:>10.3f}us {3:>10.3f}us {4:>7.1f}x'.format(
+          parser_name, name, generic_time, compiled_time,
+          generic_time / max(compiled_time, 0.000001)))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark event filters.
+
+For example, to benchmark common psort event filters against 100000 events:
+
+  PYTHONPATH=. python3 utils/benchmark_event_filter.py \
+      --number_of_events 100000
+
+Every event filter expression is matched against the same events with the
+filter the expression is compiled into, which is how events were matched
+previously, and with the match function the filter is compiled into, which is
+how the event object filter matches events.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import sys
+import time
+
+from plaso.containers import events
+from plaso.filters import event_filter
+from plaso.lib import definitions
+
+
+# Event filter expressions that are commonly used with psort.
+FILTER_EXPRESSIONS = [
+    ('date range', (
+        'date > \'2020-01-01 00:00:00\' and date < \'2020-01-02 00:00:00\'')),
+    ('parser', 'parser is \'syslog\''),
+    ('parser and body', 'parser is \'syslog\' and body contains \'root\''),
+    ('filename regexp', 'filename regexp \'(?i)system32.*\\.dll$\''),
+    ('regexp and date', (
+        'filename iregexp \'\\.exe$\' and date > \'2020-01-01 12:00:00\'')),
+    ('hash or tag', (
+        'md5_hash is \'e3df0d2abd2c27fbdadfb41a47442520\' or tag contains '
+        '\'malware\''))]
+
+
+def CreateEvents(number_of_events):
+  """Creates events to match against the event filters.
+
+  Args:
+    number_of_events (int): number of events to create.
+
+  Returns:
+    list[tuple[EventObject, EventData, EventDataStream, EventTag]]: events,
+        event data, event data streams and event tags.
+  """
+  base_timestamp = 1577836800000000
+
+  event_data_stream = events.EventDataStream()
+  event_data_stream.md5_hash = 'd41d8cd98f00b204e9800998ecf8427e'
+
+  test_events = []
+  for index in range(number_of_events):
+    event_data = events.EventData(data_type='test:event')
+    if index % 2:
+      event_data.body = 'session opened for user {0:s}'.format(
+          'root' if index % 5 == 1 else 'plaso')
+      event_data.filename = '/var/log/auth.log'
+      event_data.parser = 'syslog'
+    else:
+      event_data.filename = '/Windows/System32/file{0:d}.{1:s}'.format(
+          index, 'exe' if index % 3 else 'dll')
+      event_data.parser = 'filestat'
+
+    event = events.EventObject()
+    event.timestamp = base_timestamp + (index * 1000000)
+    event.timestamp_desc = definitions.TIME_DESCRIPTION_WRITTEN
+
+    event_tag = None
+    if not index % 100:
+      event_tag = events.EventTag()
+      event_tag.AddLabel('malware')
+
+    test_events.append((event, event_data, event_data_stream, event_tag))
+
+  return test_events
+
+
+def BenchmarkFilter(filter_expression, test_events):
+  """Benchmarks matching events against an event filter expression.
+
+  Args:
+    filter_expression (str): event filter expression.
+    test_events (list[tuple[EventObject, EventData, EventDataStream,
+        EventTag]]): events, event data, event data streams and event tags.
+
+  Returns:
+    tuple[float, float, int]: time in seconds it took to match the events
+        against the filter and against the compiled match function, and
+        the number of matching events.
+
+  Raises:
+    RuntimeError: if the filter and the compiled match function do not match
+        the same number of events.
+  """
+  filter_object = event_filter.EventObjectFilter()
+  filter_object.CompileFilter(filter_expression)
+
+  # pylint: disable=protected-access
+  matches_function = filter_object._event_filter.Matches
+
+  start_time = time.time()
+
+  number_of_filter_matches = 0
+  for event, event_data, event_data_stream, event_tag in test_events:
+    if matches_function(event, event_data, event_data_stream, event_tag):
+      number_of_filter_matches += 1
+
+  filter_time = time.time() - start_time
+
+  start_time = time.time()
+
+  number_of_matches = 0
+  for event, event_data, event_data_stream, event_tag in test_events:
+    if filter_object.Match(event, event_data, event_data_stream, event_tag):
+      number_of_matches += 1
+
+  match_function_time = time.time() - start_time
+
+  if number_of_matches != number_of_filter_matches:
+    raise RuntimeError((
+        'Number of matches of filter: {0:d} and match function: {1:d} '
+        'differ.').format(number_of_filter_matches, number_of_matches))
+
+  return filter_time, match_function_time, number_of_matches
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks event filters.'))
+
+  argument_parser.add_argument(
+      '--number_of_events', '--number-of-events', dest='number_of_events',
+      type=int, default=100000, help=(
+          'number of events to match, the default is: 100000.'))
+
+  options = argument_parser.parse_args()
+
+  test_events = CreateEvents(options.number_of_events)
+
+  print('{0:<16s} {1:>10s} {2:>12s} {3:>14s} {4:>8s}'.format(
+      'Filter', 'Matches', 'Filter (s)', 'Compiled (s)', 'Speedup'))
+
+  for description, filter_expression in FILTER_EXPRESSIONS:
+    try:
+      filter_time, match_function_time, number_of_matches = BenchmarkFilter(
+          filter_expression, test_events)
+    except RuntimeError as exception:
+      print('{0:s}: {1!s}'.format(description, exception))
+      return False
+
+    print('{0:<16s} {1:>10d} {2:>12.3f} {3:>14.3f} {4:>7.1f}x'.format(
+        description, number_of_matches, filter_time, match_function_time,
+        filter_time / max(match_function_time, 0.000001)))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark a parser on one or more files.
+
+For example, to benchmark the Windows XML EventLog (EVTX) parser on the
+test data:
+
+  PYTHONPATH=. python3 utils/benchmark_parser.py --parser winevtx \
+      test_data/*.evtx
+
+The number of records is the number of event data attribute containers
+produced by the parser.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import sys
+import time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.containers import sessions
+from plaso.engine import knowledge_base
+from plaso.parsers import dtfabric_parser
+from plaso.parsers import interface
+from plaso.parsers import manager as parsers_manager
+from plaso.parsers import mediator as parsers_mediator
+from plaso.storage.fake import writer as fake_writer
+
+
+def ParseFile(parser, path):
+  """Parses a file with a parser.
+
+  Args:
+    parser (BaseParser): parser.
+    path (str): path of the file.
+
+  Returns:
+    tuple[int, int, float]: number of records, number of events and the time
+        in seconds it took to parse the file.
+  """
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+  file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+  session = sessions.Session()
+  storage_writer = fake_writer.FakeStorageWriter(session)
+  storage_writer.Open()
+
+  knowledge_base_object = knowledge_base.KnowledgeBase()
+  knowledge_base_object.SetTimeZone('UTC')
+
+  parser_mediator = parsers_mediator.ParserMediator(
+      storage_writer, knowledge_base_object)
+  parser_mediator.SetFileEntry(file_entry)
+
+  start_time = time.time()
+
+  if isinstance(parser, interface.FileEntryParser):
+    parser.Parse(parser_mediator)
+
+  else:
+    file_object = file_entry.GetFileObject()
+    try:
+      parser.Parse(parser_mediator, file_object)
+    finally:
+      file_object.close()
+
+  parse_time = time.time() - start_time
+
+  number_of_records = len(list(storage_writer.GetEventData()))
+  number_of_events = storage_writer.number_of_events
+
+  storage_writer.Close()
+
+  return number_of_records, number_of_events, parse_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks a parser on one or more files.'))
+
+  argument_parser.add_argument(
+      '--parser', dest='parser_name', type=str, default='winevtx', help=(
+          'name of the parser to benchmark, the default is: winevtx.'))
+
+  argument_parser.add_argument(
+      '--read_ahead_window_size', '--read-ahead-window-size',
+      dest='read_ahead_window_size', type=int, default=None, help=(
+          'size of the read-ahead window in bytes of dtFabric-based parsers, '
+          'where 0 disables read-ahead, the default is the window size '
+          'defined by the parser.'))
+
+  argument_parser.add_argument(
+      '--repeat', dest='repeat', type=int, default=3, help=(
+          'number of times to parse every file, where the fastest time is '
+          'reported, the default is: 3.'))
+
+  argument_parser.add_argument(
+      'paths', nargs='+', type=str, help='paths of the files to parse.')
+
+  options = argument_parser.parse_args()
+
+  parser = parsers_manager.ParsersManager.GetParserObjectByName(
+      options.parser_name)
+  if not parser:
+    print('No such parser: {0:s}'.format(options.parser_name))
+    return False
+
+  if options.read_ahead_window_size is not None:
+    if not isinstance(parser, dtfabric_parser.DtFabricBaseParser):
+      print('Parser: {0:s} does not support read-ahead.'.format(
+          options.parser_name))
+      return False
+
+    parser.SetReadAheadWindowSize(options.read_ahead_window_size)
+
+  print('{0:<40s} {1:>10s} {2:>10s} {3:>10s} {4:>14s}'.format(
+      'File', 'Records', 'Events', 'Seconds', 'Records/second'))
+
+  total_number_of_records = 0
+  total_parse_time = 0.0
+
+  for path in options.paths:
+    if not os.path.isfile(path):
+      print('No such file: {0:s}'.format(path))
+      return False
+
+    parse_time = None
+    for _ in range(max(options.repeat, 1)):
+      number_of_records, number_of_events, repeat_parse_time = ParseFile(
+          parser, os.path.abspath(path))
+      if parse_time is None or repeat_parse_time < parse_time:
+        parse_time = repeat_parse_time
+
+    total_number_of_records += number_of_records
+    total_parse_time += parse_time
+
+    print('{0:<40s} {1:>10d} {2:>10d} {3:>10.3f} {4:>14.1f}'.format(
+        os.path.basename(path), number_of_records, number_of_events,
+        parse_time, number_of_records / max(parse_time, 0.000001)))
+
+  print('{0:<40s} {1:>10d} {2:>10s} {3:>10.3f} {4:>14.1f}'.format(
+      'Total', total_number_of_records, '', total_parse_time,
+      total_number_of_records / max(total_parse_time, 0.000001)))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the Redis task store.
+
+For example, to benchmark the Redis task store against a Redis server
+listening on localhost:
+
+  PYTHONPATH=. python3 utils/benchmark_redis_store.py \
+      --url redis://127.0.0.1/0
+
+If no URL is specified an in-process fakeredis server is used, which measures
+the overhead of the store but not the latency of the round trips to a Redis
+server.
+
+The events are written once with every write buffered in the pipeline,
+which is the behavior of the store, and once with the pipeline sent to the
+Redis server after every write.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import sys
+import time
+
+import redis
+
+from plaso.containers import events
+from plaso.lib import definitions
+from plaso.storage.redis import redis_store
+
+
+def BenchmarkStore(
+    redis_client, number_of_events, compression_format,
+    maximum_number_of_buffered_commands=None):
+  """Benchmarks writing and reading a Redis task store.
+
+  Args:
+    redis_client (Redis): Redis client.
+    number_of_events (int): number of events to write.
+    compression_format (str): compression format of the store.
+    maximum_number_of_buffered_commands (Optional[int]): maximum number of
+        commands buffered in the pipeline, where None represents the default
+        of the store.
+
+  Returns:
+    tuple[float, float, float]: time in seconds it took to write the events,
+        to read the events in sorted order and to read the serialized event
+        data as the merge reader does.
+  """
+  store = redis_store.RedisStore(compression_format=compression_format)
+
+  # pylint: disable=protected-access
+  if maximum_number_of_buffered_commands:
+    store._MAXIMUM_NUMBER_OF_BUFFERED_COMMANDS = (
+        maximum_number_of_buffered_commands)
+
+  store.Open(redis_client=redis_client)
+
+  start_time = time.time()
+
+  for index in range(number_of_events):
+    event_data = events.EventData(data_type='test:event')
+    event_data.filename = '/Windows/System32/file{0:d}.dll'.format(index)
+    event_data.offset = index
+    store.AddEventData(event_data)
+
+    event = events.EventObject()
+    event.timestamp = (number_of_events - index) * 1000000
+    event.timestamp_desc = definitions.TIME_DESCRIPTION_WRITTEN
+    event.SetEventDataIdentifier(event_data.GetIdentifier())
+    store.AddEvent(event)
+
+  store.Finalize()
+
+  write_time = time.time() - start_time
+
+  start_time = time.time()
+
+  for _ in store.GetSortedEvents():
+    pass
+
+  sorted_read_time = time.time() - start_time
+
+  start_time = time.time()
+
+  cursor = 0
+  while True:
+    cursor, _ = store.GetSerializedAttributeContainers(
+        store._CONTAINER_TYPE_EVENT_DATA, cursor, 0)
+    if not cursor:
+      break
+
+  merge_read_time = time.time() - start_time
+
+  for container_type in (
+      store._CONTAINER_TYPE_EVENT, store._CONTAINER_TYPE_EVENT_DATA):
+    redis_client.delete(store._GenerateRedisKey(container_type))
+  store.Remove()
+  store.Close()
+
+  return write_time, sorted_read_time, merge_read_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the Redis task store.'))
+
+  argument_parser.add_argument(
+      '--compression', dest='compression_format', type=str,
+      choices=sorted(definitions.COMPRESSION_FORMATS),
+      default=definitions.COMPRESSION_FORMAT_NONE, help=(
+          'compression format of the stored attribute containers, the '
+          'default is: none.'))
+
+  argument_parser.add_argument(
+      '--number_of_events', '--number-of-events', dest='number_of_events',
+      type=int, default=10000, help=(
+          'number of events to write, the default is: 10000.'))
+
+  argument_parser.add_argument(
+      '--url', dest='url', type=str, default=None, help=(
+          'URL of the Redis database, the default is to use an in-process '
+          'fakeredis server.'))
+
+  options = argument_parser.parse_args()
+
+  if options.url:
+    redis_client = redis.from_url(url=options.url, socket_timeout=60)
+    try:
+      redis_client.ping()
+    except redis.exceptions.ConnectionError as exception:
+      print('Unable to connect to: {0:s} with error: {1!s}'.format(
+          options.url, exception))
+      return False
+
+  else:
+    try:
+      import fakeredis  # pylint: disable=import-outside-toplevel
+    except ImportError:
+      print('Missing fakeredis, a URL of a Redis database is required.')
+      return False
+
+    redis_client = fakeredis.FakeStrictRedis()
+
+  print('{0:<12s} {1:>10s} {2:>14s} {3:>14s} {4:>14s}'.format(
+      'Writes', 'Events', 'Write (s)', 'Sorted (s)', 'Merge (s)'))
+
+  for description, maximum_number_of_buffered_commands in (
+      ('unbuffered', 1), ('buffered', None)):
+    write_time, sorted_read_time, merge_read_time = BenchmarkStore(
+        redis_client, options.number_of_events, options.compression_format,
+        maximum_number_of_buffered_commands=(
+            maximum_number_of_buffered_commands))
+
+    print('{0:<12s} {1:>10d} {2:>14.3f} {3:>14.3f} {4:>14.3f}'.format(
+        description, options.number_of_events, write_time, sorted_read_time,
+        merge_read_time))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
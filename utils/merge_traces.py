@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to merge the traces of the trace profiler into a single timeline.
+
+Every process writes its own trace file when the trace profiler is enabled,
+for example:
+
+  log2timeline.py --profilers trace --profiling_directory traces \
+      timeline.plaso image.raw
+
+To merge the traces into a single Chrome trace event format file:
+
+  PYTHONPATH=. python3 utils/merge_traces.py --output trace.json traces
+
+The merged trace can be viewed with chrome://tracing, Perfetto or speedscope.
+Next to the events of the individual processes, the merged trace contains
+a "Tasks" process with the lifecycle of every task, from its creation by
+the foreman, to processing by a worker, to merging by the foreman.
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import glob
+import gzip
+import heapq
+import json
+import os
+import sys
+
+
+# Process identifier of the task lifecycle process in the merged trace.
+TASKS_PROCESS_IDENTIFIER = 0
+
+
+def ReadTrace(path):
+  """Reads the trace events of a trace file.
+
+  The trace file of a process that did not stop cleanly, for example because
+  it was killed, lacks the closing bracket, which is added when missing.
+
+  Args:
+    path (str): path of the trace file.
+
+  Returns:
+    list[dict[str, object]]: trace events.
+
+  Raises:
+    ValueError: if the trace file cannot be read.
+  """
+  if path.endswith('.gz'):
+    file_object = gzip.open(path, 'rb')
+  else:
+    file_object = open(path, 'rb')
+
+  data = []
+  with file_object:
+    try:
+      for chunk in iter(lambda: file_object.read(65536), b''):
+        data.append(chunk)
+    except EOFError:
+      # The gzip stream is truncated, use the data read so far.
+      pass
+
+  content = b''.join(data).decode('utf-8').strip()
+  if not content.endswith(']'):
+    # Remove a partially written last trace event.
+    content, _, _ = content.rpartition('\n')
+    content = '{0:s}\n]'.format(content.rstrip(','))
+
+  trace_events = json.loads(content)
+  if isinstance(trace_events, dict):
+    trace_events = trace_events.get('traceEvents', [])
+
+  return trace_events
+
+
+def GetTaskLifecycleEvents(trace_events):
+  """Retrieves the task lifecycle events.
+
+  The status changes of the tasks, which are recorded by the foreman and the
+  workers, are combined into complete events of the phases of every task.
+  Every task is placed on the first track that is free at the time the task
+  is created, to keep the number of tracks small.
+
+  Args:
+    trace_events (list[dict[str, object]]): trace events of all processes.
+
+  Returns:
+    list[dict[str, object]]: task lifecycle trace events.
+  """
+  task_status_per_identifier = {}
+  for trace_event in trace_events:
+    if trace_event.get('ph') != 'i' or trace_event.get('cat') != 'task':
+      continue
+
+    task_identifier = trace_event.get('args', {}).get('task', None)
+    if task_identifier:
+      task_status = task_status_per_identifier.setdefault(task_identifier, [])
+      task_status.append((trace_event['ts'], trace_event['name']))
+
+  lifecycle_events = [{
+      'args': {'name': 'Tasks'},
+      'name': 'process_name',
+      'ph': 'M',
+      'pid': TASKS_PROCESS_IDENTIFIER}]
+
+  # Heap of the tracks, as tuples of the end timestamp of the last task on
+  # the track and the track identifier.
+  tracks = []
+
+  for task_identifier, task_status in sorted(
+      task_status_per_identifier.items(), key=lambda item: min(item[1])):
+    task_status.sort()
+
+    first_timestamp = task_status[0][0]
+    last_timestamp = task_status[-1][0]
+
+    if tracks and tracks[0][0] <= first_timestamp:
+      _, track_identifier = heapq.heappop(tracks)
+    else:
+      track_identifier = len(tracks) + 1
+
+    heapq.heappush(tracks, (last_timestamp, track_identifier))
+
+    lifecycle_events.append({
+        'args': {'task': task_identifier},
+        'cat': 'task',
+        'dur': last_timestamp - first_timestamp,
+        'name': task_identifier,
+        'ph': 'X',
+        'pid': TASKS_PROCESS_IDENTIFIER,
+        'tid': track_identifier,
+        'ts': first_timestamp})
+
+    for (timestamp, status), (next_timestamp, _) in zip(
+        task_status[:-1], task_status[1:]):
+      lifecycle_events.append({
+          'args': {'task': task_identifier},
+          'cat': 'task',
+          'dur': next_timestamp - timestamp,
+          'name': status,
+          'ph': 'X',
+          'pid': TASKS_PROCESS_IDENTIFIER,
+          'tid': track_identifier,
+          'ts': timestamp})
+
+  return lifecycle_events
+
+
+def MergeTraces(paths):
+  """Merges the trace events of trace files.
+
+  Args:
+    paths (list[str]): paths of the trace files.
+
+  Returns:
+    dict[str, object]: merged trace in the Chrome trace event object format.
+  """
+  trace_events = []
+  for path in paths:
+    try:
+      trace_events.extend(ReadTrace(path))
+    except (IOError, UnicodeDecodeError, ValueError) as exception:
+      print('Unable to read trace file: {0:s} with error: {1!s}'.format(
+          path, exception))
+
+  trace_events.extend(GetTaskLifecycleEvents(trace_events))
+
+  return {'displayTimeUnit': 'ms', 'traceEvents': trace_events}
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Merges the traces of the trace profiler into a single timeline.'))
+
+  argument_parser.add_argument(
+      '--output', dest='output', type=str, default='trace.json', help=(
+          'path of the merged trace, which is gzip compressed if the path '
+          'ends with .gz, the default is: trace.json.'))
+
+  argument_parser.add_argument(
+      'paths', nargs='+', type=str, help=(
+          'paths of the trace files or directories that contain the trace '
+          'files.'))
+
+  options = argument_parser.parse_args()
+
+  paths = []
+  for path in options.paths:
+    if os.path.isdir(path):
+      paths.extend(sorted(glob.glob(os.path.join(path, 'trace-*.json.gz'))))
+    else:
+      paths.append(path)
+
+  if not paths:
+    print('No trace files found.')
+    return False
+
+  merged_trace = MergeTraces(paths)
+
+  if options.output.endswith('.gz'):
+    file_object = gzip.open(options.output, 'wt', encoding='utf-8')
+  else:
+    file_object = open(options.output, 'w', encoding='utf-8')
+
+  with file_object:
+    json.dump(merged_trace, file_object, separators=(',', ':'))
+
+  print('Merged {0:d} trace files into: {1:s}'.format(
+      len(paths), options.output))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -72,6 +72,8 @@ def Main():
     name_suffix = 'processing'
 
   names = ['time', 'name', 'cpu']
+  if options.profiler == 'analyzers':
+    names.append('data_size')
 
   glob_pattern = '{0:s}-*-{1:s}.csv.gz'.format(name_prefix, name_suffix)
   glob_expression = os.path.join(options.profile_path, glob_pattern)
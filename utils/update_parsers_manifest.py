@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to update the parsers manifest.
+
+The parsers manifest, plaso/parsers/manifest.py, contains the names, data
+formats, plugins and format specifications of the parsers, so that the
+parsers manager does not need to import every parser module. The manifest
+needs to be updated when a parser or plugin is added, removed or changed:
+
+  PYTHONPATH=. python3 utils/update_parsers_manifest.py
+"""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import importlib
+import os
+import pkgutil
+import sys
+
+import plaso
+
+from plaso.parsers import manager as parsers_manager
+
+
+_MANIFEST_HEADER = '''\
+# -*- coding: utf-8 -*-
+"""Manifest of the parsers and their plugins.
+
+This file is generated by utils/update_parsers_manifest.py, do not edit.
+"""
+
+# pylint: disable=line-too-long
+
+from __future__ import unicode_literals
+
+PARSERS = {
+'''
+
+
+def ImportParserModules():
+  """Imports all the modules in the parsers package.
+
+  Importing a parser or plugin module registers the parsers and plugins it
+  defines.
+  """
+  parsers_path = os.path.join(os.path.dirname(plaso.__file__), 'parsers')
+
+  for module_information in pkgutil.walk_packages(
+      [parsers_path], prefix='plaso.parsers.'):
+    if module_information.name != 'plaso.parsers.manifest':
+      importlib.import_module(module_information.name)
+
+
+def FormatManifest(manifest_entries):
+  """Formats the parsers manifest.
+
+  Args:
+    manifest_entries (dict[str, dict[str, object]]): parsers manifest entries
+        per parser name.
+
+  Returns:
+    str: parsers manifest as Python source code.
+  """
+  lines = [_MANIFEST_HEADER]
+  for parser_name, manifest_entry in sorted(manifest_entries.items()):
+    lines.append('    {0!r}: {{\n'.format(parser_name))
+
+    for key, value in sorted(manifest_entry.items()):
+      if isinstance(value, list) and value:
+        lines.append('        {0!r}: [\n'.format(key))
+        for item in value:
+          lines.append('            {0!r},\n'.format(item))
+        lines.append('        ],\n')
+
+      elif isinstance(value, dict):
+        lines.append('        {0!r}: {{\n'.format(key))
+        for item_key, item_value in sorted(value.items()):
+          lines.append('            {0!r}: {1!r},\n'.format(
+              item_key, item_value))
+        lines.append('        },\n')
+
+      else:
+        lines.append('        {0!r}: {1!r},\n'.format(key, value))
+
+    lines.append('    },\n')
+
+  lines.append('}\n')
+  return ''.join(lines)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Updates the parsers manifest.'))
+
+  argument_parser.add_argument(
+      '--output', dest='output', type=str, default=None, help=(
+          'path of the parsers manifest, the default is: '
+          'plaso/parsers/manifest.py.'))
+
+  options = argument_parser.parse_args()
+
+  ImportParserModules()
+
+  # pylint: disable=protected-access
+  manager = parsers_manager.ParsersManager
+  manifest_entries = {
+      parser_name: manager._CreateManifestEntry(parser_class)
+      for parser_name, parser_class in manager._parser_classes.items()}
+
+  output_path = options.output or os.path.join(
+      os.path.dirname(plaso.__file__), 'parsers', 'manifest.py')
+
+  with open(output_path, 'w', encoding='utf-8') as file_object:
+    file_object.write(FormatManifest(manifest_entries))
+
+  print('Parsers manifest with {0:d} parsers written to: {1:s}'.format(
+      len(manifest_entries), output_path))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)